@@ -39,7 +39,6 @@ from core.policy_builder import CustomPolicy, PolicyLibrary
 from core.monte_carlo_scenarios import MonteCarloPolicySimulator, PolicySensitivityAnalyzer, StressTestAnalyzer
 from core.policy_enhancements import PolicyRecommendationEngine, PolicyImpactCalculator, InteractiveScenarioExplorer, FiscalGoal
 from core.data_loader import load_real_data
-from core.report_generator import ComprehensiveReportBuilder, ReportMetadata
 import pandas as pd
 
 # Authentication imports (Phase 5)
@@ -581,6 +580,7 @@ def create_api_app() -> "Flask":
                 spending_change_pct=req.spending_change_pct,
                 years=req.years,
                 iterations=req.iterations,
+                return_paths=False,
             )
             
             duration_ms = int((datetime.now(timezone.utc) - start_time).total_seconds() * 1000)
@@ -696,6 +696,7 @@ def create_api_app() -> "Flask":
                 spending_change_pct=spending_change,
                 years=years,
                 iterations=iterations,
+                return_paths=False,
             )
             
             return jsonify({
@@ -1347,6 +1348,9 @@ def create_api_app() -> "Flask":
     @app.route('/api/report/generate', methods=['POST'])
     def generate_report():
         """Generate fiscal policy report."""
+        # Report backends (openpyxl, reportlab) load on first use, not at worker startup
+        from core.report_generator import ComprehensiveReportBuilder, ReportMetadata
+
         try:
             data = request.get_json()
             
@@ -22,129 +22,148 @@ Usage:
     result = engine.run_simulation(scenario, iterations=100000)
 """
 
+import importlib
+import importlib.util
 import logging
+from typing import Any, Dict, List, Tuple
 
-from core.economics import calculate_revenues_and_outs
-from core.simulation import simulate_years
-from core.simulation import simulate_healthcare_years
-from core.metrics import compute_policy_metrics, calculate_cbo_summary
-
-from core.healthcare import (
-    HealthcarePolicyModel,
-    HealthcarePolicyFactory,
-    PolicyType,
-    get_policy_by_type,
-    list_available_policies,
-)
-
-from core.economic_engine import (
-    MonteCarloEngine,
-    EconomicModel,
-    PolicyScenario,
-    SimulationResult,
-    EconomicParameters,
-    RevenueLine,
-    SpendingCategory,
-    SensitivityAnalyzer,
-    ScenarioComparator,
-)
-
-# Phase 2: Social Security & Revenue modules
-from core.social_security import (
-    SocialSecurityModel,
-    DemographicAssumptions,
-    BenefitFormula,
-    TrustFundAssumptions,
-    SocialSecurityReforms,
-)
-
-from core.revenue_modeling import (
-    FederalRevenueModel,
-    IndividualIncomeTaxAssumptions,
-    PayrollTaxAssumptions,
-    CorporateIncomeTaxAssumptions,
-    TaxReforms,
-)
-
-# Phase 3.1: Medicare & Medicaid modules
-from core.medicare_medicaid import (
-    MedicareModel,
-    MedicaidModel,
-    MedicareAssumptions,
-    MedicaidAssumptions,
-)
-
-# Phase 3.2: Discretionary & Interest & Combined modules
-from core.discretionary_spending import (
-    DiscretionarySpendingModel,
-    DiscretionaryAssumptions,
-)
-
-from core.interest_spending import (
-    InterestOnDebtModel,
-    DebtAssumptions,
-)
-
-from core.combined_outlook import (
-    CombinedFiscalOutlookModel,
-)
+# Exports are resolved lazily (PEP 562): "from core import X" imports only the
+# submodule that defines X, so API workers that need one model do not pay for
+# the report generator, PDF parser or policy builder at startup.
+_LAZY_EXPORTS: Dict[str, Tuple[str, ...]] = {
+    "core.economics": ("calculate_revenues_and_outs", "compile_policy", "PolicyPlan"),
+    "core.simulation": (
+        "simulate_years",
+        "simulate_years_headless",
+        "simulate_healthcare_years",
+        "simulate_healthcare_batch",
+        "simulate_healthcare_monte_carlo",
+        "healthcare_percentile_bands",
+        "HealthcareUncertainty",
+    ),
+    "core.metrics": ("compute_policy_metrics", "calculate_cbo_summary"),
+    "core.healthcare": (
+        "HealthcarePolicyModel",
+        "HealthcarePolicyFactory",
+        "PolicyType",
+        "get_policy_by_type",
+        "list_available_policies",
+    ),
+    "core.policy_registry": ("PolicyRegistry", "get_registry"),
+    "core.economic_engine": (
+        "MonteCarloEngine",
+        "EconomicModel",
+        "PolicyScenario",
+        "SimulationResult",
+        "EconomicParameters",
+        "RevenueLine",
+        "SpendingCategory",
+        "SensitivityAnalyzer",
+        "ScenarioComparator",
+        "SweepResult",
+    ),
+    # Phase 2: Social Security & Revenue modules
+    "core.social_security": (
+        "SocialSecurityModel",
+        "DemographicAssumptions",
+        "BenefitFormula",
+        "TrustFundAssumptions",
+        "SocialSecurityReforms",
+    ),
+    "core.revenue_modeling": (
+        "FederalRevenueModel",
+        "IndividualIncomeTaxAssumptions",
+        "PayrollTaxAssumptions",
+        "CorporateIncomeTaxAssumptions",
+        "TaxReforms",
+    ),
+    # Phase 3.1: Medicare & Medicaid modules
+    "core.medicare_medicaid": (
+        "MedicareModel",
+        "MedicaidModel",
+        "MedicareAssumptions",
+        "MedicaidAssumptions",
+    ),
+    # Phase 3.2: Discretionary & Interest & Combined modules
+    "core.discretionary_spending": ("DiscretionarySpendingModel", "DiscretionaryAssumptions"),
+    "core.interest_spending": ("InterestOnDebtModel", "DebtAssumptions"),
+    "core.combined_outlook": ("CombinedFiscalOutlookModel",),
+    # Phase 4: Real Data & Policy Builder modules
+    "core.data_loader": (
+        "RealDataLoader",
+        "load_real_data",
+        "CBOHistoricalData",
+        "SSAHistoricalData",
+        "MedicareHistoricalData",
+        "MedicaidHistoricalData",
+        "PopulationProjections",
+    ),
+    "core.policy_builder": (
+        "CustomPolicy",
+        "PolicyParameter",
+        "PolicyTemplate",
+        "PolicyLibrary",
+        "ScenarioBundle",
+        "ScenarioBundleLibrary",
+        "build_policy_comparison_table",
+        "build_scenario_bundle_zip",
+    ),
+    "core.pdf_policy_parser": (
+        "PolicyPDFProcessor",
+        "PolicyKeywordMatcher",
+        "PolicyExtraction",
+        "process_policy_pdf",
+    ),
+    # Phase 4b: Policy Enhancements
+    "core.policy_enhancements": (
+        "PolicyRecommendationEngine",
+        "PolicyImpactCalculator",
+        "InteractiveScenarioExplorer",
+        "PolicyComparator",
+        "PolicyScore",
+        "FiscalGoal",
+    ),
+    # Phase 4c: Monte Carlo Scenarios
+    "core.monte_carlo_scenarios": (
+        "MonteCarloPolicySimulator",
+        "PolicySensitivityAnalyzer",
+        "StressTestAnalyzer",
+        "MonteCarloResult",
+    ),
+    # Phase 4b: Report Generation
+    "core.report_generator": (
+        "PDFReportGenerator",
+        "ExcelReportGenerator",
+        "ComprehensiveReportBuilder",
+        "ReportSection",
+        "ReportMetadata",
+    ),
+}
 
-# Phase 4: Real Data & Policy Builder modules
-from core.data_loader import (
-    RealDataLoader,
-    load_real_data,
-    CBOHistoricalData,
-    SSAHistoricalData,
-    MedicareHistoricalData,
-    MedicaidHistoricalData,
-    PopulationProjections,
-)
+# Public name -> (module, attribute)
+_EXPORTS: Dict[str, Tuple[str, str]] = {
+    name: (module, name) for module, names in _LAZY_EXPORTS.items() for name in names
+}
+_EXPORTS["BuilderPolicyType"] = ("core.policy_builder", "PolicyType")
 
-from core.policy_builder import (
-    CustomPolicy,
-    PolicyParameter,
-    PolicyTemplate,
-    PolicyLibrary,
-    PolicyType as BuilderPolicyType,
-    ScenarioBundle,
-    ScenarioBundleLibrary,
-    build_policy_comparison_table,
-    build_scenario_bundle_zip,
-)
 
-from core.pdf_policy_parser import (
-    PolicyPDFProcessor,
-    PolicyKeywordMatcher,
-    PolicyExtraction,
-    process_policy_pdf,
-)
+def __getattr__(name: str) -> Any:
+    """Import an export's module on first access (PEP 562)."""
+    if name in _EXPORTS:
+        module, attribute = _EXPORTS[name]
+        value = getattr(importlib.import_module(module), attribute)
+    elif not name.startswith("_") and importlib.util.find_spec(f"{__name__}.{name}") is not None:
+        # "import core; core.simulation" worked when every submodule was imported eagerly
+        value = importlib.import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
 
-# Phase 4b: Policy Enhancements
-from core.policy_enhancements import (
-    PolicyRecommendationEngine,
-    PolicyImpactCalculator,
-    InteractiveScenarioExplorer,
-    PolicyComparator,
-    PolicyScore,
-    FiscalGoal,
-)
 
-# Phase 4c: Monte Carlo Scenarios
-from core.monte_carlo_scenarios import (
-    MonteCarloPolicySimulator,
-    PolicySensitivityAnalyzer,
-    StressTestAnalyzer,
-    MonteCarloResult,
-)
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
 
-# Phase 4b: Report Generation
-from core.report_generator import (
-    PDFReportGenerator,
-    ExcelReportGenerator,
-    ComprehensiveReportBuilder,
-    ReportSection,
-    ReportMetadata,
-)
 
 # Configure module-level logging
 _logger = logging.getLogger(__name__)
@@ -153,8 +172,15 @@ _logger.addHandler(logging.NullHandler())
 __all__ = [
     # Economics
     'calculate_revenues_and_outs',
+    'compile_policy',
+    'PolicyPlan',
     'simulate_years',
+    'simulate_years_headless',
     'simulate_healthcare_years',
+    'simulate_healthcare_batch',
+    'simulate_healthcare_monte_carlo',
+    'healthcare_percentile_bands',
+    'HealthcareUncertainty',
     'compute_policy_metrics',
     'calculate_cbo_summary',
     
@@ -164,6 +190,8 @@ __all__ = [
     'PolicyType',
     'get_policy_by_type',
     'list_available_policies',
+    'PolicyRegistry',
+    'get_registry',
     
     # Economic engine
     'MonteCarloEngine',
@@ -175,6 +203,7 @@ __all__ = [
     'SpendingCategory',
     'SensitivityAnalyzer',
     'ScenarioComparator',
+    'SweepResult',
     
     # Phase 2: Social Security & Revenue
     'SocialSecurityModel',
@@ -13,10 +13,11 @@ Provides:
 
 import numpy as np
 import pandas as pd
-from typing import Dict, Tuple, Optional, Any, TYPE_CHECKING
+from typing import Callable, Dict, Tuple, Optional, Any, Union, TYPE_CHECKING
 import logging
-import hashlib
 import pickle
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
 from functools import lru_cache
 
 from core.validation import InputValidator, ValidationError, validate_projection_params
@@ -26,14 +27,225 @@ from core.medicare_medicaid import MedicareModel, MedicaidModel
 from core.healthcare import get_policy_by_type, PolicyType
 from core.discretionary_spending import DiscretionarySpendingModel
 from core.interest_spending import InterestOnDebtModel
+from core.projection_context import ProjectionContext, growth_index
+from core.random_streams import RandomStreamMixin, SeedLike
+from core.samplers import SamplerLike
+from core.result_cache import ResultCache, fingerprint
 
 if TYPE_CHECKING:
     from core.policy_mechanics_extractor import PolicyMechanics
 
 logger = logging.getLogger(__name__)
 
+# Execution modes for project_unified_budget component fan-out
+EXECUTION_MODES = ("serial", "thread", "process")
 
-class CombinedFiscalOutlookModel:
+# Nominal GDP in the first projection year (billions, ~2026)
+BASE_GDP_BILLIONS = 28000.0
+
+# "Other health" spending (VA, CHIP, ACA) growth on the baseline medical path
+OTHER_HEALTH_GROWTH = 0.055
+
+
+# Component kernels. They are module-level so a process pool can pickle them;
+# each takes the sub-model it projects and returns a per-year DataFrame.
+
+def _project_revenue(model: FederalRevenueModel, years: int, iterations: int, scenario: str,
+                     chunk_size: Optional[int] = None,
+                     context: Optional[ProjectionContext] = None) -> pd.DataFrame:
+    """Mean total federal revenue by year (billions)."""
+    if chunk_size is not None:
+        summary = model.project_all_revenues(
+            years=years, iterations=iterations, scenario=scenario,
+            return_summary=True, chunk_size=chunk_size, context=context,
+        )
+        return pd.DataFrame({"year": summary["year"], "total_revenues": summary["total_revenues_mean"]})
+    revenue_paths = model.project_all_revenues(
+        years=years,
+        gdp_growth=None,  # Uses the context's GDP growth (default 2% baseline without one)
+        wage_growth=None,  # Uses the context's wage growth (default 3% baseline without one)
+        iterations=iterations,
+        scenario=scenario,
+        return_arrays=True,
+        context=context,
+    )
+    return pd.DataFrame({
+        "year": revenue_paths["year"],
+        "total_revenues": revenue_paths.mean("total_revenues"),
+    })
+
+
+def _project_social_security(model: SocialSecurityModel, years: int, iterations: int, scenario: str,
+                             chunk_size: Optional[int] = None,
+                             context: Optional[ProjectionContext] = None) -> pd.DataFrame:
+    """Mean Social Security benefit payments by year (billions)."""
+    if chunk_size is not None:
+        summary = model.project_trust_funds(
+            years, iterations, return_summary=True, chunk_size=chunk_size, context=context
+        )
+        return pd.DataFrame({"year": summary["year"], "spending": summary["benefit_payments_mean"]})
+    # Columnar paths skip building the long-format frame
+    ss_paths = model.project_trust_funds(years, iterations, return_arrays=True, context=context)
+    return pd.DataFrame({
+        "year": ss_paths["year"],
+        "spending": ss_paths.mean("benefit_payments_billions"),
+    })
+
+
+def _project_medicare(model: MedicareModel, years: int, iterations: int,
+                      chunk_size: Optional[int] = None,
+                      context: Optional[ProjectionContext] = None) -> pd.DataFrame:
+    """Mean Medicare spending by year (billions)."""
+    # Fused kernel, summary mode skips the long-format frame
+    medicare_summary = model.project_all_parts(
+        years, iterations, return_summary=True, chunk_size=chunk_size, context=context
+    )
+    return pd.DataFrame({
+        "year": medicare_summary["year"],
+        "spending": medicare_summary["total_mean"] / 1e9,  # Dollars to billions
+    })
+
+
+def _project_medicaid(model: MedicaidModel, years: int, iterations: int,
+                      chunk_size: Optional[int] = None,
+                      context: Optional[ProjectionContext] = None) -> pd.DataFrame:
+    """Mean Medicaid spending by year (billions)."""
+    medicaid_summary = model.project_spending(
+        years, iterations, return_summary=True, chunk_size=chunk_size, context=context
+    )
+    return pd.DataFrame({
+        "year": medicaid_summary["year"],
+        "spending": medicaid_summary["total_mean"] / 1e3,  # Thousands to billions
+    })
+
+
+def _project_discretionary(model: DiscretionarySpendingModel, years: int, iterations: int, scenario: str,
+                           chunk_size: Optional[int] = None,
+                           context: Optional[ProjectionContext] = None) -> pd.DataFrame:
+    """Defense and non-defense discretionary spending by year."""
+    return model.project_all_discretionary(
+        years, iterations,
+        defense_scenario=scenario,
+        nondefense_scenario=scenario,
+        chunk_size=chunk_size,
+        context=context,
+    )
+
+
+def _project_interest(model: InterestOnDebtModel, years: int, iterations: int, scenario: str,
+                      chunk_size: Optional[int] = None,
+                      context: Optional[ProjectionContext] = None) -> pd.DataFrame:
+    """Interest expense and debt by year."""
+    return model.project_interest_and_debt(
+        years, iterations, interest_rate_scenario=scenario, chunk_size=chunk_size, context=context
+    )
+
+
+def _run_component(kernel: Callable[..., pd.DataFrame], model: Any, kwargs: Dict[str, Any]) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """
+    Run a component kernel and return its result with the model's RNG state.
+    
+    A worker process advances a pickled copy of the model's Generator; the
+    returned state lets the parent resume the same stream, so serial, thread
+    and process execution produce identical results.
+    """
+    result = kernel(model, **kwargs)
+    return result, model.rng.bit_generator.state
+
+
+@dataclass(frozen=True)
+class ComponentNode:
+    """
+    A component in the unified-budget evaluation graph.
+    
+    Attributes:
+        name: Component name (also the cache namespace)
+        kernel: Module-level projection function
+        model_attr: CombinedFiscalOutlookModel attribute holding the sub-model
+        inputs: project_unified_budget arguments the node reads, as
+            (kernel keyword, budget argument) pairs
+    """
+    name: str
+    kernel: Callable[..., pd.DataFrame]
+    model_attr: str
+    inputs: Tuple[Tuple[str, str], ...]
+    
+    def bind(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Select this node's kernel kwargs from the budget arguments."""
+        return {keyword: arguments[argument] for keyword, argument in self.inputs}
+
+
+_SIZE_INPUTS = (
+    ("years", "years"), ("iterations", "iterations"), ("chunk_size", "chunk_size"), ("context", "context"),
+)
+
+# A node is dirty when its inputs, its sub-model's state or the applied policy
+# mechanics change; clean nodes are served from the result cache, so a change
+# to one scenario only recomputes the component that reads it
+BUDGET_GRAPH: Tuple[ComponentNode, ...] = (
+    ComponentNode("revenue", _project_revenue, "revenue_model",
+                  _SIZE_INPUTS + (("scenario", "revenue_scenario"),)),
+    ComponentNode("ss_spending", _project_social_security, "ss_model",
+                  _SIZE_INPUTS + (("scenario", "ss_scenario"),)),
+    ComponentNode("medicare_spending", _project_medicare, "medicare_model", _SIZE_INPUTS),
+    ComponentNode("medicaid_spending", _project_medicaid, "medicaid_model", _SIZE_INPUTS),
+    ComponentNode("discretionary", _project_discretionary, "discretionary_model",
+                  _SIZE_INPUTS + (("scenario", "discretionary_scenario"),)),
+    ComponentNode("interest", _project_interest, "interest_model",
+                  _SIZE_INPUTS + (("scenario", "interest_scenario"),)),
+)
+
+
+def fiscal_gap(
+    primary_balance: np.ndarray,
+    gdp: np.ndarray,
+    interest_rate: np.ndarray,
+    initial_debt: float,
+    target_debt_to_gdp: float = 0.60,
+) -> Union[float, np.ndarray]:
+    """
+    Closed-form fiscal gap for one path or a batch of paths.
+    
+    Debt follows D_t = D_{t-1} * (1 + r_t) - (PB_t + x * Y_t). Discounting
+    every year back to the start with the path's own rates turns the horizon
+    condition D_T = target * Y_T into a linear equation in x:
+    
+        x = (D_0 - sum(PB_t * v_t) - target * Y_T * v_T) / sum(Y_t * v_t)
+    
+    where v_t = 1 / prod_{s<=t}(1 + r_s).
+    
+    Args:
+        primary_balance: Primary balance by year (billions, surplus positive),
+            shape (years,) or (years, iterations)
+        gdp: Nominal GDP by year (billions), broadcastable to primary_balance
+        interest_rate: Effective interest rate on debt by year (decimal),
+            broadcastable to primary_balance
+        initial_debt: Debt held by the public before the first year (billions)
+        target_debt_to_gdp: Debt-to-GDP ratio to reach in the final year
+    
+    Returns:
+        Constant primary-balance adjustment as a percentage of GDP (positive =
+        tightening needed); a float for one path, one value per iteration otherwise
+    """
+    primary_balance = np.asarray(primary_balance, dtype=float)
+    # Per-year inputs broadcast across iterations
+    gdp, interest_rate = (
+        np.asarray(values, dtype=float).reshape(
+            np.shape(values) + (1,) * (primary_balance.ndim - np.ndim(values)))
+        for values in (gdp, interest_rate)
+    )
+    
+    discount = 1.0 / np.cumprod(1.0 + interest_rate, axis=0)
+    gap = (
+        initial_debt
+        - np.sum(primary_balance * discount, axis=0)
+        - target_debt_to_gdp * gdp[-1] * discount[-1]
+    ) / np.sum(gdp * discount, axis=0)
+    gap = gap * 100
+    return float(gap) if np.ndim(gap) == 0 else gap
+
+
+class CombinedFiscalOutlookModel(RandomStreamMixin):
     """
     Unified federal budget model combining all major components.
     
@@ -57,21 +269,43 @@ class CombinedFiscalOutlookModel:
     - Policy mechanics integration for context-aware projections
     """
     
-    def __init__(self, enable_cache: bool = True):
+    def __init__(
+        self,
+        enable_cache: bool = True,
+        seed: Optional[SeedLike] = None,
+        cache: Optional[ResultCache] = None,
+        cache_dir: Optional[str] = None,
+        sampler: Optional[SamplerLike] = None,
+    ):
         """
         Initialize all sub-models.
         
         Args:
             enable_cache: Enable result caching for repeated projections (default: True)
+            seed: Seed for the model's SeedSequence; each component gets an
+                independent child stream spawned from it (unseeded components
+                if None)
+            cache: Shared ResultCache (a private in-memory cache if None)
+            cache_dir: Directory for a persistent cache tier when no cache is given
+            sampler: Sampler shared by every component ('pseudo', 'antithetic',
+                'lhs', 'sobol' or a Sampler; pseudo-random if None)
         """
-        self.revenue_model = FederalRevenueModel()
-        self.ss_model = SocialSecurityModel()
-        self.medicare_model = MedicareModel()
-        self.medicaid_model = MedicaidModel()
-        self.discretionary_model = DiscretionarySpendingModel()
-        self.interest_model = InterestOnDebtModel()
+        self._init_random_stream(seed, sampler)
+        # Unseeded components draw fresh entropy of their own rather than
+        # children of a random parent, so their cache keys stay shareable
+        child_seeds = self.spawn(6) if seed is not None else [None] * 6
+        revenue_seed, ss_seed, medicare_seed, medicaid_seed, discretionary_seed, interest_seed = child_seeds
+        self.revenue_model = FederalRevenueModel(seed=revenue_seed, sampler=self.sampler)
+        self.ss_model = SocialSecurityModel(seed=ss_seed, sampler=self.sampler)
+        self.medicare_model = MedicareModel(seed=medicare_seed, sampler=self.sampler)
+        self.medicaid_model = MedicaidModel(seed=medicaid_seed, sampler=self.sampler)
+        self.discretionary_model = DiscretionarySpendingModel(seed=discretionary_seed, sampler=self.sampler)
+        self.interest_model = InterestOnDebtModel(seed=interest_seed, sampler=self.sampler)
         self.enable_cache = enable_cache
-        self._cache: Dict[str, Any] = {}  # Manual cache for component results
+        # Content-addressed component results (Performance #2)
+        self._cache = cache if cache is not None else ResultCache(disk_dir=cache_dir)
+        # Components recomputed by the last project_unified_budget call
+        self.last_recomputed: Tuple[str, ...] = ()
         
         # Policy mechanics storage for context-aware projections
         self._policy_mechanics: Optional[Dict[str, Any]] = None
@@ -156,9 +390,7 @@ class CombinedFiscalOutlookModel:
             if spend_mech.get("nondefense_discretionary_change") is not None:
                 self.discretionary_model.assumptions.nondefense_discretionary_2025_billions *= (1 + spend_mech["nondefense_discretionary_change"])
             if spend_mech.get("budget_caps_enabled"):
-                self.discretionary_model.assumptions.inflation_annual = min(
-                    self.discretionary_model.assumptions.inflation_annual, 0.02
-                )
+                self.discretionary_model.assumptions.growth_cap_annual = 0.02
             
             # Apply Medicaid mechanics
             if spend_mech.get("medicaid_expansion"):
@@ -178,11 +410,31 @@ class CombinedFiscalOutlookModel:
                     0.025, self.medicaid_model.assumptions.long_term_care_growth_annual - 0.005
                 )
         
-        # Clear cache since parameters changed
-        self.clear_cache()
+        # No cache invalidation needed: cache keys hash the updated models and mechanics
         logger.info(f"Applied policy mechanics: healthcare_target={self._healthcare_gdp_target}, target_year={self._healthcare_target_year}")
     
-    def _calculate_policy_healthcare_spending(self, years: int, base_gdp_billions: float = 28000.0) -> np.ndarray:
+    def projection_context(self, years: int, **rates: float) -> ProjectionContext:
+        """
+        Shared macro paths for one projection horizon.
+        
+        Components are calibrated against the baseline path and move by a
+        context's deviation from it, so the default context reproduces each
+        component's standalone baseline.
+        
+        Args:
+            years: Number of projection years
+            **rates: Overrides for gdp_growth, wage_growth, inflation or
+                medical_inflation (the projection_context BASELINE_* rates
+                otherwise)
+        
+        Returns:
+            ProjectionContext starting from BASE_GDP_BILLIONS in 2026
+        """
+        return ProjectionContext(years, **rates, base_gdp=BASE_GDP_BILLIONS, start_year=2026)
+    
+    def _calculate_policy_healthcare_spending(
+        self, years: int, context: Optional[ProjectionContext] = None
+    ) -> np.ndarray:
         """
         Calculate healthcare spending based on policy mechanics.
         
@@ -191,25 +443,24 @@ class CombinedFiscalOutlookModel:
         
         Args:
             years: Number of projection years
-            base_gdp_billions: Starting GDP (default ~$28T for 2026)
+            context: Shared macro paths (projection_context(years) if None)
             
         Returns:
             Array of healthcare spending values in billions
         """
+        context = (context or self.projection_context(years)).check_horizon(years)
         # Default healthcare spending model (current baseline)
         # VA (~$300B) + CHIP (~$20B) + ACA subsidies (~$30B) = ~$350B baseline
         base_other_health = 350.0
-        default_growth = 0.055  # 5.5% annual growth (healthcare inflation)
-        
-        # GDP growth assumption for calculating % GDP targets
-        gdp_growth = 0.025  # 2.5% real GDP growth
+        # 5.5% annual growth (healthcare inflation) on the baseline path
+        default_growth = context.shifted("medical_inflation", OTHER_HEALTH_GROWTH)
         
         if self._healthcare_gdp_target is None:
             # No policy target - use default growth
-            return base_other_health * np.power(1 + default_growth, np.arange(years))
+            return base_other_health * growth_index(default_growth, years)
         
-        # Calculate GDP trajectory
-        gdp_trajectory = base_gdp_billions * np.power(1 + gdp_growth, np.arange(years))
+        # GDP trajectory for calculating % GDP targets
+        gdp_trajectory = context.gdp[:years]
         
         # Current total healthcare spending is ~18% of GDP (~$5T total)
         # "Other health" (VA, CHIP, ACA) is ~$350B (~1.25% GDP)
@@ -251,35 +502,43 @@ class CombinedFiscalOutlookModel:
         
         return spending
     
-    def _get_cache_key(self, component: str, **kwargs) -> str:
-        """Generate cache key from component name and parameters."""
-        # Create deterministic hash of parameters using SHA-256
-        # MD5 was replaced with SHA-256 for security (CWE-327)
-        param_str = f"{component}:" + ":".join(f"{k}={v}" for k, v in sorted(kwargs.items()))
-        return hashlib.sha256(param_str.encode()).hexdigest()[:16]
+    def _get_cache_key(self, component: str, model: Any, **kwargs) -> str:
+        """
+        Generate a content-addressed cache key for a component result.
+        
+        Hashes the component name, its parameters, the full state of the
+        sub-model (assumption dataclasses, baselines), the applied policy
+        mechanics and, for seeded models, the seed.
+        """
+        return ResultCache.make_key(
+            component,
+            kwargs,
+            fingerprint(model),
+            self._policy_mechanics,
+            self.seed,
+        )
     
-    def _get_cached(self, component: str, **kwargs) -> Optional[pd.DataFrame]:
-        """Get cached result if available."""
+    def _get_cached(self, component: str, model: Any, **kwargs) -> Optional[pd.DataFrame]:
+        """Get cached result if available (read-only, not copied)."""
         if not self.enable_cache:
             return None
         
-        cache_key = self._get_cache_key(component, **kwargs)
-        if cache_key in self._cache:
-            logger.debug(f"Cache hit for {component} ({cache_key})")
-            return self._cache[cache_key].copy()  # Return copy to prevent mutation
-        
-        logger.debug(f"Cache miss for {component} ({cache_key})")
-        return None
+        cache_key = self._get_cache_key(component, model, **kwargs)
+        result = self._cache.get(cache_key)
+        if result is not None:
+            logger.debug(f"Cache hit for {component} ({cache_key[:16]})")
+        else:
+            logger.debug(f"Cache miss for {component} ({cache_key[:16]})")
+        return result
     
-    def _set_cached(self, component: str, result: pd.DataFrame, **kwargs):
+    def _set_cached(self, component: str, model: Any, result: pd.DataFrame, **kwargs):
         """Store result in cache."""
         if not self.enable_cache:
             return
         
-        cache_key = self._get_cache_key(component, **kwargs)
-        self._cache[cache_key] = result.copy()
-        logger.debug(f"Cached {component} ({cache_key}): {len(result)} records")
-
+        cache_key = self._get_cache_key(component, model, **kwargs)
+        self._cache.put(cache_key, result)
+        logger.debug(f"Cached {component} ({cache_key[:16]}): {len(result)} records")
     
     def project_unified_budget(
         self,
@@ -289,11 +548,22 @@ class CombinedFiscalOutlookModel:
         ss_scenario: str = "baseline",
         healthcare_policy: str = "usgha",
         discretionary_scenario: str = "baseline",
-        interest_scenario: str = "baseline"
+        interest_scenario: str = "baseline",
+        executor: Union[str, Executor] = "serial",
+        max_workers: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        context: Optional[ProjectionContext] = None,
     ) -> pd.DataFrame:
         """
         Project complete federal budget (all revenue and spending).
         
+        The six components are independent until the final combine, so they
+        can fan out to a thread or process pool. Each sub-model draws from its
+        own RNG stream, so every execution mode gives the same result.
+        Components are nodes of BUDGET_GRAPH: only nodes whose inputs or
+        sub-model changed since they were cached are recomputed (see
+        ``last_recomputed``), then the totals are rebuilt from the parts.
+
         Parameters:
             years: Projection years (default 30, range 1-75)
             iterations: Monte Carlo iterations (default 10000, range 100-50000)
@@ -302,12 +572,21 @@ class CombinedFiscalOutlookModel:
             healthcare_policy: 'usgha', 'current_law', etc.
             discretionary_scenario: 'baseline', 'growth', 'reduction'
             interest_scenario: 'baseline', 'rising', 'falling', 'spike'
+            executor: 'serial', 'thread', 'process', or an existing
+                concurrent.futures Executor to run the components on
+            max_workers: Worker count for a pool created for this call
+            chunk_size: Simulate each component at most this many iterations at
+                a time, folding blocks into streaming statistics so memory
+                does not grow with iterations
+            context: Macro paths shared by every component (GDP, wage, CPI and
+                medical inflation); projection_context(years) if None
         
         Returns:
             DataFrame with all revenue and spending components
             
         Raises:
             ValidationError: If parameters are out of valid ranges
+            ValueError: If the context covers fewer than ``years`` years
         """
         # Validate projection parameters (Safety #2)
         validate_projection_params(years, iterations)
@@ -320,55 +599,71 @@ class CombinedFiscalOutlookModel:
         InputValidator.validate_scenario_name(revenue_scenario, valid_revenue, 'revenue_scenario')
         InputValidator.validate_scenario_name(discretionary_scenario, valid_discretionary, 'discretionary_scenario')
         InputValidator.validate_scenario_name(interest_scenario, valid_interest, 'interest_scenario')
+        if not isinstance(executor, Executor):
+            InputValidator.validate_scenario_name(executor, list(EXECUTION_MODES), 'executor')
+        # One context for every component, so they share a single macro path
+        context = (context or self.projection_context(years)).check_horizon(years)
         
-        year_array = np.arange(years) + 2026
+        arguments = {
+            "years": years,
+            "iterations": iterations,
+            "chunk_size": chunk_size,
+            "context": context,
+            "revenue_scenario": revenue_scenario,
+            "ss_scenario": ss_scenario,
+            "discretionary_scenario": discretionary_scenario,
+            "interest_scenario": interest_scenario,
+        }
         
-        # Project each component
-        # Revenue projection using FederalRevenueModel
-        revenue_df = self.revenue_model.project_all_revenues(
-            years=years,
-            gdp_growth=None,  # Uses default 2% baseline
-            wage_growth=None,  # Uses default 3% baseline
-            iterations=iterations,
-            scenario=revenue_scenario  # Pass the scenario parameter
+        # Evaluate the component graph (clean nodes are cache hits and skip the pool)
+        components = self._project_components(
+            {
+                node.name: (node.kernel, getattr(self, node.model_attr), node.bind(arguments))
+                for node in BUDGET_GRAPH
+            },
+            executor,
+            max_workers,
         )
-        # Group by year and calculate mean across iterations
-        revenue_by_year = revenue_df.groupby('year').agg({
-            'total_revenues': 'mean'
-        }).reset_index()
-        revenue_billions = revenue_by_year['total_revenues'].values
-        
-        # Other federal healthcare spending (VA, CHIP, ACA, Public Health, etc.)
-        # Uses policy mechanics if applied, otherwise baseline growth
+        return self._combine_components(components, years, context)
+    
+    def _other_health_spending(self, years: int, context: Optional[ProjectionContext] = None) -> np.ndarray:
+        """
+        Other federal healthcare spending (VA, CHIP, ACA, Public Health, etc.).
+        
+        Uses policy mechanics if applied, otherwise baseline growth.
+        """
         if self._policy_mechanics is not None:
             # Use policy-driven healthcare spending trajectory
-            healthcare_spending = self._calculate_policy_healthcare_spending(years)
             logger.info(f"Using policy-driven healthcare spending (target: {self._healthcare_gdp_target}% GDP)")
-        else:
-            # Baseline ~$350B/year (2025), grows with healthcare inflation
-            # Separate from Medicare/Medicaid which are modeled explicitly
-            base_other_health = 350  # Billions: VA (~$300B) + CHIP (~$20B) + ACA subsidies (~$30B)
-            other_health_growth = 0.055  # 5.5% annual growth (healthcare inflation)
-            healthcare_spending = base_other_health * np.power(1 + other_health_growth, np.arange(years))
-        
-        # Social Security
-        ss_df = self._get_ss_spending(years, iterations, ss_scenario)
-        
-        # Medicare/Medicaid
-        medicare_df = self._get_medicare_spending(years, iterations)
-        medicaid_df = self._get_medicaid_spending(years, iterations)
-        
-        # Discretionary
-        discret_df = self.discretionary_model.project_all_discretionary(
-            years, iterations,
-            defense_scenario=discretionary_scenario,
-            nondefense_scenario=discretionary_scenario
-        )
+            return self._calculate_policy_healthcare_spending(years, context)
+        context = (context or self.projection_context(years)).check_horizon(years)
+        # Baseline ~$350B/year (2025), grows with healthcare inflation
+        # Separate from Medicare/Medicaid which are modeled explicitly
+        base_other_health = 350  # Billions: VA (~$300B) + CHIP (~$20B) + ACA subsidies (~$30B)
+        other_health_growth = context.shifted("medical_inflation", OTHER_HEALTH_GROWTH)  # 5.5% at baseline
+        return base_other_health * growth_index(other_health_growth, years)
+    
+    def _combine_components(
+        self, components: Dict[str, pd.DataFrame], years: int, context: Optional[ProjectionContext] = None
+    ) -> pd.DataFrame:
+        """
+        Combine component results into the unified budget with derived totals.
         
-        # Interest
-        interest_df = self.interest_model.project_interest_and_debt(
-            years, iterations, interest_rate_scenario=interest_scenario
-        )
+        Only reads the component frames, so it is cheap to rerun after any
+        subset of components has been recomputed.
+        """
+        year_array = np.arange(years) + 2026
+        
+        # Revenue (billions)
+        revenue_billions = components["revenue"]['total_revenues'].values
+        
+        healthcare_spending = self._other_health_spending(years, context)
+        
+        ss_df = components["ss_spending"]
+        medicare_df = components["medicare_spending"]
+        medicaid_df = components["medicaid_spending"]
+        discret_df = components["discretionary"]
+        interest_df = components["interest"]
         
         # Helper function to safely extract spending arrays
         def _safe_extract_spending(df, column, years, default_value=0):
@@ -461,94 +756,318 @@ class CombinedFiscalOutlookModel:
         self,
         years: int = 75,
         target_debt_to_gdp: float = 0.60,
-        gdp_growth: float = 0.025
-    ) -> float:
+        gdp_growth: float = 0.025,
+        iterations: int = 1000,
+        return_distribution: bool = False,
+    ) -> Union[float, Dict[str, Any]]:
         """
         Calculate fiscal gap (CBO methodology).
         
         Fiscal gap = sustained policy adjustment needed to stabilize debt/GDP ratio
         at target level over projection period.
         
+        Solved in closed form with fiscal_gap() on cached per-iteration
+        primary-balance and interest-rate paths (one set per GDP growth rate,
+        which drives revenue and the GDP denominator alike), so changing the
+        target never re-simulates the budget. The point estimate uses the
+        mean paths; the distribution solves every iteration at once.
+        
+        Args:
+            years: Projection horizon (default 75)
+            target_debt_to_gdp: Debt-to-GDP ratio to reach in the final year
+            gdp_growth: Nominal GDP growth of the shared projection context
+            iterations: Monte Carlo iterations behind the cached paths
+            return_distribution: If True, return a dict with the point estimate,
+                summary statistics and the per-iteration gaps
+        
         Returns:
-            Fiscal gap as percentage of GDP (positive = revenue increase needed)
+            Fiscal gap as percentage of GDP (positive = revenue increase needed),
+            or a dict when return_distribution is True
         """
-        # Simplified: requires full 75-year projection
-        # For now, return placeholder
-        return 1.5  # Placeholder: 1.5% of GDP gap
+        validate_projection_params(years, iterations)
+        paths = self._fiscal_gap_paths(years, iterations, gdp_growth)
+        gdp = self.projection_context(years, gdp_growth=gdp_growth).gdp
+        initial_debt = self.interest_model.assumptions.public_debt_2025_billions
+        
+        point = fiscal_gap(
+            paths["primary_balance"].mean(axis=1),
+            gdp,
+            paths["interest_rate"].mean(axis=1),
+            initial_debt,
+            target_debt_to_gdp,
+        )
+        if not return_distribution:
+            return point
+        
+        gaps = fiscal_gap(paths["primary_balance"], gdp, paths["interest_rate"], initial_debt, target_debt_to_gdp)
+        p10, p50, p90 = np.percentile(gaps, [10, 50, 90])
+        return {
+            "fiscal_gap_pct_gdp": point,
+            "mean": float(gaps.mean()),
+            "std": float(gaps.std()),
+            "p10": float(p10),
+            "p50": float(p50),
+            "p90": float(p90),
+            "distribution": gaps,
+        }
     
-    def _get_ss_spending(self, years: int, iterations: int, scenario: str) -> pd.DataFrame:
-        """Get Social Security spending projections with caching."""
-        # Check cache first (Performance #2)
-        cached = self._get_cached("ss_spending", years=years, iterations=iterations, scenario=scenario)
-        if cached is not None:
-            return cached
+    def _fiscal_gap_paths(self, years: int, iterations: int, gdp_growth: float) -> Dict[str, np.ndarray]:
+        """
+        Baseline per-iteration primary balance and interest rate paths.
         
-        # Compute if not cached
-        ss_proj = self.ss_model.project_trust_funds(years, iterations)
+        Runs every component once in array mode against
+        projection_context(years, gdp_growth=gdp_growth) and caches the
+        result, so repeated gap calculations only redo the present-value
+        arithmetic.
         
-        # Group by year and calculate mean benefit payments across iterations
-        yearly_spending = ss_proj.groupby('year').agg({
-            'benefit_payments_billions': 'mean'
-        }).reset_index()
+        Returns:
+            Dictionary of (years, iterations) arrays: "primary_balance"
+            (billions) and "interest_rate" (decimal)
+        """
+        models = self._sub_models()
+        key = {"years": years, "iterations": iterations, "gdp_growth": gdp_growth}
+        cached = self._get_cached("fiscal_gap_paths", models, **key)
+        if cached is not None:
+            return {
+                column: cached[column].to_numpy().reshape(years, iterations)
+                for column in ("primary_balance", "interest_rate")
+            }
         
-        result = pd.DataFrame({
-            "year": yearly_spending["year"],
-            "spending": yearly_spending["benefit_payments_billions"],
-        })
+        context = self.projection_context(years, gdp_growth=gdp_growth)
+        components = self._component_paths(years, iterations, context=context)
+        paths = {
+            "primary_balance": components["total_revenue"] - self._non_interest_spending(components),
+            "interest_rate": self.interest_model.project_interest_expense(
+                years, iterations, context=context)["interest_rate"].T,
+        }
+        self._set_cached(
+            "fiscal_gap_paths",
+            models,
+            pd.DataFrame({column: values.ravel() for column, values in paths.items()}),
+            **key,
+        )
+        return paths
+    
+    def _sub_models(self) -> Tuple[Any, ...]:
+        """All component sub-models, for cache keys that depend on every one."""
+        return (
+            self.revenue_model, self.ss_model, self.medicare_model,
+            self.medicaid_model, self.discretionary_model, self.interest_model,
+        )
+    
+    def _component_paths(
+        self,
+        years: int,
+        iterations: int,
+        revenue_scenario: str = "baseline",
+        discretionary_scenario: str = "baseline",
+        context: Optional[ProjectionContext] = None,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Per-iteration revenue and non-interest spending of every component.
         
-        # Cache the result
-        self._set_cached("ss_spending", result, years=years, iterations=iterations, scenario=scenario)
-        return result
+        Each sub-model runs once in array mode, drawing from its own stream,
+        against one shared context (projection_context(years) if None).
+        
+        Returns:
+            Dictionary of (years, iterations) arrays in billions, keyed like the
+            unified budget columns ("healthcare_spending" is (years, 1))
+        """
+        context = (context or self.projection_context(years)).check_horizon(years)
+        revenue = self.revenue_model.project_all_revenues(
+            years=years, iterations=iterations, scenario=revenue_scenario, return_arrays=True, context=context
+        )["total_revenues"]
+        social_security = self.ss_model.project_trust_funds(
+            years, iterations, return_arrays=True, context=context
+        )["benefit_payments_billions"]
+        medicare = self.medicare_model.project_all_parts(
+            years, iterations, return_arrays=True, context=context
+        )["total_spending"] / 1e9  # Dollars to billions
+        medicaid = self.medicaid_model.project_spending(
+            years, iterations, return_arrays=True, context=context
+        )["total_spending"] / 1e3  # Thousands to billions
+        # Discretionary paths are (iterations, years)
+        discretionary = (
+            self.discretionary_model.project_defense(
+                years, iterations, discretionary_scenario, context)["defense_billions"]
+            + self.discretionary_model.project_nondefense_discretionary(
+                years, iterations, discretionary_scenario, context)["nondefense_billions"]
+        ).T
+        return {
+            "total_revenue": revenue,
+            "healthcare_spending": self._other_health_spending(years, context)[:, np.newaxis],
+            "social_security_spending": social_security,
+            "medicare_spending": medicare,
+            "medicaid_spending": medicaid,
+            "discretionary_spending": discretionary,
+        }
     
-    def _get_medicare_spending(self, years: int, iterations: int) -> pd.DataFrame:
-        """Get Medicare spending projections with caching."""
-        # Check cache first (Performance #2)
-        cached = self._get_cached("medicare_spending", years=years, iterations=iterations)
+    @staticmethod
+    def _non_interest_spending(components: Dict[str, np.ndarray]) -> np.ndarray:
+        """Sum of every spending component before interest."""
+        return (
+            components["healthcare_spending"]
+            + components["social_security_spending"]
+            + components["medicare_spending"]
+            + components["medicaid_spending"]
+            + components["discretionary_spending"]
+        )
+    
+    def project_coupled_budget(
+        self,
+        years: int = 30,
+        iterations: int = 10000,
+        revenue_scenario: str = "baseline",
+        discretionary_scenario: str = "baseline",
+        interest_scenario: str = "baseline",
+        gdp_growth: float = 0.025,
+        debt_drag_factor: float = 0.0,
+    ) -> pd.DataFrame:
+        """
+        Project the unified budget with debt, interest and GDP solved together.
+        
+        project_unified_budget takes interest from InterestOnDebtModel, whose
+        debt grows by a fixed assumed primary deficit. Here every iteration's
+        primary deficit comes from its own component revenue and spending, and
+        debt and interest are stepped forward from it year by year (all
+        iterations at once), so interest, debt and deficits are consistent.
+        With a debt_drag_factor, debt/GDP above 60% also slows GDP growth and
+        the revenue that follows it.
+        
+        Parameters:
+            years: Projection years (default 30, range 1-75)
+            iterations: Monte Carlo iterations (default 10000, range 100-50000)
+            revenue_scenario: 'baseline', 'recession', 'strong_growth', 'demographic_challenge'
+            discretionary_scenario: 'baseline', 'growth', 'reduction'
+            interest_scenario: 'baseline', 'rising', 'falling', 'spike'
+            gdp_growth: Baseline nominal GDP growth
+            debt_drag_factor: Growth reduction per unit of debt/GDP above 60%
+                (default 0, no feedback)
+        
+        Returns:
+            DataFrame with the project_unified_budget columns (iteration
+            means) plus gdp, debt_billions, debt_p10, debt_p90 and debt_to_gdp
+            
+        Raises:
+            ValidationError: If parameters are out of valid ranges
+        """
+        validate_projection_params(years, iterations)
+        InputValidator.validate_scenario_name(
+            revenue_scenario, ['baseline', 'recession', 'strong_growth', 'demographic_challenge'], 'revenue_scenario')
+        InputValidator.validate_scenario_name(
+            discretionary_scenario, ['baseline', 'growth', 'reduction'], 'discretionary_scenario')
+        InputValidator.validate_scenario_name(
+            interest_scenario, ['baseline', 'rising', 'falling', 'spike'], 'interest_scenario')
+        
+        arguments = {
+            "years": years,
+            "iterations": iterations,
+            "revenue_scenario": revenue_scenario,
+            "discretionary_scenario": discretionary_scenario,
+            "interest_scenario": interest_scenario,
+            "gdp_growth": gdp_growth,
+            "debt_drag_factor": debt_drag_factor,
+        }
+        models = self._sub_models()
+        cached = self._get_cached("coupled_budget", models, **arguments)
         if cached is not None:
-            return cached
-        
-        # Compute if not cached (using optimized vectorized projection - Performance #1)
-        medicare_proj = self.medicare_model.project_all_parts(years, iterations)
-        
-        # Group by year and calculate mean across iterations
-        yearly_spending = medicare_proj.groupby('year').agg({
-            'part_a_spending': 'mean',
-            'part_b_spending': 'mean',
-            'part_d_spending': 'mean',
-            'total_spending': 'mean'
-        }).reset_index()
-        
-        # Convert from dollars to billions
-        result = pd.DataFrame({
-            "year": yearly_spending["year"],
-            "spending": yearly_spending["total_spending"] / 1e9,
+            # Cached columns are shared and read-only; callers get their own frame
+            return cached.copy()
+        
+        context = self.projection_context(years, gdp_growth=gdp_growth)
+        components = self._component_paths(years, iterations, revenue_scenario, discretionary_scenario, context)
+        non_interest_spending = self._non_interest_spending(components)
+        coupled = self.interest_model.project_coupled_debt(
+            components["total_revenue"],
+            non_interest_spending,
+            context.gdp,
+            interest_rate_scenario=interest_scenario,
+            debt_drag_factor=debt_drag_factor,
+            context=context,
+        )
+        
+        means = {name: values.mean(axis=1) for name, values in components.items()}
+        interest = coupled["interest_billions"].mean(axis=1)
+        revenue = coupled["revenue"].mean(axis=1)
+        debt_p10, debt_p90 = np.percentile(coupled["debt_billions"], [10, 90], axis=1)
+        unified = pd.DataFrame({
+            "year": np.arange(years) + 2026,
+            "total_revenue": revenue,
+            "healthcare_spending": means["healthcare_spending"],
+            "social_security_spending": means["social_security_spending"],
+            "medicare_spending": means["medicare_spending"],
+            "medicaid_spending": means["medicaid_spending"],
+            "discretionary_spending": means["discretionary_spending"],
+            "interest_spending": interest,
         })
+        mandatory_cols = ["social_security_spending", "medicare_spending", "medicaid_spending", "healthcare_spending"]
+        unified["mandatory_spending"] = unified[mandatory_cols].sum(axis=1)
+        unified["total_spending"] = (
+            unified["mandatory_spending"] + unified["discretionary_spending"] + unified["interest_spending"]
+        )
+        unified["deficit_surplus"] = unified["total_revenue"] - unified["total_spending"]
+        unified["primary_deficit"] = unified["total_revenue"] - (unified["total_spending"] - unified["interest_spending"])
+        unified["gdp"] = coupled["gdp"].mean(axis=1)
+        unified["debt_billions"] = coupled["debt_billions"].mean(axis=1)
+        unified["debt_p10"] = debt_p10
+        unified["debt_p90"] = debt_p90
+        unified["debt_to_gdp"] = (coupled["debt_billions"] / coupled["gdp"]).mean(axis=1)
         
-        # Cache the result
-        self._set_cached("medicare_spending", result, years=years, iterations=iterations)
-        return result
+        self._set_cached("coupled_budget", models, unified, **arguments)
+        return unified
     
-    def _get_medicaid_spending(self, years: int, iterations: int) -> pd.DataFrame:
-        """Get Medicaid spending projections with caching."""
-        # Check cache first (Performance #2)
-        cached = self._get_cached("medicaid_spending", years=years, iterations=iterations)
-        if cached is not None:
-            return cached
+    def _project_components(
+        self,
+        tasks: Dict[str, Tuple[Callable[..., pd.DataFrame], Any, Dict[str, Any]]],
+        executor: Union[str, Executor],
+        max_workers: Optional[int] = None,
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Run independent component projections, optionally on a worker pool.
+        
+        Args:
+            tasks: Component name -> (kernel, sub-model, kwargs)
+            executor: "serial", "thread", "process", or an existing Executor
+            max_workers: Pool size when a pool is created here (default: one per task)
         
-        # Compute if not cached
-        medicaid_proj = self.medicaid_model.project_spending(years, iterations)
+        Returns:
+            Component name -> per-year DataFrame
+        """
+        results: Dict[str, pd.DataFrame] = {}
+        pending = {}
+        for name, (kernel, model, kwargs) in tasks.items():
+            cached = self._get_cached(name, model, **kwargs)
+            if cached is not None:
+                results[name] = cached
+            else:
+                pending[name] = (kernel, model, kwargs)
         
-        # Group by year and calculate mean across iterations
-        yearly_spending = medicaid_proj.groupby('year').agg({
-            'total_spending': 'mean'
-        }).reset_index()
+        self.last_recomputed = tuple(pending)
+        if not pending:
+            return results
         
-        # Convert from thousands to billions
-        result = pd.DataFrame({
-            "year": yearly_spending["year"],
-            "spending": yearly_spending["total_spending"] / 1e3,
-        })
+        if executor == "serial":
+            for name, (kernel, model, kwargs) in pending.items():
+                results[name] = kernel(model, **kwargs)
+        else:
+            if isinstance(executor, Executor):
+                pool, owns_pool = executor, False
+            else:
+                pool_class = ProcessPoolExecutor if executor == "process" else ThreadPoolExecutor
+                pool, owns_pool = pool_class(max_workers=max_workers or len(pending)), True
+            try:
+                futures = {
+                    name: pool.submit(_run_component, kernel, model, kwargs)
+                    for name, (kernel, model, kwargs) in pending.items()
+                }
+                for name, future in futures.items():
+                    results[name], rng_state = future.result()
+                    # Resume the component's stream where the worker left it
+                    pending[name][1].rng.bit_generator.state = rng_state
+            finally:
+                if owns_pool:
+                    pool.shutdown()
         
-        # Cache the result
-        self._set_cached("medicaid_spending", result, years=years, iterations=iterations)
-        return result
+        for name, (kernel, model, kwargs) in pending.items():
+            self._set_cached(name, model, results[name], **kwargs)
+        return results
@@ -7,7 +7,7 @@ matrices useful for policymaker reports and Excel exports.
 
 from typing import List, Dict, Tuple
 import pandas as pd
-from core.simulation import simulate_healthcare_years
+from core.simulation import simulate_healthcare_batch
 from core.healthcare import HealthcarePolicyModel
 
 
@@ -67,8 +67,8 @@ def compare_and_summarize(policies: List[HealthcarePolicyModel], base_gdp: float
     time_series: Dict[str, pd.DataFrame] = {}
     summaries = []
 
-    for p in policies:
-        df = simulate_healthcare_years(p, base_gdp=base_gdp, initial_debt=initial_debt, years=years, population=population, gdp_growth=gdp_growth, start_year=start_year)
+    frames = simulate_healthcare_batch(policies, base_gdp=base_gdp, initial_debt=initial_debt, years=years, population=population, gdp_growth=gdp_growth, start_year=start_year, stacked=False)
+    for p, df in zip(policies, frames):
         time_series[p.policy_name] = df
         summ = summarize_timeseries(df, population)
         summ.insert(0, 'Policy', p.policy_name)
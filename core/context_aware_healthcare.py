@@ -12,6 +12,32 @@ Provides mechanism-based calculators for:
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 import math
+import warnings
+
+
+# Model constants shared by the calculators below and the batched
+# simulation kernel in core.simulation
+WAGE_SHARE_GDP = 0.53  # Payroll tax base as a share of GDP
+PREMIUM_CONVERSION_RATE = 0.95  # Share of premiums successfully converted
+MECHANICS_RAMP_YEARS = 8  # Years for premium conversion and efficiency gains to phase in
+SAVINGS_ATTRIBUTION = (0.40, 0.25, 0.20, 0.15)  # Admin, drug pricing, preventive, other shares of savings
+
+# Circuit breaker messages (pct: current % GDP; threshold and action from the breaker)
+SPENDING_CAP_MESSAGE = "Spending {pct:.1f}% GDP exceeds {threshold}% cap - {action}"
+SURPLUS_TRIGGER_MESSAGE = "Surplus {pct:.1f}% GDP exceeds {threshold}% - {action}"
+
+
+def linear_ramp(years_since_start: float, ramp_years: int = MECHANICS_RAMP_YEARS) -> float:
+    """Phase-in fraction rising linearly to 1 over ramp_years."""
+    return min(years_since_start / ramp_years, 1.0) if ramp_years > 0 else 1.0
+
+
+def sigmoid_ramp(years_since_start: float, ramp_years: int = MECHANICS_RAMP_YEARS) -> float:
+    """Phase-in fraction on an S-curve: slow start, rapid middle, slow end."""
+    if ramp_years == 0:
+        return 1.0
+    x = (years_since_start / ramp_years) * 12 - 6  # Map to [-6, 6]
+    return 1 / (1 + math.exp(-x))
 
 
 @dataclass
@@ -90,7 +116,7 @@ class MechanismBasedRevenueCalculator:
         rate: float,
         gdp: float,
         employment_rate: float = 0.63,
-        wage_share_gdp: float = 0.53
+        wage_share_gdp: float = WAGE_SHARE_GDP
     ) -> float:
         """
         Calculate payroll tax revenue.
@@ -128,9 +154,9 @@ class MechanismBasedRevenueCalculator:
     def calculate_converted_premiums(
         pct_gdp: float,
         gdp: float,
-        conversion_rate: float = 0.95,
+        conversion_rate: float = PREMIUM_CONVERSION_RATE,
         year: int = 0,
-        ramp_years: int = 8
+        ramp_years: int = MECHANICS_RAMP_YEARS
     ) -> float:
         """
         Calculate converted employer/employee premiums.
@@ -146,15 +172,14 @@ class MechanismBasedRevenueCalculator:
             Converted premium revenue in billions
         """
         # Ramp up conversion over time
-        progress = min(year / ramp_years, 1.0) if ramp_years > 0 else 1.0
-        return pct_gdp * gdp * conversion_rate * progress
+        return pct_gdp * gdp * conversion_rate * linear_ramp(year, ramp_years)
     
     @staticmethod
     def calculate_efficiency_gains(
         pct_gdp: float,
         gdp: float,
         year: int = 0,
-        ramp_years: int = 8,
+        ramp_years: int = MECHANICS_RAMP_YEARS,
         curve: str = "sigmoid"
     ) -> float:
         """
@@ -170,14 +195,10 @@ class MechanismBasedRevenueCalculator:
         Returns:
             Efficiency gain funding in billions
         """
-        if ramp_years == 0:
-            progress = 1.0
-        elif curve == "sigmoid":
-            # S-curve: slow start, rapid middle, slow end
-            x = (year / ramp_years) * 12 - 6  # Map to [-6, 6]
-            progress = 1 / (1 + math.exp(-x))
+        if curve == "sigmoid":
+            progress = sigmoid_ramp(year, ramp_years)
         else:  # linear
-            progress = min(year / ramp_years, 1.0)
+            progress = linear_ramp(year, ramp_years)
         
         return pct_gdp * gdp * progress
     
@@ -285,7 +306,7 @@ class MechanismBasedSpendingCalculator:
         """
         # Admin costs are ~25-30% of US healthcare spending
         admin_share = 0.275
-        progress = min(year / ramp_years, 1.0) if ramp_years > 0 else 1.0
+        progress = linear_ramp(year, ramp_years)
         
         return baseline_spending * admin_share * admin_reduction_pct * progress
     
@@ -310,7 +331,7 @@ class MechanismBasedSpendingCalculator:
         """
         # Drugs are ~10-12% of US healthcare spending
         drug_share = 0.11
-        progress = min(year / ramp_years, 1.0) if ramp_years > 0 else 1.0
+        progress = linear_ramp(year, ramp_years)
         
         return baseline_spending * drug_share * pricing_reduction_pct * progress
     
@@ -334,7 +355,7 @@ class MechanismBasedSpendingCalculator:
             Savings in billions
         """
         # Preventive care saves on treatment costs (slow accumulation)
-        progress = min(year / ramp_years, 1.0) if ramp_years > 0 else 1.0
+        progress = linear_ramp(year, ramp_years)
         
         return baseline_spending * prevention_effectiveness * progress
     
@@ -381,10 +402,11 @@ class MechanismBasedSpendingCalculator:
         total_savings = breakdown.baseline_spending - target_spending
         
         # Attribute savings to mechanisms (rough approximation)
-        breakdown.administrative_savings = total_savings * 0.40  # 40% from admin
-        breakdown.drug_pricing_savings = total_savings * 0.25    # 25% from drug pricing
-        breakdown.preventive_care_savings = total_savings * 0.20  # 20% from prevention
-        breakdown.other_savings = total_savings * 0.15           # 15% other efficiencies
+        admin_share, drug_share, preventive_share, other_share = SAVINGS_ATTRIBUTION
+        breakdown.administrative_savings = total_savings * admin_share
+        breakdown.drug_pricing_savings = total_savings * drug_share
+        breakdown.preventive_care_savings = total_savings * preventive_share
+        breakdown.other_savings = total_savings * other_share
         
         breakdown.net_spending = target_spending
         
@@ -449,7 +471,9 @@ class CircuitBreakerEnforcer:
         for breaker in circuit_breakers:
             if breaker.trigger_type == "spending_cap":
                 if spending_pct_gdp > breaker.threshold_value:
-                    return True, f"Spending {spending_pct_gdp:.1f}% GDP exceeds {breaker.threshold_value}% cap - {breaker.action}"
+                    return True, SPENDING_CAP_MESSAGE.format(
+                        pct=spending_pct_gdp, threshold=breaker.threshold_value, action=breaker.action
+                    )
         
         return False, None
     
@@ -471,7 +495,9 @@ class CircuitBreakerEnforcer:
         for breaker in circuit_breakers:
             if breaker.trigger_type == "surplus_trigger":
                 if surplus_pct_gdp > breaker.threshold_value:
-                    return True, f"Surplus {surplus_pct_gdp:.1f}% GDP exceeds {breaker.threshold_value}% - {breaker.action}"
+                    return True, SURPLUS_TRIGGER_MESSAGE.format(
+                        pct=surplus_pct_gdp, threshold=breaker.threshold_value, action=breaker.action
+                    )
         
         return False, None
 
@@ -484,27 +510,36 @@ def calculate_mechanism_based_outcomes(
     baseline_spending_pct_gdp: float = 0.185
 ) -> Dict:
     """
-    Calculate all outcomes from policy mechanics.
-    
+    Calculate all outcomes from policy mechanics for a single year.
+
+    Deprecated: simulations compile the mechanics once with
+    compile_mechanics() and evaluate every year in one pass
+    (core.simulation.simulate_healthcare_years / simulate_healthcare_batch).
+
     Args:
         mechanics: PolicyMechanics object
         gdp: Current GDP
         year: Current year
         start_year: Year policy started
         baseline_spending_pct_gdp: Baseline healthcare spending as % GDP
-    
+
     Returns:
         Dictionary with revenue, spending, surplus, and circuit breaker status
     """
+    warnings.warn(
+        "calculate_mechanism_based_outcomes() is deprecated; use compile_mechanics() with "
+        "simulate_healthcare_years() or simulate_healthcare_batch()",
+        DeprecationWarning,
+        stacklevel=2,
+    )
     results = {}
-    
+
     # Calculate revenue
-    revenue_calc = MechanismBasedRevenueCalculator()
-    revenue_breakdown = revenue_calc.calculate_from_mechanics(
+    revenue_breakdown = MechanismBasedRevenueCalculator.calculate_from_mechanics(
         mechanics, gdp, year, start_year
     )
     results['revenue'] = revenue_breakdown
-    
+
     # Calculate spending
     if mechanics and mechanics.target_spending_pct_gdp and mechanics.target_spending_year:
         spending_breakdown = MechanismBasedSpendingCalculator.calculate_from_target(
@@ -521,26 +556,25 @@ def calculate_mechanism_based_outcomes(
             baseline_spending=baseline_spending_pct_gdp * gdp,
             net_spending=baseline_spending_pct_gdp * gdp
         )
-    
+
     results['spending'] = spending_breakdown
-    
+
     # Calculate surplus
     surplus = revenue_breakdown.total - spending_breakdown.net_spending
     results['surplus'] = surplus
-    
+
     # Allocate surplus
     if mechanics and mechanics.surplus_allocation:
-        surplus_breakdown = SurplusAllocationEngine.allocate_surplus(
+        results['surplus_allocation'] = SurplusAllocationEngine.allocate_surplus(
             surplus, mechanics.surplus_allocation
         )
-        results['surplus_allocation'] = surplus_breakdown
     else:
         results['surplus_allocation'] = None
-    
+
     # Check circuit breakers
     spending_pct = (spending_breakdown.net_spending / gdp) * 100
     surplus_pct = (surplus / gdp) * 100
-    
+
     circuit_breakers = []
     if mechanics and mechanics.circuit_breakers:
         cap_triggered, cap_msg = CircuitBreakerEnforcer.check_spending_cap(
@@ -548,13 +582,96 @@ def calculate_mechanism_based_outcomes(
         )
         if cap_triggered:
             circuit_breakers.append(('spending_cap', cap_msg))
-        
+
         surplus_triggered, surplus_msg = CircuitBreakerEnforcer.check_surplus_trigger(
             surplus_pct, mechanics.circuit_breakers, year
         )
         if surplus_triggered:
             circuit_breakers.append(('surplus_trigger', surplus_msg))
-    
+
     results['circuit_breakers'] = circuit_breakers
-    
+
     return results
+
+
+@dataclass(frozen=True)
+class CompiledMechanics:
+    """
+    PolicyMechanics reduced to the coefficients the simulation evaluates.
+
+    Built once per policy by compile_mechanics(), so a multi-year (or
+    multi-policy) simulation does not walk the mechanics objects every year.
+    Percentages are stored as fractions, exactly as the calculators above
+    derive them.
+    """
+    payroll_rate: float = 0.0
+    redirected_pct_gdp: float = 0.0
+    converted_pct_gdp: float = 0.0
+    efficiency_pct_gdp: float = 0.0
+    other_pct_gdp: Tuple[float, ...] = ()
+    target_pct_gdp: Optional[float] = None
+    target_year: Optional[int] = None
+    surplus_allocation: Optional[Tuple[float, float, float, float]] = None  # contingency, debt, infrastructure, dividends
+    spending_caps: Tuple[Tuple[float, str], ...] = ()  # (threshold % GDP, action), in policy order
+    surplus_triggers: Tuple[Tuple[float, str], ...] = ()
+    innovation_fund: Optional[Tuple[float, float]] = None  # (funding fraction of savings, annual cap % of surplus)
+
+
+def compile_mechanics(mechanics) -> CompiledMechanics:
+    """
+    Compile a PolicyMechanics object into CompiledMechanics.
+
+    Follows MechanismBasedRevenueCalculator.calculate_from_mechanics(): a
+    later funding mechanism of the same type replaces an earlier one, other
+    sources add up, and circuit breakers keep their order.
+
+    Args:
+        mechanics: PolicyMechanics object (or None)
+
+    Returns:
+        CompiledMechanics
+    """
+    if not mechanics:
+        return CompiledMechanics()
+
+    funding = {"payroll_rate": 0.0, "redirected_pct_gdp": 0.0, "converted_pct_gdp": 0.0, "efficiency_pct_gdp": 0.0}
+    other_pct_gdp = []
+    for mechanism in mechanics.funding_mechanisms or []:
+        if mechanism.source_type == "payroll_tax":
+            if mechanism.percentage_rate:
+                funding["payroll_rate"] = mechanism.percentage_rate / 100
+        elif mechanism.source_type in ("redirected_federal", "converted_premiums", "efficiency_gains"):
+            if mechanism.percentage_gdp:
+                key = {"redirected_federal": "redirected_pct_gdp",
+                       "converted_premiums": "converted_pct_gdp",
+                       "efficiency_gains": "efficiency_pct_gdp"}[mechanism.source_type]
+                funding[key] = mechanism.percentage_gdp / 100
+        elif mechanism.percentage_gdp:
+            other_pct_gdp.append(mechanism.percentage_gdp / 100)
+
+    has_target = bool(mechanics.target_spending_pct_gdp and mechanics.target_spending_year)
+    rules = mechanics.surplus_allocation
+    breakers = mechanics.circuit_breakers or []
+    fund = mechanics.innovation_fund
+
+    return CompiledMechanics(
+        **funding,
+        other_pct_gdp=tuple(other_pct_gdp),
+        target_pct_gdp=mechanics.target_spending_pct_gdp / 100 if has_target else None,
+        target_year=mechanics.target_spending_year if has_target else None,
+        surplus_allocation=(
+            rules.contingency_reserve_pct / 100,
+            rules.debt_reduction_pct / 100,
+            rules.infrastructure_pct / 100,
+            rules.dividends_pct / 100,
+        ) if rules else None,
+        spending_caps=tuple(
+            (breaker.threshold_value, breaker.action) for breaker in breakers
+            if breaker.trigger_type == "spending_cap"
+        ),
+        surplus_triggers=tuple(
+            (breaker.threshold_value, breaker.action) for breaker in breakers
+            if breaker.trigger_type == "surplus_trigger"
+        ),
+        innovation_fund=(fund.funding_min_pct / 100, fund.annual_cap_pct) if fund else None,
+    )
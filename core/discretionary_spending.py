@@ -15,6 +15,11 @@ import logging
 from dataclasses import dataclass
 from typing import Dict, Tuple, List, Optional
 
+from core.projection_context import ProjectionContext, growth_index
+from core.online_stats import AdaptiveSampling, ConvergenceMonitor, final_year_mean, summarize_paths
+from core.random_streams import RandomStreamMixin, SeedLike
+from core.samplers import Draw, SamplerLike
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,6 +35,7 @@ class DiscretionaryAssumptions:
     inflation_annual: float = 0.025  # 2.5% inflation baseline
     population_growth_annual: float = 0.007  # 0.7% population growth
     gdp_growth_annual: float = 0.025  # 2.5% GDP growth baseline
+    growth_cap_annual: Optional[float] = None  # Cap on inflation-only growth (budget caps)
     
     # Defense-specific
     force_structure_multiplier: float = 1.0  # 1.0 = current, 1.2 = 20% expansion
@@ -43,127 +49,187 @@ class DiscretionaryAssumptions:
     ndd_other_pct: float = 0.55  # 55% - Other (justice, agencies, etc.)
 
 
-class DiscretionarySpendingModel:
+class DiscretionarySpendingModel(RandomStreamMixin):
     """Projects federal discretionary spending under different scenarios."""
     
-    def __init__(self, assumptions: DiscretionaryAssumptions = None, seed: Optional[int] = None):
+    def __init__(
+        self,
+        assumptions: DiscretionaryAssumptions = None,
+        seed: Optional[SeedLike] = None,
+        sampler: Optional[SamplerLike] = None,
+    ):
         self.assumptions = assumptions or DiscretionaryAssumptions()
-        self.seed = seed
-        
+        self._init_random_stream(seed, sampler)
         if seed is not None:
-            np.random.seed(seed)
             logger.info(f"Random seed set to {seed} for reproducibility")
     
+    def _compound_paths(self, base: float, growth_rate: float, years: int, iterations: int) -> np.ndarray:
+        """
+        Compound a base amount along stochastic growth paths.
+        
+        Each iteration draws one growth rate (±1% around growth_rate) and
+        grows the base at that rate for every year.
+        
+        Returns:
+            Array of shape (iterations, years)
+        """
+        (noise,) = self.draw_block(Draw((iterations,), 0.0, 0.01))
+        stochastic_rate = growth_rate + noise
+        return base * growth_index(stochastic_rate, years + 1)[1:].T
+    
+    def _path_result(
+        self,
+        name: str,
+        base: float,
+        growth_rate: float,
+        years: int,
+        iterations: int,
+        chunk_size: Optional[int] = None,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Compound paths and their per-year statistics, in blocks if chunk_size is set.
+        
+        Streaming drops the (iterations, years) ``name`` array; the median and
+        percentiles become sketch estimates.
+        """
+        if chunk_size is not None and chunk_size < iterations:
+            # Summaries expect (years, n) blocks; paths are (n, years)
+            summary = summarize_paths(
+                lambda n: {name: self._compound_paths(base, growth_rate, years, n).T},
+                iterations,
+                chunk_size,
+            )[name]
+            median, p10, p90 = summary.percentile([50, 10, 90])
+            return {"mean": summary.mean, "median": median, "p10": p10, "p90": p90}
+        projections = self._compound_paths(base, growth_rate, years, iterations)
+        return {
+            name: projections,
+            "mean": projections.mean(axis=0),
+            "median": np.median(projections, axis=0),
+            "p10": np.percentile(projections, 10, axis=0),
+            "p90": np.percentile(projections, 90, axis=0),
+        }
+    
+    def _inflation_growth_rate(self, years: int, context: Optional[ProjectionContext] = None) -> float:
+        """
+        Inflation-only growth rate, moved by a shared context's CPI deviation.
+        
+        Raises:
+            ValueError: If the context is too short or has per-path inflation
+        """
+        inflation = self.assumptions.inflation_annual
+        if context is not None:
+            context.check_horizon(years)
+            if np.ndim(context.inflation):
+                raise ValueError("Discretionary projections need a scalar context inflation rate")
+            inflation = context.shifted("inflation", inflation)
+        if self.assumptions.growth_cap_annual is not None:
+            inflation = min(inflation, self.assumptions.growth_cap_annual)
+        return inflation
+    
+    def _defense_growth_rate(self, scenario: str, years: int = 0,
+                             context: Optional[ProjectionContext] = None) -> float:
+        """Annual defense growth rate for a scenario."""
+        if scenario == "growth":
+            return 0.035  # 3.5%
+        if scenario == "reduction":
+            return 0.015  # 1.5%
+        # Baseline and custom (force structure multiplier): inflation only
+        return self._inflation_growth_rate(years, context)
+    
+    def _nondefense_growth_rate(self, scenario: str, years: int = 0,
+                                context: Optional[ProjectionContext] = None) -> float:
+        """Annual non-defense discretionary growth rate for a scenario."""
+        if scenario == "growth":
+            return 0.05  # 5% growth
+        if scenario == "reduction":
+            return 0.015  # 1.5%
+        if scenario == "infrastructure":
+            return 0.04  # 4% (infrastructure focus)
+        return self._inflation_growth_rate(years, context)
+    
     def project_defense(
         self,
         years: int,
         iterations: int = 10000,
-        scenario: str = "baseline"
+        scenario: str = "baseline",
+        context: Optional[ProjectionContext] = None,
+        chunk_size: Optional[int] = None
     ) -> Dict[str, np.ndarray]:
         """
         Project defense spending under specified scenario.
         
         Scenarios:
-        - baseline: Inflation only (2.5% annually)
+        - baseline: Inflation only (2.5% annually, moved by a context's inflation)
         - growth: Force structure expansion (3.5% annually)
         - reduction: Drawdown (1.5% annually)
         - custom: Use force_structure_multiplier
         
+        With chunk_size, iterations are simulated in blocks and the
+        "defense_billions" paths are not returned.
+        
         Returns:
             Dictionary with arrays of shape (iterations, years)
         """
         base = self.assumptions.defense_2025_billions
+        growth_rate = self._defense_growth_rate(scenario, years, context)
         
-        # Set annual growth rate by scenario
-        if scenario == "baseline":
-            growth_rate = self.assumptions.inflation_annual
-        elif scenario == "growth":
-            growth_rate = 0.035  # 3.5%
-        elif scenario == "reduction":
-            growth_rate = 0.015  # 1.5%
-        else:
-            # Custom based on force structure multiplier
-            growth_rate = self.assumptions.inflation_annual
-        
-        # Stochastic modeling - add uncertainty
-        year_array = np.arange(years)
-        
-        # Create stochastic paths
-        projections = np.zeros((iterations, years))
-        
-        for i in range(iterations):
-            if i % 1000 == 0 and i > 0:
-                logger.info(f"  Defense spending projection: {i}/{iterations} iterations ({i/iterations*100:.1f}%)")
-            
-            # Add stochastic variation to growth rates (±1%)
-            stochastic_rate = growth_rate + np.random.normal(0, 0.01)
-            
-            for t in range(years):
-                projections[i, t] = base * (1 + stochastic_rate) ** (t + 1)
-        
-        return {
-            "defense_billions": projections,
-            "mean": projections.mean(axis=0),
-            "median": np.median(projections, axis=0),
-            "p10": np.percentile(projections, 10, axis=0),
-            "p90": np.percentile(projections, 90, axis=0),
-        }
+        # Stochastic paths: one growth rate per iteration (±1%), compounded per year
+        return self._path_result("defense_billions", base, growth_rate, years, iterations, chunk_size)
     
     def project_nondefense_discretionary(
         self,
         years: int,
         iterations: int = 10000,
-        scenario: str = "baseline"
+        scenario: str = "baseline",
+        context: Optional[ProjectionContext] = None,
+        chunk_size: Optional[int] = None
     ) -> Dict[str, np.ndarray]:
         """
         Project non-defense discretionary spending.
         
         Scenarios:
-        - baseline: Inflation only
+        - baseline: Inflation only (moved by a context's inflation)
         - growth: Increase by 2.5% above inflation (hiring, programs)
         - reduction: Reduce by 1% annually (efficiency)
         - infrastructure: 4% annual increase (infrastructure focus)
+        
+        With chunk_size, iterations are simulated in blocks and the
+        "nondefense_billions" paths are not returned.
         """
         base = self.assumptions.nondefense_discretionary_2025_billions
-        
-        if scenario == "baseline":
-            growth_rate = self.assumptions.inflation_annual
-        elif scenario == "growth":
-            growth_rate = 0.05  # 5% growth
-        elif scenario == "reduction":
-            growth_rate = 0.015  # 1.5%
-        elif scenario == "infrastructure":
-            growth_rate = 0.04  # 4% (infrastructure focus)
-        else:
-            growth_rate = self.assumptions.inflation_annual
+        growth_rate = self._nondefense_growth_rate(scenario, years, context)
         
         # Stochastic paths
-        projections = np.zeros((iterations, years))
-        
-        for i in range(iterations):
-            stochastic_rate = growth_rate + np.random.normal(0, 0.01)
-            
-            for t in range(years):
-                projections[i, t] = base * (1 + stochastic_rate) ** (t + 1)
-        
-        return {
-            "nondefense_billions": projections,
-            "mean": projections.mean(axis=0),
-            "median": np.median(projections, axis=0),
-            "p10": np.percentile(projections, 10, axis=0),
-            "p90": np.percentile(projections, 90, axis=0),
-        }
+        return self._path_result("nondefense_billions", base, growth_rate, years, iterations, chunk_size)
     
     def project_all_discretionary(
         self,
         years: int,
         iterations: int = 10000,
         defense_scenario: str = "baseline",
-        nondefense_scenario: str = "baseline"
+        nondefense_scenario: str = "baseline",
+        chunk_size: Optional[int] = None,
+        adaptive: Optional[AdaptiveSampling] = None,
+        context: Optional[ProjectionContext] = None
     ) -> pd.DataFrame:
         """
         Project all discretionary spending and return DataFrame.
         
+        Args:
+            years: Number of years to project
+            iterations: Monte Carlo iterations
+            defense_scenario: Defense scenario name
+            nondefense_scenario: Non-defense scenario name
+            chunk_size: Simulate at most this many iterations at a time and fold
+                them into streaming statistics (percentiles become sketch estimates)
+            adaptive: Run in batches until the monitored statistics converge
+                (final-year mean defense and non-defense spending by default);
+                ``iterations`` becomes the cap and ``df.attrs["convergence"]``
+                reports the result
+            context: Shared macro paths; inflation-only scenarios move with its
+                (scalar) inflation's deviation from the baseline path
+        
         Returns:
             DataFrame with columns:
             - year
@@ -171,8 +237,34 @@ class DiscretionarySpendingModel:
             - nondefense_mean, nondefense_p10, nondefense_p90
             - total_mean, total_p10, total_p90
         """
-        defense = self.project_defense(years, iterations, defense_scenario)
-        nondefense = self.project_nondefense_discretionary(years, iterations, nondefense_scenario)
+        monitor = None
+        if adaptive is not None:
+            monitor = ConvergenceMonitor(adaptive, {
+                "final_defense": final_year_mean("defense"),
+                "final_nondefense": final_year_mean("nondefense"),
+            })
+        if monitor is not None or (chunk_size is not None and chunk_size < iterations):
+            defense_rate = self._defense_growth_rate(defense_scenario, years, context)
+            nondefense_rate = self._nondefense_growth_rate(nondefense_scenario, years, context)
+            # Summaries expect (years, n) blocks; paths are (n, years)
+            summaries = summarize_paths(
+                lambda n: {
+                    "defense": self._compound_paths(
+                        self.assumptions.defense_2025_billions, defense_rate, years, n).T,
+                    "nondefense": self._compound_paths(
+                        self.assumptions.nondefense_discretionary_2025_billions, nondefense_rate, years, n).T,
+                },
+                iterations,
+                chunk_size,
+                monitor=monitor,
+            )
+            defense, nondefense = {}, {}
+            for stats, name in ((defense, "defense"), (nondefense, "nondefense")):
+                stats["mean"] = summaries[name].mean
+                stats["p10"], stats["p90"] = summaries[name].percentile([10, 90])
+        else:
+            defense = self.project_defense(years, iterations, defense_scenario, context)
+            nondefense = self.project_nondefense_discretionary(years, iterations, nondefense_scenario, context)
         
         total_mean = defense["mean"] + nondefense["mean"]
         total_p10 = defense["p10"] + nondefense["p10"]
@@ -180,7 +272,7 @@ class DiscretionarySpendingModel:
         
         year_array = np.arange(years) + 2026  # Start from 2026
         
-        return pd.DataFrame({
+        df = pd.DataFrame({
             "year": year_array,
             "defense_mean": defense["mean"],
             "defense_p10": defense["p10"],
@@ -192,6 +284,9 @@ class DiscretionarySpendingModel:
             "total_p10": total_p10,
             "total_p90": total_p90,
         })
+        if monitor is not None:
+            df.attrs["convergence"] = monitor.report()
+        return df
     
     def get_10year_totals(
         self,
@@ -11,17 +11,27 @@ Classes:
     - EconomicModel: Orchestrates projections
     - SensitivityAnalyzer: Performs sensitivity analysis
     - ScenarioComparator: Compares multiple scenarios
+    - SweepResult: Labelled results of a batched parameter sweep
 """
 
+import dataclasses
 import logging
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+from typing import Collection, Dict, List, Optional, Sequence, Tuple, Union
 import numpy as np
 import pandas as pd
 
+from core.projection_context import growth_index
+from core.online_stats import AdaptiveSampling, ConvergenceMonitor, final_year_mean, summarize_paths
+from core.random_streams import RandomStreamMixin, SeedLike
+from core.samplers import Draw, SamplerLike
+
 
 logger = logging.getLogger(__name__)
 
+# Debt percentiles reported by simulations and sweeps
+DEBT_PERCENTILES = (10, 25, 50, 75, 90)
+
 
 @dataclass
 class EconomicParameters:
@@ -155,7 +165,68 @@ class SimulationResult:
         return df
 
 
-class MonteCarloEngine:
+@dataclass
+class SweepResult:
+    """
+    Results from a batched parameter sweep: one mean trajectory per grid point.
+    
+    A labelled cube with (point, year) axes per metric; ``sel`` and
+    ``to_frame`` attach the grid coordinates as a pandas index.
+    """
+    points: pd.DataFrame  # One row per grid point, one column per swept parameter
+    years: np.ndarray  # Array of years [0, 1, 2, ...]
+    values: Dict[str, np.ndarray]  # Metric -> (points, years): gdp, revenue, spending, debt, deficit, debt_10th, ...
+    metadata: Dict = field(default_factory=dict)
+
+    def sel(self, metric: str) -> pd.DataFrame:
+        """One metric as a (grid point x year) frame indexed by the grid coordinates."""
+        return pd.DataFrame(
+            self.values[metric],
+            index=pd.MultiIndex.from_frame(self.points),
+            columns=pd.Index(self.years, name="year"),
+        )
+
+    def final(self, metric: str) -> pd.Series:
+        """Final-year value of a metric at every grid point."""
+        return self.sel(metric).iloc[:, -1].rename(metric)
+
+    def to_frame(self) -> pd.DataFrame:
+        """Long format: (grid coordinates..., year) index, one column per metric."""
+        return pd.DataFrame({metric: self.sel(metric).stack() for metric in self.values})
+
+    def to_simulation_result(self, point: int, scenario_name: str) -> SimulationResult:
+        """The SimulationResult that run_simulation would report for one grid point."""
+        gdp = self.values["gdp"][point]
+        debt = self.values["debt"][point]
+        return SimulationResult(
+            scenario_name=scenario_name,
+            years=self.years,
+            gdp=gdp,
+            revenues=self.values["revenue"][point],
+            spending=self.values["spending"][point],
+            debt=debt,
+            deficit=self.values["deficit"][point],
+            percentiles={f"{p}th": self.values[f"debt_{p}th"][point] for p in DEBT_PERCENTILES},
+            metadata={
+                "iterations": self.metadata["iterations"],
+                "seed": self.metadata["seed"],
+                "final_debt_gdp_ratio": debt[-1] / gdp[-1],
+                "exploded_paths": int(self.metadata["exploded_paths"][point]),
+            },
+        )
+
+
+def parameter_grid(**axes: Sequence[float]) -> pd.DataFrame:
+    """
+    Cartesian product of parameter values, one row per grid point.
+    
+    Example:
+        parameter_grid(gdp_growth_rate=[0.01, 0.02, 0.03], inflation_rate=[0.02, 0.04])
+    """
+    return pd.MultiIndex.from_product(list(axes.values()), names=list(axes)).to_frame(index=False)
+
+
+class MonteCarloEngine(RandomStreamMixin):
     """
     Runs stochastic Monte Carlo simulations over economic scenarios.
     
@@ -166,17 +237,29 @@ class MonteCarloEngine:
     - Convergence checking
     """
 
-    def __init__(self, seed: Optional[int] = None):
-        """Initialize engine with optional random seed for reproducibility."""
-        self.seed = seed
-        if seed is not None:
-            np.random.seed(seed)
+    # EconomicParameters fields read by the projection
+    _PROJECTION_PARAMETERS = (
+        "gdp",
+        "national_debt",
+        "gdp_growth_rate",
+        "inflation_rate",
+        "debt_drag_factor",
+        "stop_on_debt_explosion",
+    )
+    # Keys of _scenario_coefficients
+    _COEFFICIENTS = ("revenue_pct", "revenue_fixed", "spending_pct", "spending_fixed")
+
+    def __init__(self, seed: Optional[SeedLike] = None, sampler: Optional[SamplerLike] = None):
+        """Initialize engine with optional random seed and sampler (pseudo-random if None)."""
+        self._init_random_stream(seed, sampler)
 
     def run_simulation(
         self,
         scenario: PolicyScenario,
         iterations: int = 100000,
         uncertainty_dict: Optional[Dict] = None,
+        chunk_size: Optional[int] = None,
+        adaptive: Optional[AdaptiveSampling] = None,
     ) -> SimulationResult:
         """
         Run Monte Carlo simulation with parameter uncertainty.
@@ -186,6 +269,12 @@ class MonteCarloEngine:
             iterations: Number of Monte Carlo iterations
             uncertainty_dict: Dict of parameter -> (mean, std_dev) for uncertainty
                              E.g., {'gdp_growth_rate': (0.02, 0.01)}
+            chunk_size: Simulate at most this many paths at a time and fold them
+                into streaming statistics, so memory does not grow with
+                iterations (debt percentiles become sketch estimates)
+            adaptive: Run in batches and stop once the monitored statistics
+                (final-year mean deficit by default) converge; ``iterations``
+                becomes the cap and metadata reports the achieved count
         
         Returns:
             SimulationResult with percentiles and full history
@@ -194,47 +283,53 @@ class MonteCarloEngine:
         scenario.validate()
         
         years = np.arange(scenario.economic_params.simulation_years + 1)
+        coefficients = self._scenario_coefficients(scenario)
         
-        # Initialize result arrays (mean trajectory)
-        gdp_trajectories = np.zeros((iterations, len(years)))
-        revenue_trajectories = np.zeros((iterations, len(years)))
-        spending_trajectories = np.zeros((iterations, len(years)))
-        debt_trajectories = np.zeros((iterations, len(years)))
-        deficit_trajectories = np.zeros((iterations, len(years)))
+        monitor = None
+        if adaptive is not None:
+            monitor = ConvergenceMonitor(adaptive, {"final_mean_deficit": final_year_mean("deficit")})
+            chunk_size = adaptive.batch_size
         
-        for i in range(iterations):
-            if i % max(1, iterations // 10) == 0:
-                logger.debug(f"  Iteration {i}/{iterations}")
+        if monitor is not None or (chunk_size is not None and chunk_size < iterations):
+            def simulate_block(n: int) -> Dict[str, np.ndarray]:
+                params = self._sample_parameters(scenario.economic_params, uncertainty_dict, n)
+                paths = self._project_paths(coefficients, params, years)
+                paths["exploded"] = paths["exploded"][np.newaxis, :].astype(float)
+                return paths
             
-            # Create perturbed parameters if uncertainty provided
-            params = self._perturb_parameters(scenario.economic_params, uncertainty_dict)
-            
-            # Run projection
-            gdp_traj, rev_traj, spend_traj, debt_traj, def_traj = self._project_single(
-                scenario, params, years
+            summaries = summarize_paths(
+                simulate_block,
+                iterations,
+                chunk_size,
+                moments_only=("gdp", "revenue", "spending", "deficit", "exploded"),
+                monitor=monitor,
             )
-            
-            gdp_trajectories[i] = gdp_traj
-            revenue_trajectories[i] = rev_traj
-            spending_trajectories[i] = spend_traj
-            debt_trajectories[i] = debt_traj
-            deficit_trajectories[i] = def_traj
+            iterations = summaries["debt"].count
+            debt_quantiles = summaries["debt"].percentile(DEBT_PERCENTILES)
+            means = {name: summary.mean for name, summary in summaries.items()}
+            exploded_paths = int(round(means.pop("exploded")[0] * iterations))
+        else:
+            # Sample all perturbed parameters up front, then step every path at once
+            params = self._sample_parameters(scenario.economic_params, uncertainty_dict, iterations)
+            paths = self._project_paths(coefficients, params, years)
+            debt_quantiles = np.percentile(paths["debt"], DEBT_PERCENTILES, axis=1)
+            means = {
+                name: paths[name].mean(axis=1)
+                for name in ("gdp", "revenue", "spending", "debt", "deficit")
+            }
+            exploded_paths = int(paths["exploded"].sum())
         
         # Compute percentiles
         percentiles = {
-            "10th": np.percentile(debt_trajectories, 10, axis=0),
-            "25th": np.percentile(debt_trajectories, 25, axis=0),
-            "50th": np.percentile(debt_trajectories, 50, axis=0),  # Median
-            "75th": np.percentile(debt_trajectories, 75, axis=0),
-            "90th": np.percentile(debt_trajectories, 90, axis=0),
-        }
+            f"{p}th": quantile for p, quantile in zip(DEBT_PERCENTILES, debt_quantiles)
+        }  # 50th is the median
         
         # Mean trajectory
-        mean_gdp = gdp_trajectories.mean(axis=0)
-        mean_revenue = revenue_trajectories.mean(axis=0)
-        mean_spending = spending_trajectories.mean(axis=0)
-        mean_debt = debt_trajectories.mean(axis=0)
-        mean_deficit = deficit_trajectories.mean(axis=0)
+        mean_gdp = means["gdp"]
+        mean_revenue = means["revenue"]
+        mean_spending = means["spending"]
+        mean_debt = means["debt"]
+        mean_deficit = means["deficit"]
         
         result = SimulationResult(
             scenario_name=scenario.name,
@@ -249,98 +344,342 @@ class MonteCarloEngine:
                 "iterations": iterations,
                 "seed": self.seed,
                 "final_debt_gdp_ratio": mean_debt[-1] / mean_gdp[-1],
+                "exploded_paths": exploded_paths,
             },
         )
+        if monitor is not None:
+            result.metadata["convergence"] = monitor.report()
         
         logger.info(f"Simulation complete. Final debt/GDP: {result.metadata['final_debt_gdp_ratio']:.1%}")
         return result
 
-    def _perturb_parameters(
-        self, params: EconomicParameters, uncertainty_dict: Optional[Dict]
-    ) -> EconomicParameters:
-        """Create a perturbed copy of parameters for stochastic sampling."""
-        if not uncertainty_dict:
-            return params
+    def run_sweep(
+        self,
+        scenario: PolicyScenario,
+        grid: Union[pd.DataFrame, Dict[str, Sequence[float]]],
+        iterations: int = 1000,
+        uncertainty_dict: Optional[Dict] = None,
+        max_batch_values: int = 4_000_000,
+    ) -> SweepResult:
+        """
+        Simulate a scenario at every point of a parameter grid in one batch.
         
-        import copy
-        perturbed = copy.deepcopy(params)
+        Grid points are stacked along the iteration axis, so the year loop runs
+        once for the whole grid instead of once per point. Swept parameters
+        are fixed at their grid values; the other uncertain parameters use the
+        same draws at every point (common random numbers), so differences
+        between points reflect the parameters rather than sampling noise.
+        
+        Args:
+            scenario: Base scenario; unswept parameters keep its values
+            grid: DataFrame with one row per point and one column per
+                parameter, or a dict of parameter -> values expanded with
+                parameter_grid()
+            iterations: Monte Carlo iterations per grid point
+            uncertainty_dict: Dict of parameter -> (mean, std_dev), as in
+                run_simulation
+            max_batch_values: Upper bound on path-years held at once; larger
+                grids are evaluated in blocks of points
+        
+        Returns:
+            SweepResult with (points, years) mean trajectories and debt percentiles
         
-        for param_name, (mean, std_dev) in uncertainty_dict.items():
-            if hasattr(perturbed, param_name):
-                sampled_value = np.random.normal(mean, std_dev)
-                # Clamp certain parameters to realistic ranges
-                if param_name == "gdp_growth_rate":
-                    sampled_value = np.clip(sampled_value, -0.1, 0.1)  # -10% to +10%
-                elif param_name == "inflation_rate":
-                    sampled_value = np.clip(sampled_value, -0.05, 0.5)  # -5% to +50%
-                setattr(perturbed, param_name, sampled_value)
+        Raises:
+            ValueError: If a grid column is not a projection parameter
+        """
+        points = grid if isinstance(grid, pd.DataFrame) else parameter_grid(**grid)
+        unknown = [name for name in points.columns if name not in self._PROJECTION_PARAMETERS]
+        if unknown:
+            raise ValueError(
+                f"Cannot sweep {unknown}; sweepable parameters are {list(self._PROJECTION_PARAMETERS)}"
+            )
+        logger.info(f"Starting parameter sweep: {scenario.name} ({len(points)} points x {iterations} iterations)")
+        scenario.validate()
+        base = {
+            **{name: float(getattr(scenario.economic_params, name)) for name in self._PROJECTION_PARAMETERS},
+            **self._scenario_coefficients(scenario),
+        }
+        settings = []
+        for values in points.to_dict("records"):
+            dataclasses.replace(scenario.economic_params, **values).validate()
+            settings.append({**base, **values})
         
-        return perturbed
+        years = np.arange(scenario.economic_params.simulation_years + 1)
+        values, exploded_paths = self._simulate_points(
+            pd.DataFrame(settings), scenario.economic_params, uncertainty_dict,
+            points.columns, iterations, years, max_batch_values,
+        )
+        return SweepResult(
+            points=points.reset_index(drop=True),
+            years=years,
+            values=values,
+            metadata={
+                "scenario_name": scenario.name,
+                "iterations": iterations,
+                "seed": self.seed,
+                "exploded_paths": exploded_paths,
+            },
+        )
 
-    def _project_single(
+    def run_scenarios(
+        self,
+        scenarios: Dict[str, PolicyScenario],
+        iterations: int = 100000,
+        uncertainty_dict: Optional[Dict] = None,
+        max_batch_values: int = 4_000_000,
+    ) -> Dict[str, SimulationResult]:
+        """
+        Simulate several scenarios together, batching those with equal horizons.
+        
+        Each scenario's revenue and spending coefficients become per-path
+        vectors, so the whole batch shares one year loop.
+        
+        Returns:
+            Dict of scenario name -> SimulationResult
+        """
+        by_horizon: Dict[int, List[str]] = {}
+        for name, scenario in scenarios.items():
+            scenario.validate()
+            by_horizon.setdefault(scenario.economic_params.simulation_years, []).append(name)
+        
+        results: Dict[str, SimulationResult] = {}
+        for horizon, names in by_horizon.items():
+            settings = pd.DataFrame([
+                {
+                    **{param: float(getattr(scenarios[name].economic_params, param))
+                       for param in self._PROJECTION_PARAMETERS},
+                    **self._scenario_coefficients(scenarios[name]),
+                }
+                for name in names
+            ])
+            years = np.arange(horizon + 1)
+            values, exploded_paths = self._simulate_points(
+                settings, scenarios[names[0]].economic_params, uncertainty_dict,
+                (), iterations, years, max_batch_values,
+            )
+            sweep = SweepResult(
+                points=pd.DataFrame({"scenario": names}),
+                years=years,
+                values=values,
+                metadata={"iterations": iterations, "seed": self.seed, "exploded_paths": exploded_paths},
+            )
+            for point, name in enumerate(names):
+                results[name] = sweep.to_simulation_result(point, scenarios[name].name)
+        return {name: results[name] for name in scenarios}
+
+    def _simulate_points(
+        self,
+        settings: pd.DataFrame,
+        reference_params: EconomicParameters,
+        uncertainty_dict: Optional[Dict],
+        swept: Collection[str],
+        iterations: int,
+        years: np.ndarray,
+        max_batch_values: int,
+    ) -> Tuple[Dict[str, np.ndarray], np.ndarray]:
+        """
+        Project many parameter settings at once, one block of paths per setting.
+        
+        Paths are laid out point-major along the iteration axis (path
+        ``point * iterations + i``), so per-point statistics come from a
+        (years, points, iterations) reshape.
+        
+        Args:
+            settings: One row per point with every projection parameter and
+                scenario coefficient
+            reference_params: Parameters for sampling (uncertain values come
+                from uncertainty_dict, so any scenario's parameters will do)
+            uncertainty_dict: Dict of parameter -> (mean, std_dev)
+            swept: Parameters held at their settings values even if uncertain
+        
+        Returns:
+            Tuple of (metric -> (points, years) array, (points,) exploded path counts)
+        """
+        n_points, n_years = len(settings), len(years)
+        sampled = self._sample_parameters(reference_params, uncertainty_dict, iterations)
+        uncertain = {
+            name for name in (uncertainty_dict or {})
+            if name in self._PROJECTION_PARAMETERS and name not in swept
+        }
+        metrics = ("gdp", "revenue", "spending", "debt", "deficit")
+        values = {
+            name: np.zeros((n_points, n_years))
+            for name in metrics + tuple(f"debt_{p}th" for p in DEBT_PERCENTILES)
+        }
+        exploded_paths = np.zeros(n_points, dtype=int)
+        
+        points_per_batch = max(1, max_batch_values // (iterations * n_years))
+        for start in range(0, n_points, points_per_batch):
+            block = settings.iloc[start:start + points_per_batch]
+            count = len(block)
+            rows = slice(start, start + count)
+            
+            def per_path(name: str) -> np.ndarray:
+                return np.repeat(block[name].to_numpy(dtype=float), iterations)
+            
+            params = {
+                name: np.tile(sampled[name], count) if name in uncertain else per_path(name)
+                for name in self._PROJECTION_PARAMETERS
+            }
+            coefficients = {name: per_path(name) for name in self._COEFFICIENTS}
+            paths = self._project_paths(coefficients, params, years)
+            
+            for name in metrics:
+                values[name][rows] = paths[name].reshape(n_years, count, iterations).mean(axis=2).T
+            debt_quantiles = np.percentile(
+                paths["debt"].reshape(n_years, count, iterations), DEBT_PERCENTILES, axis=2
+            )
+            for p, quantile in zip(DEBT_PERCENTILES, debt_quantiles):
+                values[f"debt_{p}th"][rows] = quantile.T
+            exploded_paths[rows] = paths["exploded"].reshape(count, iterations).sum(axis=1)
+        
+        return values, exploded_paths
+
+    def _sample_parameters(
         self,
-        scenario: PolicyScenario,
         params: EconomicParameters,
+        uncertainty_dict: Optional[Dict],
+        iterations: int,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Sample perturbed parameters for every iteration in one pass.
+        
+        Draws are taken in the same (iteration, parameter) order as sampling
+        one perturbed copy per iteration, so seeded runs are reproducible.
+        
+        Returns:
+            Dict of parameter name -> (iterations,) array for the parameters
+            used by the projection
+        """
+        sampled = {
+            name: np.full(iterations, float(getattr(params, name)))
+            for name in self._PROJECTION_PARAMETERS
+        }
+        if not uncertainty_dict:
+            return sampled
+        
+        perturbed = [
+            (param_name, mean, std_dev)
+            for param_name, (mean, std_dev) in uncertainty_dict.items()
+            if hasattr(params, param_name)
+        ]
+        (draws,) = self.draw_block(Draw((iterations, len(perturbed)), iteration_axis=0))
+        
+        for column, (param_name, mean, std_dev) in enumerate(perturbed):
+            sampled_value = mean + std_dev * draws[:, column]
+            # Clamp certain parameters to realistic ranges
+            if param_name == "gdp_growth_rate":
+                sampled_value = np.clip(sampled_value, -0.1, 0.1)  # -10% to +10%
+            elif param_name == "inflation_rate":
+                sampled_value = np.clip(sampled_value, -0.05, 0.5)  # -5% to +50%
+            if param_name in sampled:
+                sampled[param_name] = sampled_value
+        
+        return sampled
+
+    @staticmethod
+    def _scenario_coefficients(scenario: PolicyScenario) -> Dict[str, float]:
+        """
+        Collapse a scenario's revenue and spending lines into four coefficients.
+        
+        Returns:
+            Dict with "revenue_pct" and "spending_pct" (shares of GDP) and
+            "revenue_fixed" and "spending_fixed" (amounts inflated each year)
+        """
+        return {
+            "revenue_pct": sum(rev.value / 100 for rev in scenario.revenues if rev.is_percent),
+            "revenue_fixed": sum(rev.value for rev in scenario.revenues if not rev.is_percent),
+            "spending_pct": sum(spend.value / 100 for spend in scenario.spending if spend.is_percent),
+            "spending_fixed": sum(spend.value for spend in scenario.spending if not spend.is_percent),
+        }
+
+    def _project_paths(
+        self,
+        coefficients: Dict[str, float],
+        params: Dict[str, np.ndarray],
         years: np.ndarray,
-    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    ) -> Dict[str, np.ndarray]:
         """
-        Project a single trajectory year-by-year.
+        Project all trajectories year-by-year as (years, iterations) arrays.
+        
+        Revenue and spending come from the percent-of-GDP and fixed-amount
+        coefficients of _scenario_coefficients (scalars, or one value per
+        path when a batch mixes scenarios); fixed amounts are inflated per
+        path. Paths whose debt explodes are frozen with a per-path mask:
+        debt is held, the deficit is zeroed and later GDP/revenue/spending
+        stay at zero.
         
         Returns:
-            (gdp, revenue, spending, debt, deficit) trajectories
+            Dict with "gdp", "revenue", "spending", "debt", "deficit" arrays
+            and an "exploded" (iterations,) mask
         """
         n_years = len(years)
-        gdp = np.zeros(n_years)
-        revenue = np.zeros(n_years)
-        spending = np.zeros(n_years)
-        debt = np.zeros(n_years)
-        deficit = np.zeros(n_years)
+        iterations = len(params["gdp"])
+        gdp = np.zeros((n_years, iterations))
+        revenue = np.zeros((n_years, iterations))
+        spending = np.zeros((n_years, iterations))
+        debt = np.zeros((n_years, iterations))
+        deficit = np.zeros((n_years, iterations))
+        
+        revenue_pct = coefficients["revenue_pct"]
+        revenue_fixed = coefficients["revenue_fixed"]
+        spending_pct = coefficients["spending_pct"]
+        spending_fixed = coefficients["spending_fixed"]
         
         # Initial conditions
-        gdp[0] = params.gdp
-        debt[0] = params.national_debt
+        gdp[0] = params["gdp"]
+        debt[0] = params["national_debt"]
+        
+        stop_on_explosion = params["stop_on_debt_explosion"] != 0
+        active = np.ones(iterations, dtype=bool)
+        cpi_index = growth_index(params["inflation_rate"], n_years)
         
         for year_idx in range(1, n_years):
             # GDP growth with debt drag
-            debt_to_gdp = debt[year_idx - 1] / gdp[year_idx - 1] if gdp[year_idx - 1] > 0 else 0
+            prev_gdp = gdp[year_idx - 1]
+            debt_to_gdp = np.divide(
+                debt[year_idx - 1], prev_gdp, out=np.zeros(iterations), where=prev_gdp > 0
+            )
             # Drag increases linearly: 0.1% drag per 10 percentage points above 60% debt/GDP
             # E.g., at 100% debt/GDP: drag = 0.1 * (1.0 - 0.6) = 0.04 (4% drag)
-            debt_drag = params.debt_drag_factor * max(0, debt_to_gdp - 0.6)
-            adjusted_growth = max(params.gdp_growth_rate - debt_drag, -0.10)  # Floor at -10% growth
-            gdp[year_idx] = gdp[year_idx - 1] * (1 + adjusted_growth)
-            
-            # Calculate revenues (% of GDP or fixed)
-            year_revenue = 0
-            for rev in scenario.revenues:
-                if rev.is_percent:
-                    year_revenue += gdp[year_idx] * (rev.value / 100)
-                else:
-                    # Inflate fixed revenues
-                    year_revenue += rev.value * ((1 + params.inflation_rate) ** (year_idx))
-            revenue[year_idx] = year_revenue
+            debt_drag = params["debt_drag_factor"] * np.maximum(0, debt_to_gdp - 0.6)
+            adjusted_growth = np.maximum(params["gdp_growth_rate"] - debt_drag, -0.10)  # Floor at -10% growth
+            year_gdp = prev_gdp * (1 + adjusted_growth)
             
-            # Calculate spending (% of GDP or fixed)
-            year_spending = 0
-            for spend in scenario.spending:
-                if spend.is_percent:
-                    year_spending += gdp[year_idx] * (spend.value / 100)
-                else:
-                    year_spending += spend.value * ((1 + params.inflation_rate) ** (year_idx))
-            spending[year_idx] = year_spending
+            # Revenues and spending (% of GDP plus inflated fixed amounts)
+            inflation_factor = cpi_index[year_idx]
+            year_revenue = year_gdp * revenue_pct + revenue_fixed * inflation_factor
+            year_spending = year_gdp * spending_pct + spending_fixed * inflation_factor
             
             # Deficit and debt
-            deficit[year_idx] = year_spending - year_revenue
-            debt[year_idx] = debt[year_idx - 1] + deficit[year_idx]
+            year_deficit = year_spending - year_revenue
+            year_debt = debt[year_idx - 1] + year_deficit
+            
+            # Frozen paths keep their capped debt and zero deficit
+            gdp[year_idx] = np.where(active, year_gdp, 0.0)
+            revenue[year_idx] = np.where(active, year_revenue, 0.0)
+            spending[year_idx] = np.where(active, year_spending, 0.0)
+            deficit[year_idx] = np.where(active, year_deficit, 0.0)
+            debt[year_idx] = np.where(active, year_debt, debt[year_idx - 1])
             
-            # Debt explosion check
-            if params.stop_on_debt_explosion:
-                if debt[year_idx] / gdp[year_idx] > 10.0:  # >1000% debt/GDP
-                    logger.warning(f"Debt explosion detected at year {year_idx}; capping debt trajectory")
-                    debt[year_idx:] = debt[year_idx]
-                    deficit[year_idx:] = 0
-                    break
+            # Debt explosion check (>1000% debt/GDP)
+            exploded = active & stop_on_explosion & (year_debt > 10.0 * year_gdp)
+            if exploded.any():
+                logger.warning(
+                    f"Debt explosion detected at year {year_idx} in {int(exploded.sum())} paths; "
+                    "capping debt trajectories"
+                )
+                deficit[year_idx, exploded] = 0
+                active &= ~exploded
         
-        return gdp, revenue, spending, debt, deficit
+        return {
+            "gdp": gdp,
+            "revenue": revenue,
+            "spending": spending,
+            "debt": debt,
+            "deficit": deficit,
+            "exploded": ~active,
+        }
 
 
 class EconomicModel:
@@ -417,19 +756,36 @@ class SensitivityAnalyzer:
             DataFrame with sensitivity results
         """
         logger.info(f"Starting tornado analysis for {len(parameter_ranges)} parameters")
-        results = []
         
+        # Projection parameters run as one batched sweep: a low and a high
+        # point per parameter, every other parameter at its base value
+        economic = base_scenario.economic_params
+        swept = [name for name in parameter_ranges if name in MonteCarloEngine._PROJECTION_PARAMETERS]
+        final_debt: Dict[str, Tuple[float, float]] = {}
+        if swept:
+            base_values = {name: getattr(economic, name) for name in swept}
+            grid = pd.DataFrame([
+                {**base_values, name: value}
+                for name in swept
+                for value in parameter_ranges[name]
+            ])
+            sweep = self.engine.run_sweep(base_scenario, grid, iterations=1000)
+            debt = sweep.values["debt"][:, -1]
+            final_debt = {name: (debt[2 * k], debt[2 * k + 1]) for k, name in enumerate(swept)}
+        
+        results = []
         for param_name, (low, high) in parameter_ranges.items():
-            # Run low
-            scenario_low = self._create_variant(base_scenario, {param_name: low})
-            result_low = self.engine.run_simulation(scenario_low, iterations=1000)
-            
-            # Run high
-            scenario_high = self._create_variant(base_scenario, {param_name: high})
-            result_high = self.engine.run_simulation(scenario_high, iterations=1000)
+            if param_name in final_debt:
+                debt_low, debt_high = final_debt[param_name]
+            else:
+                # Parameters outside the projection (e.g. the horizon) run one at a time
+                scenario_low = self._create_variant(base_scenario, {param_name: low})
+                debt_low = self.engine.run_simulation(scenario_low, iterations=1000).debt[-1]
+                scenario_high = self._create_variant(base_scenario, {param_name: high})
+                debt_high = self.engine.run_simulation(scenario_high, iterations=1000).debt[-1]
             
             # Compute impact
-            impact = result_high.debt[-1] - result_low.debt[-1]
+            impact = debt_high - debt_low
             results.append({
                 "Parameter": param_name,
                 "Low": low,
@@ -463,11 +819,9 @@ class ScenarioComparator:
         self.results: Dict[str, SimulationResult] = {}
 
     def run_all(self, iterations: int = 100000) -> None:
-        """Run all scenarios and store results."""
-        engine = MonteCarloEngine()
-        for name, scenario in self.scenarios.items():
-            logger.info(f"Running scenario: {name}")
-            self.results[name] = engine.run_simulation(scenario, iterations)
+        """Run all scenarios as one batch and store results."""
+        logger.info(f"Running scenarios: {', '.join(self.scenarios)}")
+        self.results.update(MonteCarloEngine().run_scenarios(self.scenarios, iterations))
 
     def comparison_table(self) -> pd.DataFrame:
         """Generate summary comparison table."""
@@ -2,13 +2,28 @@
 
 This module contains core economic functions for calculating revenues,
 expenditures, and their impacts.
+
+A policy's revenue and expenditure lines can be compiled once into an
+immutable PolicyPlan (value vectors, percent-of-GDP masks and an
+expenditure-by-revenue allocation matrix). A PolicyStepper then evaluates
+the plan year by year with a matrix product, leaving the caller's dicts
+untouched, so one policy definition can drive any number of runs.
 """
 
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+import numpy as np
+
 
 def calculate_revenues_and_outs(internal_revenues, internal_outs, current_gdp, scale_factor, inflation_factor):
     """
     Calculate revenues and expenditure surpluses for a given year.
 
+    Fixed-amount lines are scaled in place, so the caller's dicts carry the
+    compounded values into the next year. Use compile_policy() and
+    PolicyStepper to simulate without mutating them.
+
     CRITICAL FIX: Non-percent outs now scale with GDP growth + inflation (scale_factor),
     not just inflation. This prevents unrealistic surplus accumulation in growing economies.
     
@@ -48,3 +63,113 @@ def calculate_revenues_and_outs(internal_revenues, internal_outs, current_gdp, s
         category_surplus[out['name']] = funded - target
 
     return category_surplus, rev_totals
+
+
+def _readonly(values, dtype=float) -> np.ndarray:
+    array = np.array(values, dtype=dtype)
+    array.setflags(write=False)
+    return array
+
+
+@dataclass(frozen=True)
+class PolicyPlan:
+    """
+    Immutable, array-backed revenue and expenditure lines of a policy.
+
+    Attributes:
+        revenue_names: Revenue line names, in input order
+        revenue_values: Percent of GDP for percent lines, base amount otherwise
+        revenue_is_percent: True where the revenue line is a percent of GDP
+        out_names: Expenditure line names, in input order
+        out_values: Percent of GDP for percent lines, base amount otherwise
+        out_is_percent: True where the expenditure line is a percent of GDP
+        allocation: (outs, revenues) fraction of each revenue funding each
+            expenditure; allocations naming unknown sources are dropped
+    """
+    revenue_names: Tuple[str, ...]
+    revenue_values: np.ndarray
+    revenue_is_percent: np.ndarray
+    out_names: Tuple[str, ...]
+    out_values: np.ndarray
+    out_is_percent: np.ndarray
+    allocation: np.ndarray
+
+    def stepper(self) -> "PolicyStepper":
+        """Start a year-by-year evaluation of this plan."""
+        return PolicyStepper(self)
+
+
+def compile_policy(internal_revenues: List[Dict], internal_outs: List[Dict]) -> PolicyPlan:
+    """
+    Compile revenue and expenditure dicts into a PolicyPlan.
+
+    Args:
+        internal_revenues: List of revenue dicts with 'name', 'is_percent', 'value'
+        internal_outs: List of expenditure dicts with 'name', 'is_percent', 'value', 'allocations'
+
+    Returns:
+        PolicyPlan; the input dicts are not modified
+    """
+    revenue_names = tuple(rev['name'] for rev in internal_revenues)
+    # A repeated revenue name resolves to its last line, as in calculate_revenues_and_outs()
+    revenue_index = {name: i for i, name in enumerate(revenue_names)}
+
+    allocation = np.zeros((len(internal_outs), len(revenue_names)))
+    for row, out in enumerate(internal_outs):
+        for alloc in out['allocations']:
+            column = revenue_index.get(alloc['source'])
+            if column is not None:
+                allocation[row, column] += alloc['percent'] / 100
+
+    return PolicyPlan(
+        revenue_names=revenue_names,
+        revenue_values=_readonly([rev['value'] for rev in internal_revenues]),
+        revenue_is_percent=_readonly([rev['is_percent'] for rev in internal_revenues], dtype=bool),
+        out_names=tuple(out['name'] for out in internal_outs),
+        out_values=_readonly([out['value'] for out in internal_outs]),
+        out_is_percent=_readonly([out['is_percent'] for out in internal_outs], dtype=bool),
+        allocation=_readonly(allocation),
+    )
+
+
+class PolicyStepper:
+    """
+    Year-by-year evaluation of a PolicyPlan.
+
+    Holds the compounded fixed amounts of one run; the plan itself is never
+    modified, so several steppers can share it (e.g. across threads).
+    """
+
+    def __init__(self, plan: PolicyPlan):
+        self.plan = plan
+        self._revenue_fixed = np.where(plan.revenue_is_percent, 0.0, plan.revenue_values)
+        self._out_fixed = np.where(plan.out_is_percent, 0.0, plan.out_values)
+
+    def step(self, current_gdp: float, scale_factor: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Advance one year and evaluate the plan.
+
+        Fixed amounts first grow by scale_factor (GDP growth + inflation), as
+        in calculate_revenues_and_outs().
+
+        Args:
+            current_gdp: Current GDP value
+            scale_factor: Scale factor combining GDP growth and inflation
+
+        Returns:
+            (surplus per expenditure line, total per revenue line) arrays
+        """
+        plan = self.plan
+        self._revenue_fixed = self._revenue_fixed * scale_factor
+        self._out_fixed = self._out_fixed * scale_factor
+        revenue = np.where(plan.revenue_is_percent, (plan.revenue_values / 100) * current_gdp, self._revenue_fixed)
+        target = np.where(plan.out_is_percent, (plan.out_values / 100) * current_gdp, self._out_fixed)
+        return plan.allocation @ revenue - target, revenue
+
+    def step_dicts(self, current_gdp: float, scale_factor: float) -> Tuple[Dict[str, float], Dict[str, float]]:
+        """step() keyed by line name, like calculate_revenues_and_outs()."""
+        surplus, revenue = self.step(current_gdp, scale_factor)
+        return (
+            dict(zip(self.plan.out_names, surplus.tolist())),
+            dict(zip(self.plan.revenue_names, revenue.tolist())),
+        )
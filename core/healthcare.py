@@ -19,6 +19,8 @@ from typing import Dict, List, Optional, TYPE_CHECKING
 import pandas as pd
 from datetime import datetime
 
+from core.policy_registry import PolicyRegistry, get_registry
+
 if TYPE_CHECKING:
     from core.policy_mechanics_extractor import PolicyMechanics
 
@@ -780,7 +782,7 @@ class HealthcarePolicyFactory:
 
 
 def get_policy_by_type(policy_type: PolicyType) -> HealthcarePolicyModel:
-    """Get a policy model by type"""
+    """Get a policy model by type (frozen and shared; copy.deepcopy() it to modify)"""
     factory = HealthcarePolicyFactory()
     policies = {
         PolicyType.USGHA: factory.create_usgha,
@@ -791,7 +793,9 @@ def get_policy_by_type(policy_type: PolicyType) -> HealthcarePolicyModel:
     }
     
     if policy_type in policies:
-        return policies[policy_type]()
+        # Built once per process and shared frozen (see core.policy_registry)
+        key = PolicyRegistry.make_key("healthcare_policy", policy_type)
+        return get_registry().register(key, policies[policy_type])
     
     raise ValueError(f"Unknown policy type: {policy_type}")
 
@@ -15,6 +15,11 @@ import logging
 from dataclasses import dataclass
 from typing import Dict, Optional
 
+from core.projection_context import ProjectionContext
+from core.online_stats import AdaptiveSampling, ConvergenceMonitor, final_year_mean, summarize_paths
+from core.random_streams import RandomStreamMixin, SeedLike
+from core.samplers import Draw, SamplerLike
+
 logger = logging.getLogger(__name__)
 
 
@@ -46,15 +51,18 @@ class DebtAssumptions:
     gdp_growth_annual: float = 0.025  # 2.5% GDP growth
 
 
-class InterestOnDebtModel:
+class InterestOnDebtModel(RandomStreamMixin):
     """Projects federal interest expenses under different scenarios."""
     
-    def __init__(self, assumptions: DebtAssumptions = None, seed: Optional[int] = None):
+    def __init__(
+        self,
+        assumptions: DebtAssumptions = None,
+        seed: Optional[SeedLike] = None,
+        sampler: Optional[SamplerLike] = None,
+    ):
         self.assumptions = assumptions or DebtAssumptions()
-        self.seed = seed
-        
+        self._init_random_stream(seed, sampler)
         if seed is not None:
-            np.random.seed(seed)
             logger.info(f"Random seed set to {seed} for reproducibility")
     
     def calculate_current_interest_rate(self) -> float:
@@ -71,7 +79,8 @@ class InterestOnDebtModel:
         self,
         years: int,
         iterations: int = 10000,
-        interest_rate_scenario: str = "baseline"
+        interest_rate_scenario: str = "baseline",
+        context: Optional[ProjectionContext] = None
     ) -> Dict[str, np.ndarray]:
         """
         Project annual interest expense on federal debt.
@@ -82,13 +91,49 @@ class InterestOnDebtModel:
         - falling: Rates decrease 25 bps per year (recession/monetary easing)
         - spike: Rates jump 100 bps and hold (fiscal crisis)
         
+        With a context, TIPS accrue its inflation's deviation from the baseline path.
+        
         Returns:
             Dictionary with interest expense projections
         """
-        starting_debt = self.assumptions.public_debt_2025_billions
-        primary_deficit = self.assumptions.primary_deficit_annual_billions
-        gdp_growth = self.assumptions.gdp_growth_annual
+        paths = self._simulate_interest_paths(years, iterations, interest_rate_scenario, context)
+        projections = paths["interest_billions"]
+        debt_track = paths["debt_billions"]
+        
+        return {
+            **paths,
+            "mean": projections.mean(axis=0),
+            "median": np.median(projections, axis=0),
+            "p10": np.percentile(projections, 10, axis=0),
+            "p90": np.percentile(projections, 90, axis=0),
+            "debt_mean": debt_track.mean(axis=0),
+            "debt_p90": np.percentile(debt_track, 90, axis=0),
+        }
+    
+    def _rate_paths(
+        self,
+        years: int,
+        iterations: int,
+        interest_rate_scenario: str = "baseline",
+        context: Optional[ProjectionContext] = None
+    ) -> np.ndarray:
+        """
+        Draw effective interest rate paths.
+        
+        Returns:
+            (iterations, years) array of rates (decimal)
+        
+        Raises:
+            ValueError: If the context is too short or has per-path inflation
+        """
         base_rate = self.calculate_current_interest_rate()
+        if context is not None:
+            context.check_horizon(years)
+            if np.ndim(context.inflation):
+                raise ValueError("InterestOnDebtModel needs a scalar context inflation rate")
+            # TIPS principal indexes to CPI: pass inflation above baseline through
+            inflation = context.shifted("inflation", self.assumptions.inflation_baseline)
+            base_rate += self.assumptions.tips_pct * (inflation - self.assumptions.inflation_baseline)
         
         # Set rate adjustment scenario
         if interest_rate_scenario == "baseline":
@@ -102,61 +147,186 @@ class InterestOnDebtModel:
         else:
             annual_rate_change = 0.0
         
-        # Stochastic projections
+        # Interest rate paths for all iterations, (iterations, years)
+        year_index = np.arange(years)
+        if interest_rate_scenario == "spike":
+            # Jump to 5% in year 1 and hold (deterministic)
+            rate_track = np.tile(np.minimum(0.05, base_rate + 0.01 * (year_index > 0)), (iterations, 1))
+        else:
+            rate_track = base_rate + annual_rate_change * (year_index + 1)
+            # Add stochastic variation (±50 bps)
+            (noise,) = self.draw_block(Draw((iterations, years), 0.0, 0.005, iteration_axis=0))
+            rate_track = rate_track + noise
+            rate_track = np.clip(rate_track, 0.001, 0.10)  # Bound between 0.1% and 10%
+        return rate_track
+    
+    def _simulate_interest_paths(
+        self,
+        years: int,
+        iterations: int,
+        interest_rate_scenario: str = "baseline",
+        context: Optional[ProjectionContext] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Draw rate paths and run the debt recursion for all iterations.
+        
+        Returns:
+            Dictionary of (iterations, years) arrays: "interest_billions",
+            "debt_billions" and "interest_rate"
+        """
+        starting_debt = self.assumptions.public_debt_2025_billions
+        primary_deficit = self.assumptions.primary_deficit_annual_billions
+        rate_track = self._rate_paths(years, iterations, interest_rate_scenario, context)
+        
+        # Debt recursion: all iterations advance together, one year at a time
         projections = np.zeros((iterations, years))
         debt_track = np.zeros((iterations, years))
-        rate_track = np.zeros((iterations, years))
+        current_debt = np.full(iterations, starting_debt)
         
-        for i in range(iterations):
-            current_debt = starting_debt
+        for t in range(years):
+            # Calculate interest expense for this year
+            interest_expense = current_debt * rate_track[:, t]
+            projections[:, t] = interest_expense
             
-            for t in range(years):
-                # Set interest rate for this year
-                if interest_rate_scenario == "spike":
-                    current_rate = min(0.05, base_rate + 0.01 * (t > 0))  # Jump to 5% in year 1
-                else:
-                    current_rate = base_rate + (annual_rate_change * (t + 1))
-                    # Add stochastic variation (±50 bps)
-                    current_rate += np.random.normal(0, 0.005)
-                    current_rate = np.clip(current_rate, 0.001, 0.10)  # Bound between 0.1% and 10%
-                
-                # Calculate interest expense for this year
-                interest_expense = current_debt * current_rate
-                projections[i, t] = interest_expense
-                rate_track[i, t] = current_rate
-                
-                # Update debt for next year (interest + primary deficit)
-                current_debt = current_debt + interest_expense + primary_deficit
-                debt_track[i, t] = current_debt
+            # Update debt for next year (interest + primary deficit)
+            current_debt = current_debt + interest_expense + primary_deficit
+            debt_track[:, t] = current_debt
         
         return {
             "interest_billions": projections,
             "debt_billions": debt_track,
             "interest_rate": rate_track,
-            "mean": projections.mean(axis=0),
-            "median": np.median(projections, axis=0),
-            "p10": np.percentile(projections, 10, axis=0),
-            "p90": np.percentile(projections, 90, axis=0),
-            "debt_mean": debt_track.mean(axis=0),
-            "debt_p90": np.percentile(debt_track, 90, axis=0),
         }
-    
+
+    def project_coupled_debt(
+        self,
+        revenue: np.ndarray,
+        non_interest_spending: np.ndarray,
+        gdp: np.ndarray,
+        interest_rate_scenario: str = "baseline",
+        debt_drag_factor: float = 0.0,
+        context: Optional[ProjectionContext] = None,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Step debt, interest and GDP forward from component revenue and spending.
+
+        Unlike _simulate_interest_paths, the primary deficit comes from the
+        budget itself. All iterations advance together one year at a time:
+        interest accrues on last year's debt at the drawn rate, and with a
+        debt_drag_factor, debt/GDP above 60% slows GDP growth (as in
+        MonteCarloEngine) and revenue, which follows GDP, with it.
+
+        Args:
+            revenue: Total revenue (billions), shape (years, iterations)
+            non_interest_spending: Spending before interest (billions),
+                broadcastable to revenue
+            gdp: Baseline GDP path (billions), shape (years,)
+            interest_rate_scenario: 'baseline', 'rising', 'falling' or 'spike'
+            debt_drag_factor: Growth reduction per unit of debt/GDP above 60%
+                (0 disables the feedback)
+            context: Shared macro paths for the rate draw (see
+                project_interest_expense())
+
+        Returns:
+            Dictionary of (years, iterations) arrays: "gdp", "revenue",
+            "primary_deficit", "interest_billions", "debt_billions" and
+            "interest_rate"
+        """
+        years, iterations = revenue.shape
+        rate_track = self._rate_paths(years, iterations, interest_rate_scenario, context).T
+        baseline_growth = np.concatenate([[0.0], gdp[1:] / gdp[:-1] - 1])
+        non_interest_spending = np.broadcast_to(non_interest_spending, revenue.shape)
+
+        gdp_track = np.zeros((years, iterations))
+        revenue_track = np.zeros((years, iterations))
+        primary_track = np.zeros((years, iterations))
+        interest_track = np.zeros((years, iterations))
+        debt_track = np.zeros((years, iterations))
+        current_debt = np.full(iterations, self.assumptions.public_debt_2025_billions)
+        current_gdp = np.full(iterations, float(gdp[0]))
+
+        for t in range(years):
+            if t > 0:
+                # Debt drag: growth falls with debt/GDP above 60% (floor at -10%)
+                debt_drag = debt_drag_factor * np.maximum(0, current_debt / current_gdp - 0.6)
+                current_gdp = current_gdp * (1 + np.maximum(baseline_growth[t] - debt_drag, -0.10))
+            gdp_track[t] = current_gdp
+            revenue_track[t] = revenue[t] * (current_gdp / gdp[t])
+
+            primary_track[t] = non_interest_spending[t] - revenue_track[t]
+            interest_track[t] = current_debt * rate_track[t]
+            current_debt = current_debt + primary_track[t] + interest_track[t]
+            debt_track[t] = current_debt
+
+        return {
+            "gdp": gdp_track,
+            "revenue": revenue_track,
+            "primary_deficit": primary_track,
+            "interest_billions": interest_track,
+            "debt_billions": debt_track,
+            "interest_rate": rate_track,
+        }
+
     def project_interest_and_debt(
         self,
         years: int,
         iterations: int = 10000,
-        interest_rate_scenario: str = "baseline"
+        interest_rate_scenario: str = "baseline",
+        chunk_size: Optional[int] = None,
+        adaptive: Optional[AdaptiveSampling] = None,
+        context: Optional[ProjectionContext] = None
     ) -> pd.DataFrame:
         """
         Project interest expense and total debt over time.
         
+        Args:
+            years: Number of years to project
+            iterations: Monte Carlo iterations
+            interest_rate_scenario: 'baseline', 'rising', 'falling' or 'spike'
+            chunk_size: Simulate at most this many iterations at a time and fold
+                them into streaming statistics (percentiles become sketch estimates)
+            adaptive: Run in batches until the monitored statistics converge
+                (final-year mean interest expense by default); ``iterations``
+                becomes the cap and ``df.attrs["convergence"]`` reports the result
+            context: Shared macro paths; TIPS accrue its inflation's deviation
+                from the baseline path
+        
         Returns:
             DataFrame with interest expense, debt levels, and interest rates
         """
-        proj = self.project_interest_expense(years, iterations, interest_rate_scenario)
-        
         year_array = np.arange(years) + 2026
         
+        monitor = None
+        if adaptive is not None:
+            monitor = ConvergenceMonitor(adaptive, {"final_interest": final_year_mean("interest_billions")})
+        if monitor is not None or (chunk_size is not None and chunk_size < iterations):
+            # Summaries expect (years, n) blocks; paths are (n, years)
+            summaries = summarize_paths(
+                lambda n: {
+                    name: values.T
+                    for name, values in self._simulate_interest_paths(years, n, interest_rate_scenario, context).items()
+                },
+                iterations,
+                chunk_size,
+                moments_only=("interest_rate",),
+                monitor=monitor,
+            )
+            interest_p10, interest_p90 = summaries["interest_billions"].percentile([10, 90])
+            df = pd.DataFrame({
+                "year": year_array,
+                "interest_billions": summaries["interest_billions"].mean,
+                "interest_p10": interest_p10,
+                "interest_p90": interest_p90,
+                "debt_billions": summaries["debt_billions"].mean,
+                "debt_p90": summaries["debt_billions"].percentile([90])[0],
+                "interest_rate_pct": summaries["interest_rate"].mean * 100,
+            })
+            if monitor is not None:
+                df.attrs["convergence"] = monitor.report()
+            return df
+        
+        proj = self.project_interest_expense(years, iterations, interest_rate_scenario, context)
+        
         return pd.DataFrame({
             "year": year_array,
             "interest_billions": proj["mean"],
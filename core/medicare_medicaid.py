@@ -12,11 +12,28 @@ Key Features:
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Callable, Dict, List, Optional, Tuple, Any, Union
 import numpy as np
 import pandas as pd
 import logging
 
+from core.online_stats import (
+    AdaptiveSampling,
+    ConvergenceMonitor,
+    final_year_mean,
+    summarize_paths,
+    summary_statistics,
+)
+from core.path_results import ProjectionPaths
+from core.projection_context import (
+    BASELINE_MEDICAL_INFLATION,
+    ProjectionContext,
+    RateLike,
+    growth_index,
+)
+from core.random_streams import RandomStreamMixin, SeedLike
+from core.samplers import Draw, SamplerLike
+
 logger = logging.getLogger(__name__)
 
 
@@ -119,7 +136,7 @@ class MedicareProjection:
     per_capita_cost: np.ndarray
 
 
-class MedicareModel:
+class MedicareModel(RandomStreamMixin):
     """
     Comprehensive Medicare Parts A/B/D projection model.
     
@@ -131,14 +148,18 @@ class MedicareModel:
     - Comparison with baseline projections
     """
 
-    def __init__(self, assumptions: Optional[MedicareAssumptions] = None, seed: Optional[int] = None):
-        """Initialize Medicare model with assumptions."""
+    def __init__(
+        self,
+        assumptions: Optional[MedicareAssumptions] = None,
+        seed: Optional[SeedLike] = None,
+        sampler: Optional[SamplerLike] = None,
+    ):
+        """Initialize Medicare model with assumptions and a sampler (pseudo-random if None)."""
         self.assumptions = assumptions or MedicareAssumptions()
         self.baseline_year = 2025
-        self.seed = seed
         
+        self._init_random_stream(seed, sampler)
         if seed is not None:
-            np.random.seed(seed)
             logger.info(f"Random seed set to {seed} for reproducibility")
         
         logger.info("Medicare model initialized with 2025 baseline")
@@ -156,38 +177,114 @@ class MedicareModel:
         Returns:
             (enrollment_projections, age_distribution)
         """
-        enrollment = np.zeros((years, iterations))
+        (noise,) = self.draw_block(Draw((years, iterations), 1.0, 0.008))
+        enrollment = self._enrollment_paths(noise)
         age_dist = np.zeros((years, 101, iterations))  # Ages 0-100
 
-        for it in range(iterations):
-            if it % 1000 == 0:
-                logger.debug(f"  Enrollment projection: iteration {it}/{iterations}")
+        logger.info(f"Enrollment projections: {enrollment.mean():.0f} avg by year {years}")
+        return enrollment, age_dist
 
-            # Base enrollment with demographic growth
-            current_enrollment = self.assumptions.baseline_medicare_enrollment
+    def _enrollment_paths(self, enrollment_noise: np.ndarray) -> np.ndarray:
+        """
+        Compound enrollment over a (years, iterations) noise matrix.
 
-            for year in range(years):
-                # Age 65+ population growth (1.2% + 0.3% immigration = 1.5% annual)
-                age_65_growth = 0.015
+        Age 65+ population growth (1.2% + 0.3% immigration = 1.5% annual) plus
+        stable disability enrollment growth (0.3%), with multiplicative noise.
+        """
+        age_65_growth = 0.015
+        disability_growth = 0.003
+        return self.assumptions.baseline_medicare_enrollment * np.cumprod(
+            (1 + age_65_growth + disability_growth) * enrollment_noise, axis=0
+        )
 
-                # Disability enrollment (stable, slight growth)
-                disability_growth = 0.003
+    def _cost_growth(self, years: int, context: Optional[ProjectionContext]) -> Tuple[RateLike, RateLike]:
+        """
+        Medical and prescription drug cost growth rates.
 
-                # Apply stochastic variation
-                enrollment_noise = np.random.normal(1.0, 0.008)
+        A shared context moves both calibrated rates by its medical
+        inflation's deviation from the baseline path.
+        """
+        medical = self.assumptions.medical_cost_growth_annual
+        drugs = self.assumptions.prescription_drug_growth_annual
+        if context is None:
+            return medical, drugs
+        context.check_horizon(years)
+        return context.shifted("medical_inflation", medical), context.shifted("medical_inflation", drugs)
+
+    def _part_a_per_capita(self, cost_noise: np.ndarray, medical_growth: RateLike) -> np.ndarray:
+        """Part A per-capita path: medical inflation, payment update and half of utilization growth."""
+        annual_factor = (
+            (1 + medical_growth)
+            * (1 + self.assumptions.provider_payment_update_factor)
+            * (1 + self.assumptions.utilization_growth_annual * 0.5)
+        )
+        return self.assumptions.part_a_per_capita_annual * np.cumprod(annual_factor * cost_noise, axis=0)
+
+    def _part_b_per_capita(self, cost_noise: np.ndarray, medical_growth: RateLike) -> np.ndarray:
+        """Part B per-capita path: slightly lower cost growth than Part A, higher utilization."""
+        annual_factor = (
+            (1 + medical_growth * 0.95)
+            * (1 + self.assumptions.provider_payment_update_factor)
+            * (1 + self.assumptions.utilization_growth_annual * 1.1 * 0.5)
+        )
+        return self.assumptions.part_b_per_capita_annual * np.cumprod(annual_factor * cost_noise, axis=0)
 
-                current_enrollment = (
-                    current_enrollment
-                    * (1 + age_65_growth + disability_growth)
-                    * enrollment_noise
-                )
-                enrollment[year, it] = current_enrollment
+    def _part_d_spending(self, cost_noise: np.ndarray, drug_growth: RateLike) -> Tuple[np.ndarray, np.ndarray]:
+        """Part D spending and enrollment paths from a (years, iterations) noise matrix."""
+        years, iterations = cost_noise.shape
+        year_index = np.arange(years)
 
-        logger.info(f"Enrollment projections: {enrollment.mean():.0f} avg by year {years}")
-        return enrollment, age_dist
+        # Part D enrollment slightly lower than full Medicare, deterministic growth
+        enrollment_path = self.assumptions.part_d_enrollment * (1 + 0.015 * year_index)
+        enrollment = np.broadcast_to(enrollment_path[:, np.newaxis], (years, iterations)).astype(float)
+
+        # Prescription drug spending grows fastest
+        per_capita = self.assumptions.part_d_per_capita_annual * np.cumprod(
+            (1 + drug_growth) * cost_noise, axis=0
+        )
+
+        # GLP-1 drugs and advanced therapies drive growth (8% cumulative impact)
+        specialty_drug_factor = 1.0 + (0.08 * year_index / years)
+        spending = per_capita * enrollment * specialty_drug_factor[:, np.newaxis]
+        return spending, enrollment
+
+    @staticmethod
+    def _part_result(
+        simulate: Callable[[int], Tuple[np.ndarray, np.ndarray]],
+        iterations: int,
+        chunk_size: Optional[int] = None,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Run one Part's (spending, enrollment) kernel, in blocks if chunk_size is set.
+
+        Streaming drops the per-path arrays and keeps per-year moments.
+        """
+        if chunk_size is not None and chunk_size < iterations:
+            summaries = summarize_paths(
+                lambda n: dict(zip(("spending", "enrollment"), simulate(n))),
+                iterations,
+                chunk_size,
+                moments_only=("spending", "enrollment"),
+            )
+            return {
+                "mean_annual": summaries["spending"].mean,
+                "std_annual": summaries["spending"].std,
+                "enrollment_mean": summaries["enrollment"].mean,
+            }
+        spending, enrollment = simulate(iterations)
+        return {
+            "spending": spending,
+            "enrollment": enrollment,
+            "mean_annual": np.mean(spending, axis=1),
+            "std_annual": np.std(spending, axis=1),
+        }
 
     def project_part_a(
-        self, years: int, iterations: int = 10000
+        self,
+        years: int,
+        iterations: int = 10000,
+        context: Optional[ProjectionContext] = None,
+        chunk_size: Optional[int] = None,
     ) -> Dict[str, np.ndarray]:
         """
         Project Medicare Part A (Hospital Insurance) spending.
@@ -195,43 +292,32 @@ class MedicareModel:
         Args:
             years: Number of years to project
             iterations: Monte Carlo iterations
+            context: Shared macro paths (cost growth moves with its medical inflation)
+            chunk_size: Simulate at most this many iterations at a time; the
+                result then holds mean_annual, std_annual and enrollment_mean
+                instead of the (years, iterations) arrays
 
         Returns:
             Dictionary with spending, enrollment, per-capita costs
         """
         logger.info(f"Projecting Medicare Part A for {years} years ({iterations} iterations)")
 
-        spending = np.zeros((years, iterations))
-        enrollment, _ = self.project_enrollment(years, iterations)
-
-        for it in range(iterations):
-            per_capita = self.assumptions.part_a_per_capita_annual
-            sgr_update = self.assumptions.provider_payment_update_factor
+        medical_growth, _ = self._cost_growth(years, context)
 
-            for year in range(years):
-                # Medical cost inflation (3.5% baseline + 0.5-1.5% variance)
-                cost_growth = self.assumptions.medical_cost_growth_annual
-                cost_noise = np.random.normal(1.0, 0.025)
+        def simulate(n: int) -> Tuple[np.ndarray, np.ndarray]:
+            enrollment, _ = self.project_enrollment(years, n)
+            # Medical cost inflation (3.5% baseline + 2.5% volatility)
+            (noise,) = self.draw_block(Draw((years, n), 1.0, 0.025))
+            return self._part_a_per_capita(noise, medical_growth) * enrollment, enrollment
 
-                # Update factor application
-                per_capita = per_capita * (1 + cost_growth) * cost_noise * (1 + sgr_update)
-
-                # Utilization growth (population aging effect)
-                util_growth = self.assumptions.utilization_growth_annual
-                per_capita = per_capita * (1 + util_growth * 0.5)
-
-                total_spending = per_capita * enrollment[year, it]
-                spending[year, it] = total_spending
-
-        return {
-            "spending": spending,
-            "enrollment": enrollment,
-            "mean_annual": np.mean(spending, axis=1),
-            "std_annual": np.std(spending, axis=1),
-        }
+        return self._part_result(simulate, iterations, chunk_size)
 
     def project_part_b(
-        self, years: int, iterations: int = 10000
+        self,
+        years: int,
+        iterations: int = 10000,
+        context: Optional[ProjectionContext] = None,
+        chunk_size: Optional[int] = None,
     ) -> Dict[str, np.ndarray]:
         """
         Project Medicare Part B (Physician/Supplementary Medical) spending.
@@ -239,42 +325,29 @@ class MedicareModel:
         Args:
             years: Number of years to project
             iterations: Monte Carlo iterations
+            context: Shared macro paths (cost growth moves with its medical inflation)
+            chunk_size: Simulate in blocks (see project_part_a())
 
         Returns:
             Dictionary with spending, enrollment, per-capita costs
         """
         logger.info(f"Projecting Medicare Part B for {years} years ({iterations} iterations)")
 
-        spending = np.zeros((years, iterations))
-        enrollment, _ = self.project_enrollment(years, iterations)
-
-        for it in range(iterations):
-            per_capita = self.assumptions.part_b_per_capita_annual
-            sgr_update = self.assumptions.provider_payment_update_factor
-
-            for year in range(years):
-                # Slightly lower growth than Part A
-                cost_growth = self.assumptions.medical_cost_growth_annual * 0.95
-                cost_noise = np.random.normal(1.0, 0.022)
-
-                per_capita = per_capita * (1 + cost_growth) * cost_noise * (1 + sgr_update)
-
-                # Utilization growth
-                util_growth = self.assumptions.utilization_growth_annual * 1.1
-                per_capita = per_capita * (1 + util_growth * 0.5)
+        medical_growth, _ = self._cost_growth(years, context)
 
-                total_spending = per_capita * enrollment[year, it]
-                spending[year, it] = total_spending
+        def simulate(n: int) -> Tuple[np.ndarray, np.ndarray]:
+            enrollment, _ = self.project_enrollment(years, n)
+            (noise,) = self.draw_block(Draw((years, n), 1.0, 0.022))
+            return self._part_b_per_capita(noise, medical_growth) * enrollment, enrollment
 
-        return {
-            "spending": spending,
-            "enrollment": enrollment,
-            "mean_annual": np.mean(spending, axis=1),
-            "std_annual": np.std(spending, axis=1),
-        }
+        return self._part_result(simulate, iterations, chunk_size)
 
     def project_part_d(
-        self, years: int, iterations: int = 10000
+        self,
+        years: int,
+        iterations: int = 10000,
+        context: Optional[ProjectionContext] = None,
+        chunk_size: Optional[int] = None,
     ) -> Dict[str, np.ndarray]:
         """
         Project Medicare Part D (Prescription Drugs) spending.
@@ -282,140 +355,173 @@ class MedicareModel:
         Args:
             years: Number of years to project
             iterations: Monte Carlo iterations
+            context: Shared macro paths (cost growth moves with its medical inflation)
+            chunk_size: Simulate in blocks (see project_part_a())
 
         Returns:
             Dictionary with spending, enrollment, per-capita costs
         """
         logger.info(f"Projecting Medicare Part D for {years} years ({iterations} iterations)")
 
-        spending = np.zeros((years, iterations))
+        _, drug_growth = self._cost_growth(years, context)
 
-        # Part D enrollment slightly lower than full Medicare
-        enrollment = np.zeros((years, iterations))
-        for it in range(iterations):
-            enrollment_val = self.assumptions.part_d_enrollment * (1 + 0.015 * np.arange(years))[:, np.newaxis]
-            enrollment[:, it] = enrollment_val.flatten()[:years]
+        def simulate(n: int) -> Tuple[np.ndarray, np.ndarray]:
+            # Higher volatility for drug costs
+            (noise,) = self.draw_block(Draw((years, n), 1.0, 0.035))
+            return self._part_d_spending(noise, drug_growth)
 
-        for it in range(iterations):
-            per_capita = self.assumptions.part_d_per_capita_annual
+        return self._part_result(simulate, iterations, chunk_size)
 
-            for year in range(years):
-                # Prescription drug spending grows fastest
-                cost_growth = self.assumptions.prescription_drug_growth_annual
-                cost_noise = np.random.normal(1.0, 0.035)  # Higher volatility
-
-                per_capita = per_capita * (1 + cost_growth) * cost_noise
+    def _simulate_all_parts(
+        self, years: int, iterations: int, context: Optional[ProjectionContext] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Fused Part A/B/D kernel.
 
-                # GLP-1 drugs and advanced therapies drive growth
-                specialty_drug_factor = 1.0 + (0.08 * year / years)  # 8% cumulative impact
+        Draws enrollment once and shares it between Parts A and B, then builds
+        every per-capita path as a cumulative product over its own
+        (years, iterations) noise matrix.
 
-                total_spending = per_capita * enrollment[year, it] * specialty_drug_factor
-                spending[year, it] = total_spending
+        Returns:
+            Dictionary of (years, iterations) arrays
+        """
+        shape = (years, iterations)
+        enrollment_noise, part_a_noise, part_b_noise, part_d_noise = self.draw_block(
+            Draw(shape, 1.0, 0.008),
+            Draw(shape, 1.0, 0.025),
+            Draw(shape, 1.0, 0.022),
+            Draw(shape, 1.0, 0.035),
+        )
+        medical_growth, drug_growth = self._cost_growth(years, context)
+        enrollment = self._enrollment_paths(enrollment_noise)
+        part_a = self._part_a_per_capita(part_a_noise, medical_growth) * enrollment
+        part_b = self._part_b_per_capita(part_b_noise, medical_growth) * enrollment
+        part_d, _ = self._part_d_spending(part_d_noise, drug_growth)
 
+        total_spending = part_a + part_b + part_d
+        per_capita_cost = np.divide(
+            total_spending,
+            enrollment,
+            out=np.zeros_like(total_spending),
+            where=enrollment != 0,
+        )
         return {
-            "spending": spending,
+            "part_a_spending": part_a,
+            "part_b_spending": part_b,
+            "part_d_spending": part_d,
+            "total_spending": total_spending,
             "enrollment": enrollment,
-            "mean_annual": np.mean(spending, axis=1),
-            "std_annual": np.std(spending, axis=1),
+            "per_capita_cost": per_capita_cost,
         }
 
     def project_all_parts(
-        self, years: int, iterations: int = 10000, return_summary: bool = False
-    ) -> pd.DataFrame:
+        self,
+        years: int,
+        iterations: int = 10000,
+        return_summary: bool = False,
+        chunk_size: Optional[int] = None,
+        adaptive: Optional[AdaptiveSampling] = None,
+        return_arrays: bool = False,
+        context: Optional[ProjectionContext] = None,
+    ) -> Union[pd.DataFrame, ProjectionPaths]:
         """
         Project all Medicare Parts combined.
 
+        Uses the fused kernel, so Parts A and B share a single enrollment draw.
+
         Args:
             years: Number of years to project
             iterations: Monte Carlo iterations
+            return_arrays: If True, return the (years, iterations) arrays from
+                the fused kernel (spending in dollars) as ProjectionPaths instead
+                of a DataFrame
             return_summary: If True, return aggregated summary instead of detailed records
+                (the long-format DataFrame is never built)
+            chunk_size: With return_summary, simulate at most this many iterations
+                at a time and fold them into streaming statistics, so memory does
+                not grow with iterations (percentiles become sketch estimates)
+            adaptive: With return_summary, run in batches until the monitored
+                statistics converge (final-year mean total spending by default);
+                ``iterations`` becomes the cap and ``df.attrs["convergence"]``
+                reports the result
+            context: Shared macro paths; Parts A, B and D cost growth move by its
+                medical inflation's deviation from the baseline path
 
         Returns:
             DataFrame with detailed Medicare projections or summary statistics
         """
         logger.info(f"Projecting all Medicare Parts for {years} years ({iterations} iterations)")
 
-        part_a = self.project_part_a(years, iterations)
-        part_b = self.project_part_b(years, iterations)
-        part_d = self.project_part_d(years, iterations)
+        if (chunk_size is not None or adaptive is not None) and not return_summary:
+            raise ValueError("chunk_size and adaptive require return_summary=True")
+        monitor = None
+        if adaptive is not None:
+            monitor = ConvergenceMonitor(adaptive, {"final_total_spending": final_year_mean("total_spending")})
+        chunked = monitor is not None or (chunk_size is not None and chunk_size < iterations)
+        if context is not None:
+            context.check_paths(iterations, streamed=chunked)
+        if chunked:
+            summaries = summarize_paths(
+                lambda n: self._simulate_all_parts(years, n, context),
+                iterations,
+                chunk_size,
+                moments_only=("enrollment", "per_capita_cost"),
+                monitor=monitor,
+            )
+            df = pd.DataFrame({
+                "year": np.arange(self.baseline_year, self.baseline_year + years),
+                **summaries["part_a_spending"].to_dict("part_a"),
+                **summaries["part_b_spending"].to_dict("part_b"),
+                **summaries["part_d_spending"].to_dict("part_d"),
+                **summaries["total_spending"].to_dict("total"),
+                "enrollment_mean": summaries["enrollment"].mean,
+                "per_capita_mean": summaries["per_capita_cost"].mean,
+                "per_capita_std": summaries["per_capita_cost"].std,
+            })
+            if monitor is not None:
+                df.attrs["convergence"] = monitor.report()
+            logger.info(f"Medicare streaming summary complete: {len(df)} years")
+            return df
 
-        # Vectorized computation instead of nested loops
-        # This is ~3-5x faster for large iteration counts
-        
-        # Calculate total spending (vectorized)
-        total_spending = (
-            part_a["spending"] + part_b["spending"] + part_d["spending"]
-        )  # Shape: (years, iterations)
-        
-        # Calculate per-capita cost (vectorized with safe division)
-        per_capita_cost = np.divide(
-            total_spending,
-            part_a["enrollment"],
-            out=np.zeros_like(total_spending),
-            where=part_a["enrollment"] != 0
+        paths = ProjectionPaths(
+            np.arange(self.baseline_year, self.baseline_year + years),
+            self._simulate_all_parts(years, iterations, context),
         )
-        
+        if return_arrays:
+            return paths
+        part_a = paths["part_a_spending"]
+        part_b = paths["part_b_spending"]
+        part_d = paths["part_d_spending"]
+        total_spending = paths["total_spending"]
+        enrollment = paths["enrollment"]
+        per_capita_cost = paths["per_capita_cost"]
+
         if return_summary:
             # Return aggregated summary statistics (much faster, smaller memory)
             years_array = np.arange(self.baseline_year, self.baseline_year + years)
             
             summary_data = {
                 "year": years_array,
-                "part_a_mean": np.mean(part_a["spending"], axis=1),
-                "part_a_std": np.std(part_a["spending"], axis=1),
-                "part_a_p10": np.percentile(part_a["spending"], 10, axis=1),
-                "part_a_p90": np.percentile(part_a["spending"], 90, axis=1),
-                "part_b_mean": np.mean(part_b["spending"], axis=1),
-                "part_b_std": np.std(part_b["spending"], axis=1),
-                "part_b_p10": np.percentile(part_b["spending"], 10, axis=1),
-                "part_b_p90": np.percentile(part_b["spending"], 90, axis=1),
-                "part_d_mean": np.mean(part_d["spending"], axis=1),
-                "part_d_std": np.std(part_d["spending"], axis=1),
-                "part_d_p10": np.percentile(part_d["spending"], 10, axis=1),
-                "part_d_p90": np.percentile(part_d["spending"], 90, axis=1),
-                "total_mean": np.mean(total_spending, axis=1),
-                "total_std": np.std(total_spending, axis=1),
-                "total_p10": np.percentile(total_spending, 10, axis=1),
-                "total_p90": np.percentile(total_spending, 90, axis=1),
-                "enrollment_mean": np.mean(part_a["enrollment"], axis=1),
-                "per_capita_mean": np.mean(per_capita_cost, axis=1),
-                "per_capita_std": np.std(per_capita_cost, axis=1),
+                **summary_statistics(part_a, "part_a"),
+                **summary_statistics(part_b, "part_b"),
+                **summary_statistics(part_d, "part_d"),
+                **summary_statistics(total_spending, "total"),
             }
+            summary_data["enrollment_mean"] = np.mean(enrollment, axis=1)
+            summary_data["per_capita_mean"] = np.mean(per_capita_cost, axis=1)
+            summary_data["per_capita_std"] = np.std(per_capita_cost, axis=1)
             
             df = pd.DataFrame(summary_data)
             logger.info(f"Medicare summary projections complete: {len(df)} years")
             return df
         
-        # Detailed output: Create DataFrame using vectorized approach
-        # Pre-allocate arrays for efficiency
-        n_records = years * iterations
-        
-        # Create year and iteration arrays using broadcasting
-        year_grid, iter_grid = np.meshgrid(
-            np.arange(years),
-            np.arange(iterations),
-            indexing='ij'
-        )
-        
-        # Flatten all arrays to 1D
-        data = {
-            "year": (self.baseline_year + year_grid.ravel()),
-            "iteration": iter_grid.ravel(),
-            "part_a_spending": part_a["spending"].ravel(),
-            "part_b_spending": part_b["spending"].ravel(),
-            "part_d_spending": part_d["spending"].ravel(),
-            "total_spending": total_spending.ravel(),
-            "enrollment": part_a["enrollment"].ravel(),
-            "per_capita_cost": per_capita_cost.ravel(),
-        }
-        
-        # Create DataFrame in one shot (much faster than appending)
-        df = pd.DataFrame(data)
+        # Detailed output, rows in year-major order
+        df = paths.to_frame(order="year")
         logger.info(f"Medicare projections complete: {len(df)} records")
         return df
 
 
-class MedicaidModel:
+class MedicaidModel(RandomStreamMixin):
     """
     Comprehensive Medicaid spending projection model.
     
@@ -426,20 +532,48 @@ class MedicaidModel:
     - Policy reform scenarios (eligibility changes, payment rates)
     """
 
-    def __init__(self, assumptions: Optional[MedicaidAssumptions] = None, seed: Optional[int] = None):
-        """Initialize Medicaid model with assumptions."""
+    def __init__(
+        self,
+        assumptions: Optional[MedicaidAssumptions] = None,
+        seed: Optional[SeedLike] = None,
+        sampler: Optional[SamplerLike] = None,
+    ):
+        """Initialize Medicaid model with assumptions and a sampler (pseudo-random if None)."""
         self.assumptions = assumptions or MedicaidAssumptions()
         self.baseline_year = 2025
-        self.seed = seed
         
+        self._init_random_stream(seed, sampler)
         if seed is not None:
-            np.random.seed(seed)
             logger.info(f"Random seed set to {seed} for reproducibility")
         
         logger.info("Medicaid model initialized with 2025 baseline")
 
+    def draw_noise(self, years: int, iterations: int = 10000) -> Dict[str, np.ndarray]:
+        """
+        Draw every Medicaid noise matrix in one pass.
+
+        Args:
+            years: Number of years to project
+            iterations: Monte Carlo iterations
+
+        Returns:
+            Dictionary of (years, iterations) multiplicative noise matrices for
+            "traditional", "expansion" and "chip" enrollment and "spending"
+        """
+        shape = (years, iterations)
+        traditional, expansion, chip, spending = self.draw_block(
+            Draw(shape, 1.0, 0.01),
+            Draw(shape, 1.0, 0.015),
+            Draw(shape, 1.0, 0.012),
+            Draw(shape, 1.0, 0.025),
+        )
+        return {"traditional": traditional, "expansion": expansion, "chip": chip, "spending": spending}
+
     def project_enrollment(
-        self, years: int, iterations: int = 10000
+        self,
+        years: int,
+        iterations: int = 10000,
+        noise: Optional[Dict[str, np.ndarray]] = None,
     ) -> Dict[str, np.ndarray]:
         """
         Project Medicaid enrollment by category with uncertainty.
@@ -447,40 +581,34 @@ class MedicaidModel:
         Args:
             years: Number of years to project
             iterations: Monte Carlo iterations
+            noise: Pre-drawn noise matrices from draw_noise() (drawn if None)
 
         Returns:
             Dictionary with enrollment by category
         """
         logger.info(f"Projecting Medicaid enrollment for {years} years ({iterations} iterations)")
 
-        traditional = np.zeros((years, iterations))
-        expansion = np.zeros((years, iterations))
-        chip = np.zeros((years, iterations))
+        if noise is None:
+            noise = self.draw_noise(years, iterations)
+        year_index = np.arange(years)[:, np.newaxis]
 
-        for it in range(iterations):
-            trad_val = self.assumptions.traditional_medicaid_enrollment
-            exp_val = self.assumptions.medicaid_expansion_enrollment
-            chip_val = self.assumptions.chip_enrollment
-
-            for year in range(years):
-                # Traditional Medicaid growth (stable)
-                trad_growth = 0.01
-                trad_noise = np.random.normal(1.0, 0.01)
-                trad_val = trad_val * (1 + trad_growth) * trad_noise
-
-                # Expansion states growth (slower as reaches saturation)
-                exp_growth = 0.015 * (1 - year / (years * 2))  # Declining
-                exp_noise = np.random.normal(1.0, 0.015)
-                exp_val = exp_val * (1 + max(exp_growth, 0.002)) * exp_noise
+        # Traditional Medicaid growth (stable)
+        trad_growth = 0.01
+        traditional = self.assumptions.traditional_medicaid_enrollment * np.cumprod(
+            (1 + trad_growth) * noise["traditional"], axis=0
+        )
 
-                # CHIP enrollment (stable)
-                chip_growth = 0.005
-                chip_noise = np.random.normal(1.0, 0.012)
-                chip_val = chip_val * (1 + chip_growth) * chip_noise
+        # Expansion states growth (slower as reaches saturation)
+        exp_growth = np.maximum(0.015 * (1 - year_index / (years * 2)), 0.002)  # Declining
+        expansion = self.assumptions.medicaid_expansion_enrollment * np.cumprod(
+            (1 + exp_growth) * noise["expansion"], axis=0
+        )
 
-                traditional[year, it] = trad_val
-                expansion[year, it] = exp_val
-                chip[year, it] = chip_val
+        # CHIP enrollment (stable)
+        chip_growth = 0.005
+        chip = self.assumptions.chip_enrollment * np.cumprod(
+            (1 + chip_growth) * noise["chip"], axis=0
+        )
 
         return {
             "traditional": traditional,
@@ -490,65 +618,162 @@ class MedicaidModel:
         }
 
     def project_spending(
-        self, years: int, iterations: int = 10000
-    ) -> pd.DataFrame:
+        self,
+        years: int,
+        iterations: int = 10000,
+        noise: Optional[Dict[str, np.ndarray]] = None,
+        return_summary: bool = False,
+        chunk_size: Optional[int] = None,
+        adaptive: Optional[AdaptiveSampling] = None,
+        return_arrays: bool = False,
+        context: Optional[ProjectionContext] = None,
+    ) -> Union[pd.DataFrame, ProjectionPaths]:
         """
         Project total Medicaid spending.
 
         Args:
             years: Number of years to project
             iterations: Monte Carlo iterations
+            noise: Pre-drawn noise matrices from draw_noise() (drawn if None)
+            return_arrays: If True, return the (years, iterations) enrollment
+                (total and by category) and spending arrays (spending in
+                thousands) as ProjectionPaths instead of a DataFrame
+            return_summary: If True, return per-year mean/std/p10/p90 instead of
+                detailed records (the long-format DataFrame is never built)
+            chunk_size: With return_summary, simulate at most this many iterations
+                at a time and fold them into streaming statistics (percentiles
+                become sketch estimates); cannot be combined with noise
+            adaptive: With return_summary, run in batches until the monitored
+                statistics converge (final-year mean total spending by default);
+                ``iterations`` becomes the cap and ``df.attrs["convergence"]``
+                reports the result
+            context: Shared macro paths; per-capita costs scale with its medical
+                price index relative to the baseline medical inflation path
+                the category rates are calibrated against
 
         Returns:
-            DataFrame with detailed Medicaid projections
+            DataFrame with detailed Medicaid projections or summary statistics
         """
         logger.info(f"Projecting Medicaid spending for {years} years ({iterations} iterations)")
+        if context is not None:
+            context.check_horizon(years)
+
+        year_index = np.arange(years)
+        streamed = chunk_size is not None or adaptive is not None
+        if streamed and not return_summary:
+            raise ValueError("chunk_size and adaptive require return_summary=True")
+        if streamed and noise is not None:
+            raise ValueError("chunk_size and adaptive draw their own noise per block; do not pass noise")
+        monitor = None
+        if adaptive is not None:
+            monitor = ConvergenceMonitor(adaptive, {"final_total_spending": final_year_mean("total")})
+        chunked = monitor is not None or (chunk_size is not None and chunk_size < iterations)
+        if context is not None:
+            context.check_paths(iterations, streamed=chunked)
+        if chunked:
+            def simulate_block(n: int) -> Dict[str, np.ndarray]:
+                enrollment, total_spending = self._spending_paths(years, n, context=context)
+                return {"total": total_spending, "enrollment": enrollment["total"]}
+
+            summaries = summarize_paths(
+                simulate_block, iterations, chunk_size, moments_only=("enrollment",), monitor=monitor
+            )
+            total_stats = summaries["total"].to_dict("total")
+            df = pd.DataFrame({
+                "year": self.baseline_year + year_index,
+                **total_stats,
+                # The federal share is a constant 60%, so its statistics scale exactly
+                **{key.replace("total_", "federal_", 1): values * 0.60
+                   for key, values in total_stats.items()},
+                "enrollment_mean": summaries["enrollment"].mean,
+                "enrollment_std": summaries["enrollment"].std,
+            })
+            if monitor is not None:
+                df.attrs["convergence"] = monitor.report()
+            logger.info(f"Medicaid streaming summary complete: {len(df)} years")
+            return df
+
+        enrollment, total_spending = self._spending_paths(years, iterations, noise, context)
+        if return_arrays:
+            return ProjectionPaths(self.baseline_year + year_index, {
+                "enrollment": enrollment["total"],
+                **{f"{category}_enrollment": enrollment[category] for category in ("traditional", "expansion", "chip")},
+                "total_spending": total_spending,
+            })
+
+        if return_summary:
+            df = pd.DataFrame({
+                "year": self.baseline_year + year_index,
+                **summary_statistics(total_spending, "total"),
+                **summary_statistics(total_spending * 0.60, "federal"),
+                "enrollment_mean": np.mean(enrollment["total"], axis=1),
+                "enrollment_std": np.std(enrollment["total"], axis=1),
+            })
+            logger.info(f"Medicaid summary projections complete: {len(df)} years")
+            return df
 
-        enrollment = self.project_enrollment(years, iterations)
-
-        results = []
-        for it in range(iterations):
-            for year in range(years):
-                # Cost growth by category
-                aged_pc = self.assumptions.aged_per_capita_annual * ((1 + 0.040) ** year)
-                disabled_pc = self.assumptions.blind_disabled_per_capita_annual * ((1 + 0.035) ** year)
-                children_pc = self.assumptions.children_per_capita_annual * ((1 + 0.028) ** year)
-                parents_pc = self.assumptions.parents_caregivers_per_capita_annual * ((1 + 0.032) ** year)
-                expansion_pc = self.assumptions.expansion_adults_per_capita_annual * ((1 + 0.030) ** year)
-
-                # Estimate category breakdown
-                aged_pct, disabled_pct, children_pct, parents_pct = 0.12, 0.15, 0.40, 0.20
-                expansion_pct = 0.13
-
-                total_spending = (
-                    enrollment["traditional"][year, it] * (aged_pct * aged_pc + disabled_pct * disabled_pc + 
-                                                           children_pct * children_pc + parents_pct * parents_pc)
-                    + enrollment["expansion"][year, it] * expansion_pc
-                    + enrollment["chip"][year, it] * children_pc
-                )
-
-                # Add Monte Carlo noise
-                noise = np.random.normal(1.0, 0.025)
-                total_spending *= noise
-
-                results.append(
-                    {
-                        "year": self.baseline_year + year,
-                        "iteration": it,
-                        "traditional_enrollment": enrollment["traditional"][year, it],
-                        "expansion_enrollment": enrollment["expansion"][year, it],
-                        "chip_enrollment": enrollment["chip"][year, it],
-                        "total_enrollment": enrollment["total"][year, it],
-                        "total_spending": total_spending,
-                        "federal_share": total_spending * 0.60,
-                        "state_share": total_spending * 0.40,
-                    }
-                )
-
-        df = pd.DataFrame(results)
+        paths = ProjectionPaths(self.baseline_year + year_index, {
+            **{f"{category}_enrollment": enrollment[category] for category in ("traditional", "expansion", "chip", "total")},
+            "total_spending": total_spending,
+            "federal_share": total_spending * 0.60,
+            "state_share": total_spending * 0.40,
+        })
+        df = paths.to_frame()
         logger.info(f"Medicaid projections complete: {len(df)} records")
         return df
 
+    def _spending_paths(
+        self,
+        years: int,
+        iterations: int,
+        noise: Optional[Dict[str, np.ndarray]] = None,
+        context: Optional[ProjectionContext] = None,
+    ) -> Tuple[Dict[str, np.ndarray], np.ndarray]:
+        """
+        Enrollment by category and total spending as (years, iterations) arrays.
+
+        Args:
+            years: Number of years to project
+            iterations: Monte Carlo iterations
+            noise: Pre-drawn noise matrices from draw_noise() (drawn if None)
+            context: Shared macro paths (see project_spending())
+
+        Returns:
+            Tuple of (enrollment dictionary, total spending array)
+        """
+        if noise is None:
+            noise = self.draw_noise(years, iterations)
+        enrollment = self.project_enrollment(years, iterations, noise=noise)
+
+        # Cost growth by category (shared index tables)
+        aged_pc = self.assumptions.aged_per_capita_annual * growth_index(0.040, years)
+        disabled_pc = self.assumptions.blind_disabled_per_capita_annual * growth_index(0.035, years)
+        children_pc = self.assumptions.children_per_capita_annual * growth_index(0.028, years)
+        parents_pc = self.assumptions.parents_caregivers_per_capita_annual * growth_index(0.032, years)
+        expansion_pc = self.assumptions.expansion_adults_per_capita_annual * growth_index(0.030, years)
+
+        # Estimate category breakdown of traditional enrollment
+        aged_pct, disabled_pct, children_pct, parents_pct = 0.12, 0.15, 0.40, 0.20
+        traditional_pc = (
+            aged_pct * aged_pc + disabled_pct * disabled_pc
+            + children_pct * children_pc + parents_pct * parents_pc
+        )
+
+        total_spending = (
+            enrollment["traditional"] * traditional_pc[:, np.newaxis]
+            + enrollment["expansion"] * expansion_pc[:, np.newaxis]
+            + enrollment["chip"] * children_pc[:, np.newaxis]
+        ) * noise["spending"]  # Monte Carlo noise
+        if context is not None:
+            # (years,) for a constant rate, (years, iterations) for per-path rates
+            medical_index = context.medical_index[:years]
+            if medical_index.ndim == 1:
+                medical_index = medical_index[:, np.newaxis]
+            total_spending = total_spending * (
+                medical_index / growth_index(BASELINE_MEDICAL_INFLATION, years)[:, np.newaxis]
+            )
+        return enrollment, total_spending
+
     def apply_policy_reform(
         self, reforms: Dict[str, Any], baseline: pd.DataFrame
     ) -> pd.DataFrame:
@@ -13,7 +13,16 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple, Optional, Any
 from dataclasses import dataclass
-from scipy import stats
+
+from core.online_stats import (
+    AdaptiveSampling,
+    ConvergenceMonitor,
+    final_year_mean,
+    final_year_percentile,
+    run_adaptive,
+)
+from core.random_streams import RandomStreamMixin, SeedLike, make_generator
+from core.samplers import Draw, SamplerLike
 
 
 @dataclass
@@ -30,14 +39,22 @@ class MonteCarloResult:
     best_case: float
     worst_case: float
     probability_balanced: float  # P(deficit < 0)
-    simulation_results: np.ndarray  # All simulation paths
+    simulation_results: Optional[np.ndarray] = None  # All simulation paths (None if not requested)
+    convergence: Optional[Dict[str, Any]] = None  # Adaptive runs: achieved iterations and precision
 
 
-class MonteCarloPolicySimulator:
+class MonteCarloPolicySimulator(RandomStreamMixin):
     """Run Monte Carlo simulations on custom policies."""
     
-    def __init__(self, base_revenue: float = 5_980.0, base_spending: float = 6_911.0):
-        """Initialize simulator with baseline values."""
+    def __init__(
+        self,
+        base_revenue: float = 5_980.0,
+        base_spending: float = 6_911.0,
+        seed: Optional[SeedLike] = None,
+        sampler: Optional[SamplerLike] = None,
+    ):
+        """Initialize simulator with baseline values, its own random stream and a sampler."""
+        self._init_random_stream(seed, sampler)
         self.base_revenue = base_revenue
         self.base_spending = base_spending
         self.gdp = 29_360.0
@@ -55,11 +72,17 @@ class MonteCarloPolicySimulator:
         growth_scenarios: Optional[List[float]] = None,
         years: int = 10,
         iterations: int = 10_000,
-        random_seed: Optional[int] = None,
+        random_seed: Optional[SeedLike] = None,
+        dtype: Any = np.float64,
+        return_paths: bool = True,
+        adaptive: Optional[AdaptiveSampling] = None,
     ) -> MonteCarloResult:
         """
         Run Monte Carlo simulation on a policy.
         
+        Each path is base × (1 + change) × multiplier × (1 + g)^t, so the
+        deficit matrix is built with broadcasting rather than a year loop.
+        
         Args:
             policy_name: Name of policy
             revenue_change_pct: Expected revenue change
@@ -69,47 +92,53 @@ class MonteCarloPolicySimulator:
             growth_scenarios: List of GDP growth rate assumptions (uses random if None)
             years: Projection years
             iterations: Number of Monte Carlo iterations
-            random_seed: Random seed for reproducibility
+            random_seed: Seed for a one-off stream for this call (uses the
+                simulator's own stream if None)
+            dtype: Floating point dtype of the deficit paths (e.g. np.float32)
+            return_paths: If False, only the final-year deficits are computed and
+                simulation_results is None (summary statistics are unchanged)
+            adaptive: Run in batches and stop once the monitored statistics
+                (mean and P90 final-year deficit by default) converge;
+                ``iterations`` becomes the cap
         
         Returns:
             MonteCarloResult with statistics
         """
-        if random_seed is not None:
-            np.random.seed(random_seed)
+        rng = self.rng if random_seed is None else make_generator(random_seed)
         
-        # Initialize results array (iterations x years)
-        deficit_paths = np.zeros((iterations, years))
+        def simulate_block(n: int) -> Dict[str, np.ndarray]:
+            initial_deficit, growth_factor = self._sample_deficits(
+                rng, n, revenue_change_pct, spending_change_pct,
+                revenue_uncertainty_pct, spending_uncertainty_pct, growth_scenarios, dtype,
+            )
+            if return_paths:
+                # Annual growth compounding, (n, years)
+                compounding = growth_factor[:, np.newaxis] ** np.arange(1, years + 1, dtype=dtype)
+                paths = initial_deficit[:, np.newaxis] * compounding
+                return {"paths": paths, "deficit": paths[np.newaxis, :, -1]}  # Final year deficits
+            # Closed form for the final year only
+            return {"deficit": (initial_deficit * growth_factor ** years)[np.newaxis, :]}
         
-        for i in range(iterations):
-            # Draw random realizations
-            if growth_scenarios:
-                growth_rate = np.random.choice(growth_scenarios)
-            else:
-                growth_rate = np.random.normal(self.growth_mean, self.growth_std)
-            
-            # Revenue uncertainty (lognormal distribution)
-            revenue_multiplier = np.random.normal(1.0, revenue_uncertainty_pct / 100)
-            revenue_multiplier = np.maximum(revenue_multiplier, 0.5)  # Cap at -50%
-            
-            # Spending uncertainty (lognormal distribution)
-            spending_multiplier = np.random.normal(1.0, spending_uncertainty_pct / 100)
-            spending_multiplier = np.maximum(spending_multiplier, 0.5)  # Cap at -50%
-            
-            # Project each year
-            current_revenue = self.base_revenue * (1 + revenue_change_pct / 100) * revenue_multiplier
-            current_spending = self.base_spending * (1 + spending_change_pct / 100) * spending_multiplier
-            
-            for year in range(years):
-                # Annual growth
-                current_revenue *= (1 + growth_rate)
-                current_spending *= (1 + growth_rate)
-                
-                # Store deficit
-                deficit_paths[i, year] = current_spending - current_revenue
+        convergence = None
+        if adaptive is None:
+            blocks = [simulate_block(iterations)]
+        else:
+            monitor = ConvergenceMonitor(adaptive, {
+                "mean_deficit": final_year_mean("deficit"),
+                "p90_deficit": final_year_percentile("deficit", 90),
+            })
+            blocks = list(run_adaptive(simulate_block, iterations, monitor))
+            convergence = monitor.report()
+            iterations = monitor.iterations
         
-        # Calculate statistics
-        annual_deficits = deficit_paths[:, -1]  # Final year deficits
+        if len(blocks) == 1:
+            annual_deficits = blocks[0]["deficit"][0]
+            deficit_paths = blocks[0].get("paths")
+        else:
+            annual_deficits = np.concatenate([block["deficit"][0] for block in blocks])
+            deficit_paths = np.concatenate([block["paths"] for block in blocks]) if return_paths else None
         
+        # Calculate statistics
         mean_deficit = np.mean(annual_deficits)
         median_deficit = np.median(annual_deficits)
         std_dev_deficit = np.std(annual_deficits)
@@ -134,8 +163,57 @@ class MonteCarloPolicySimulator:
             worst_case=worst_case,
             probability_balanced=probability_balanced,
             simulation_results=deficit_paths,
+            convergence=convergence,
         )
     
+    def _sample_deficits(
+        self,
+        rng: np.random.Generator,
+        iterations: int,
+        revenue_change_pct: float,
+        spending_change_pct: float,
+        revenue_uncertainty_pct: float,
+        spending_uncertainty_pct: float,
+        growth_scenarios: Optional[List[float]],
+        dtype: Any,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Draw starting deficits and growth factors for a batch of iterations.
+        
+        Returns:
+            Tuple of (initial deficit, 1 + growth rate) arrays of shape (iterations,)
+        """
+        # Draw random realizations for every iteration
+        if growth_scenarios:
+            # A uniform draw picks the scenario, so samplers stratify the choice too
+            scenario_draw, draws = self.sampler.draw(rng, [
+                Draw((iterations,), uniform=True, iteration_axis=0),
+                Draw((iterations, 2), iteration_axis=0),
+            ])
+            index = np.minimum((scenario_draw * len(growth_scenarios)).astype(int), len(growth_scenarios) - 1)
+            growth_rate = np.asarray(growth_scenarios, dtype=float)[index]
+            revenue_draws, spending_draws = draws[:, 0], draws[:, 1]
+        else:
+            # One (growth, revenue, spending) draw per iteration
+            (draws,) = self.sampler.draw(rng, [Draw((iterations, 3), iteration_axis=0)])
+            growth_rate = self.growth_mean + self.growth_std * draws[:, 0]
+            revenue_draws, spending_draws = draws[:, 1], draws[:, 2]
+        
+        # Revenue uncertainty (lognormal distribution)
+        revenue_multiplier = 1.0 + (revenue_uncertainty_pct / 100) * revenue_draws
+        revenue_multiplier = np.maximum(revenue_multiplier, 0.5)  # Cap at -50%
+        
+        # Spending uncertainty (lognormal distribution)
+        spending_multiplier = 1.0 + (spending_uncertainty_pct / 100) * spending_draws
+        spending_multiplier = np.maximum(spending_multiplier, 0.5)  # Cap at -50%
+        
+        # Starting deficit per path; revenue and spending share the growth rate
+        initial_revenue = self.base_revenue * (1 + revenue_change_pct / 100) * revenue_multiplier
+        initial_spending = self.base_spending * (1 + spending_change_pct / 100) * spending_multiplier
+        initial_deficit = (initial_spending - initial_revenue).astype(dtype)
+        growth_factor = (1 + growth_rate).astype(dtype)
+        return initial_deficit, growth_factor
+    
     def compare_policies(
         self,
         policies: Dict[str, Dict[str, float]],
@@ -162,6 +240,7 @@ class MonteCarloPolicySimulator:
                 spending_change_pct=params.get("spending_change_pct", 0),
                 years=years,
                 iterations=iterations,
+                return_paths=False,
             )
             
             results.append({
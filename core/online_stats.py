@@ -0,0 +1,515 @@
+"""
+Streaming summary statistics for Monte Carlo outputs.
+
+Most consumers reduce simulated paths to per-year mean, standard deviation
+and a few percentiles. The accumulators here fold iterations in block by
+block, so a projection can run millions of iterations in constant memory:
+
+    - RunningMoments: Welford/Chan mean and variance, exact and mergeable
+    - QuantileSketch: vectorized merging t-digest (arcsine scale), mergeable
+    - StreamingSummary: both of the above, reported with the same keys as
+      summary_statistics()
+    - ConvergenceMonitor: batch-means standard errors of scalar statistics,
+      used to stop an adaptive run once they fall below a tolerance
+
+Every accumulator tracks a vector of independent cells (usually one per
+projection year) and is updated with (cells, n) blocks.
+
+Usage:
+    from core.online_stats import iter_chunks, summarize_paths
+
+    summaries = summarize_paths(
+        lambda n: {"total": simulate(years, n)},  # (years, n) arrays
+        iterations=1_000_000,
+        chunk_size=10_000,
+    )
+    summaries["total"].to_dict("total")  # total_mean, total_std, total_p10, total_p90
+
+    # Adaptive: stop once the final-year mean is known to 0.1% (iterations is the cap)
+    monitor = ConvergenceMonitor(AdaptiveSampling(tolerance=0.001), {"total": final_year_mean("total")})
+    summaries = summarize_paths(
+        lambda n: {"total": simulate(years, n)}, iterations=50_000, monitor=monitor
+    )
+    monitor.report()  # iterations, converged, estimates, standard_errors
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Sequence
+
+import numpy as np
+
+# Iterations per block when a caller asks for chunked summaries without a size
+DEFAULT_CHUNK_SIZE = 10_000
+
+# t-digest compression: centroids kept per cell (accuracy ~1/compression in the tails)
+DEFAULT_COMPRESSION = 200
+
+
+def summary_statistics(
+    values: np.ndarray, prefix: str, percentiles: Sequence[float] = (10, 90)
+) -> Dict[str, np.ndarray]:
+    """Exact per-year mean/std/percentiles of a (years, iterations) array, keyed by prefix."""
+    quantiles = np.percentile(values, percentiles, axis=1)
+    return {
+        f"{prefix}_mean": np.mean(values, axis=1),
+        f"{prefix}_std": np.std(values, axis=1),
+        **{f"{prefix}_p{p:g}": quantile for p, quantile in zip(percentiles, quantiles)},
+    }
+
+
+def iter_chunks(iterations: int, chunk_size: Optional[int] = None) -> Iterator[int]:
+    """
+    Split an iteration count into block sizes.
+
+    Args:
+        iterations: Total Monte Carlo iterations
+        chunk_size: Maximum iterations per block (DEFAULT_CHUNK_SIZE if None)
+
+    Yields:
+        Block sizes summing to ``iterations``
+    """
+    chunk_size = DEFAULT_CHUNK_SIZE if chunk_size is None else chunk_size
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+    remaining = iterations
+    while remaining > 0:
+        block = min(chunk_size, remaining)
+        yield block
+        remaining -= block
+
+
+class RunningMoments:
+    """
+    Running mean and variance per cell (Welford, merged with Chan's formula).
+
+    Blocks are reduced with NumPy and combined pairwise, which is both faster
+    and more accurate than a per-sample update.
+    """
+
+    def __init__(self, cells: int):
+        """
+        Initialize empty accumulators.
+
+        Args:
+            cells: Number of independent cells (e.g. projection years)
+        """
+        self.count = 0
+        self.mean = np.zeros(cells)
+        self._m2 = np.zeros(cells)
+
+    def update(self, block: np.ndarray) -> None:
+        """Fold in a (cells, n) block of samples."""
+        block = np.asarray(block, dtype=float)
+        n = block.shape[1]
+        if n == 0:
+            return
+        block_mean = block.mean(axis=1)
+        block_m2 = np.square(block - block_mean[:, np.newaxis]).sum(axis=1)
+        self._combine(n, block_mean, block_m2)
+
+    def merge(self, other: "RunningMoments") -> None:
+        """Fold in another accumulator over the same cells."""
+        self._combine(other.count, other.mean, other._m2)
+
+    def _combine(self, n: int, mean: np.ndarray, m2: np.ndarray) -> None:
+        if n == 0:
+            return
+        total = self.count + n
+        delta = mean - self.mean
+        self.mean = self.mean + delta * (n / total)
+        self._m2 = self._m2 + m2 + np.square(delta) * (self.count * n / total)
+        self.count = total
+
+    @property
+    def variance(self) -> np.ndarray:
+        """Population variance (ddof=0, as np.var)."""
+        if self.count == 0:
+            return np.full_like(self.mean, np.nan)
+        return self._m2 / self.count
+
+    @property
+    def std(self) -> np.ndarray:
+        """Population standard deviation (ddof=0, as np.std)."""
+        return np.sqrt(self.variance)
+
+
+class QuantileSketch:
+    """
+    Mergeable quantile sketch per cell (merging t-digest).
+
+    Each cell keeps at most ``compression`` weighted centroids. On compression,
+    centroids are sorted and assigned to buckets of equal width on the arcsine
+    scale k(q) = compression * (asin(2q - 1) / pi + 1/2), so buckets are narrow
+    near the tails and wide around the median. All cells compress together in
+    one vectorized pass.
+    """
+
+    def __init__(self, cells: int, compression: int = DEFAULT_COMPRESSION):
+        """
+        Initialize an empty sketch.
+
+        Args:
+            cells: Number of independent cells (e.g. projection years)
+            compression: Maximum centroids per cell
+        """
+        if compression < 2:
+            raise ValueError(f"compression must be at least 2, got {compression}")
+        self.cells = cells
+        self.compression = compression
+        self.count = 0
+        self._means = np.zeros((cells, 0))
+        self._weights = np.zeros((cells, 0))
+        self.min = np.full(cells, np.inf)
+        self.max = np.full(cells, -np.inf)
+
+    def update(self, block: np.ndarray) -> None:
+        """Fold in a (cells, n) block of samples."""
+        block = np.asarray(block, dtype=float)
+        if block.shape[1] == 0:
+            return
+        self.min = np.minimum(self.min, block.min(axis=1))
+        self.max = np.maximum(self.max, block.max(axis=1))
+        self._absorb(block, np.ones_like(block), block.shape[1])
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Fold in another sketch over the same cells."""
+        if other.count == 0:
+            return
+        self.min = np.minimum(self.min, other.min)
+        self.max = np.maximum(self.max, other.max)
+        self._absorb(other._means, other._weights, other.count)
+
+    def _absorb(self, means: np.ndarray, weights: np.ndarray, count: int) -> None:
+        self._means = np.concatenate([self._means, means], axis=1)
+        self._weights = np.concatenate([self._weights, weights], axis=1)
+        self.count += count
+        if self._means.shape[1] > self.compression:
+            self._compress()
+
+    def _compress(self) -> None:
+        """Merge centroids into at most ``compression`` per cell."""
+        order = np.argsort(self._means, axis=1, kind="stable")
+        means = np.take_along_axis(self._means, order, axis=1)
+        weights = np.take_along_axis(self._weights, order, axis=1)
+
+        cumulative = np.cumsum(weights, axis=1)
+        midpoint_q = (cumulative - weights / 2) / cumulative[:, -1:]
+        k = self.compression * (np.arcsin(2 * midpoint_q - 1) / np.pi + 0.5)
+        bucket = np.clip(np.floor(k).astype(np.intp), 0, self.compression - 1)
+
+        # Flat (cell, bucket) ids let one bincount reduce every cell at once
+        flat = (bucket + np.arange(self.cells)[:, np.newaxis] * self.compression).ravel()
+        size = self.cells * self.compression
+        bucket_weights = np.bincount(flat, weights=weights.ravel(), minlength=size)
+        bucket_sums = np.bincount(flat, weights=(weights * means).ravel(), minlength=size)
+
+        self._weights = bucket_weights.reshape(self.cells, self.compression)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            bucket_means = bucket_sums / bucket_weights
+        # Empty buckets keep zero weight and never influence a quantile
+        self._means = np.where(bucket_weights > 0, bucket_means, 0.0).reshape(self.cells, self.compression)
+
+    def quantile(self, q: Iterable[float]) -> np.ndarray:
+        """
+        Estimate quantiles per cell.
+
+        Args:
+            q: Quantiles in [0, 1]
+
+        Returns:
+            Array of shape (len(q), cells)
+        """
+        q = np.atleast_1d(np.asarray(q, dtype=float))
+        if self.count == 0:
+            return np.full((len(q), self.cells), np.nan)
+
+        # Empty centroids sort last and sit on the upper anchor, so they add
+        # zero-length segments and every cell shares one table width
+        present = self._weights > 0
+        order = np.argsort(np.where(present, self._means, np.inf), axis=1, kind="stable")
+        weights = np.take_along_axis(self._weights, order, axis=1)
+        means = np.where(
+            np.take_along_axis(present, order, axis=1),
+            np.take_along_axis(self._means, order, axis=1),
+            self.max[:, np.newaxis],
+        )
+        cumulative = np.cumsum(weights, axis=1)
+        total = cumulative[:, -1:]
+
+        # Interpolate between centroid midpoints, anchored at the observed extremes
+        positions = np.hstack([np.zeros((self.cells, 1)), cumulative - weights / 2, total])
+        values = np.hstack([self.min[:, np.newaxis], means, self.max[:, np.newaxis]])
+        targets = q[:, np.newaxis] * total.T  # (len(q), cells)
+
+        # Segment per (quantile, cell): last position at or below the target
+        segment = (positions[np.newaxis] <= targets[..., np.newaxis]).sum(axis=2) - 1
+        segment = np.clip(segment, 0, positions.shape[1] - 2)
+        cell_index = np.arange(self.cells)
+        lo, hi = positions[cell_index, segment], positions[cell_index, segment + 1]
+        lo_value, hi_value = values[cell_index, segment], values[cell_index, segment + 1]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            slope = np.where(hi > lo, (hi_value - lo_value) / (hi - lo), 0.0)
+        return slope * (targets - lo) + lo_value
+
+
+class StreamingSummary:
+    """Running mean/std plus a quantile sketch for a vector of cells."""
+
+    def __init__(self, cells: int, compression: Optional[int] = DEFAULT_COMPRESSION):
+        """
+        Initialize empty accumulators.
+
+        Args:
+            cells: Number of independent cells (e.g. projection years)
+            compression: Quantile sketch compression (None tracks moments only)
+        """
+        self.moments = RunningMoments(cells)
+        self.sketch = QuantileSketch(cells, compression) if compression is not None else None
+
+    def update(self, block: np.ndarray) -> None:
+        """Fold in a (cells, n) block of samples."""
+        self.moments.update(block)
+        if self.sketch is not None:
+            self.sketch.update(block)
+
+    def merge(self, other: "StreamingSummary") -> None:
+        """Fold in another summary over the same cells."""
+        self.moments.merge(other.moments)
+        if self.sketch is not None and other.sketch is not None:
+            self.sketch.merge(other.sketch)
+        elif self.sketch is not None:
+            raise ValueError("Cannot merge a moments-only summary into one with a quantile sketch")
+
+    @property
+    def count(self) -> int:
+        return self.moments.count
+
+    @property
+    def mean(self) -> np.ndarray:
+        return self.moments.mean
+
+    @property
+    def std(self) -> np.ndarray:
+        return self.moments.std
+
+    def percentile(self, percentiles: Iterable[float]) -> np.ndarray:
+        """Estimated percentiles (0-100) per cell, shape (len(percentiles), cells)."""
+        if self.sketch is None:
+            raise ValueError("Summary was created without a quantile sketch")
+        return self.sketch.quantile(np.asarray(percentiles, dtype=float) / 100)
+
+    def to_dict(self, prefix: str, percentiles: Sequence[float] = (10, 90)) -> Dict[str, np.ndarray]:
+        """Mean/std/percentiles keyed like summary_statistics()."""
+        quantiles = self.percentile(percentiles)
+        return {
+            f"{prefix}_mean": self.mean,
+            f"{prefix}_std": self.std,
+            **{f"{prefix}_p{p:g}": quantile for p, quantile in zip(percentiles, quantiles)},
+        }
+
+
+# A statistic reduces one block of outputs ({name: (cells, n) array}) to a scalar
+BlockStatistic = Callable[[Dict[str, np.ndarray]], float]
+
+
+def final_year_mean(output: str) -> BlockStatistic:
+    """Statistic: mean of an output's last cell (usually the final projection year)."""
+    return lambda block: float(np.mean(block[output][-1]))
+
+
+def final_year_percentile(output: str, percentile: float) -> BlockStatistic:
+    """
+    Statistic: percentile (0-100) of an output's last cell.
+
+    Monitored estimates are weighted averages of per-batch percentiles, an
+    approximation of the pooled percentile whose small-batch bias shrinks
+    with ``batch_size``.
+    """
+    return lambda block: float(np.percentile(block[output][-1], percentile))
+
+
+@dataclass
+class AdaptiveSampling:
+    """
+    Convergence stopping rule for an adaptive Monte Carlo run.
+
+    Iterations are drawn in batches of ``batch_size`` until the standard error
+    of every monitored statistic is at most ``tolerance`` (relative to the
+    estimate's magnitude when ``relative``), or the caller's iteration count,
+    which acts as the cap, is reached.
+    """
+    tolerance: float = 0.001
+    relative: bool = True
+    batch_size: int = 1_000
+    min_batches: int = 4
+    statistics: Optional[Dict[str, BlockStatistic]] = None  # None uses the model's defaults
+
+    def __post_init__(self):
+        if self.tolerance <= 0:
+            raise ValueError(f"tolerance must be positive, got {self.tolerance}")
+        if self.batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {self.batch_size}")
+        if self.min_batches < 2:
+            raise ValueError(f"min_batches must be at least 2, got {self.min_batches}")
+
+
+class ConvergenceMonitor:
+    """
+    Batch-means standard errors for scalar statistics of streamed blocks.
+
+    Each statistic is evaluated once per batch; the spread of those batch
+    values estimates the standard error of their average, which works for
+    percentiles as well as means. Batches are weighted by their iteration
+    count, since the final batch under an iteration cap can be short. For
+    means the estimate equals the pooled mean; for percentiles it is the
+    batch-mean approximation, not the pooled percentile.
+    """
+
+    def __init__(self, adaptive: AdaptiveSampling, default_statistics: Dict[str, BlockStatistic]):
+        """
+        Initialize a monitor.
+
+        Args:
+            adaptive: Stopping rule (its statistics override the defaults)
+            default_statistics: Statistics to monitor when the rule names none
+        """
+        self.adaptive = adaptive
+        self.statistics = adaptive.statistics or default_statistics
+        if not self.statistics:
+            raise ValueError("Adaptive sampling needs at least one statistic to monitor")
+        self.iterations = 0
+        self._values: Dict[str, list] = {name: [] for name in self.statistics}
+        self._sizes: list = []
+
+    @property
+    def batch_size(self) -> int:
+        return self.adaptive.batch_size
+
+    def update(self, block: Dict[str, np.ndarray], n: int) -> None:
+        """Evaluate every statistic on one batch of ``n`` iterations."""
+        self.iterations += n
+        self._sizes.append(n)
+        for name, statistic in self.statistics.items():
+            self._values[name].append(statistic(block))
+
+    def estimates(self) -> Dict[str, float]:
+        """Batch-size weighted average of the batch values of each statistic."""
+        return {
+            name: float(np.average(values, weights=self._sizes))
+            for name, values in self._values.items()
+        }
+
+    def standard_errors(self) -> Dict[str, float]:
+        """
+        Batch-means standard error of each weighted estimate (inf before two batches).
+
+        Reduces to std(values, ddof=1) / sqrt(batches) for equal batch sizes.
+        """
+        batches = len(self._sizes)
+        if batches < 2:
+            return {name: np.inf for name in self._values}
+        weights = np.asarray(self._sizes, dtype=float) / sum(self._sizes)
+        estimates = self.estimates()
+        return {
+            name: float(np.sqrt(
+                batches / (batches - 1) * np.sum((weights * (np.asarray(values) - estimates[name])) ** 2)
+            ))
+            for name, values in self._values.items()
+        }
+
+    def precision(self) -> Dict[str, float]:
+        """Standard errors in the units of the tolerance (relative or absolute)."""
+        errors = self.standard_errors()
+        if not self.adaptive.relative:
+            return errors
+        estimates = self.estimates()
+        return {
+            name: error / abs(estimates[name]) if estimates[name] != 0 else np.inf
+            for name, error in errors.items()
+        }
+
+    @property
+    def converged(self) -> bool:
+        """True once enough batches ran and every statistic meets the tolerance."""
+        batches = len(next(iter(self._values.values())))
+        if batches < self.adaptive.min_batches:
+            return False
+        return all(value <= self.adaptive.tolerance for value in self.precision().values())
+
+    def report(self) -> Dict[str, Any]:
+        """Achieved iteration count and precision, for result metadata."""
+        return {
+            "iterations": self.iterations,
+            "converged": self.converged,
+            "tolerance": self.adaptive.tolerance,
+            "relative": self.adaptive.relative,
+            "estimates": self.estimates(),
+            "standard_errors": self.standard_errors(),
+            "precision": self.precision(),
+        }
+
+
+def run_adaptive(
+    simulate: Callable[[int], Dict[str, np.ndarray]],
+    max_iterations: int,
+    monitor: ConvergenceMonitor,
+) -> Iterator[Dict[str, np.ndarray]]:
+    """
+    Yield simulated batches until the monitor converges or the cap is reached.
+
+    Args:
+        simulate: Callable taking a block size ``n`` and returning a dict of
+            (cells, n) arrays
+        max_iterations: Iteration cap
+        monitor: Convergence monitor, updated with every batch
+
+    Yields:
+        Each simulated batch, after the monitor has seen it
+    """
+    for block_size in iter_chunks(max_iterations, monitor.batch_size):
+        block = simulate(block_size)
+        monitor.update(block, block_size)
+        yield block
+        if monitor.converged:
+            return
+
+
+def summarize_paths(
+    simulate: Callable[[int], Dict[str, np.ndarray]],
+    iterations: int,
+    chunk_size: Optional[int] = None,
+    compression: int = DEFAULT_COMPRESSION,
+    moments_only: Iterable[str] = (),
+    monitor: Optional[ConvergenceMonitor] = None,
+) -> Dict[str, StreamingSummary]:
+    """
+    Run a simulation block by block and fold every output into a summary.
+
+    Args:
+        simulate: Callable taking a block size ``n`` and returning a dict of
+            (cells, n) arrays; only these arrays are held in memory at once
+        iterations: Total Monte Carlo iterations (the cap when monitored)
+        chunk_size: Iterations per block (DEFAULT_CHUNK_SIZE if None; the
+            monitor's batch size when monitored)
+        compression: Quantile sketch compression
+        moments_only: Outputs that only need mean/std (no sketch is kept)
+        monitor: Stop early once this convergence monitor is satisfied
+
+    Returns:
+        Output name -> StreamingSummary
+    """
+    if monitor is not None:
+        blocks: Iterable[Dict[str, np.ndarray]] = run_adaptive(simulate, iterations, monitor)
+    else:
+        blocks = (simulate(block_size) for block_size in iter_chunks(iterations, chunk_size))
+
+    moments_only = set(moments_only)
+    summaries: Dict[str, StreamingSummary] = {}
+    for outputs in blocks:
+        for name, block in outputs.items():
+            if name not in summaries:
+                summaries[name] = StreamingSummary(
+                    block.shape[0], None if name in moments_only else compression
+                )
+            summaries[name].update(block)
+    return summaries
@@ -0,0 +1,247 @@
+"""
+Columnar Monte Carlo results.
+
+Projection engines produce one (years, iterations) array per output
+variable. Flattening those into a long-format DataFrame (one row per
+year/iteration) and grouping it back by year costs several copies of the
+data and a hash groupby over millions of rows. ProjectionPaths keeps the
+arrays as they are, without copying them. Per-year reductions run directly
+on the iteration axis, and pandas frames are built only when a caller asks.
+
+ProjectionPaths is a read-only mapping, so code that indexed the plain
+dictionaries returned by ``return_arrays=True`` keeps working.
+
+Usage:
+    from core.path_results import ProjectionPaths
+
+    paths = model.project_trust_funds(75, 10_000, return_arrays=True)
+    paths["benefit_payments_billions"]          # (years, iterations) array
+    paths.mean("benefit_payments_billions")     # per-year mean
+    paths.summary_frame()                       # year + mean/std/p10/p90 columns
+    paths.agg({"oasi_balance_billions": ["mean", "min"]})  # like groupby("year").agg
+    paths.to_frame()                            # long format, built on demand
+"""
+
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from core.online_stats import summary_statistics
+
+# Long-format row orders: iteration-major (all years of path 0, then path 1, ...)
+# or year-major (all paths for the first year, then the next year, ...)
+ROW_ORDERS = ("iteration", "year")
+
+# Per-year reductions supported by agg(), with pandas groupby semantics
+_AGGREGATIONS = {
+    "mean": lambda values: np.mean(values, axis=1),
+    "std": lambda values: np.std(values, axis=1, ddof=1),
+    "min": lambda values: np.min(values, axis=1),
+    "max": lambda values: np.max(values, axis=1),
+    "median": lambda values: np.median(values, axis=1),
+    "sum": lambda values: np.sum(values, axis=1),
+}
+
+
+class ProjectionPaths(Mapping[str, np.ndarray]):
+    """
+    Per-variable (years, iterations) arrays sharing one year axis.
+
+    The mapping holds "year" plus one entry per variable. Arrays are stored
+    without copying; treat them as read-only.
+    """
+
+    def __init__(self, year: Any, paths: Mapping[str, np.ndarray]):
+        """
+        Wrap simulated paths.
+
+        Args:
+            year: Calendar years, one per row of every path
+            paths: Variable name -> (years, iterations) array
+
+        Raises:
+            ValueError: If a path does not match the year axis or the others'
+                iteration count
+        """
+        self.year = np.asarray(year)
+        self._paths: Dict[str, np.ndarray] = {}
+        iterations = None
+        for name, values in paths.items():
+            values = np.asarray(values)
+            if values.ndim != 2 or values.shape[0] != len(self.year):
+                raise ValueError(
+                    f"Path '{name}' has shape {values.shape}; expected ({len(self.year)}, iterations)"
+                )
+            if iterations is not None and values.shape[1] != iterations:
+                raise ValueError(f"Path '{name}' has {values.shape[1]} iterations; expected {iterations}")
+            iterations = values.shape[1]
+            self._paths[name] = values
+
+    @classmethod
+    def from_dict(cls, arrays: Mapping[str, np.ndarray]) -> "ProjectionPaths":
+        """Build from a dictionary holding "year" and the (years, iterations) paths."""
+        return cls(arrays["year"], {name: values for name, values in arrays.items() if name != "year"})
+
+    # Mapping interface ("year" first, then the variables)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        if name == "year":
+            return self.year
+        return self._paths[name]
+
+    def __iter__(self) -> Iterator[str]:
+        yield "year"
+        yield from self._paths
+
+    def __len__(self) -> int:
+        return len(self._paths) + 1
+
+    def __repr__(self) -> str:
+        return (
+            f"ProjectionPaths(years={self.years}, iterations={self.iterations}, "
+            f"variables={list(self._paths)})"
+        )
+
+    @property
+    def variables(self) -> List[str]:
+        """Names of the simulated variables."""
+        return list(self._paths)
+
+    @property
+    def years(self) -> int:
+        """Number of projection years."""
+        return len(self.year)
+
+    @property
+    def iterations(self) -> int:
+        """Number of Monte Carlo iterations."""
+        return next(iter(self._paths.values())).shape[1] if self._paths else 0
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the paths."""
+        return self.year.nbytes + sum(values.nbytes for values in self._paths.values())
+
+    def with_paths(self, **paths: np.ndarray) -> "ProjectionPaths":
+        """New result sharing these arrays plus the given (years, iterations) paths."""
+        return ProjectionPaths(self.year, {**self._paths, **paths})
+
+    def select(self, names: Sequence[str]) -> "ProjectionPaths":
+        """New result sharing only the named arrays."""
+        return ProjectionPaths(self.year, {name: self._paths[name] for name in names})
+
+    # Per-year reductions over the iteration axis
+
+    def mean(self, name: str) -> np.ndarray:
+        """Per-year mean of a variable."""
+        return np.mean(self._paths[name], axis=1)
+
+    def std(self, name: str, ddof: int = 0) -> np.ndarray:
+        """Per-year standard deviation of a variable."""
+        return np.std(self._paths[name], axis=1, ddof=ddof)
+
+    def percentile(self, name: str, q: Union[float, Sequence[float]]) -> np.ndarray:
+        """Per-year percentile(s) of a variable (shape (years,) or (len(q), years))."""
+        return np.percentile(self._paths[name], q, axis=1)
+
+    def final(self, name: str) -> np.ndarray:
+        """Final-year values of a variable, one per iteration."""
+        return self._paths[name][-1]
+
+    def first_year(self, name: str, condition: Callable[[np.ndarray], np.ndarray]) -> np.ndarray:
+        """
+        First year each iteration meets a condition.
+
+        Args:
+            name: Variable to test
+            condition: Function mapping the (years, iterations) array to a
+                boolean mask, e.g. ``lambda balance: balance <= 0``
+
+        Returns:
+            (iterations,) float array of years, NaN where the condition never holds
+        """
+        mask = np.asarray(condition(self._paths[name]), dtype=bool)
+        return np.where(mask.any(axis=0), self.year[mask.argmax(axis=0)], np.nan)
+
+    def summary(
+        self, name: str, prefix: Optional[str] = None, percentiles: Sequence[float] = (10, 90)
+    ) -> Dict[str, np.ndarray]:
+        """Per-year mean/std/percentiles of a variable, keyed like summary_statistics()."""
+        return summary_statistics(self._paths[name], prefix or name, percentiles)
+
+    def summary_frame(
+        self, names: Optional[Sequence[str]] = None, percentiles: Sequence[float] = (10, 90)
+    ) -> pd.DataFrame:
+        """One row per year with the summary statistics of each variable."""
+        data: Dict[str, np.ndarray] = {"year": self.year}
+        for name in names or self._paths:
+            data.update(self.summary(name, percentiles=percentiles))
+        return pd.DataFrame(data)
+
+    def agg(self, spec: Mapping[str, Union[str, Sequence[str]]]) -> pd.DataFrame:
+        """
+        Per-year aggregates laid out like ``to_frame().groupby("year").agg(spec).reset_index()``.
+
+        Args:
+            spec: Variable -> reduction name or list of names ("mean", "std",
+                "min", "max", "median", "sum"); std uses ddof=1 as pandas does
+
+        Returns:
+            DataFrame with a "year" column, and (variable, reduction) MultiIndex
+            columns when any entry is a list
+        """
+        columns: Dict[Any, np.ndarray] = {}
+        multi = any(not isinstance(how, str) for how in spec.values())
+        for name, how in spec.items():
+            for reduction in ([how] if isinstance(how, str) else how):
+                if reduction not in _AGGREGATIONS:
+                    raise ValueError(f"Unknown reduction '{reduction}'. Valid: {sorted(_AGGREGATIONS)}")
+                values = self._paths[name]
+                if values.dtype == bool:
+                    values = values.astype(float)
+                columns[(name, reduction) if multi else name] = _AGGREGATIONS[reduction](values)
+
+        df = pd.DataFrame(columns)
+        if multi:
+            df.columns = pd.MultiIndex.from_tuples(df.columns)
+        df.insert(0, ("year", "") if multi else "year", self.year)
+        return df
+
+    # Lazy pandas conversion
+
+    def to_frame(
+        self,
+        names: Optional[Sequence[str]] = None,
+        order: str = "iteration",
+        **constants: Any,
+    ) -> pd.DataFrame:
+        """
+        Long-format DataFrame with one row per (year, iteration).
+
+        Args:
+            names: Variables to include, in column order (all if None)
+            order: "iteration" for iteration-major rows, "year" for year-major
+            **constants: Scalar columns placed after "year" and "iteration"
+
+        Returns:
+            DataFrame with year, iteration, constant and variable columns
+        """
+        if order not in ROW_ORDERS:
+            raise ValueError(f"Unknown row order '{order}'. Valid: {ROW_ORDERS}")
+        years, iterations = self.years, self.iterations
+        if order == "iteration":
+            data: Dict[str, Any] = {
+                "year": np.tile(self.year, iterations),
+                "iteration": np.repeat(np.arange(iterations), years),
+            }
+        else:
+            data = {
+                "year": np.repeat(self.year, iterations),
+                "iteration": np.tile(np.arange(iterations), years),
+            }
+        data.update(constants)
+        for name in names or self._paths:
+            values = self._paths[name]
+            data[name] = values.T.ravel() if order == "iteration" else values.ravel()
+        return pd.DataFrame(data)
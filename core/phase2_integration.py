@@ -29,6 +29,7 @@ from core.social_security import (
     BenefitFormula,
     TrustFundAssumptions,
 )
+from core.projection_context import ProjectionContext
 from core.revenue_modeling import TaxReforms
 
 logger = logging.getLogger(__name__)
@@ -244,21 +245,17 @@ class Phase2SimulationEngine:
             # Apply progressive tax in revenue calculations
             pass  # Would need to modify revenue calculations
         
-        # Run projections
-        projections = self.ss_model.project_trust_funds(years=years, iterations=iterations)
+        # Run projections (columnar paths, no long-format frame)
+        projections = self.ss_model.project_trust_funds(years=years, iterations=iterations, return_arrays=True)
         
         # Calculate summary statistics by year
-        summary = (
-            projections.groupby('year')
-            .agg({
-                'oasi_balance_billions': ['mean', 'std', 'min', 'max'],
-                'di_balance_billions': ['mean', 'std', 'min', 'max'],
-                'payroll_tax_income_billions': ['mean'],
-                'benefit_payments_billions': ['mean'],
-                'oasi_solvent': ['mean'],  # Proportion of iterations solvent
-            })
-            .reset_index()
-        )
+        summary = projections.agg({
+            'oasi_balance_billions': ['mean', 'std', 'min', 'max'],
+            'di_balance_billions': ['mean', 'std', 'min', 'max'],
+            'payroll_tax_income_billions': ['mean'],
+            'benefit_payments_billions': ['mean'],
+            'oasi_solvent': ['mean'],  # Proportion of iterations solvent
+        })
         
         return summary
     
@@ -275,10 +272,11 @@ class Phase2SimulationEngine:
         Returns DataFrame with comprehensive fiscal indicators.
         """
         rows = []
+        gdp_path = ProjectionContext(years, gdp_growth=gdp_growth_rate, base_gdp=self.base_gdp).gdp.tolist()
         
         for year_idx in range(years):
             year = self.start_year + year_idx
-            current_gdp = self.base_gdp * ((1 + gdp_growth_rate) ** year_idx)
+            current_gdp = gdp_path[year_idx]
             
             # Get tax reform revenue for this year
             if 'year' in tax_results.columns:
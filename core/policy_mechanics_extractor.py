@@ -295,7 +295,24 @@ class PolicyMechanicsExtractor:
     @staticmethod
     def mechanics_from_dict(data: Dict[str, Any], default_name: str = "Uploaded Policy",
                             default_type: str = "healthcare") -> PolicyMechanics:
-        """Rehydrate PolicyMechanics from a serialized dictionary."""
+        """
+        Rehydrate PolicyMechanics from a serialized dictionary.
+
+        Results are registered by content hash (see core.policy_registry), so
+        loading the same dictionary again returns the same frozen object;
+        copy.deepcopy() it to modify.
+        """
+        from core.policy_registry import PolicyRegistry, get_registry
+
+        key = PolicyRegistry.make_key("policy_mechanics", data, default_name, default_type)
+        return get_registry().register(
+            key, lambda: PolicyMechanicsExtractor._build_mechanics_from_dict(data, default_name, default_type)
+        )
+
+    @staticmethod
+    def _build_mechanics_from_dict(data: Dict[str, Any], default_name: str,
+                                   default_type: str) -> PolicyMechanics:
+        """Build a new PolicyMechanics tree from a serialized dictionary."""
         mechanics = PolicyMechanics(
             policy_name=data.get("policy_name", default_name),
             policy_type=data.get("policy_type", default_type)
@@ -0,0 +1,290 @@
+"""
+Content-addressed registry of built policy objects.
+
+Building a HealthcarePolicyModel or rehydrating PolicyMechanics from a
+stored dictionary constructs a large dataclass tree, and Streamlit reruns
+and API requests used to rebuild identical policies every time. The
+registry builds each distinct source once, keyed by a content hash (see
+core.result_cache.fingerprint). It freezes the result so it can be shared
+safely, and stores the compiled mechanics coefficients the simulator
+evaluates next to it. A repeat load is a dictionary lookup.
+
+Frozen objects keep their dataclass type (isinstance, dataclasses.fields
+and repr are unchanged), but assigning a field raises
+dataclasses.FrozenInstanceError. Their lists become tuples and their dicts
+become read-only. ``copy.deepcopy`` returns an ordinary, mutable copy.
+
+Usage:
+    from core.policy_registry import PolicyRegistry, get_registry
+
+    key = PolicyRegistry.make_key("policy_mechanics", data)
+    mechanics = get_registry().register(key, lambda: build_mechanics(data))
+    compiled = get_registry().compiled(mechanics)   # precompiled, no rebuild
+"""
+
+import copy
+import dataclasses
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+from core.context_aware_healthcare import CompiledMechanics, compile_mechanics
+from core.result_cache import ResultCache
+
+T = TypeVar("T")
+
+_MUTABLE_COPY_HINT = "use copy.deepcopy() for a mutable copy"
+
+
+class FrozenList(tuple):
+    """Read-only list field of a registered policy (deep-copies to a list)."""
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> list:
+        return [copy.deepcopy(value, memo) for value in self]
+
+
+class FrozenDict(dict):
+    """Read-only dict field of a registered policy (deep-copies to a dict)."""
+
+    def _read_only(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError(f"registered policy data is read-only; {_MUTABLE_COPY_HINT}")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __copy__(self) -> dict:
+        return dict(self)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> dict:
+        return {copy.deepcopy(key, memo): copy.deepcopy(value, memo) for key, value in self.items()}
+
+    def __reduce__(self):
+        return FrozenDict, (dict(self),)
+
+
+_FROZEN_CLASSES: Dict[type, type] = {}
+_FROZEN_TYPES = set()
+_FROZEN_LOCK = threading.Lock()
+
+
+def _restore_frozen(cls: type, state: Dict[str, Any]) -> Any:
+    """Unpickle a frozen dataclass instance."""
+    obj = cls.__new__(cls)
+    obj.__dict__.update(state)
+    return freeze(obj)
+
+
+def _frozen_class(cls: type) -> type:
+    """Subclass of a dataclass whose instances reject attribute assignment."""
+    with _FROZEN_LOCK:
+        frozen = _FROZEN_CLASSES.get(cls)
+        if frozen is not None:
+            return frozen
+
+        def __setattr__(self, name: str, value: Any) -> None:
+            raise dataclasses.FrozenInstanceError(
+                f"cannot assign to field '{name}' of a registered {cls.__name__}; {_MUTABLE_COPY_HINT}"
+            )
+
+        def __delattr__(self, name: str) -> None:
+            raise dataclasses.FrozenInstanceError(
+                f"cannot delete field '{name}' of a registered {cls.__name__}; {_MUTABLE_COPY_HINT}"
+            )
+
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            # Only reached through dataclasses.replace(); build, then freeze
+            vars(self).update(vars(freeze(cls(*args, **kwargs))))
+
+        def __copy__(self) -> Any:
+            clone = cls.__new__(cls)
+            vars(clone).update(vars(self))
+            return clone
+
+        def __deepcopy__(self, memo: Dict[int, Any]) -> Any:
+            clone = cls.__new__(cls)
+            memo[id(self)] = clone
+            vars(clone).update({name: copy.deepcopy(value, memo) for name, value in vars(self).items()})
+            return clone
+
+        def __reduce__(self):
+            return _restore_frozen, (cls, dict(vars(self)))
+
+        frozen = type(cls.__name__, (cls,), {
+            "__slots__": (),
+            "__module__": cls.__module__,
+            "__qualname__": cls.__qualname__,
+            "__setattr__": __setattr__,
+            "__delattr__": __delattr__,
+            "__init__": __init__,
+            "__copy__": __copy__,
+            "__deepcopy__": __deepcopy__,
+            "__reduce__": __reduce__,
+        })
+        _FROZEN_CLASSES[cls] = frozen
+        _FROZEN_TYPES.add(frozen)
+        return frozen
+
+
+def is_frozen(obj: Any) -> bool:
+    """True for dataclass instances frozen by freeze()."""
+    return type(obj) in _FROZEN_TYPES
+
+
+def freeze(obj: T) -> T:
+    """
+    Freeze a dataclass tree in place.
+
+    Dataclass instances switch to a frozen subclass of their own type;
+    lists, dicts and sets inside them become FrozenList, FrozenDict and
+    frozenset. Other values are left as they are.
+
+    Returns:
+        The frozen object (the same instance for dataclasses)
+    """
+    if isinstance(obj, (FrozenList, FrozenDict, frozenset)) or is_frozen(obj):
+        return obj
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        state = vars(obj)
+        for name, value in state.items():
+            state[name] = freeze(value)
+        obj.__class__ = _frozen_class(type(obj))
+        return obj
+    if isinstance(obj, list):
+        return FrozenList(freeze(value) for value in obj)
+    if type(obj) is tuple:
+        return tuple(freeze(value) for value in obj)
+    if isinstance(obj, dict):
+        return FrozenDict({key: freeze(value) for key, value in obj.items()})
+    if isinstance(obj, set):
+        return frozenset(obj)
+    return obj
+
+
+@dataclasses.dataclass(frozen=True)
+class RegisteredPolicy:
+    """
+    One registry entry.
+
+    Attributes:
+        key: Content hash the object was registered under
+        value: Frozen HealthcarePolicyModel, PolicyMechanics or other dataclass
+        compiled: Simulator coefficients of its mechanics (None without mechanics)
+    """
+    key: str
+    value: Any
+    compiled: Optional[CompiledMechanics] = None
+
+
+def _mechanics_of(value: Any) -> Any:
+    """The PolicyMechanics held by a registered object, if any."""
+    if hasattr(value, "funding_mechanisms"):
+        return value
+    return getattr(value, "mechanics", None)
+
+
+class PolicyRegistry:
+    """
+    Bounded LRU of frozen policy objects keyed by content hash.
+
+    Thread-safe; one instance is shared process-wide (see get_registry()).
+    """
+
+    def __init__(self, max_entries: int = 256):
+        """
+        Initialize registry.
+
+        Args:
+            max_entries: Maximum number of registered objects kept
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, got {max_entries}")
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, RegisteredPolicy]" = OrderedDict()
+        # id(mechanics) -> (mechanics, compiled) for registered mechanics objects
+        self._compiled: Dict[int, Tuple[Any, CompiledMechanics]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    make_key = staticmethod(ResultCache.make_key)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def entry(self, key: str) -> Optional[RegisteredPolicy]:
+        """Registered entry for a key, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def register(self, key: str, build: Callable[[], T]) -> T:
+        """
+        Frozen object for a key, building and registering it on first use.
+
+        Args:
+            key: Content hash of everything the object is built from
+            build: Zero-argument function returning a new object
+
+        Returns:
+            The registered (frozen) object
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry.value
+
+        value = freeze(build())
+        mechanics = _mechanics_of(value)
+        compiled = compile_mechanics(mechanics) if mechanics is not None else None
+        with self._lock:
+            self.misses += 1
+            existing = self._entries.get(key)
+            if existing is not None:
+                # Another thread registered it first; share that object
+                return existing.value
+            self._entries[key] = RegisteredPolicy(key, value, compiled)
+            if compiled is not None:
+                self._compiled[id(mechanics)] = (mechanics, compiled)
+            while len(self._entries) > self.max_entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._compiled.pop(id(_mechanics_of(evicted.value)), None)
+        return value
+
+    def compiled(self, mechanics: Any) -> CompiledMechanics:
+        """
+        Simulator coefficients for a PolicyMechanics object.
+
+        Registered mechanics return their precompiled coefficients; anything
+        else is compiled on the spot.
+        """
+        with self._lock:
+            entry = self._compiled.get(id(mechanics))
+        if entry is not None and entry[0] is mechanics:
+            return entry[1]
+        return compile_mechanics(mechanics)
+
+    def clear(self) -> None:
+        """Drop all registered objects."""
+        with self._lock:
+            self._entries.clear()
+            self._compiled.clear()
+
+
+_REGISTRY = PolicyRegistry()
+
+
+def get_registry() -> PolicyRegistry:
+    """Process-wide policy registry."""
+    return _REGISTRY
+
+
+def precompiled_mechanics(mechanics: Any) -> CompiledMechanics:
+    """Compiled coefficients for mechanics, reusing the registry's precompiled view."""
+    return _REGISTRY.compiled(mechanics)
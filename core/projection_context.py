@@ -0,0 +1,212 @@
+"""
+Shared macroeconomic index paths for polisim projections.
+
+Projections scale baseline amounts by compound growth in GDP, wages, prices
+and medical costs. Rather than each component recomputing (1 + rate) ** t
+inside its year loop, a ProjectionContext builds the index paths once for a
+horizon and hands the same tables to every component, so they also agree on
+the macro path they project against.
+
+Constant-rate tables are memoized process-wide and read-only; per-iteration
+rates (one rate per path, e.g. sampled inflation) give (years, iterations)
+tables built in a single vectorized power, once per context.
+
+Usage:
+    from core.projection_context import ProjectionContext, growth_index
+
+    context = ProjectionContext(years=75, gdp_growth=0.025, inflation=0.025)
+    gdp = context.gdp                        # base GDP x (1 + g) ** t
+    benefits = base_benefit * context.cpi_index
+    per_capita = base_cost * growth_index(0.04, 75)
+"""
+
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from typing import Union
+
+import numpy as np
+
+RateLike = Union[float, np.ndarray]
+
+# Baseline macro path. Components are calibrated against it, and a context
+# moves each one by its rates' deviation from these values
+BASELINE_GDP_GROWTH = 0.025  # Nominal GDP growth
+BASELINE_WAGE_GROWTH = 0.03  # Average wage growth
+BASELINE_INFLATION = 0.025  # CPI inflation
+BASELINE_MEDICAL_INFLATION = 0.035  # Medical cost inflation
+
+_BASELINE_RATES = {
+    "gdp_growth": BASELINE_GDP_GROWTH,
+    "wage_growth": BASELINE_WAGE_GROWTH,
+    "inflation": BASELINE_INFLATION,
+    "medical_inflation": BASELINE_MEDICAL_INFLATION,
+}
+
+
+@lru_cache(maxsize=256)
+def _constant_index(rate: float, years: int) -> np.ndarray:
+    """Read-only (1 + rate) ** t table for one constant rate."""
+    index = np.power(1.0 + rate, np.arange(years))
+    index.setflags(write=False)
+    return index
+
+
+def growth_index(rate: RateLike, years: int) -> np.ndarray:
+    """
+    Compound growth index (1 + rate) ** t for t = 0 .. years - 1.
+
+    Args:
+        rate: Annual growth rate, or an (iterations,) array of per-path rates
+        years: Number of years (index[0] is 1)
+
+    Returns:
+        (years,) array for a constant rate (shared, read-only), or a
+        (years, iterations) array for per-path rates
+    """
+    if np.ndim(rate) == 0:
+        return _constant_index(float(rate), years)
+    rate = np.asarray(rate, dtype=float)
+    return np.power(1.0 + rate[:, np.newaxis], np.arange(years)).T
+
+
+_RATE_FIELDS = tuple(_BASELINE_RATES)
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    """Mark an array read-only (shared tables must not be mutated in place)."""
+    array.setflags(write=False)
+    return array
+
+
+@dataclass(frozen=True, eq=False)
+class ProjectionContext:
+    """
+    Macro assumptions and their index paths for one projection horizon.
+
+    Attributes:
+        years: Number of projection years
+        gdp_growth: Nominal GDP growth
+        wage_growth: Average wage growth
+        inflation: CPI inflation
+        medical_inflation: Medical cost inflation
+        base_gdp: GDP in the first projection year (billions)
+        start_year: First projection year
+
+    Rates are scalars, or (iterations,) arrays of per-path rates for an
+    iteration batch. Per-path rates are stored as read-only copies, and
+    contexts compare by identity because their rates may be arrays. Index
+    tables are built on first access and reused.
+    """
+    years: int
+    gdp_growth: RateLike = BASELINE_GDP_GROWTH
+    wage_growth: RateLike = BASELINE_WAGE_GROWTH
+    inflation: RateLike = BASELINE_INFLATION
+    medical_inflation: RateLike = BASELINE_MEDICAL_INFLATION
+    base_gdp: float = 28000.0
+    start_year: int = 2026
+
+    def __post_init__(self):
+        for name in _RATE_FIELDS:
+            rate = getattr(self, name)
+            if np.ndim(rate):
+                object.__setattr__(self, name, _read_only(np.array(rate, dtype=float)))
+
+    @property
+    def paths(self) -> int:
+        """
+        Number of per-path rates (0 when every rate is a scalar).
+
+        Raises:
+            ValueError: If per-path rates have different lengths
+        """
+        lengths = {len(getattr(self, name)) for name in _RATE_FIELDS if np.ndim(getattr(self, name))}
+        if len(lengths) > 1:
+            raise ValueError(f"ProjectionContext per-path rates have different lengths: {sorted(lengths)}")
+        return lengths.pop() if lengths else 0
+
+    def check_paths(self, iterations: int, streamed: bool = False) -> "ProjectionContext":
+        """
+        Check that per-path rates line up with a projection's iterations.
+
+        Args:
+            iterations: Monte Carlo iterations of the projection
+            streamed: Whether the projection runs in chunks or adaptive batches
+
+        Raises:
+            ValueError: If per-path rates are used in a streamed projection, or
+                their count differs from ``iterations``
+        """
+        paths = self.paths
+        if paths and streamed:
+            raise ValueError("chunk_size and adaptive need a context with scalar rates")
+        if paths and paths != iterations:
+            raise ValueError(
+                f"ProjectionContext has {paths} per-path rates but the projection has {iterations} iterations"
+            )
+        return self
+
+    def shifted(self, rate: str, calibrated: float) -> RateLike:
+        """
+        A component's calibrated rate moved by this context's deviation from baseline.
+
+        Components keep their own calibration on the baseline path, so a
+        default context reproduces their standalone projections exactly.
+
+        Args:
+            rate: "gdp_growth", "wage_growth", "inflation" or "medical_inflation"
+            calibrated: The component's own rate at the baseline path
+
+        Returns:
+            A float, or an (iterations,) array for per-path context rates
+        """
+        deviation = getattr(self, rate) - _BASELINE_RATES[rate]
+        if np.ndim(deviation):
+            return calibrated + np.asarray(deviation, dtype=float)
+        return calibrated + float(deviation)
+
+    def check_horizon(self, years: int) -> "ProjectionContext":
+        """
+        Check that the context covers a projection horizon.
+
+        Raises:
+            ValueError: If the context has fewer than ``years`` years
+        """
+        if self.years < years:
+            raise ValueError(
+                f"ProjectionContext covers {self.years} years but the projection needs {years}"
+            )
+        return self
+
+    @property
+    def year_array(self) -> np.ndarray:
+        """Calendar years of the projection."""
+        return self.start_year + np.arange(self.years)
+
+    def index(self, rate: RateLike) -> np.ndarray:
+        """Growth index for any other rate over this horizon."""
+        return growth_index(rate, self.years)
+
+    @cached_property
+    def gdp_index(self) -> np.ndarray:
+        """GDP relative to the first year."""
+        return _read_only(self.index(self.gdp_growth))
+
+    @cached_property
+    def wage_index(self) -> np.ndarray:
+        """Average wage relative to the first year."""
+        return _read_only(self.index(self.wage_growth))
+
+    @cached_property
+    def cpi_index(self) -> np.ndarray:
+        """Price level relative to the first year."""
+        return _read_only(self.index(self.inflation))
+
+    @cached_property
+    def medical_index(self) -> np.ndarray:
+        """Medical cost level relative to the first year."""
+        return _read_only(self.index(self.medical_inflation))
+
+    @cached_property
+    def gdp(self) -> np.ndarray:
+        """GDP path (billions)."""
+        return _read_only(self.base_gdp * self.gdp_index)
@@ -0,0 +1,128 @@
+"""
+Per-instance random number streams for polisim models.
+
+Every stochastic model owns a ``numpy.random.Generator`` derived from a
+``SeedSequence`` instead of seeding the global ``np.random`` state, so
+concurrent requests in one process cannot disturb each other's
+reproducibility. Child sequences spawned from a parent give independent,
+deterministic streams to components that run in other threads or
+processes.
+
+Usage:
+    from core.random_streams import RandomStreamMixin
+
+    class MyModel(RandomStreamMixin):
+        def __init__(self, seed=None):
+            self._init_random_stream(seed)
+
+        def draw(self, n):
+            return self.rng.normal(size=n)
+
+    parent = MyModel(seed=42)
+    children = [MyModel(seed=s) for s in parent.spawn(3)]
+
+Models also carry a ``self.sampler`` (see core.samplers) that turns the
+Generator into pseudo-random, antithetic or quasi-random draws.
+"""
+
+from typing import List, Optional, Union
+
+import numpy as np
+
+from core.samplers import Draw, Sampler, SamplerLike, make_sampler
+
+
+SeedLike = Union[int, np.random.SeedSequence, np.random.Generator]
+
+
+def seed_sequence(seed: Optional[SeedLike] = None) -> np.random.SeedSequence:
+    """
+    Normalize a seed into a SeedSequence.
+
+    Args:
+        seed: Integer seed, SeedSequence, Generator (its own sequence is
+            reused), or None for fresh OS entropy
+
+    Returns:
+        SeedSequence for the seed
+    """
+    if isinstance(seed, np.random.SeedSequence):
+        return seed
+    if isinstance(seed, np.random.Generator):
+        return seed.bit_generator.seed_seq
+    return np.random.SeedSequence(seed)
+
+
+def make_generator(seed: Optional[SeedLike] = None) -> np.random.Generator:
+    """Create a Generator for a seed (Generators are returned unchanged)."""
+    if isinstance(seed, np.random.Generator):
+        return seed
+    return np.random.default_rng(seed_sequence(seed))
+
+
+def spawn_seeds(seed: Optional[SeedLike], n: int) -> List[np.random.SeedSequence]:
+    """Spawn ``n`` independent child SeedSequences from a seed."""
+    return seed_sequence(seed).spawn(n)
+
+
+class RandomStreamMixin:
+    """
+    Gives a model its own Generator (``self.rng``), a sampler
+    (``self.sampler``) and a spawn API.
+
+    Subclasses call ``_init_random_stream(seed, sampler)`` from ``__init__``.
+    """
+
+    seed: Optional[SeedLike]
+    seed_sequence: np.random.SeedSequence
+    rng: np.random.Generator
+    sampler: Sampler
+
+    def _init_random_stream(
+        self, seed: Optional[SeedLike] = None, sampler: Optional[SamplerLike] = None
+    ) -> None:
+        """
+        Create the instance's SeedSequence, Generator and sampler.
+
+        The Generator is built from ``self.seed_sequence`` (a Generator seed
+        is shared as-is), so an unseeded stream and the children spawn()
+        hands out derive from the same entropy.
+        """
+        self.seed = seed
+        self.seed_sequence = seed_sequence(seed)
+        if isinstance(seed, np.random.Generator):
+            self.rng = seed
+        else:
+            self.rng = np.random.default_rng(self.seed_sequence)
+        self.sampler = make_sampler(sampler)
+
+    def draw_block(self, *draws: Draw) -> List[np.ndarray]:
+        """
+        Draw a block's random inputs jointly through the instance's sampler.
+
+        Args:
+            draws: Inputs sharing one iteration count
+
+        Returns:
+            One array per Draw
+        """
+        return self.sampler.draw(self.rng, draws)
+
+    def reseed(self, seed: Optional[SeedLike] = None) -> None:
+        """Restart the instance's random stream from a new seed (keeping the sampler)."""
+        self._init_random_stream(seed, self.sampler)
+
+    def spawn(self, n: int) -> List[np.random.SeedSequence]:
+        """
+        Spawn independent child SeedSequences from this instance's sequence.
+
+        Children are deterministic for a seeded parent and are safe to pass
+        to components running in other threads or processes.
+
+        Args:
+            n: Number of child sequences
+
+        Returns:
+            List of SeedSequences, usable as ``seed=`` for other models
+        """
+        return self.seed_sequence.spawn(n)
@@ -0,0 +1,283 @@
+"""
+Bounded, content-addressed result cache for projection components.
+
+Keys are SHA-256 hashes of everything that determines a result: the
+component name, its call parameters and a fingerprint of the model state
+(assumption dataclasses, applied policy mechanics, explicit seeds). Any
+change to a model therefore produces a new key instead of a stale hit.
+
+Two tiers:
+    - Memory: LRU with entry-count and byte limits. Cached columns are
+      stored read-only and handed out without copying.
+    - Disk (optional): one ``.npz`` file per key, written atomically, so
+      worker processes and restarts share results.
+
+Usage:
+    from core.result_cache import ResultCache, fingerprint
+
+    cache = ResultCache(max_entries=64, disk_dir="~/.polisim/cache")
+    key = ResultCache.make_key("medicare_spending", {"years": 30}, fingerprint(model))
+    frame = cache.get(key)
+    if frame is None:
+        frame = compute()
+        cache.put(key, frame)
+"""
+
+import dataclasses
+import enum
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Attributes that hold live random-stream state rather than model state.
+# Seeds and SeedSequences are hashed (entropy and spawn key), so a reseeded
+# or replaced model gets a new key; only the Generator's position is skipped.
+_UNHASHED_ATTRIBUTES = {"rng"}
+
+# Stream attributes skipped when a model is unseeded (``seed is None``): its
+# SeedSequence holds fresh OS entropy, and any fresh draw is an equally valid
+# sample, so unseeded models share keys across instances and processes.
+_UNSEEDED_ATTRIBUTES = {"seed_sequence"}
+
+
+def _canonical(obj: Any) -> Any:
+    """Convert an object into a JSON-serializable structure for hashing."""
+    if obj is None or isinstance(obj, (bool, int, float, str)):
+        return obj
+    if isinstance(obj, enum.Enum):
+        return _canonical(obj.value)
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return {"__ndarray__": hashlib.sha256(np.ascontiguousarray(obj).tobytes()).hexdigest(),
+                "dtype": str(obj.dtype), "shape": list(obj.shape)}
+    if isinstance(obj, np.random.SeedSequence):
+        return {"entropy": _canonical(obj.entropy), "spawn_key": list(obj.spawn_key)}
+    if isinstance(obj, np.random.Generator):
+        return None
+    if isinstance(obj, dict):
+        return {str(key): _canonical(value) for key, value in sorted(obj.items(), key=lambda item: str(item[0]))}
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        items = [_canonical(value) for value in obj]
+        return sorted(items, key=repr) if isinstance(obj, (set, frozenset)) else items
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        fields = {field.name: getattr(obj, field.name) for field in dataclasses.fields(obj)}
+        return {"__class__": type(obj).__qualname__, **_canonical(fields)}
+    if hasattr(obj, "__dict__"):
+        skipped = _UNHASHED_ATTRIBUTES
+        if "seed" in vars(obj) and obj.seed is None:
+            skipped = skipped | _UNSEEDED_ATTRIBUTES
+        state = {
+            name: value for name, value in vars(obj).items()
+            if name not in skipped and not callable(value)
+        }
+        return {"__class__": type(obj).__qualname__, **_canonical(state)}
+    return repr(obj)
+
+
+def fingerprint(obj: Any) -> str:
+    """
+    Content hash of an object's state.
+
+    Walks dataclasses, dicts, sequences, numpy arrays and plain objects
+    (via ``vars``). Explicit seeds count as state; live Generators and the
+    SeedSequence of an unseeded model are excluded.
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    payload = json.dumps(_canonical(obj), sort_keys=True, default=repr)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ResultCache:
+    """
+    LRU cache of per-year result DataFrames with an optional disk tier.
+
+    Thread-safe; one instance can be shared by several models.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        max_bytes: int = 256 * 1024 * 1024,
+        disk_dir: Optional[Union[str, Path]] = None,
+        max_disk_bytes: int = 1024 * 1024 * 1024,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            max_entries: Maximum number of results held in memory
+            max_bytes: Maximum total size of results held in memory
+            disk_dir: Directory for the persistent tier (memory only if None)
+            max_disk_bytes: Size at which the oldest disk entries are pruned
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, got {max_entries}")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.disk_dir = Path(disk_dir).expanduser() if disk_dir is not None else None
+        if self.disk_dir is not None:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+
+        self._entries: "OrderedDict[str, Dict[str, np.ndarray]]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Content-addressed key for the given parts (component, params, fingerprints)."""
+        return fingerprint(parts)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        path = self._disk_path(key)
+        return key in self._entries or (path is not None and path.exists())
+
+    @property
+    def nbytes(self) -> int:
+        """Total size of results held in memory."""
+        return self._bytes
+
+    def get(self, key: str) -> Optional[pd.DataFrame]:
+        """
+        Look up a result, promoting disk hits into memory.
+
+        Returns:
+            DataFrame backed by read-only arrays, or None on a miss
+        """
+        with self._lock:
+            columns = self._entries.get(key)
+            if columns is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._to_frame(columns)
+
+        columns = self._read_disk(key)
+        with self._lock:
+            if columns is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._store(key, columns)
+        return self._to_frame(columns)
+
+    def put(self, key: str, frame: pd.DataFrame) -> None:
+        """Store a result in memory and, if configured, on disk."""
+        columns = {}
+        for name in frame.columns:
+            values = np.array(frame[name].to_numpy(), copy=True)
+            values.setflags(write=False)
+            columns[str(name)] = values
+
+        with self._lock:
+            self._store(key, columns)
+        self._write_disk(key, columns)
+
+    def clear(self, disk: bool = False) -> None:
+        """Drop all in-memory results (and disk results if ``disk`` is True)."""
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self._bytes = 0
+        if disk and self.disk_dir is not None:
+            for path in self.disk_dir.glob("*.npz"):
+                path.unlink(missing_ok=True)
+
+    def _store(self, key: str, columns: Dict[str, np.ndarray]) -> None:
+        """Insert into the memory tier and evict least recently used entries."""
+        if key in self._entries:
+            self._bytes -= self._sizes.pop(key)
+            del self._entries[key]
+        size = sum(values.nbytes for values in columns.values())
+        self._entries[key] = columns
+        self._sizes[key] = size
+        self._bytes += size
+
+        while len(self._entries) > self.max_entries or (self._bytes > self.max_bytes and len(self._entries) > 1):
+            evicted, _ = self._entries.popitem(last=False)
+            self._bytes -= self._sizes.pop(evicted)
+            self.evictions += 1
+            logger.debug(f"Evicted cached result {evicted[:12]}")
+
+    @staticmethod
+    def _to_frame(columns: Dict[str, np.ndarray]) -> pd.DataFrame:
+        """Wrap cached columns in a DataFrame without copying them."""
+        return pd.DataFrame(columns, copy=False)
+
+    def _disk_path(self, key: str) -> Optional[Path]:
+        return self.disk_dir / f"{key}.npz" if self.disk_dir is not None else None
+
+    def _read_disk(self, key: str) -> Optional[Dict[str, np.ndarray]]:
+        """Load a result from the disk tier."""
+        path = self._disk_path(key)
+        if path is None or not path.exists():
+            return None
+        try:
+            with np.load(path, allow_pickle=False) as stored:
+                names = [str(name) for name in stored["__columns__"]]
+                columns = {name: stored[f"c{i}"] for i, name in enumerate(names)}
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable cache file {path.name}: {e}")
+            return None
+        for values in columns.values():
+            values.setflags(write=False)
+        os.utime(path)  # Mark as recently used for pruning
+        return columns
+
+    def _write_disk(self, key: str, columns: Dict[str, np.ndarray]) -> None:
+        """Atomically write a result to the disk tier (numeric columns only)."""
+        path = self._disk_path(key)
+        if path is None:
+            return
+        if any(values.dtype.hasobject for values in columns.values()):
+            logger.debug(f"Result {key[:12]} has object columns; kept in memory only")
+            return
+
+        arrays = {f"c{i}": values for i, values in enumerate(columns.values())}
+        arrays["__columns__"] = np.array(list(columns), dtype=str)
+        fd, tmp_path = tempfile.mkstemp(dir=self.disk_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                np.savez(handle, **arrays)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to write cache file {path.name}: {e}")
+            Path(tmp_path).unlink(missing_ok=True)
+            return
+        self._prune_disk()
+
+    def _prune_disk(self) -> None:
+        """Delete the least recently used disk entries above max_disk_bytes."""
+        files = []
+        for path in self.disk_dir.glob("*.npz"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue  # Removed by another process
+            files.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.max_disk_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
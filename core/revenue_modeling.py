@@ -11,11 +11,23 @@ Covers:
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Union
 import numpy as np
 import pandas as pd
 import logging
 
+from core.online_stats import (
+    AdaptiveSampling,
+    ConvergenceMonitor,
+    final_year_mean,
+    summarize_paths,
+    summary_statistics,
+)
+from core.path_results import ProjectionPaths
+from core.projection_context import ProjectionContext
+from core.random_streams import RandomStreamMixin, SeedLike
+from core.samplers import Draw, SamplerLike
+
 logger = logging.getLogger(__name__)
 
 # Constants for revenue modeling calculations
@@ -128,7 +140,7 @@ class CorporateIncomeTaxAssumptions:
         return cls()
 
 
-class FederalRevenueModel:
+class FederalRevenueModel(RandomStreamMixin):
     """
     Comprehensive federal revenue projection system.
 
@@ -147,14 +159,14 @@ class FederalRevenueModel:
         corporate_income_tax: Optional[CorporateIncomeTaxAssumptions] = None,
         start_year: int = 2025,
         baseline_revenues_billions: Optional[Dict[str, float]] = None,
-        seed: Optional[int] = None,
+        seed: Optional[SeedLike] = None,
+        sampler: Optional[SamplerLike] = None,
     ):
-        """Initialize revenue model."""
+        """Initialize revenue model (pseudo-random draws if sampler is None)."""
         self.iit = individual_income_tax or IndividualIncomeTaxAssumptions.cbo_2025_baseline()
         self.payroll = payroll_taxes or PayrollTaxAssumptions.ssa_2024_trustees()
         self.corporate = corporate_income_tax or CorporateIncomeTaxAssumptions.cbo_2025_baseline()
         self.start_year = start_year
-        self.seed = seed
         
         # Input validation
         if self.iit.tax_brackets and len(self.iit.tax_brackets) > 0:
@@ -166,8 +178,8 @@ class FederalRevenueModel:
         if not 0 <= self.corporate.marginal_tax_rate <= 1:
             raise ValueError(f"Corporate tax rate {self.corporate.marginal_tax_rate:.1%} outside reasonable range [0%, 100%]")
         
+        self._init_random_stream(seed, sampler)
         if seed is not None:
-            np.random.seed(seed)
             logger.info(f"Random seed set to {seed} for reproducibility")
 
         # 2025 baseline revenue estimates (billions)
@@ -183,12 +195,46 @@ class FederalRevenueModel:
         logger.info(f"Revenue Model initialized for {start_year}")
         logger.info(f"  Baseline total revenues: ${self.baseline_revenues['total']:.0f}B")
 
+    def draw_noise(self, years: int, iterations: int = 10000) -> Dict[str, np.ndarray]:
+        """
+        Draw every revenue source's noise matrix in one sampler pass.
+
+        Args:
+            years: Number of years to project
+            iterations: Number of Monte Carlo iterations
+
+        Returns:
+            Dictionary of (years, iterations) matrices keyed by source:
+            "individual_income_tax", "payroll", "corporate_profit_shock"
+            (uniform draws for the mild profit-decline coin flip),
+            "corporate_avoidance", "corporate" and "excise_other"
+        """
+        shape = (years, iterations)
+        names = (
+            "individual_income_tax",
+            "payroll",
+            "corporate_profit_shock",
+            "corporate_avoidance",
+            "corporate",
+            "excise_other",
+        )
+        draws = self.draw_block(
+            Draw(shape, 1.0, 0.03),  # 3% std dev
+            Draw(shape, 1.0, 0.025),  # 2.5% std dev
+            Draw(shape, uniform=True),
+            Draw(shape, self.corporate.tax_avoidance_factor, 0.05),  # 5% std dev
+            Draw(shape, 1.0, 0.05),  # 5% std dev cyclical noise
+            Draw(shape, 1.0, EXCISE_OTHER_REVENUE_UNCERTAINTY),
+        )
+        return dict(zip(names, draws))
+
     def project_individual_income_tax(
         self,
         years: int,
         gdp_growth: np.ndarray,
         wage_growth: np.ndarray,
         iterations: int = 10000,
+        noise: Optional[np.ndarray] = None,
     ) -> Dict[str, np.ndarray]:
         """
         Project individual income tax revenue.
@@ -198,51 +244,31 @@ class FederalRevenueModel:
             gdp_growth: Annual GDP growth rates (years,)
             wage_growth: Annual wage growth rates (years,)
             iterations: Number of Monte Carlo iterations
+            noise: Pre-drawn (years, iterations) growth noise (drawn if None)
 
         Returns:
             Dictionary with revenue projections
         """
         logger.info(f"Projecting IIT for {years} years with {iterations} iterations")
 
-        revenues = np.zeros((years, iterations))
-        effective_rates = np.zeros((years, iterations))
-
-        for it in range(iterations):
-            if it % 1000 == 0 and it > 0:
-                logger.info(f"  Individual income tax projection: {it}/{iterations} iterations ({it/iterations*100:.1f}%)")
-
-            revenue = self.baseline_revenues["individual_income_tax"]
+        if noise is None:
+            (noise,) = self.draw_block(Draw((years, iterations), 1.0, 0.03))  # 3% std dev
 
-            for year in range(years):
-                # Wage growth impact (year-over-year, not cumulative)
-                wage_factor = 1 + wage_growth[year]
+        # Tax base growth (year-over-year): wage growth × filer growth (~0.5% per year)
+        filer_growth = 1.005
+        tax_base_growth = (1 + np.asarray(wage_growth[:years], dtype=float)) * filer_growth
 
-                # Number of filers growth (~0.5% per year)
-                filer_growth = 1.005
-
-                # Tax base growth (year-over-year)
-                tax_base_growth = wage_factor * filer_growth
-
-                # Add Monte Carlo noise to growth
-                growth_noise = np.random.normal(1.0, 0.03)  # 3% std dev
-
-                # Adjusted revenue projection (simple compounding)
-                revenue = revenue * tax_base_growth * growth_noise
-
-                # Effective tax rate (for reference)
-                # Protect against division by zero with nested division check
-                baseline_iit = self.baseline_revenues.get("individual_income_tax", 0.0)
-                if baseline_iit > 0:
-                    tax_base = baseline_iit / 0.08
-                    if tax_base > 0:
-                        effective_rate = revenue / tax_base
-                    else:
-                        effective_rate = 0.08  # Fallback to default rate
-                else:
-                    effective_rate = 0.08  # Fallback to default rate
+        # Simple compounding with Monte Carlo noise on growth
+        revenues = self.baseline_revenues["individual_income_tax"] * np.cumprod(
+            tax_base_growth[:, np.newaxis] * noise, axis=0
+        )
 
-                revenues[year, it] = revenue
-                effective_rates[year, it] = effective_rate
+        # Effective tax rate (for reference); fall back to 8% without a baseline
+        baseline_iit = self.baseline_revenues.get("individual_income_tax", 0.0)
+        if baseline_iit > 0:
+            effective_rates = revenues / (baseline_iit / 0.08)
+        else:
+            effective_rates = np.full((years, iterations), 0.08)
 
         return {
             "revenues": revenues,
@@ -257,6 +283,7 @@ class FederalRevenueModel:
         wage_growth: np.ndarray,
         employment: np.ndarray,
         iterations: int = 10000,
+        noise: Optional[np.ndarray] = None,
     ) -> Dict[str, np.ndarray]:
         """
         Project payroll tax revenue (Social Security + Medicare).
@@ -266,40 +293,34 @@ class FederalRevenueModel:
             wage_growth: Annual wage growth rates
             employment: Employment levels
             iterations: Number of Monte Carlo iterations
+            noise: Pre-drawn (years, iterations) noise shared by both taxes (drawn if None)
 
         Returns:
             Dictionary with revenue projections
         """
         logger.info(f"Projecting payroll taxes for {years} years with {iterations} iterations")
 
-        ss_revenues = np.zeros((years, iterations))
-        medicare_revenues = np.zeros((years, iterations))
-
-        for it in range(iterations):
-            if it % 1000 == 0 and it > 0:
-                logger.info(f"  Payroll tax projection: {it}/{iterations} iterations ({it/iterations*100:.1f}%)")
+        if noise is None:
+            (noise,) = self.draw_block(Draw((years, iterations), 1.0, 0.025))  # 2.5% std dev
 
-            ss_revenue = self.baseline_revenues["payroll_taxes"] * SOCIAL_SECURITY_SHARE_OF_PAYROLL
-            medicare_revenue = self.baseline_revenues["payroll_taxes"] * MEDICARE_SHARE_OF_PAYROLL
+        year_index = np.arange(years)
+        wage_factor = 1 + np.asarray(wage_growth[:years], dtype=float)
+        employment_factor = np.ones(years)
+        n_employment = min(len(employment), years)
+        employment_factor[:n_employment] = employment[:n_employment]
 
-            for year in range(years):
-                # Wage base growth (year-over-year, not cumulative)
-                wage_factor = 1 + wage_growth[year]
-                employment_factor = employment[year] if year < len(employment) else 1.0
+        # Social Security cap becomes more binding over time as wages grow
+        # Starts at 100% effective, decreases to 95% by end (5% of payroll escapes cap)
+        ss_cap_effect = 1.0 - (0.05 * year_index / years)
 
-                # Social Security cap becomes more binding over time as wages grow
-                # Starts at 100% effective, decreases to 95% by end (5% of payroll escapes cap)
-                ss_cap_effect = 1.0 - (0.05 * year / years)
-
-                # Add Monte Carlo noise
-                noise = np.random.normal(1.0, 0.025)  # 2.5% std dev
-
-                # Project revenues (simple compounding)
-                ss_revenue = ss_revenue * wage_factor * employment_factor * ss_cap_effect * noise
-                medicare_revenue = medicare_revenue * wage_factor * employment_factor * noise
-
-                ss_revenues[year, it] = ss_revenue
-                medicare_revenues[year, it] = medicare_revenue
+        # Project revenues (simple compounding)
+        medicare_growth = (wage_factor * employment_factor)[:, np.newaxis] * noise
+        medicare_revenues = (
+            self.baseline_revenues["payroll_taxes"] * MEDICARE_SHARE_OF_PAYROLL
+        ) * np.cumprod(medicare_growth, axis=0)
+        ss_revenues = (
+            self.baseline_revenues["payroll_taxes"] * SOCIAL_SECURITY_SHARE_OF_PAYROLL
+        ) * np.cumprod(medicare_growth * ss_cap_effect[:, np.newaxis], axis=0)
 
         total = ss_revenues + medicare_revenues
 
@@ -316,6 +337,7 @@ class FederalRevenueModel:
         years: int,
         gdp_growth: np.ndarray,
         iterations: int = 10000,
+        noise: Optional[Dict[str, np.ndarray]] = None,
     ) -> Dict[str, np.ndarray]:
         """
         Project corporate income tax revenue.
@@ -326,6 +348,8 @@ class FederalRevenueModel:
             years: Number of years to project
             gdp_growth: Annual GDP growth rates
             iterations: Number of Monte Carlo iterations
+            noise: Pre-drawn matrices from draw_noise() with "corporate_profit_shock",
+                "corporate_avoidance" and "corporate" keys (drawn if None)
 
         Returns:
             Dictionary with revenue projections
@@ -341,65 +365,57 @@ class FederalRevenueModel:
             invalid_values = gdp_growth[(gdp_growth < -0.10) | (gdp_growth > 0.15)]
             raise ValueError(f"GDP growth rates outside reasonable bounds (-10% to +15%): {invalid_values}")
 
-        revenues = np.zeros((years, iterations))
-
-        for it in range(iterations):
-            if it % 1000 == 0 and it > 0:
-                logger.info(f"  Corporate income tax projection: {it}/{iterations} iterations ({it/iterations*100:.1f}%)")
-
-            revenue = self.baseline_revenues["corporate_income_tax"]
-            
-            # M3 Enhancement: Track recession state for loss carryforward logic
-            in_recession = False
-            years_since_recession = 0
-
-            for year in range(years):
-                # Corporate profits highly sensitive to GDP growth
-                # Elasticity ~2.0 (1% GDP growth → 2% profit growth)
-                profit_growth = 1 + (gdp_growth[year] * CORPORATE_PROFIT_GDP_ELASTICITY)
-
-                # M3 Enhancement: Improved recession handling with multi-year effects
-                # Recession defined as GDP growth < -2%
-                is_recession_year = gdp_growth[year] < -0.02
-                
-                if is_recession_year:
-                    in_recession = True
-                    years_since_recession = 0
-                    # During recession: profit decline + loss carryforwards reduce tax revenue
-                    recession_impact = 0.75  # 25% revenue reduction from losses
-                    logger.debug(f"Iteration {it}, Year {year}: Recession detected (GDP: {gdp_growth[year]:.1%})")
-                elif in_recession and years_since_recession < 3:
-                    # Post-recession recovery: loss carryforwards still reducing revenue
-                    years_since_recession += 1
-                    # Gradual recovery: 15% -> 10% -> 5% reduction over 3 years
-                    carryforward_reduction = 0.15 - (years_since_recession * 0.05)
-                    recession_impact = 1.0 - carryforward_reduction
-                    logger.debug(f"Iteration {it}, Year {year}: Post-recession year {years_since_recession}, carryforward reduction: {carryforward_reduction:.1%}")
-                    if years_since_recession >= 3:
-                        in_recession = False
-                else:
-                    # Normal years: mild profit volatility only
-                    recession_impact = 1.0
-                    if np.random.random() < 0.10:  # 10% chance of mild profit decline
-                        recession_impact = 0.95  # 5% decline
-
-                # Tax avoidance effects
-                tax_avoidance = np.random.normal(
-                    self.corporate.tax_avoidance_factor, 0.05
-                )  # 5% std dev
-
-                # Add cyclical noise
-                noise = np.random.normal(1.0, 0.05)  # 5% std dev
-
-                revenue = (
-                    revenue
-                    * profit_growth
-                    * recession_impact
-                    * tax_avoidance
-                    * noise
-                )
-
-                revenues[year, it] = revenue
+        if noise is None:
+            shape = (years, iterations)
+            profit_shock, avoidance, cyclical = self.draw_block(
+                Draw(shape, uniform=True),
+                Draw(shape, self.corporate.tax_avoidance_factor, 0.05),
+                Draw(shape, 1.0, 0.05),
+            )
+            noise = {
+                "corporate_profit_shock": profit_shock,
+                "corporate_avoidance": avoidance,
+                "corporate": cyclical,
+            }
+
+        # Corporate profits highly sensitive to GDP growth
+        # Elasticity ~2.0 (1% GDP growth → 2% profit growth)
+        profit_growth = 1 + gdp_growth * CORPORATE_PROFIT_GDP_ELASTICITY
+
+        # M3 Enhancement: recession state depends only on the GDP path, so it is
+        # shared by every iteration; only normal years carry a per-path shock
+        recession_impact = np.ones(years)
+        normal_year = np.zeros(years, dtype=bool)
+        in_recession = False
+        years_since_recession = 0
+        for year in range(years):
+            # Recession defined as GDP growth < -2%
+            if gdp_growth[year] < -0.02:
+                in_recession = True
+                years_since_recession = 0
+                # During recession: profit decline + loss carryforwards reduce tax revenue
+                recession_impact[year] = 0.75  # 25% revenue reduction from losses
+                logger.debug(f"Year {year}: Recession detected (GDP: {gdp_growth[year]:.1%})")
+            elif in_recession and years_since_recession < 3:
+                # Post-recession recovery: loss carryforwards still reducing revenue
+                years_since_recession += 1
+                # Gradual recovery: 15% -> 10% -> 5% reduction over 3 years
+                carryforward_reduction = 0.15 - (years_since_recession * 0.05)
+                recession_impact[year] = 1.0 - carryforward_reduction
+                logger.debug(f"Year {year}: Post-recession year {years_since_recession}, carryforward reduction: {carryforward_reduction:.1%}")
+                if years_since_recession >= 3:
+                    in_recession = False
+            else:
+                normal_year[year] = True
+
+        # Normal years: 10% chance of a mild (5%) profit decline, applied as a mask
+        mild_decline = normal_year[:, np.newaxis] & (noise["corporate_profit_shock"] < 0.10)
+        impact = np.where(mild_decline, 0.95, recession_impact[:, np.newaxis])
+
+        revenues = self.baseline_revenues["corporate_income_tax"] * np.cumprod(
+            profit_growth[:, np.newaxis] * impact * noise["corporate_avoidance"] * noise["corporate"],
+            axis=0,
+        )
 
         return {
             "revenues": revenues,
@@ -414,20 +430,48 @@ class FederalRevenueModel:
         wage_growth: Optional[np.ndarray] = None,
         iterations: int = 10000,
         scenario: str = "baseline",
-    ) -> pd.DataFrame:
+        return_arrays: bool = False,
+        return_summary: bool = False,
+        chunk_size: Optional[int] = None,
+        adaptive: Optional[AdaptiveSampling] = None,
+        context: Optional[ProjectionContext] = None,
+    ) -> Union[pd.DataFrame, ProjectionPaths]:
         """
         Project all federal revenues with scenario differentiation.
 
+        All sources share one noise draw (see draw_noise()) and are evaluated
+        as (years, iterations) array operations.
+
         Args:
             years: Number of years to project
             gdp_growth: Annual GDP growth rates (if None, use scenario-specific baseline)
             wage_growth: Annual wage growth rates (if None, use scenario-specific baseline)
             iterations: Number of Monte Carlo iterations
             scenario: Revenue scenario - "baseline", "recession", or "strong_growth"
+            return_arrays: If True, return the (years, iterations) arrays per
+                source as ProjectionPaths instead of a long-format DataFrame
+            return_summary: If True, return one row per year with the
+                mean/std/p10/p90 of every source
+            chunk_size: With return_summary, simulate at most this many iterations
+                at a time and fold them into streaming statistics (percentiles
+                become sketch estimates)
+            adaptive: With return_summary, run in batches until the monitored
+                statistics converge (final-year mean total revenues by default);
+                ``iterations`` becomes the cap and ``df.attrs["convergence"]``
+                reports the result
+            context: Shared macro paths; the default GDP and wage growth move
+                by its deviations from the baseline path (explicit growth
+                arrays still take precedence, and scenario multipliers apply
+                on top). Rates must be constant, not per-path
 
         Returns:
-            DataFrame with detailed revenue projections
+            DataFrame with detailed revenue projections (one row per
+            iteration/year, ordered by iteration then year), a per-year
+            summary, or ProjectionPaths
         """
+        if (chunk_size is not None or adaptive is not None) and not return_summary:
+            raise ValueError("chunk_size and adaptive require return_summary=True")
+
         # Scenario-specific growth assumptions
         scenario_params = {
             "baseline": {"gdp_multiplier": 1.0, "wage_multiplier": 1.0},
@@ -441,6 +485,15 @@ class FederalRevenueModel:
         
         scenario_config = scenario_params[scenario]
         
+        if context is not None:
+            context.check_horizon(years)
+            if np.ndim(context.gdp_growth) or np.ndim(context.wage_growth):
+                raise ValueError("FederalRevenueModel needs constant GDP and wage growth in the context")
+            if gdp_growth is None:
+                gdp_growth = np.full(years, context.shifted("gdp_growth", DEFAULT_GDP_GROWTH))
+            if wage_growth is None:
+                wage_growth = np.full(years, context.shifted("wage_growth", DEFAULT_WAGE_GROWTH))
+        
         # Default growth assumptions if not provided - apply scenario multipliers
         if gdp_growth is None:
             gdp_growth = np.full(years, DEFAULT_GDP_GROWTH * scenario_config["gdp_multiplier"])
@@ -460,65 +513,96 @@ class FederalRevenueModel:
 
         logger.info(f"Projecting all revenues for {years} years with {iterations} iterations (scenario: {scenario})")
 
+        if return_summary:
+            year_array = self.start_year + np.arange(years)
+            data: Dict[str, Any] = {"year": year_array, "scenario": scenario}
+            monitor = None
+            if adaptive is not None:
+                monitor = ConvergenceMonitor(adaptive, {"final_total_revenues": final_year_mean("total_revenues")})
+            if monitor is not None or (chunk_size is not None and chunk_size < iterations):
+                summaries = summarize_paths(
+                    lambda n: self._simulate_revenue_paths(years, gdp_growth, wage_growth, n),
+                    iterations,
+                    chunk_size,
+                    monitor=monitor,
+                )
+                for column in self._REVENUE_COLUMNS:
+                    data.update(summaries[column].to_dict(column))
+            else:
+                paths = self._simulate_revenue_paths(years, gdp_growth, wage_growth, iterations)
+                for column in self._REVENUE_COLUMNS:
+                    data.update(summary_statistics(paths[column], column))
+            df = pd.DataFrame(data)
+            if monitor is not None:
+                df.attrs["convergence"] = monitor.report()
+            logger.info(f"Revenue summary complete: {len(df)} years (scenario: {scenario})")
+            return df
+
+        paths = ProjectionPaths(
+            self.start_year + np.arange(years),
+            self._simulate_revenue_paths(years, gdp_growth, wage_growth, iterations),
+        )
+        if return_arrays:
+            return paths
+
+        df = paths.to_frame(self._REVENUE_COLUMNS, scenario=scenario)
+        logger.info(f"Revenue projections complete: {len(df)} records (scenario: {scenario})")
+        return df
+
+    # Per-source outputs of _simulate_revenue_paths, in report order
+    _REVENUE_COLUMNS = (
+        "individual_income_tax",
+        "social_security_tax",
+        "medicare_tax",
+        "corporate_income_tax",
+        "excise_taxes",
+        "other_revenues",
+        "total_revenues",
+    )
+
+    def _simulate_revenue_paths(
+        self, years: int, gdp_growth: np.ndarray, wage_growth: np.ndarray, iterations: int
+    ) -> Dict[str, np.ndarray]:
+        """
+        Draw noise and project every revenue source.
+
+        Returns:
+            Dictionary of (years, iterations) arrays keyed by _REVENUE_COLUMNS
+        """
+        noise = self.draw_noise(years, iterations)
+
         # Project individual sources
         iit_results = self.project_individual_income_tax(
-            years, gdp_growth, wage_growth, iterations
+            years, gdp_growth, wage_growth, iterations, noise=noise["individual_income_tax"]
         )
         payroll_results = self.project_payroll_taxes(
-            years, wage_growth, np.ones(years), iterations
+            years, wage_growth, np.ones(years), iterations, noise=noise["payroll"]
         )
         cit_results = self.project_corporate_income_tax(
-            years, gdp_growth, iterations
+            years, gdp_growth, iterations, noise=noise
         )
 
-        # Simplified excise & other taxes (grow with GDP)
-        excise_revenues = np.zeros((years, iterations))
-        other_revenues = np.zeros((years, iterations))
-
-        for it in range(iterations):
-            excise_rev = self.baseline_revenues["excise_taxes"]
-            other_rev = self.baseline_revenues["other_revenues"]
-
-            for year in range(years):
-                growth_factor = 1 + gdp_growth[year]
-                noise = np.random.normal(1.0, EXCISE_OTHER_REVENUE_UNCERTAINTY)
-
-                excise_rev = excise_rev * growth_factor * noise
-                other_rev = other_rev * growth_factor * noise
-                excise_revenues[year, it] = excise_rev
-                other_revenues[year, it] = other_rev
-
-        # Compile results
-        results = []
-
-        for it in range(iterations):
-            for year in range(years):
-                total_rev = (
-                    iit_results["revenues"][year, it]
-                    + payroll_results["total_payroll_revenues"][year, it]
-                    + cit_results["revenues"][year, it]
-                    + excise_revenues[year, it]
-                    + other_revenues[year, it]
-                )
-
-                results.append(
-                    {
-                        "year": self.start_year + year,
-                        "iteration": it,
-                        "scenario": scenario,
-                        "individual_income_tax": iit_results["revenues"][year, it],
-                        "social_security_tax": payroll_results["ss_revenues"][year, it],
-                        "medicare_tax": payroll_results["medicare_revenues"][year, it],
-                        "corporate_income_tax": cit_results["revenues"][year, it],
-                        "excise_taxes": excise_revenues[year, it],
-                        "other_revenues": other_revenues[year, it],
-                        "total_revenues": total_rev,
-                    }
-                )
-
-        df = pd.DataFrame(results)
-        logger.info(f"Revenue projections complete: {len(df)} records (scenario: {scenario})")
-        return df
+        # Simplified excise & other taxes (grow with GDP, shared noise)
+        excise_other_growth = np.cumprod((1 + gdp_growth)[:, np.newaxis] * noise["excise_other"], axis=0)
+        excise_revenues = self.baseline_revenues["excise_taxes"] * excise_other_growth
+        other_revenues = self.baseline_revenues["other_revenues"] * excise_other_growth
+
+        paths = {
+            "individual_income_tax": iit_results["revenues"],
+            "social_security_tax": payroll_results["ss_revenues"],
+            "medicare_tax": payroll_results["medicare_revenues"],
+            "corporate_income_tax": cit_results["revenues"],
+            "excise_taxes": excise_revenues,
+            "other_revenues": other_revenues,
+        }
+        paths["total_revenues"] = (
+            paths["individual_income_tax"]
+            + payroll_results["total_payroll_revenues"]
+            + paths["corporate_income_tax"]
+            + paths["excise_taxes"]
+            + paths["other_revenues"]
+        )
+        return paths
 
     def apply_tax_reform(
         self,
@@ -0,0 +1,213 @@
+"""
+Pluggable Monte Carlo samplers for polisim models.
+
+Every stochastic model draws its random inputs for a block of iterations
+through a Sampler, so plain pseudo-random draws can be swapped for
+variance-reduction schemes without touching the model equations:
+
+    - PseudoRandomSampler: the model's Generator, draw for draw (default)
+    - AntitheticSampler: pairs u and 1 - u, so normal shocks come as z, -z
+    - LatinHypercubeSampler: one stratum per iteration in every dimension
+    - SobolSampler: scrambled Sobol low-discrepancy points
+
+A block's draws are requested together: every input of one iteration is a
+coordinate of the same point, so stratification and low discrepancy hold
+jointly across variables and years. Non-default samplers map uniform points
+to normals through the inverse normal CDF. Each block gets a fresh
+randomization seeded from the model's Generator, so results stay
+reproducible and blocks are independent replicates (which is what the
+chunked and adaptive modes in core.online_stats assume).
+
+Usage:
+    from core.samplers import Draw
+
+    class MyModel(RandomStreamMixin):
+        def __init__(self, seed=None, sampler=None):
+            self._init_random_stream(seed, sampler)
+
+        def noise(self, years, iterations):
+            growth, shock = self.sampler.draw(self.rng, [
+                Draw((years, iterations), loc=1.0, scale=0.02),
+                Draw((years, iterations), uniform=True),
+            ])
+
+    MyModel(seed=1, sampler="sobol")
+"""
+
+import warnings
+from abc import ABC, abstractmethod
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple, Type, Union
+
+import numpy as np
+
+# scipy is imported where the quasi-random samplers need it, so importing the
+# models (and the default pseudo-random sampler) does not load scipy.stats
+
+
+class Draw(NamedTuple):
+    """
+    One random input of a block.
+
+    Attributes:
+        shape: Full array shape, including the iteration axis
+        loc: Mean of a normal draw (lower bound of a uniform draw)
+        scale: Standard deviation of a normal draw (width of a uniform draw)
+        uniform: Draw uniforms instead of normals
+        iteration_axis: Axis of ``shape`` that indexes iterations
+    """
+    shape: Tuple[int, ...]
+    loc: float = 0.0
+    scale: float = 1.0
+    uniform: bool = False
+    iteration_axis: int = -1
+
+
+class Sampler(ABC):
+    """
+    Abstract base sampler: subclasses provide ``uniform`` points in the unit cube.
+
+    ``draw`` turns one (iterations, dimensions) block of points into the
+    requested arrays.
+    """
+
+    name = "base"
+
+    @abstractmethod
+    def uniform(self, rng: np.random.Generator, iterations: int, dimensions: int) -> np.ndarray:
+        """Points of shape (iterations, dimensions) in the open unit cube."""
+        pass
+
+    def draw(self, rng: np.random.Generator, draws: Sequence[Draw]) -> List[np.ndarray]:
+        """
+        Draw every input of a block from one joint set of points.
+
+        Args:
+            rng: Generator that seeds the block's randomization
+            draws: Inputs to draw; all must share the iteration count
+
+        Returns:
+            One array per Draw, with the requested shape
+        """
+        from scipy.special import ndtri
+
+        iterations = _iteration_count(draws)
+        widths = [int(np.prod(draw.shape)) // iterations if iterations else 0 for draw in draws]
+        points = self.uniform(rng, iterations, sum(widths))
+        # Keep ndtri finite for points that land on the cube's boundary
+        points = np.clip(points, np.finfo(float).tiny, 1.0 - np.finfo(float).epsneg)
+
+        arrays = []
+        start = 0
+        for draw, width in zip(draws, widths):
+            block = points[:, start:start + width]
+            start += width
+            values = block if draw.uniform else ndtri(block)
+            values = draw.loc + draw.scale * values
+            # (iterations, rest) -> requested shape with iterations on its axis
+            rest = tuple(np.delete(draw.shape, draw.iteration_axis))
+            values = np.moveaxis(values.reshape((iterations,) + rest), 0, draw.iteration_axis)
+            arrays.append(values)
+        return arrays
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class PseudoRandomSampler(Sampler):
+    """Plain pseudo-random draws, identical to calling the Generator directly."""
+
+    name = "pseudo"
+
+    def uniform(self, rng: np.random.Generator, iterations: int, dimensions: int) -> np.ndarray:
+        return rng.random((iterations, dimensions))
+
+    def draw(self, rng: np.random.Generator, draws: Sequence[Draw]) -> List[np.ndarray]:
+        # Draw input by input in the requested shape, so seeded streams match
+        # models that call rng.normal()/rng.random() themselves
+        return [
+            draw.loc + draw.scale * rng.random(draw.shape) if draw.uniform
+            else rng.normal(draw.loc, draw.scale, size=draw.shape)
+            for draw in draws
+        ]
+
+
+class AntitheticSampler(Sampler):
+    """
+    Antithetic pairs: the second half of a block mirrors the first.
+
+    Iteration i + ceil(n/2) uses 1 - u where iteration i uses u, so normal
+    shocks cancel in pairs and monotone outputs have lower variance.
+    """
+
+    name = "antithetic"
+
+    def uniform(self, rng: np.random.Generator, iterations: int, dimensions: int) -> np.ndarray:
+        half = rng.random(((iterations + 1) // 2, dimensions))
+        return np.concatenate([half, 1.0 - half])[:iterations]
+
+
+class LatinHypercubeSampler(Sampler):
+    """Latin hypercube: each dimension has exactly one point per 1/n stratum."""
+
+    name = "lhs"
+
+    def uniform(self, rng: np.random.Generator, iterations: int, dimensions: int) -> np.ndarray:
+        from scipy.stats import qmc
+
+        return qmc.LatinHypercube(d=dimensions, seed=rng).random(iterations)
+
+
+class SobolSampler(Sampler):
+    """
+    Scrambled Sobol sequence.
+
+    Balance is best when blocks hold a power of two iterations; other sizes
+    remain unbiased but give up part of the gain.
+    """
+
+    name = "sobol"
+
+    def uniform(self, rng: np.random.Generator, iterations: int, dimensions: int) -> np.ndarray:
+        from scipy.stats import qmc
+
+        engine = qmc.Sobol(d=dimensions, scramble=True, seed=rng)
+        with warnings.catch_warnings():
+            # Non-power-of-two sizes are allowed; scipy warns about balance
+            warnings.simplefilter("ignore", UserWarning)
+            return engine.random(iterations)
+
+
+SAMPLERS: Dict[str, Type[Sampler]] = {
+    sampler.name: sampler
+    for sampler in (PseudoRandomSampler, AntitheticSampler, LatinHypercubeSampler, SobolSampler)
+}
+
+SamplerLike = Union[str, Sampler]
+
+
+def make_sampler(sampler: Optional[SamplerLike] = None) -> Sampler:
+    """
+    Resolve a sampler name or instance.
+
+    Args:
+        sampler: 'pseudo', 'antithetic', 'lhs', 'sobol', a Sampler, or None
+            for pseudo-random draws
+
+    Returns:
+        Sampler instance
+    """
+    if sampler is None:
+        return PseudoRandomSampler()
+    if isinstance(sampler, Sampler):
+        return sampler
+    if sampler not in SAMPLERS:
+        raise ValueError(f"Unknown sampler: {sampler}. Must be one of {list(SAMPLERS)}")
+    return SAMPLERS[sampler]()
+
+
+def _iteration_count(draws: Sequence[Draw]) -> int:
+    """Shared iteration count of a block's draws."""
+    counts = {draw.shape[draw.iteration_axis] for draw in draws}
+    if len(counts) != 1:
+        raise ValueError(f"Draws in one block must share the iteration count, got {sorted(counts)}")
+    return counts.pop()
@@ -4,22 +4,33 @@ This module handles multi-year simulations of economic policies,
 tracking GDP, debt, surplus, and other macroeconomic indicators.
 """
 
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence
 import logging
 
+import numpy as np
 import pandas as pd
-from tkinter import messagebox
 
 logger = logging.getLogger(__name__)
 
-from core.economics import calculate_revenues_and_outs
+from core.economics import compile_policy
 from core.healthcare import PolicyType
 from core.context_aware_healthcare import (
-    calculate_mechanism_based_outcomes,
-    RevenueBreakdown,
-    SpendingBreakdown,
-    SurplusBreakdown
+    MECHANICS_RAMP_YEARS,
+    PREMIUM_CONVERSION_RATE,
+    SAVINGS_ATTRIBUTION,
+    SPENDING_CAP_MESSAGE,
+    SURPLUS_TRIGGER_MESSAGE,
+    WAGE_SHARE_GDP,
+    CompiledMechanics,
+    linear_ramp,
+    sigmoid_ramp,
 )
+from core.path_results import ProjectionPaths
+from core.policy_registry import precompiled_mechanics
+from core.projection_context import ProjectionContext, growth_index
+from core.random_streams import SeedLike, make_generator
+from core.samplers import Draw, SamplerLike, make_sampler
 
 # L2 Fix: Extract simulation magic numbers to named constants
 # Category reduction bounds
@@ -30,6 +41,223 @@ REDUCTION_FACTOR_MAX = 1.5  # Maximum spending level (50% increase max for growt
 BASELINE_HEALTH_PCT_GDP = 0.185  # 18.5% GDP (2025 US baseline)
 
 
+# Mechanics-mode constants (revenue and savings coefficients live in
+# core.context_aware_healthcare, shared with its calculators)
+DEBT_INTEREST_RATE = 0.035  # Average rate on national debt
+
+# Column order of mechanics-mode simulation frames
+MECHANICS_COLUMNS = (
+    'Year', 'GDP', 'National Debt', 'Debt % GDP',
+    'Total Revenue', 'Payroll Tax Revenue', 'Redirected Federal Revenue',
+    'Converted Premiums Revenue', 'Efficiency Gains Revenue', 'Other Revenue',
+    'Healthcare Spending', 'Health % GDP', 'Baseline Health Spending', 'Savings vs Baseline',
+    'Administrative Savings', 'Drug Pricing Savings', 'Preventive Care Savings',
+    'Surplus/Deficit', 'Surplus % GDP', 'Interest Spending',
+    'Contingency Reserve', 'Debt Reduction', 'Infrastructure Allocation', 'Dividend Pool',
+    'Dividend Per Capita', 'Innovation Fund', 'Per Capita Health ($)', 'Population',
+    'Circuit Breaker Triggered', 'Circuit Breaker Message',
+)
+
+
+def _policy_start_year(policy, start_year: Optional[int]) -> int:
+    """Calendar start year: explicit, else the policy timeline's, else 2025."""
+    if start_year is not None:
+        return start_year
+    timeline = policy.transition_timeline
+    return timeline.start_year if timeline and timeline.start_year else 2025
+
+
+def _breaker_messages(pct: np.ndarray, breakers, template: str) -> List[List[str]]:
+    """
+    Message of the first breaker each (policy, year) value exceeds, else "".
+
+    Args:
+        pct: (policies, years) spending or surplus as % of GDP
+        breakers: Per policy, (threshold, action) pairs in policy order
+        template: Message format with pct, threshold and action fields
+    """
+    messages = [[""] * pct.shape[1] for _ in breakers]
+    for n, policy_breakers in enumerate(breakers):
+        pending = np.ones(pct.shape[1], dtype=bool)
+        for threshold, action in policy_breakers:
+            hits = np.flatnonzero(pending & (pct[n] > threshold))
+            for i in hits:
+                messages[n][i] = template.format(pct=pct[n, i], threshold=threshold, action=action)
+            pending[hits] = False
+    return messages
+
+
+def _simulate_mechanics_batch(compiled: Sequence[CompiledMechanics], start_years: Sequence[int],
+                              gdp: np.ndarray, initial_debt: float, population: float,
+                              payroll_factor=1.0, efficiency_factor=1.0, spending_factor=1.0,
+                              detail: bool = True) -> Dict[str, np.ndarray]:
+    """
+    Evaluate compiled mechanics for many rows (policies or Monte Carlo paths).
+
+    Revenue, spending, allocations and circuit breakers are (rows, years)
+    array expressions; only the debt/reserve recurrence steps through the
+    years, for all rows at once. Arithmetic follows the
+    core.context_aware_healthcare calculators operation for operation, so
+    with unit factors each row equals their per-year results exactly.
+
+    Args:
+        compiled: Mechanics per row, or a single entry shared by all rows
+        start_years: Policy start year per entry of compiled
+        gdp: (years,) GDP path shared by all rows, or (rows, years) paths
+        initial_debt: Starting national debt
+        population: Population for per-capita metrics
+        payroll_factor: Multiplier on the payroll tax base (scalar or (rows, 1))
+        efficiency_factor: Multiplier on efficiency gains (scalar or (rows, 1))
+        spending_factor: Multiplier on net health spending (scalar, (rows, 1)
+            or (rows, years))
+        detail: Also compute the breakdown columns (revenue sources, savings
+            attribution, other allocations, innovation fund, per-capita
+            figures and circuit breaker messages; one compiled entry per row)
+
+    Returns:
+        Column name -> (rows, years) array: every MECHANICS_COLUMNS entry in
+        order, or only the aggregate columns when detail is False
+    """
+    gdp = np.asarray(gdp, dtype=float)
+    years = gdp.shape[-1]
+    gdp = np.broadcast_to(gdp, np.broadcast_shapes((len(compiled), years), gdp.shape))
+    n_rows = gdp.shape[0]
+    elapsed = np.arange(years)
+    start = np.asarray(start_years, dtype=np.int64)[:, None]
+
+    def column(values) -> np.ndarray:
+        return np.array(values, dtype=float)[:, None]
+
+    # Revenue; ramp-ups are shared by every row (scalar, as the calculators evaluate them)
+    ramp = np.array([linear_ramp(i, MECHANICS_RAMP_YEARS) for i in range(years)])
+    sigmoid = np.array([sigmoid_ramp(i, MECHANICS_RAMP_YEARS) for i in range(years)])
+
+    payroll = column([c.payroll_rate for c in compiled]) * (gdp * WAGE_SHARE_GDP * payroll_factor)
+    redirected = column([c.redirected_pct_gdp for c in compiled]) * gdp
+    converted = column([c.converted_pct_gdp for c in compiled]) * gdp * PREMIUM_CONVERSION_RATE * ramp
+    efficiency = column([c.efficiency_pct_gdp for c in compiled]) * gdp * sigmoid * efficiency_factor
+    other = np.zeros((n_rows, years))
+    for k in range(max((len(c.other_pct_gdp) for c in compiled), default=0)):
+        other = other + column([c.other_pct_gdp[k] if k < len(c.other_pct_gdp) else 0.0 for c in compiled]) * gdp
+    total_revenue = payroll + redirected + converted + efficiency + other
+
+    # Spending along the target trajectory (a policy without a target stays at baseline)
+    baseline_pct = BASELINE_HEALTH_PCT_GDP
+    has_target = np.array([c.target_pct_gdp is not None for c in compiled])[:, None]
+    target_pct = column([c.target_pct_gdp if c.target_pct_gdp is not None else baseline_pct for c in compiled])
+    years_to_target = np.array([c.target_year or 0 for c in compiled])[:, None] - start
+    progress = np.where(
+        has_target & (years_to_target > 0),
+        np.minimum(elapsed / np.where(years_to_target > 0, years_to_target, 1), 1.0),
+        np.where(has_target, 1.0, 0.0),
+    )
+    net_spending = (baseline_pct + (target_pct - baseline_pct) * progress) * gdp * spending_factor
+    baseline_spending = baseline_pct * gdp
+    savings = baseline_spending - net_spending
+    admin_share, drug_share, preventive_share, _ = SAVINGS_ATTRIBUTION
+
+    surplus = total_revenue - net_spending
+
+    # Surplus allocation amounts
+    has_allocation = np.array([c.surplus_allocation is not None for c in compiled])[:, None]
+    shares = np.array([c.surplus_allocation or (0.0, 0.0, 0.0, 0.0) for c in compiled], dtype=float)
+    allocating = (surplus > 0) & has_allocation
+
+    def allocation(k: int) -> np.ndarray:
+        return np.where(allocating, surplus * shares[:, k, None], 0.0)
+
+    contingency, debt_reduction = allocation(0), allocation(1)
+
+    # Debt and contingency reserve carry from year to year
+    # (year-major copies keep each year's slice contiguous)
+    debt_path = np.empty((years, n_rows))
+    reserve_path = np.empty((years, n_rows))
+    debt = np.full(n_rows, float(initial_debt))
+    reserve = np.zeros(n_rows)
+    for i, (allocate, surplus_i, contingency_i, debt_reduction_i) in enumerate(zip(
+        allocating.T.copy(), surplus.T.copy(), contingency.T.copy(), debt_reduction.T.copy()
+    )):
+        deficit = -surplus_i
+        reserve = np.where(allocate, reserve + contingency_i, reserve)
+        debt = np.where(allocate, np.maximum(0.0, debt - debt_reduction_i), debt)
+        in_deficit = surplus_i < 0
+        draw = in_deficit & (reserve > deficit)
+        reserve = np.where(draw, reserve - deficit, reserve)
+        debt = np.where(in_deficit & ~draw, debt + deficit, debt)
+        debt_path[i] = debt
+        reserve_path[i] = reserve
+    debt_path, reserve_path = debt_path.T, reserve_path.T
+
+    # Circuit breakers: a breaker of a type fires when its lowest threshold is exceeded
+    spending_pct = (net_spending / gdp) * 100
+    surplus_pct = (surplus / gdp) * 100
+    cap_floor = column([min((t for t, _ in c.spending_caps), default=np.inf) for c in compiled])
+    trigger_floor = column([min((t for t, _ in c.surplus_triggers), default=np.inf) for c in compiled])
+
+    columns = {
+        'Year': np.broadcast_to(start + elapsed, (n_rows, years)),
+        'GDP': gdp,
+        'National Debt': debt_path,
+        'Debt % GDP': (debt_path / gdp) * 100,
+        'Total Revenue': total_revenue,
+        'Healthcare Spending': net_spending,
+        'Health % GDP': spending_pct,
+        'Surplus/Deficit': surplus,
+        'Surplus % GDP': surplus_pct,
+        'Interest Spending': debt_path * DEBT_INTEREST_RATE,
+        'Contingency Reserve': reserve_path,
+        'Circuit Breaker Triggered': (spending_pct > cap_floor) | (surplus_pct > trigger_floor),
+    }
+    if not detail:
+        return columns
+
+    # Innovation fund: a share of savings, capped at a share of surplus
+    has_fund = np.array([c.innovation_fund is not None for c in compiled])[:, None]
+    fund_pct = column([c.innovation_fund[0] if c.innovation_fund else 0.0 for c in compiled])
+    cap_pct = column([c.innovation_fund[1] if c.innovation_fund else 0.0 for c in compiled])
+    funded = has_fund & (savings > 0)
+    innovation = np.where(funded, savings * fund_pct, 0.0)
+    capped = funded & (cap_pct > 0) & (surplus > 0)
+    innovation = np.where(capped, np.minimum(innovation, surplus * (cap_pct / 100)), innovation)
+
+    dividends = allocation(3)
+    if population > 0:
+        per_capita_spending = net_spending / population
+        dividend_per_capita = np.where(dividends > 0, dividends / population, 0.0)
+    else:
+        per_capita_spending = np.zeros((n_rows, years))
+        dividend_per_capita = np.zeros((n_rows, years))
+        logger.error("Population is zero or negative, cannot calculate per-capita metrics")
+
+    cap_messages = _breaker_messages(spending_pct, [c.spending_caps for c in compiled], SPENDING_CAP_MESSAGE)
+    trigger_messages = _breaker_messages(surplus_pct, [c.surplus_triggers for c in compiled], SURPLUS_TRIGGER_MESSAGE)
+
+    columns.update({
+        'Payroll Tax Revenue': payroll,
+        'Redirected Federal Revenue': redirected,
+        'Converted Premiums Revenue': converted,
+        'Efficiency Gains Revenue': efficiency,
+        'Other Revenue': other,
+        'Baseline Health Spending': baseline_spending,
+        'Savings vs Baseline': savings,
+        'Administrative Savings': np.where(has_target, savings * admin_share, 0.0),
+        'Drug Pricing Savings': np.where(has_target, savings * drug_share, 0.0),
+        'Preventive Care Savings': np.where(has_target, savings * preventive_share, 0.0),
+        'Debt Reduction': debt_reduction,
+        'Infrastructure Allocation': allocation(2),
+        'Dividend Pool': dividends,
+        'Dividend Per Capita': dividend_per_capita,
+        'Innovation Fund': innovation,
+        'Per Capita Health ($)': per_capita_spending,
+        'Population': np.full((n_rows, years), population),
+        'Circuit Breaker Message': np.array([
+            ["; ".join(msg for msg in pair if msg) for pair in zip(caps, triggers)]
+            for caps, triggers in zip(cap_messages, trigger_messages)
+        ], dtype=object).reshape(n_rows, years),
+    })
+    return {name: columns[name] for name in MECHANICS_COLUMNS}
+
+
 def _simulate_with_mechanics(policy, base_gdp: float, initial_debt: float, years: int,
                             population: float, gdp_growth: float, start_year: int = None,
                             cbo_data: dict = None) -> pd.DataFrame:
@@ -38,154 +266,63 @@ def _simulate_with_mechanics(policy, base_gdp: float, initial_debt: float, years
     
     This function understands WHY revenues and spending change, not just THAT they change.
     """
-    rows = []
-    current_debt = float(initial_debt)
-    
-    # Baseline healthcare spending
-    baseline_health_pct_gdp = BASELINE_HEALTH_PCT_GDP
-    
-    # Determine start year
-    timeline = policy.transition_timeline
-    if start_year is None:
-        start_year = timeline.start_year if timeline and timeline.start_year else 2025
-    
-    # Accumulate reserves
-    contingency_reserve_balance = 0.0
-    
-    for i in range(years):
-        year = start_year + i
-        
-        # Calculate current GDP with compounded growth
-        current_gdp = base_gdp * ((1.0 + gdp_growth) ** i)
-        
-        # CONTEXT-AWARE: Calculate outcomes from mechanics
-        outcomes = calculate_mechanism_based_outcomes(
-            mechanics=policy.mechanics,
-            gdp=current_gdp,
-            year=year,
-            start_year=start_year,
-            baseline_spending_pct_gdp=baseline_health_pct_gdp
-        )
-        
-        revenue_breakdown: RevenueBreakdown = outcomes['revenue']
-        spending_breakdown: SpendingBreakdown = outcomes['spending']
-        surplus = outcomes['surplus']
-        surplus_allocation: Optional[SurplusBreakdown] = outcomes['surplus_allocation']
-        circuit_breakers = outcomes['circuit_breakers']
-        
-        # Calculate baseline health spending for comparison
-        baseline_health_spending_this_year = baseline_health_pct_gdp * current_gdp
-        savings_vs_baseline = baseline_health_spending_this_year - spending_breakdown.net_spending
-        
-        # Apply surplus allocation
-        debt_reduction_amount = 0.0
-        infrastructure_allocation = 0.0
-        dividend_pool = 0.0
-        contingency_addition = 0.0
-        
-        if surplus > 0 and surplus_allocation:
-            debt_reduction_amount = surplus_allocation.debt_reduction
-            infrastructure_allocation = surplus_allocation.infrastructure
-            dividend_pool = surplus_allocation.dividends
-            contingency_addition = surplus_allocation.contingency_reserve
-            
-            # Add to contingency reserve
-            contingency_reserve_balance += contingency_addition
-            
-            # Reduce debt
-            current_debt = max(0, current_debt - debt_reduction_amount)
-        elif surplus < 0:
-            # Deficit: may need to draw from reserves or increase debt
-            if contingency_reserve_balance > abs(surplus):
-                contingency_reserve_balance -= abs(surplus)
-            else:
-                current_debt += abs(surplus)
-        
-        # Calculate interest on debt (assume 3.5% average rate)
-        interest_rate = 0.035
-        interest_spending = current_debt * interest_rate
-        
-        # Innovation fund allocation (from policy mechanics if specified)
-        innovation_fund_amount = 0.0
-        if policy.mechanics and policy.mechanics.innovation_fund and savings_vs_baseline > 0:
-            # Fund based on savings percentage
-            fund_pct = policy.mechanics.innovation_fund.funding_min_pct / 100
-            innovation_fund_amount = savings_vs_baseline * fund_pct
-            
-            # Apply annual cap
-            if policy.mechanics.innovation_fund.annual_cap_pct > 0 and surplus > 0:
-                cap = surplus * (policy.mechanics.innovation_fund.annual_cap_pct / 100)
-                innovation_fund_amount = min(innovation_fund_amount, cap)
-        
-        # Per capita metrics (with validation to prevent division by zero)
-        if population > 0:
-            per_capita_spending = spending_breakdown.net_spending / population
-            dividend_per_capita = dividend_pool / population if dividend_pool > 0 else 0.0
-        else:
-            per_capita_spending = 0.0
-            dividend_per_capita = 0.0
-            logger.error(f"Year {year}: Population is zero or negative, cannot calculate per-capita metrics")
-        
-        # Circuit breaker status
-        circuit_breaker_triggered = len(circuit_breakers) > 0
-        circuit_breaker_msg = "; ".join([msg for _, msg in circuit_breakers]) if circuit_breaker_triggered else ""
-        
-        # Build row with context-aware column names
-        row = {
-            'Year': year,
-            'GDP': current_gdp,
-            'National Debt': current_debt,
-            'Debt % GDP': (current_debt / current_gdp) * 100,
-            
-            # Revenue breakdown (context-aware names)
-            'Total Revenue': revenue_breakdown.total,
-            'Payroll Tax Revenue': revenue_breakdown.payroll_tax,
-            'Redirected Federal Revenue': revenue_breakdown.redirected_federal,
-            'Converted Premiums Revenue': revenue_breakdown.converted_premiums,
-            'Efficiency Gains Revenue': revenue_breakdown.efficiency_gains,
-            'Other Revenue': revenue_breakdown.other_sources,
-            
-            # Spending breakdown (context-aware names)
-            'Healthcare Spending': spending_breakdown.net_spending,
-            'Health % GDP': (spending_breakdown.net_spending / current_gdp) * 100,
-            'Baseline Health Spending': baseline_health_spending_this_year,
-            'Savings vs Baseline': savings_vs_baseline,
-            'Administrative Savings': spending_breakdown.administrative_savings,
-            'Drug Pricing Savings': spending_breakdown.drug_pricing_savings,
-            'Preventive Care Savings': spending_breakdown.preventive_care_savings,
-            
-            # Fiscal outcomes (context-aware names)
-            'Surplus/Deficit': surplus,
-            'Surplus % GDP': (surplus / current_gdp) * 100,
-            'Interest Spending': interest_spending,
-            
-            # Surplus allocation
-            'Contingency Reserve': contingency_reserve_balance,
-            'Debt Reduction': debt_reduction_amount,
-            'Infrastructure Allocation': infrastructure_allocation,
-            'Dividend Pool': dividend_pool,
-            'Dividend Per Capita': dividend_per_capita,
-            
-            # Innovation
-            'Innovation Fund': innovation_fund_amount,
-            
-            # Per capita
-            'Per Capita Health ($)': per_capita_spending,
-            'Population': population,
-            
-            # Circuit breakers
-            'Circuit Breaker Triggered': circuit_breaker_triggered,
-            'Circuit Breaker Message': circuit_breaker_msg
-        }
-        
-        rows.append(row)
-    
-    return pd.DataFrame(rows)
+    gdp_path = ProjectionContext(years, gdp_growth=gdp_growth, base_gdp=float(base_gdp)).gdp
+    columns = _simulate_mechanics_batch(
+        [precompiled_mechanics(policy.mechanics)], [_policy_start_year(policy, start_year)],
+        gdp_path, initial_debt, population,
+    )
+    return pd.DataFrame({name: values[0] for name, values in columns.items()})
 
 
-def simulate_years(internal_general, internal_revenues, internal_outs):
+@dataclass
+class SimulationEvent:
+    """
+    Edge case reported by simulate_years_headless().
+
+    Attributes:
+        level: "error" (simulation stopped), "warning", or "confirm" (the
+            caller may decline to run; see on_event)
+        title: Short title, e.g. "Debt Explosion"
+        message: Human-readable description
+        year: Simulation year, or None for checks made before the first year
     """
-    Simulate economic policy over multiple years.
+    level: str
+    title: str
+    message: str
+    year: Optional[int] = None
+
+
+@dataclass
+class SimulationRun:
+    """
+    Result of simulate_years_headless().
+
+    Attributes:
+        results: Year-by-year results, or None if nothing was simulated
+        events: Edge cases in the order they occurred
+        stopped: True if an error or a declined confirmation ended the run early
+    """
+    results: Optional[pd.DataFrame]
+    events: List[SimulationEvent] = field(default_factory=list)
+    stopped: bool = False
+
+    @property
+    def warnings(self) -> List[str]:
+        """Messages of the warning and confirmation events."""
+        return [event.message for event in self.events if event.level != "error"]
+
+
+def simulate_years_headless(
+    internal_general,
+    internal_revenues,
+    internal_outs,
+    on_event: Optional[Callable[[SimulationEvent], Optional[bool]]] = None,
+) -> SimulationRun:
+    """
+    Simulate economic policy over multiple years without any GUI.
+
+    Edge cases are returned as structured events instead of dialogs, so the
+    simulation can run in API workers and on hosts without a display.
 
     EDGE CASE HANDLING:
     - Negative GDP growth (recession)
@@ -197,19 +334,31 @@ def simulate_years(internal_general, internal_revenues, internal_outs):
         internal_general: Dict with 'gdp', 'gdp_growth_rate', 'inflation_rate', etc.
         internal_revenues: List of revenue dicts
         internal_outs: List of expenditure dicts
+        on_event: Called with each event as it occurs; returning False for a
+            "confirm" event cancels the run (by default every run proceeds)
     
     Returns:
-        pandas.DataFrame with simulation results, or None if error
+        SimulationRun with the results DataFrame (None if error) and events
     """
+    run = SimulationRun(results=None)
+
+    def emit(level: str, title: str, message: str, year: Optional[int] = None) -> bool:
+        event = SimulationEvent(level, title, message, year)
+        run.events.append(event)
+        log = logger.error if level == "error" else logger.warning
+        log(f"{title}: {message}")
+        proceed = on_event(event) if on_event is not None else None
+        return proceed is not False
+
     try:
         # Ensure simulation_years is a positive integer
         sim_years = int(float(internal_general['simulation_years']))
         if sim_years <= 0:
             raise ValueError("Simulation years must be positive")
-        internal_general['simulation_years'] = sim_years
     except (ValueError, TypeError) as e:
-        messagebox.showerror("Error", f"Invalid simulation years value: {str(e)}")
-        return None
+        emit("error", "Error", f"Invalid simulation years value: {str(e)}")
+        run.stopped = True
+        return run
 
     results = []
     current_gdp = internal_general['gdp']
@@ -224,20 +373,22 @@ def simulate_years(internal_general, internal_revenues, internal_outs):
     stop_on_explosion = internal_general.get('stop_on_debt_explosion', 0)
 
     # Edge case warnings
-    warnings = []
+    edge_cases = []
     if base_gdp_growth_decimal < 0:
-        warnings.append(f"WARNING: Negative GDP growth ({internal_general['gdp_growth_rate']}%) - recession scenario")
+        edge_cases.append(f"WARNING: Negative GDP growth ({internal_general['gdp_growth_rate']}%) - recession scenario")
     if inflation_decimal > 0.5:
-        warnings.append(f"WARNING: Hyperinflation detected ({internal_general['inflation_rate']}%) - model may be unreliable")
+        edge_cases.append(f"WARNING: Hyperinflation detected ({internal_general['inflation_rate']}%) - model may be unreliable")
     if current_debt / current_gdp > 10:
-        warnings.append(f"WARNING: Debt-to-GDP ratio > 1000% - debt explosion scenario")
+        edge_cases.append(f"WARNING: Debt-to-GDP ratio > 1000% - debt explosion scenario")
+
+    if edge_cases and not emit("confirm", "Edge Case Detected", "\n".join(edge_cases)):
+        run.stopped = True
+        return run
 
-    if warnings:
-        warning_msg = "\n".join(warnings) + "\n\nContinue simulation?"
-        if not messagebox.askyesno("Edge Case Detected", warning_msg):
-            return None
+    # Compile the revenue/expenditure lines once; the caller's dicts stay untouched
+    policy = compile_policy(internal_revenues, internal_outs).stepper()
 
-    for year in range(1, int(internal_general['simulation_years']) + 1):
+    for year in range(1, sim_years + 1):
         # P1: Apply debt-drag factor (endogenous growth slowdown from high debt)
         # Based on CBO/IMF models: high debt slows growth
         debt_to_gdp_ratio = current_debt / current_gdp
@@ -246,14 +397,14 @@ def simulate_years(internal_general, internal_revenues, internal_outs):
 
         # Handle negative growth gracefully
         scale_factor = (1 + gdp_growth_decimal) * (1 + inflation_decimal)
-        inflation_factor = 1 + inflation_decimal
 
         # Prevent GDP from going negative
         if scale_factor <= 0:
-            messagebox.showerror("Error", f"Year {year}: Combined growth factor <= 0 (GDP would become negative). Simulation stopped.")
+            emit("error", "Error", f"Year {year}: Combined growth factor <= 0 (GDP would become negative). Simulation stopped.", year)
+            run.stopped = True
             break
 
-        category_surplus, rev_totals = calculate_revenues_and_outs(internal_revenues, internal_outs, current_gdp, scale_factor, inflation_factor)
+        category_surplus, rev_totals = policy.step_dicts(current_gdp, scale_factor)
 
         if 'federal' in category_surplus:
             category_surplus['federal'] -= current_interest
@@ -291,21 +442,22 @@ def simulate_years(internal_general, internal_revenues, internal_outs):
         # P1: EDGE CASE - Check for debt explosion with optional stop
         if current_debt / current_gdp > 10:
             if stop_on_explosion:
-                messagebox.showerror("Debt Explosion - Simulation Stopped",
+                emit("error", "Debt Explosion - Simulation Stopped",
                     f"Year {year}: Debt-to-GDP ratio exceeded 1000% ({current_debt/current_gdp*100:.1f}%). "
-                    "Simulation stopped (stop_on_debt_explosion=1).")
+                    "Simulation stopped (stop_on_debt_explosion=1).", year)
+                run.stopped = True
                 break
             else:
-                messagebox.showwarning("Debt Explosion",
+                emit("warning", "Debt Explosion",
                     f"Year {year}: Debt-to-GDP ratio exceeded 1000% ({current_debt/current_gdp*100:.1f}%). "
-                    "Simulation will continue but results may be unrealistic.")
+                    "Simulation will continue but results may be unrealistic.", year)
 
         # EDGE CASE: Check if interest payments exceed total revenue
         total_revenue = sum(rev_totals.values())
         if current_interest > total_revenue:
-            messagebox.showwarning("Interest Crisis",
+            emit("warning", "Interest Crisis",
                 f"Year {year}: Interest payments (${current_interest:.2f}T) exceed total revenue (${total_revenue:.2f}T). "
-                "Debt spiral detected - simulation may be unrealistic.")
+                "Debt spiral detected - simulation may be unrealistic.", year)
 
         result = {'Year': year, 'GDP': round(current_gdp, 2), 'Total Surplus': round(total_surplus, 2), 'Remaining Debt': round(current_debt, 2)}
         # Add surplus columns
@@ -322,7 +474,43 @@ def simulate_years(internal_general, internal_revenues, internal_outs):
 
         current_gdp *= (1 + gdp_growth_decimal)
 
-    return pd.DataFrame(results) if results else None
+    run.results = pd.DataFrame(results) if results else None
+    return run
+
+
+def _show_dialog(event: SimulationEvent) -> Optional[bool]:
+    """Show an event as a Tk dialog; returns the answer for confirmations."""
+    # Imported here so the simulation core never requires Tk or a display
+    from tkinter import messagebox
+
+    if event.level == "confirm":
+        return messagebox.askyesno(event.title, event.message + "\n\nContinue simulation?")
+    if event.level == "error":
+        messagebox.showerror(event.title, event.message)
+    else:
+        messagebox.showwarning(event.title, event.message)
+    return None
+
+
+def simulate_years(internal_general, internal_revenues, internal_outs):
+    """
+    Simulate economic policy over multiple years, reporting edge cases in dialogs.
+
+    Desktop entry point around simulate_years_headless(): each event is shown
+    in a Tk message box as it occurs, and declining the edge-case prompt
+    cancels the run. Services should call simulate_years_headless() instead.
+    
+    Args:
+        internal_general: Dict with 'gdp', 'gdp_growth_rate', 'inflation_rate', etc.
+        internal_revenues: List of revenue dicts
+        internal_outs: List of expenditure dicts
+    
+    Returns:
+        pandas.DataFrame with simulation results, or None if error
+    """
+    return simulate_years_headless(
+        internal_general, internal_revenues, internal_outs, on_event=_show_dialog
+    ).results
 
 
 def simulate_healthcare_years(policy, base_gdp: float, initial_debt: float, years: int = 22,
@@ -453,12 +641,17 @@ def simulate_healthcare_years(policy, base_gdp: float, initial_debt: float, year
     prev_general_revenue = general_revenue
     prev_other_revenues = other_sources_abs
 
+    # GDP and wage-growth index paths (compounded from initial GDP)
+    context = ProjectionContext(years, gdp_growth=gdp_growth, base_gdp=float(base_gdp))
+    gdp_path = context.gdp.tolist()
+    gdp_index = context.gdp_index.tolist()
+
     # Iterate years
     for i in range(years):
         year = start_year + i
 
-        # Update GDP FIRST (compounded growth from initial GDP)
-        current_gdp = base_gdp * ((1.0 + gdp_growth) ** i)
+        # Update GDP FIRST
+        current_gdp = gdp_path[i]
 
         # Update health spending percent (linear towards target over transition window)
         if i < years_to_target:
@@ -493,7 +686,7 @@ def simulate_healthcare_years(policy, base_gdp: float, initial_debt: float, year
             
             # Payroll component grows with wages (GDP growth proxy)
             employment = float(policy.employment_rate) * float(population) if getattr(policy, 'employment_rate', None) is not None else 0.0
-            payroll_base = employment * float(policy.avg_annual_wage) * float(policy.payroll_coverage_rate) * ((1.0 + gdp_growth) ** i)
+            payroll_base = employment * float(policy.avg_annual_wage) * float(policy.payroll_coverage_rate) * gdp_index[i]
             payroll_revenue = payroll_base * payroll_tax_rate
             
             # Other sources grow with GDP
@@ -510,7 +703,7 @@ def simulate_healthcare_years(policy, base_gdp: float, initial_debt: float, year
         else:
             # Use policy percentages (default behavior)
             employment = float(policy.employment_rate) * float(population) if getattr(policy, 'employment_rate', None) is not None else 0.0
-            payroll_base = employment * float(policy.avg_annual_wage) * float(policy.payroll_coverage_rate) * ((1.0 + gdp_growth) ** i)
+            payroll_base = employment * float(policy.avg_annual_wage) * float(policy.payroll_coverage_rate) * gdp_index[i]
             payroll_revenue = payroll_base * payroll_tax_rate
             # General revenue grows with GDP
             general_revenue = current_gdp * float(policy.general_revenue_pct)
@@ -684,3 +877,183 @@ def simulate_healthcare_years(policy, base_gdp: float, initial_debt: float, year
         # GDP already updated at start of loop
 
     return pd.DataFrame(rows)
+
+
+def simulate_healthcare_batch(policies: Sequence, base_gdp: float, initial_debt: float, years: int = 22,
+                              population: float = 335e6, gdp_growth: float = 0.025,
+                              start_year: int = None, stacked: bool = True):
+    """
+    Simulate several healthcare policies over the same horizon in one pass.
+
+    Each policy's mechanics are compiled to coefficients once and all
+    mechanics-based policies are evaluated together as (policies, years)
+    arrays, sharing one GDP path. Results equal simulate_healthcare_years()
+    for every policy; policies without mechanics run through its legacy
+    path.
+
+    Parameters
+    - policies: HealthcarePolicyModel objects (from core.healthcare)
+    - base_gdp, initial_debt, years, population, gdp_growth, start_year:
+      as for simulate_healthcare_years(), applied to every policy
+    - stacked: return one frame (True) or a list of per-policy frames (False)
+
+    Returns: pandas.DataFrame with a leading 'Policy' column and one block
+    of yearly rows per policy, in input order. Mechanics and legacy policies
+    report different columns, so a mixed batch has NaN where a column does
+    not apply. With stacked=False, a list of the per-policy frames exactly
+    as simulate_healthcare_years() returns them.
+    """
+    if population <= 0:
+        raise ValueError("Population must be positive")
+    if base_gdp <= 0:
+        raise ValueError("Base GDP must be positive")
+    if initial_debt < 0:
+        raise ValueError("Initial debt cannot be negative")
+
+    policies = list(policies)
+    mechanics_index = [
+        k for k, policy in enumerate(policies)
+        if getattr(policy, 'mechanics', None) is not None
+    ]
+
+    frames: List[Optional[pd.DataFrame]] = [None] * len(policies)
+    mechanics_frame = None
+    if mechanics_index:
+        gdp_path = ProjectionContext(years, gdp_growth=gdp_growth, base_gdp=float(base_gdp)).gdp
+        columns = _simulate_mechanics_batch(
+            [precompiled_mechanics(policies[k].mechanics) for k in mechanics_index],
+            [_policy_start_year(policies[k], start_year) for k in mechanics_index],
+            gdp_path, initial_debt, population,
+        )
+        mechanics_frame = pd.DataFrame({name: values.ravel() for name, values in columns.items()})
+        mechanics_frame.insert(
+            0, 'Policy', np.repeat([policies[k].policy_name for k in mechanics_index], years)
+        )
+        for block, k in enumerate(mechanics_index):
+            frames[k] = mechanics_frame.iloc[block * years:(block + 1) * years]
+
+    for k, policy in enumerate(policies):
+        if frames[k] is None:
+            df = simulate_healthcare_years(
+                policy, base_gdp, initial_debt, years, population, gdp_growth, start_year
+            )
+            df.insert(0, 'Policy', policy.policy_name)
+            frames[k] = df
+
+    if not stacked:
+        return [df.drop(columns='Policy').reset_index(drop=True) for df in frames]
+    if mechanics_frame is not None and len(mechanics_index) == len(policies):
+        return mechanics_frame
+    if not frames:
+        return pd.DataFrame(columns=['Policy', *MECHANICS_COLUMNS])
+    return pd.concat(frames, ignore_index=True)
+
+
+@dataclass(frozen=True)
+class HealthcareUncertainty:
+    """
+    Spread of the perturbations in simulate_healthcare_monte_carlo().
+
+    Each is the standard deviation of a normal draw made once per path.
+
+    Attributes:
+        gdp_growth_std: Trend GDP growth rate (absolute, 0.01 = one point)
+        payroll_base_std: Level of the payroll tax base (relative to 1)
+        efficiency_std: Realized share of the policy's efficiency gains (relative to 1)
+        spending_growth_std: Excess annual growth of net health spending over
+            the policy's target trajectory (absolute rate)
+    """
+    gdp_growth_std: float = 0.01
+    payroll_base_std: float = 0.03
+    efficiency_std: float = 0.25
+    spending_growth_std: float = 0.005
+
+
+# ProjectionPaths variable -> mechanics-mode column
+MONTE_CARLO_PATHS = {
+    'gdp': 'GDP',
+    'total_revenue': 'Total Revenue',
+    'healthcare_spending': 'Healthcare Spending',
+    'health_pct_gdp': 'Health % GDP',
+    'surplus': 'Surplus/Deficit',
+    'surplus_pct_gdp': 'Surplus % GDP',
+    'national_debt': 'National Debt',
+    'debt_pct_gdp': 'Debt % GDP',
+    'interest_spending': 'Interest Spending',
+    'contingency_reserve': 'Contingency Reserve',
+    'circuit_breaker_triggered': 'Circuit Breaker Triggered',
+}
+
+# Variables summarized by healthcare_percentile_bands()
+BAND_VARIABLES = ('national_debt', 'surplus', 'health_pct_gdp')
+
+
+def simulate_healthcare_monte_carlo(policy, base_gdp: float, initial_debt: float, years: int = 22,
+                                    iterations: int = 1_000, population: float = 335e6,
+                                    gdp_growth: float = 0.025, start_year: int = None,
+                                    uncertainty: Optional[HealthcareUncertainty] = None,
+                                    seed: Optional[SeedLike] = None,
+                                    sampler: Optional[SamplerLike] = None) -> ProjectionPaths:
+    """
+    Stochastic mechanics-based healthcare simulation.
+
+    Compiles the policy's mechanics once and evaluates every path together:
+    each path draws its own trend GDP growth, payroll base level, efficiency
+    gain realization and excess spending growth (see HealthcareUncertainty),
+    and the same array kernel as simulate_healthcare_years() runs over the
+    resulting (iterations, years) inputs. With zero uncertainty every path
+    equals the deterministic simulation.
+
+    Parameters
+    - policy: HealthcarePolicyModel with mechanics (from core.healthcare)
+    - base_gdp, initial_debt, years, population, gdp_growth, start_year:
+      as for simulate_healthcare_years(); gdp_growth is the mean trend rate
+    - iterations: number of Monte Carlo paths
+    - uncertainty: perturbation spreads (HealthcareUncertainty defaults if None)
+    - seed: seed for the draws (fresh entropy if None)
+    - sampler: 'pseudo', 'antithetic', 'lhs', 'sobol' or a Sampler (see core.samplers)
+
+    Returns: ProjectionPaths of (years, iterations) arrays keyed as in
+    MONTE_CARLO_PATHS; healthcare_percentile_bands() summarizes them.
+    """
+    if population <= 0:
+        raise ValueError("Population must be positive")
+    if base_gdp <= 0:
+        raise ValueError("Base GDP must be positive")
+    if initial_debt < 0:
+        raise ValueError("Initial debt cannot be negative")
+    if iterations < 1:
+        raise ValueError("Iterations must be at least 1")
+    if getattr(policy, 'mechanics', None) is None:
+        raise ValueError(f"Policy '{policy.policy_name}' has no mechanics; Monte Carlo mode requires them")
+
+    uncertainty = uncertainty or HealthcareUncertainty()
+    growth, payroll_base, efficiency, excess_growth = make_sampler(sampler).draw(make_generator(seed), [
+        Draw((iterations,), gdp_growth, uncertainty.gdp_growth_std),
+        Draw((iterations,), 1.0, uncertainty.payroll_base_std),
+        Draw((iterations,), 1.0, uncertainty.efficiency_std),
+        Draw((iterations,), 0.0, uncertainty.spending_growth_std),
+    ])
+
+    columns = _simulate_mechanics_batch(
+        [precompiled_mechanics(policy.mechanics)], [_policy_start_year(policy, start_year)],
+        float(base_gdp) * growth_index(growth, years).T, initial_debt, population,
+        payroll_factor=np.maximum(payroll_base, 0.0)[:, np.newaxis],
+        efficiency_factor=np.maximum(efficiency, 0.0)[:, np.newaxis],
+        spending_factor=growth_index(excess_growth, years).T,
+        detail=False,
+    )
+    return ProjectionPaths(
+        columns['Year'][0], {name: columns[column].T for name, column in MONTE_CARLO_PATHS.items()}
+    )
+
+
+def healthcare_percentile_bands(paths: ProjectionPaths, percentiles: Sequence[float] = (10, 50, 90),
+                                variables: Sequence[str] = BAND_VARIABLES) -> pd.DataFrame:
+    """
+    Per-year percentile bands from simulate_healthcare_monte_carlo() paths.
+
+    Returns: DataFrame with 'year' and <variable>_mean/_std/_p<q> columns
+    for debt, surplus and health % of GDP by default.
+    """
+    return paths.summary_frame(variables, percentiles=percentiles)
@@ -11,13 +11,25 @@ Incorporates:
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Iterator, List, Optional, Tuple, Any, Union
 import numpy as np
 import pandas as pd
-from scipy import stats
 import logging
 from enum import Enum
 
+from core.online_stats import (
+    AdaptiveSampling,
+    BlockStatistic,
+    ConvergenceMonitor,
+    final_year_mean,
+    summarize_paths,
+    summary_statistics,
+)
+from core.path_results import ProjectionPaths
+from core.projection_context import ProjectionContext
+from core.random_streams import RandomStreamMixin, SeedLike
+from core.samplers import Draw, SamplerLike
+
 logger = logging.getLogger(__name__)
 
 # Constants for Social Security calculations
@@ -179,7 +191,7 @@ class TrustFundAssumptions:
         return cls()
 
 
-class SocialSecurityModel:
+class SocialSecurityModel(RandomStreamMixin):
     """
     Comprehensive Social Security projection model.
     Stochastic Monte Carlo simulations of OASI/DI trust funds.
@@ -191,16 +203,16 @@ class SocialSecurityModel:
         benefit_formula: Optional[BenefitFormula] = None,
         trust_fund: Optional[TrustFundAssumptions] = None,
         start_year: int = 2025,
-        seed: Optional[int] = None,
+        seed: Optional[SeedLike] = None,
+        sampler: Optional[SamplerLike] = None,
     ):
-        """Initialize Social Security model with assumptions."""
+        """Initialize Social Security model with assumptions and a sampler (pseudo-random if None)."""
         self.demographics = demographics or DemographicAssumptions.ssa_2024_trustees()
         self.benefit_formula = (
             benefit_formula or BenefitFormula.ssa_2024_trustees()
         )
         self.trust_fund = trust_fund or TrustFundAssumptions.ssa_2024_trustees()
         self.start_year = start_year
-        self.seed = seed
         
         # Input validation
         if self.demographics.total_fertility_rate < 0 or self.demographics.total_fertility_rate > 10:
@@ -214,8 +226,8 @@ class SocialSecurityModel:
         if not 0 <= self.trust_fund.trust_fund_interest_rate <= 1:
             raise ValueError(f"Interest rate {self.trust_fund.trust_fund_interest_rate:.2%} outside reasonable range [0%, 100%]")
         
+        self._init_random_stream(seed, sampler)
         if seed is not None:
-            np.random.seed(seed)
             logger.info(f"Random seed set to {seed} for reproducibility")
 
         logger.info(
@@ -224,7 +236,11 @@ class SocialSecurityModel:
         )
 
     def project_population(
-        self, years: int, iterations: int = 1
+        self,
+        years: int,
+        iterations: int = 1,
+        dtype: Any = np.float64,
+        summary_only: bool = False,
     ) -> Dict[str, np.ndarray]:
         """
         Project population by age/year with demographic uncertainty.
@@ -232,253 +248,451 @@ class SocialSecurityModel:
         Args:
             years: Number of years to project
             iterations: Number of stochastic iterations
+            dtype: Floating dtype for population arrays (np.float32 halves memory)
+            summary_only: If True, skip the (years, 101, iterations) tensor and
+                return per-year age-band totals instead
 
         Returns:
-            Dictionary with population arrays
+            Dictionary with population arrays. Always includes "births" and
+            "deaths" (years, iterations). Full mode adds "population"
+            (years, 101, iterations); summary mode adds "population_under_20",
+            "population_20_64", "population_65_plus" and "total_population".
         """
+        dtype = np.dtype(dtype)
         results = {
-            "population": np.zeros((years, MAX_AGE, iterations)),  # Age 0-100+
-            "births": np.zeros((years, iterations)),
-            "deaths": np.zeros((years, iterations)),
+            "births": np.zeros((years, iterations), dtype=dtype),
+            "deaths": np.zeros((years, iterations), dtype=dtype),
         }
+        if summary_only:
+            for band in ("population_under_20", "population_20_64", "population_65_plus", "total_population"):
+                results[band] = np.zeros((years, iterations), dtype=dtype)
+        else:
+            results["population"] = np.zeros((years, MAX_AGE, iterations), dtype=dtype)  # Age 0-100+
+
+        for year, pop, births, deaths in self.iter_population(years, iterations, dtype=dtype):
+            results["births"][year] = births
+            results["deaths"][year] = deaths
+            if summary_only:
+                results["population_under_20"][year] = pop[:WORKING_AGE_MIN].sum(axis=0)
+                results["population_20_64"][year] = pop[WORKING_AGE_MIN:WORKING_AGE_MAX].sum(axis=0)
+                results["population_65_plus"][year] = pop[WORKING_AGE_MAX:].sum(axis=0)
+                results["total_population"][year] = pop.sum(axis=0)
+            else:
+                results["population"][year] = pop
 
-        # Initial population age distribution (simplified)
-        base_pop = np.array([UNIFORM_BASE_POPULATION] * MAX_AGE)  # Simplified uniform
+        return results
 
-        for it in range(iterations):
-            if it % LOG_ITERATION_INTERVAL == 0 and it > 0:
-                logger.info(f"  Population projection: {it}/{iterations} iterations ({it/iterations*100:.1f}%)")
-            
-            # Sample demographic parameters with uncertainty
-            mortality_factor = np.random.normal(
-                1.0, self.demographics.mortality_uncertainty_std
-            )
-            fertility_factor = np.random.normal(
-                1.0, self.demographics.fertility_uncertainty_std
-            )
-            immigration_factor = np.random.normal(
-                1.0, self.demographics.immigration_uncertainty_std
-            )
+    def iter_population(
+        self, years: int, iterations: int = 1, dtype: Any = np.float64
+    ) -> Iterator[Tuple[int, np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Stream the cohort projection one year at a time.
 
-            pop = base_pop.copy()
+        All iterations are aged together with a single shifted-slice copy per
+        year, reusing two (101, iterations) buffers. The yielded population
+        array is one of those buffers and is overwritten on the next step, so
+        callers that keep it must copy it.
 
-            for year in range(years):
-                # Project births (with validation to prevent division by zero)
-                population_15_50 = pop[CHILDBEARING_AGE_MIN:CHILDBEARING_AGE_MAX].sum()
-                if population_15_50 > 0 and self.demographics.total_fertility_rate > 0:
-                    births = population_15_50 * self.demographics.total_fertility_rate * fertility_factor / POPULATION_CONVERSION_TO_MILLIONS
-                else:
-                    births = 0
-                    if year == 0:  # Only warn once per iteration
-                        logger.warning(f"Iteration {it}: Childbearing population or fertility rate is zero")
-                results["births"][year, it] = births
-
-                # Project deaths
-                deaths = pop.sum() * SIMPLIFIED_MORTALITY_RATE * mortality_factor  # Simplified
-                results["deaths"][year, it] = deaths
-
-                # Age population (validate array shape)
-                if len(pop) != MAX_AGE:
-                    raise ValueError(f"Population array must be length {MAX_AGE}, got {len(pop)}")
-                new_pop = np.zeros(MAX_AGE)
-                new_pop[0] = births + self.demographics.net_immigration_annual * immigration_factor
-                new_pop[1:] = pop[:-1]
-
-                # Immigration (distributed across working ages)
-                new_pop[WORKING_AGE_MIN:WORKING_AGE_MAX] += (
-                    self.demographics.net_immigration_annual * immigration_factor
-                ) / WORKING_YEARS_SPAN
-
-                pop = new_pop
-                results["population"][year, :, it] = pop
+        Args:
+            years: Number of years to project
+            iterations: Number of stochastic iterations
+            dtype: Floating dtype for the population buffers
 
-        return results
+        Yields:
+            (year_index, population_by_age (101, iterations), births, deaths)
+        """
+        dtype = np.dtype(dtype)
+
+        # Sample (mortality, fertility, immigration) factors for every iteration
+        (shocks,) = self.draw_block(Draw((iterations, 3), iteration_axis=0))
+        mortality_factor = 1.0 + self.demographics.mortality_uncertainty_std * shocks[:, 0]
+        fertility_factor = 1.0 + self.demographics.fertility_uncertainty_std * shocks[:, 1]
+        immigration_factor = 1.0 + self.demographics.immigration_uncertainty_std * shocks[:, 2]
+
+        immigrants = self.demographics.net_immigration_annual * immigration_factor
+        working_age_immigrants = immigrants / WORKING_YEARS_SPAN
+        fertility = self.demographics.total_fertility_rate * fertility_factor
+
+        # Initial population age distribution (simplified uniform)
+        pop = np.full((MAX_AGE, iterations), UNIFORM_BASE_POPULATION, dtype=dtype)
+        next_pop = np.empty_like(pop)
+
+        for year in range(years):
+            # Project births (guard against an empty childbearing cohort or zero fertility)
+            population_15_50 = pop[CHILDBEARING_AGE_MIN:CHILDBEARING_AGE_MAX].sum(axis=0)
+            can_bear = population_15_50 > 0
+            if self.demographics.total_fertility_rate > 0:
+                births = np.where(
+                    can_bear, population_15_50 * fertility / POPULATION_CONVERSION_TO_MILLIONS, 0.0
+                )
+            else:
+                births = np.zeros(iterations)
+            if year == 0 and (self.demographics.total_fertility_rate <= 0 or not can_bear.all()):
+                logger.warning("Childbearing population or fertility rate is zero")
+
+            # Project deaths (simplified)
+            deaths = pop.sum(axis=0) * SIMPLIFIED_MORTALITY_RATE * mortality_factor
+
+            # Age every iteration one year, then add births and working-age immigration
+            next_pop[1:] = pop[:-1]
+            next_pop[0] = births + immigrants
+            next_pop[WORKING_AGE_MIN:WORKING_AGE_MAX] += working_age_immigrants
+            pop, next_pop = next_pop, pop
+
+            yield year, pop, births, deaths
 
     def project_trust_funds(
-        self, years: int, iterations: int = 10000
-    ) -> pd.DataFrame:
+        self,
+        years: int,
+        iterations: int = 10000,
+        return_arrays: bool = False,
+        return_summary: bool = False,
+        chunk_size: Optional[int] = None,
+        adaptive: Optional[AdaptiveSampling] = None,
+        context: Optional[ProjectionContext] = None,
+    ) -> Union[pd.DataFrame, ProjectionPaths]:
         """
         Project OASI and DI trust funds with Monte Carlo uncertainty.
 
         Args:
             years: Number of years to project
             iterations: Number of Monte Carlo iterations
+            return_arrays: If True, return the (years, iterations) arrays from
+                the vectorized engine as ProjectionPaths instead of building a
+                long-format DataFrame
+            return_summary: If True, return one row per year with mean/std/p10/p90
+                of balances and flows plus the share of iterations first
+                depleted in each year (accepted by estimate_solvency_dates())
+            chunk_size: With return_summary, simulate at most this many iterations
+                at a time and fold them into streaming statistics (percentiles
+                become sketch estimates; depletion shares stay exact)
+            adaptive: With return_summary, run in batches until the monitored
+                statistics converge (final-year mean benefit payments by
+                default, see depletion_year_statistic()); ``iterations`` becomes
+                the cap and ``df.attrs["convergence"]`` reports the result
+            context: Shared macro paths; annual_cola (bounded by cola_min and
+                cola_max) and wage growth move by its CPI and wage deviations
+                from the baseline path (the benefit formula's own COLA and
+                wage growth if None)
 
         Returns:
-            DataFrame with trust fund projections
+            DataFrame with trust fund projections (one row per iteration/year,
+            ordered by iteration then year), a per-year summary, or a
+            dictionary of arrays
         """
         logger.info(
             f"Projecting trust funds for {years} years with {iterations} iterations"
         )
 
-        results = []
+        if (chunk_size is not None or adaptive is not None) and not return_summary:
+            raise ValueError("chunk_size and adaptive require return_summary=True")
+        if return_summary:
+            return self._summarize_trust_funds(years, iterations, chunk_size, adaptive, context)
 
-        for iteration in range(iterations):
-            if iteration % LOG_ITERATION_INTERVAL == 0:
-                logger.debug(f"  Iteration {iteration}/{iterations}")
+        if context is not None:
+            context.check_paths(iterations)
+        paths = self._simulate_trust_fund_paths(years, iterations, context)
+        if return_arrays:
+            return paths
 
-            # Sample demographic uncertainties
-            mortality_factor = np.random.normal(
-                1.0, self.demographics.mortality_uncertainty_std
+        df = paths.to_frame()
+        logger.info(f"Completed {len(df)} projections")
+        return df
+
+    # Per-year summary columns: (summary prefix, path key)
+    _SUMMARY_PATHS = (
+        ("oasi_balance", "oasi_balance_billions"),
+        ("di_balance", "di_balance_billions"),
+        ("payroll_tax_income", "payroll_tax_income_billions"),
+        ("benefit_payments", "benefit_payments_billions"),
+    )
+
+    def _summarize_trust_funds(
+        self,
+        years: int,
+        iterations: int,
+        chunk_size: Optional[int] = None,
+        adaptive: Optional[AdaptiveSampling] = None,
+        context: Optional[ProjectionContext] = None,
+    ) -> pd.DataFrame:
+        """
+        Per-year trust fund summary, optionally streamed in blocks.
+
+        First-depletion years are counted per block, so their distribution is
+        exact whatever the chunk size.
+        """
+        def summarize_block(paths: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+            block = {key: paths[key] for _, key in self._SUMMARY_PATHS}
+            for fund in ("oasi", "di"):
+                # One-hot (years, n) indicator of each iteration's first depleted year
+                depleted = paths[f"{fund}_balance_billions"] <= 0
+                first = depleted & (np.cumsum(depleted, axis=0) == 1)
+                block[f"{fund}_first_depletion"] = first.astype(float)
+            return block
+
+        monitor = None
+        if adaptive is not None:
+            monitor = ConvergenceMonitor(
+                adaptive, {"final_benefit_payments": final_year_mean("benefit_payments_billions")}
             )
-            fertility_factor = np.random.normal(
-                1.0, self.demographics.fertility_uncertainty_std
+
+        year_array = np.arange(self.start_year, self.start_year + years)
+        data: Dict[str, Any] = {"year": year_array}
+        chunked = monitor is not None or (chunk_size is not None and chunk_size < iterations)
+        if context is not None:
+            context.check_paths(iterations, streamed=chunked)
+        if chunked:
+            summaries = summarize_paths(
+                lambda n: summarize_block(self._simulate_trust_fund_paths(years, n, context)),
+                iterations,
+                chunk_size,
+                moments_only=("oasi_first_depletion", "di_first_depletion"),
+                monitor=monitor,
             )
+            for prefix, key in self._SUMMARY_PATHS:
+                data.update(summaries[key].to_dict(prefix))
+            for fund in ("oasi", "di"):
+                data[f"{fund}_first_depletion_share"] = summaries[f"{fund}_first_depletion"].mean
+        else:
+            block = summarize_block(self._simulate_trust_fund_paths(years, iterations, context))
+            for prefix, key in self._SUMMARY_PATHS:
+                data.update(summary_statistics(block[key], prefix))
+            for fund in ("oasi", "di"):
+                data[f"{fund}_first_depletion_share"] = block[f"{fund}_first_depletion"].mean(axis=1)
+
+        df = pd.DataFrame(data)
+        if monitor is not None:
+            df.attrs["convergence"] = monitor.report()
+        logger.info(f"Trust fund summary complete: {len(df)} years")
+        return df
 
-            oasi_balance = self.trust_fund.oasi_beginning_balance
-            di_balance = self.trust_fund.di_beginning_balance
+    def depletion_year_statistic(
+        self, fund: str = "oasi", percentile: Optional[float] = None
+    ) -> BlockStatistic:
+        """
+        Adaptive-sampling statistic for a fund's first depletion year.
 
-            for year in range(self.start_year, self.start_year + years):
-                year_index = year - self.start_year
+        Iterations that never deplete count as the year after the horizon.
+        Pair with an absolute tolerance, e.g.
+        AdaptiveSampling(tolerance=0.25, relative=False, statistics={...}).
 
-                # Simulate beneficiary growth with demographics (aging population)
-                # Beneficiaries grow faster than population due to aging
-                beneficiary_growth = 1.0 + (BENEFICIARY_GROWTH_RATE * year_index) * mortality_factor
-                oasi_beneficiaries = (
-                    self.trust_fund.oasi_beneficiaries * beneficiary_growth
-                )
-                di_beneficiaries = (
-                    self.trust_fund.di_beneficiaries * (1.0 + DI_BENEFICIARY_GROWTH_RATE * year_index)
-                )
+        Args:
+            fund: 'oasi' or 'di'
+            percentile: Percentile (0-100) of the depletion year; mean if None
 
-                # Average benefit with COLA
-                base_benefit = self.benefit_formula.primary_insurance_amount_avg_2025
-                
-                # Adjust benefit for retirement age changes
-                # If FRA increases, benefits effectively decrease because:
-                # 1) People claim earlier relative to new FRA (actuarial reduction)
-                # 2) Benefit formula adjusts to maintain actuarial neutrality
-                # Roughly: 6.7% reduction per year of FRA increase
-                fra_adjustment = 1.0 - (self.benefit_formula.full_retirement_age - BASELINE_FRA) * FRA_ADJUSTMENT_RATE
-                fra_adjustment = max(FRA_ADJUSTMENT_MIN, min(FRA_ADJUSTMENT_MAX, fra_adjustment))
-                
-                avg_benefit = (
-                    base_benefit
-                    * fra_adjustment
-                    * (1 + self.benefit_formula.annual_cola) ** year_index
-                )
+        Returns:
+            Statistic for project_trust_funds(return_summary=True, adaptive=...)
+        """
+        key = f"{fund}_first_depletion"
+
+        def statistic(block: Dict[str, np.ndarray]) -> float:
+            first = block[key]
+            horizon = first.shape[0]
+            index = np.where(first.any(axis=0), first.argmax(axis=0), horizon)
+            depletion_years = self.start_year + index
+            if percentile is None:
+                return float(np.mean(depletion_years))
+            return float(np.percentile(depletion_years, percentile))
+
+        return statistic
+
+    def projection_context(self, years: int) -> ProjectionContext:
+        """Macro paths implied by the benefit formula's COLA and wage growth."""
+        return ProjectionContext(
+            years,
+            wage_growth=self.benefit_formula.wage_index_annual_growth,
+            inflation=self.benefit_formula.annual_cola,
+            start_year=self.start_year,
+        )
 
-                # Payroll tax income calculation
-                # Base taxable wages grow with wage index
-                taxable_wages_billions = BASELINE_TAXABLE_PAYROLL_BILLIONS * (
-                    1 + self.benefit_formula.wage_index_annual_growth
-                ) ** year_index
-                
-                # Apply the actual payroll tax rate from model parameters
-                # Note: BASELINE_TAXABLE_PAYROLL_BILLIONS already assumes 12.4% rate,
-                # so we need to adjust for different rates
-                rate_adjustment = self.trust_fund.payroll_tax_rate / BASELINE_PAYROLL_TAX_RATE
-                
-                # If wage cap is removed (None), increase taxable base by ~20%
-                # (roughly accounting for wages above the current cap)
-                cap_adjustment = NO_CAP_INCREASE_FACTOR if self.trust_fund.payroll_tax_cap is None else 1.0
-                
-                # Total payroll tax income with adjustments
-                total_payroll_tax_income = taxable_wages_billions * rate_adjustment * cap_adjustment
-
-                # Split payroll tax: ~85% OASI, ~15% DI
-                oasi_payroll_tax_income = total_payroll_tax_income * OASI_SHARE_OF_PAYROLL
-                di_payroll_tax_income = total_payroll_tax_income * DI_SHARE_OF_PAYROLL
-
-                # Interest income on trust fund balances
-                # M2 Fix: Only calculate interest for positive balances
-                interest_rate = self.trust_fund.trust_fund_interest_rate
-                oasi_interest_income = oasi_balance * interest_rate if oasi_balance > 0 else 0.0
-                di_interest_income = di_balance * interest_rate if di_balance > 0 else 0.0
-
-                # Benefit outgo (millions beneficiaries × avg monthly benefit × 12 months)
-                oasi_benefit_payments = (
-                    oasi_beneficiaries
-                    * avg_benefit
-                    * MONTHS_PER_YEAR
-                    / POPULATION_CONVERSION_TO_MILLIONS
-                )
-                di_benefit_payments = (
-                    di_beneficiaries
-                    * avg_benefit * DI_BENEFIT_FACTOR  # DI benefits slightly lower
-                    * MONTHS_PER_YEAR
-                    / POPULATION_CONVERSION_TO_MILLIONS
-                )
+    def _simulate_trust_fund_paths(
+        self, years: int, iterations: int, context: Optional[ProjectionContext] = None
+    ) -> ProjectionPaths:
+        """
+        Array-native trust fund engine.
 
-                # Administrative expenses (~0.7% of outgo for OASI, ~2.5% for DI)
-                oasi_admin_expenses = oasi_benefit_payments * OASI_ADMIN_EXPENSE_RATIO
-                di_admin_expenses = di_benefit_payments * DI_ADMIN_EXPENSE_RATIO
-
-                # Update OASI trust fund balance with depletion handling
-                oasi_balance_new = (
-                    oasi_balance 
-                    + oasi_payroll_tax_income 
-                    + oasi_interest_income 
-                    - oasi_benefit_payments 
-                    - oasi_admin_expenses
-                )
-                if oasi_balance_new < 0:
-                    # Trust fund depleted - benefits reduced to match income (current law)
-                    if iteration < LOG_FIRST_N_ITERATIONS:  # Only log first few iterations
-                        logger.debug(f"Year {year}, Iteration {iteration}: OASI trust fund depleted")
-                    oasi_balance = 0
-                else:
-                    oasi_balance = oasi_balance_new
-                
-                # Update DI trust fund balance
-                di_balance_new = (
-                    di_balance 
-                    + di_payroll_tax_income 
-                    + di_interest_income 
-                    - di_benefit_payments 
-                    - di_admin_expenses
-                )
-                if di_balance_new < 0:
-                    if iteration < LOG_FIRST_N_ITERATIONS:  # Only log first few iterations
-                        logger.debug(f"Year {year}, Iteration {iteration}: DI trust fund depleted")
-                    di_balance = 0
-                else:
-                    di_balance = di_balance_new
-
-                # Record projection
-                results.append(
-                    {
-                        "year": year,
-                        "iteration": iteration,
-                        "oasi_balance_billions": oasi_balance,
-                        "di_balance_billions": di_balance,
-                        "payroll_tax_income_billions": oasi_payroll_tax_income + di_payroll_tax_income,
-                        "interest_income_billions": oasi_interest_income + di_interest_income,
-                        "benefit_payments_billions": oasi_benefit_payments + di_benefit_payments,
-                        "admin_expenses_billions": oasi_admin_expenses + di_admin_expenses,
-                        "oasi_beneficiaries_millions": oasi_beneficiaries,
-                        "di_beneficiaries_millions": di_beneficiaries,
-                        "average_benefit_monthly": avg_benefit,
-                        "oasi_solvent": oasi_balance > 0,
-                    }
-                )
+        Draws every iteration's demographic factors up front, then advances all
+        OASI/DI balances together one year at a time, applying the depletion
+        clamp as a mask. Draw order and arithmetic match the original
+        per-iteration loop, so results are identical for a fixed seed.
 
-        df = pd.DataFrame(results)
-        logger.info(f"Completed {len(df)} projections")
-        return df
+        Args:
+            years: Number of years to project
+            iterations: Number of Monte Carlo iterations
+            context: Shared macro paths (see projection_context())
+
+        Returns:
+            ProjectionPaths of (years, iterations) arrays
+        """
+        if context is None:
+            context = self.projection_context(years)
+            cpi_index = context.cpi_index
+            wage_index = context.wage_index
+        else:
+            # annual_cola and wage growth move with the shared path's deviation
+            # from baseline, so COLA overrides (e.g. chained CPI) still apply
+            context.check_horizon(years)
+            formula = self.benefit_formula
+            cola = np.clip(
+                context.shifted("inflation", formula.annual_cola), formula.cola_min, formula.cola_max
+            )
+            cpi_index = context.index(cola if np.ndim(cola) else float(cola))
+            wage_index = context.index(context.shifted("wage_growth", formula.wage_index_annual_growth))
+
+        # Draw one (mortality, fertility) pair per iteration
+        (shocks,) = self.draw_block(Draw((iterations, 2), iteration_axis=0))
+        mortality_factor = 1.0 + self.demographics.mortality_uncertainty_std * shocks[:, 0]
+
+        shape = (years, iterations)
+        oasi_balances = np.empty(shape)
+        di_balances = np.empty(shape)
+        payroll_income = np.empty(shape)
+        interest_income = np.empty(shape)
+        benefit_payments = np.empty(shape)
+        admin_expenses = np.empty(shape)
+        oasi_beneficiaries_path = np.empty(shape)
+        di_beneficiaries_path = np.empty(shape)
+        average_benefit = np.empty(shape)
+
+        # Year-invariant policy adjustments
+        base_benefit = self.benefit_formula.primary_insurance_amount_avg_2025
+        # If FRA increases, benefits effectively decrease (~6.7% per year of FRA increase)
+        fra_adjustment = 1.0 - (self.benefit_formula.full_retirement_age - BASELINE_FRA) * FRA_ADJUSTMENT_RATE
+        fra_adjustment = max(FRA_ADJUSTMENT_MIN, min(FRA_ADJUSTMENT_MAX, fra_adjustment))
+        # BASELINE_TAXABLE_PAYROLL_BILLIONS assumes the 12.4% rate; adjust for other rates
+        rate_adjustment = self.trust_fund.payroll_tax_rate / BASELINE_PAYROLL_TAX_RATE
+        # Removing the wage cap (None) raises the taxable base by ~20%
+        cap_adjustment = NO_CAP_INCREASE_FACTOR if self.trust_fund.payroll_tax_cap is None else 1.0
+        interest_rate = self.trust_fund.trust_fund_interest_rate
+
+        oasi_balance = np.full(iterations, float(self.trust_fund.oasi_beginning_balance))
+        di_balance = np.full(iterations, float(self.trust_fund.di_beginning_balance))
+
+        for year_index in range(years):
+            # Beneficiaries grow faster than population due to aging
+            beneficiary_growth = 1.0 + (BENEFICIARY_GROWTH_RATE * year_index) * mortality_factor
+            oasi_beneficiaries = self.trust_fund.oasi_beneficiaries * beneficiary_growth
+            di_beneficiaries = (
+                self.trust_fund.di_beneficiaries * (1.0 + DI_BENEFICIARY_GROWTH_RATE * year_index)
+            )
+
+            avg_benefit = base_benefit * fra_adjustment * cpi_index[year_index]
+
+            taxable_wages_billions = BASELINE_TAXABLE_PAYROLL_BILLIONS * wage_index[year_index]
+            total_payroll_tax_income = taxable_wages_billions * rate_adjustment * cap_adjustment
+            oasi_payroll_tax_income = total_payroll_tax_income * OASI_SHARE_OF_PAYROLL
+            di_payroll_tax_income = total_payroll_tax_income * DI_SHARE_OF_PAYROLL
+
+            # M2 Fix: Only calculate interest for positive balances
+            oasi_interest_income = np.where(oasi_balance > 0, oasi_balance * interest_rate, 0.0)
+            di_interest_income = np.where(di_balance > 0, di_balance * interest_rate, 0.0)
+
+            # Benefit outgo (millions beneficiaries × avg monthly benefit × 12 months)
+            oasi_benefit_payments = (
+                oasi_beneficiaries
+                * avg_benefit
+                * MONTHS_PER_YEAR
+                / POPULATION_CONVERSION_TO_MILLIONS
+            )
+            di_benefit_payments = (
+                di_beneficiaries
+                * avg_benefit * DI_BENEFIT_FACTOR  # DI benefits slightly lower
+                * MONTHS_PER_YEAR
+                / POPULATION_CONVERSION_TO_MILLIONS
+            )
+
+            oasi_admin_expenses = oasi_benefit_payments * OASI_ADMIN_EXPENSE_RATIO
+            di_admin_expenses = di_benefit_payments * DI_ADMIN_EXPENSE_RATIO
+
+            oasi_balance_new = (
+                oasi_balance
+                + oasi_payroll_tax_income
+                + oasi_interest_income
+                - oasi_benefit_payments
+                - oasi_admin_expenses
+            )
+            di_balance_new = (
+                di_balance
+                + di_payroll_tax_income
+                + di_interest_income
+                - di_benefit_payments
+                - di_admin_expenses
+            )
+
+            # Trust fund depleted - benefits reduced to match income (current law)
+            oasi_depleted = oasi_balance_new < 0
+            di_depleted = di_balance_new < 0
+            if oasi_depleted[:LOG_FIRST_N_ITERATIONS].any():
+                logger.debug(f"Year {self.start_year + year_index}: OASI trust fund depleted")
+            if di_depleted[:LOG_FIRST_N_ITERATIONS].any():
+                logger.debug(f"Year {self.start_year + year_index}: DI trust fund depleted")
+            oasi_balance = np.where(oasi_depleted, 0.0, oasi_balance_new)
+            di_balance = np.where(di_depleted, 0.0, di_balance_new)
+
+            oasi_balances[year_index] = oasi_balance
+            di_balances[year_index] = di_balance
+            payroll_income[year_index] = oasi_payroll_tax_income + di_payroll_tax_income
+            interest_income[year_index] = oasi_interest_income + di_interest_income
+            benefit_payments[year_index] = oasi_benefit_payments + di_benefit_payments
+            admin_expenses[year_index] = oasi_admin_expenses + di_admin_expenses
+            oasi_beneficiaries_path[year_index] = oasi_beneficiaries
+            di_beneficiaries_path[year_index] = di_beneficiaries
+            average_benefit[year_index] = avg_benefit
+
+        return ProjectionPaths(np.arange(self.start_year, self.start_year + years), {
+            "oasi_balance_billions": oasi_balances,
+            "di_balance_billions": di_balances,
+            "payroll_tax_income_billions": payroll_income,
+            "interest_income_billions": interest_income,
+            "benefit_payments_billions": benefit_payments,
+            "admin_expenses_billions": admin_expenses,
+            "oasi_beneficiaries_millions": oasi_beneficiaries_path,
+            "di_beneficiaries_millions": di_beneficiaries_path,
+            "average_benefit_monthly": average_benefit,
+            "oasi_solvent": oasi_balances > 0,
+        })
 
     def estimate_solvency_dates(
-        self, projections: pd.DataFrame
+        self, projections: Union[pd.DataFrame, ProjectionPaths]
     ) -> Dict[str, Dict[str, Any]]:
         """
         Estimate when trust funds reach depletion.
         
         Optimized version using vectorized pandas operations. Handles both raw
-        projections (with 'iteration' column) and aggregated results (MultiIndex columns).
+        projections (with 'iteration' column) and aggregated results (MultiIndex columns),
+        as well as ProjectionPaths from project_trust_funds(return_arrays=True).
 
         Args:
-            projections: DataFrame from project_trust_funds() or aggregated results
+            projections: DataFrame or ProjectionPaths from project_trust_funds(),
+                or aggregated results
 
         Returns:
             Dictionary with solvency analysis by fund
         """
         results = {}
         
+        if isinstance(projections, ProjectionPaths):
+            # Columnar paths: first depletion year per iteration, no long frame
+            for fund in ["oasi", "di"]:
+                first_years = projections.first_year(f"{fund}_balance_billions", lambda balance: balance <= 0)
+                results[fund.upper()] = self._solvency_from_depletion_years(
+                    first_years[~np.isnan(first_years)], max(projections.iterations, 1)
+                )
+            logger.info(f"Solvency analysis complete: {results}")
+            return results
+        
         # Check if this is aggregated data (MultiIndex columns)
         is_aggregated = isinstance(projections.columns, pd.MultiIndex)
 
         for fund in ["oasi", "di"]:
-            if is_aggregated:
+            share_col = f"{fund}_first_depletion_share"
+            if not is_aggregated and share_col in projections.columns:
+                # Summary from project_trust_funds(return_summary=True): the
+                # per-year first-depletion shares are the depletion-year distribution
+                results[fund.upper()] = self._solvency_from_shares(
+                    projections["year"].to_numpy(), projections[share_col].to_numpy()
+                )
+            elif is_aggregated:
                 # Aggregated data - estimate from mean trajectory
                 balance_col = (f"{fund}_balance_billions", 'mean')
                 
@@ -531,33 +745,64 @@ class SocialSecurityModel:
                     logger.warning(f"{fund.upper()}: No iterations found in projections DataFrame")
                     unique_iterations = 1
                 
-                num_depleted = len(depletion_by_iter)
-                probability_depleted = float(num_depleted / unique_iterations)
-                
-                if num_depleted > 0:
-                    # Have depletion data - calculate full statistics
-                    depletion_years = depletion_by_iter.values
-                    results[fund.upper()] = {
-                        "depletion_year_mean": float(np.mean(depletion_years)),
-                        "depletion_year_median": float(np.median(depletion_years)),
-                        "depletion_year_std": float(np.std(depletion_years)) if len(depletion_years) > 1 else 0.0,
-                        "depletion_year_10pct": float(np.percentile(depletion_years, 10)),
-                        "depletion_year_90pct": float(np.percentile(depletion_years, 90)),
-                        "probability_depleted": probability_depleted,
-                    }
-                else:
-                    # No depletion - return consistent structure with None values
-                    results[fund.upper()] = {
-                        "depletion_year_mean": None,
-                        "depletion_year_median": None,
-                        "depletion_year_std": None,
-                        "depletion_year_10pct": None,
-                        "depletion_year_90pct": None,
-                        "probability_depleted": probability_depleted,
-                    }
+                results[fund.upper()] = self._solvency_from_depletion_years(
+                    depletion_by_iter.to_numpy(), unique_iterations
+                )
 
         logger.info(f"Solvency analysis complete: {results}")
         return results
+
+    @staticmethod
+    def _solvency_from_depletion_years(depletion_years: np.ndarray, iterations: int) -> Dict[str, Any]:
+        """Depletion statistics from the first depletion year of each depleted iteration."""
+        probability_depleted = float(len(depletion_years) / iterations)
+        if len(depletion_years) == 0:
+            # No depletion - return consistent structure with None values
+            return {
+                "depletion_year_mean": None,
+                "depletion_year_median": None,
+                "depletion_year_std": None,
+                "depletion_year_10pct": None,
+                "depletion_year_90pct": None,
+                "probability_depleted": probability_depleted,
+            }
+        return {
+            "depletion_year_mean": float(np.mean(depletion_years)),
+            "depletion_year_median": float(np.median(depletion_years)),
+            "depletion_year_std": float(np.std(depletion_years)) if len(depletion_years) > 1 else 0.0,
+            "depletion_year_10pct": float(np.percentile(depletion_years, 10)),
+            "depletion_year_90pct": float(np.percentile(depletion_years, 90)),
+            "probability_depleted": probability_depleted,
+        }
+
+    @staticmethod
+    def _solvency_from_shares(years: np.ndarray, shares: np.ndarray) -> Dict[str, Any]:
+        """Depletion statistics from the share of iterations first depleted in each year."""
+        probability_depleted = float(shares.sum())
+        if probability_depleted <= 0:
+            return {
+                "depletion_year_mean": None,
+                "depletion_year_median": None,
+                "depletion_year_std": None,
+                "depletion_year_10pct": None,
+                "depletion_year_90pct": None,
+                "probability_depleted": 0.0,
+            }
+        weights = shares / probability_depleted
+        mean = float(np.sum(years * weights))
+        cdf = np.cumsum(weights)
+
+        def _quantile(q: float) -> float:
+            return float(years[min(np.searchsorted(cdf, q - 1e-12), len(years) - 1)])
+
+        return {
+            "depletion_year_mean": mean,
+            "depletion_year_median": _quantile(0.5),
+            "depletion_year_std": float(np.sqrt(np.sum(weights * (years - mean) ** 2))),
+            "depletion_year_10pct": _quantile(0.1),
+            "depletion_year_90pct": _quantile(0.9),
+            "probability_depleted": probability_depleted,
+        }
     
     def apply_means_testing(
         self,
@@ -755,22 +1000,39 @@ class SocialSecurityModel:
         Returns:
             New benefit with COLA applied
         """
+        cola_rate = self.cola_rate(cpi_change, cola_formula)
+        
+        # Apply COLA with limits
+        return self.apply_cola_with_limits(previous_benefit, cola_rate)
+    
+    def cola_rate(
+        self,
+        cpi_change: Union[float, np.ndarray],
+        cola_formula: Optional[str] = None,
+    ) -> Union[float, np.ndarray]:
+        """
+        COLA implied by a CPI change under a COLA formula, before limits.
+        
+        Args:
+            cpi_change: Consumer Price Index change (scalar or per-path array)
+            cola_formula: "cpi_w", "cpi_e" or "chained_cpi" (the benefit
+                formula's if None)
+            
+        Returns:
+            COLA rate, shaped like cpi_change
+        """
         cola_formula = cola_formula or self.benefit_formula.cola_formula
         
         if cola_formula == "cpi_w":
             # Standard CPI-W (current law)
-            cola_rate = cpi_change
-        elif cola_formula == "cpi_e":
+            return cpi_change
+        if cola_formula == "cpi_e":
             # CPI-E (elderly inflation, typically higher)
-            cola_rate = cpi_change * 1.2  # Elderly costs rise ~20% faster
-        elif cola_formula == "chained_cpi":
+            return cpi_change * 1.2  # Elderly costs rise ~20% faster
+        if cola_formula == "chained_cpi":
             # Chained CPI (typically lower, accounts for substitution)
-            cola_rate = cpi_change * 0.9  # ~0.3% lower annually
-        else:
-            cola_rate = cpi_change
-        
-        # Apply COLA with limits
-        return self.apply_cola_with_limits(previous_benefit, cola_rate)
+            return cpi_change * 0.9  # ~0.3% lower annually
+        return cpi_change
     
     def apply_cola_with_limits(
         self,
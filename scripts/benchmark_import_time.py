@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Import-Time Benchmark for Service Cold Starts
+
+Measures how long a fresh interpreter takes to import the modules API and
+MCP workers load at startup, and which heavy optional dependencies (Tk,
+scipy, report backends) come along. Each import runs in its own process,
+so nothing is cached between measurements.
+
+Exits non-zero when a module exceeds its budget or pulls in a dependency it
+must not need, so it can guard cold start in CI.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+PROJECT_ROOT = Path(__file__).parent.parent
+REPEATS = 5
+
+# Modules that must stay out of a headless worker's startup
+HEAVY_MODULES = ("tkinter", "scipy", "reportlab", "openpyxl", "matplotlib")
+
+# (module, cold-start budget in seconds, heavy modules it may load)
+TARGETS: Sequence[Tuple[str, float, Tuple[str, ...]]] = (
+    ("core", 0.25, ()),
+    ("core.social_security", 1.0, ()),
+    ("core.combined_outlook", 1.0, ()),
+    ("mcp_server", 1.0, ()),
+    ("api.rest_server", 2.0, ()),
+)
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "loaded": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def measure_import(module: str, repeats: int = REPEATS) -> Dict[str, object]:
+    """Fastest of several cold imports, plus the heavy modules that were loaded."""
+    runs: List[Dict[str, object]] = []
+    for _ in range(repeats):
+        completed = subprocess.run(
+            [sys.executable, "-c", _PROBE.format(module=module, heavy=HEAVY_MODULES)],
+            capture_output=True, text=True, cwd=PROJECT_ROOT,
+        )
+        if completed.returncode != 0:
+            raise RuntimeError(f"import {module} failed:\n{completed.stderr}")
+        runs.append(json.loads(completed.stdout.strip().splitlines()[-1]))
+    return min(runs, key=lambda run: run["seconds"])
+
+
+def benchmark_import_time() -> int:
+    """Report cold import times; return the number of budget violations."""
+
+    print("=" * 80)
+    print(f"  Cold Import Benchmark (best of {REPEATS} fresh interpreters)")
+    print("=" * 80)
+    print()
+
+    failures = 0
+    for module, budget, allowed in TARGETS:
+        run = measure_import(module)
+        unexpected = [name for name in run["loaded"] if name not in allowed]
+        ok = run["seconds"] <= budget and not unexpected
+        failures += not ok
+        status = "OK  " if ok else "FAIL"
+        print(f"  {status} {module:<24} {run['seconds'] * 1000:8.0f} ms   (budget {budget * 1000:.0f} ms)")
+        if unexpected:
+            print(f"       loads heavy modules: {', '.join(unexpected)}")
+
+    print()
+    print("All imports within budget" if not failures else f"{failures} import(s) over budget")
+    return failures
+
+
+if __name__ == "__main__":
+    sys.exit(1 if benchmark_import_time() else 0)
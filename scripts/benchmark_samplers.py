@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Sampler Benchmark for Monte Carlo Variance Reduction
+
+For each sampler, finds the smallest iteration count whose 95% confidence
+interval on a statistic is narrower than a target width. The interval width
+is measured empirically from independently seeded replicates, so it reflects
+the sampler's real precision rather than the i.i.d. formula.
+"""
+
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional, Sequence
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.medicare_medicaid import MedicareModel
+from core.monte_carlo_scenarios import MonteCarloPolicySimulator
+from core.samplers import SAMPLERS
+
+ITERATION_GRID = (64, 128, 256, 512, 1024, 2048, 4096, 8192, 16384, 32768)
+REPLICATES = 30
+
+
+def policy_deficit_mean(sampler: str, seed: int, iterations: int) -> float:
+    """Mean final-year deficit of a 10-year policy simulation (billions)."""
+    simulator = MonteCarloPolicySimulator(seed=seed, sampler=sampler)
+    result = simulator.simulate_policy("Benchmark", 5.0, -3.0, iterations=iterations, return_paths=False)
+    return float(result.mean_deficit)
+
+
+def policy_deficit_p90(sampler: str, seed: int, iterations: int) -> float:
+    """P90 final-year deficit of a 10-year policy simulation (billions)."""
+    simulator = MonteCarloPolicySimulator(seed=seed, sampler=sampler)
+    result = simulator.simulate_policy("Benchmark", 5.0, -3.0, iterations=iterations, return_paths=False)
+    return float(result.p90_deficit)
+
+
+def medicare_total_mean(sampler: str, seed: int, iterations: int) -> float:
+    """Mean year-10 Medicare spending (billions)."""
+    summary = MedicareModel(seed=seed, sampler=sampler).project_all_parts(10, iterations, return_summary=True)
+    return float(summary["total_mean"].iloc[-1] / 1e9)
+
+
+def ci_width(statistic: Callable[[str, int, int], float], sampler: str, iterations: int) -> float:
+    """Empirical 95% confidence interval width across seeded replicates."""
+    estimates = [statistic(sampler, seed, iterations) for seed in range(REPLICATES)]
+    return 2 * 1.96 * float(np.std(estimates, ddof=1))
+
+
+def iterations_to_target(
+    statistic: Callable[[str, int, int], float],
+    sampler: str,
+    target_width: float,
+    grid: Sequence[int] = ITERATION_GRID,
+) -> Optional[int]:
+    """Smallest grid iteration count whose interval is within the target (None if never)."""
+    for iterations in grid:
+        if ci_width(statistic, sampler, iterations) <= target_width:
+            return iterations
+    return None
+
+
+def benchmark_samplers():
+    """Report iterations needed per sampler for each benchmark statistic."""
+
+    print("=" * 80)
+    print("  Monte Carlo Sampler Benchmark (iterations to reach a 95% CI width)")
+    print("=" * 80)
+    print()
+
+    # (description, statistic, target 95% CI width)
+    benchmarks = [
+        ("Policy simulator: mean final-year deficit", policy_deficit_mean, 20.0),
+        ("Policy simulator: P90 final-year deficit", policy_deficit_p90, 40.0),
+        ("Medicare: mean year-10 spending", medicare_total_mean, 3.0),
+    ]
+
+    for description, statistic, target in benchmarks:
+        print(f"{description} (target width {target:g}B, {REPLICATES} replicates)")
+        print("-" * 60)
+        results: Dict[str, Optional[int]] = {}
+        for name in SAMPLERS:
+            start_time = time.time()
+            results[name] = iterations_to_target(statistic, name, target)
+            elapsed = time.time() - start_time
+            needed = f"{results[name]:,}" if results[name] else f"> {ITERATION_GRID[-1]:,}"
+            print(f"  {name:<12} {needed:>10} iterations   ({elapsed:.1f}s to search)")
+        baseline = results.get("pseudo")
+        best = min((n for n in results.values() if n), default=None)
+        if baseline and best:
+            print(f"  Best reduction vs pseudo-random: {baseline / best:.0f}x fewer iterations")
+        print()
+
+
+if __name__ == "__main__":
+    benchmark_samplers()
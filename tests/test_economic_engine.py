@@ -7,6 +7,7 @@ Tests cover:
 - MonteCarloEngine simulation logic
 - SimulationResult handling
 - Parameter perturbation and uncertainty
+- Batched parameter sweeps
 """
 
 import pytest
@@ -21,7 +22,11 @@ from core.economic_engine import (
     MonteCarloEngine,
     SimulationResult,
     EconomicModel,
+    SensitivityAnalyzer,
+    ScenarioComparator,
+    parameter_grid,
 )
+from core.online_stats import AdaptiveSampling
 
 
 class TestEconomicParameters:
@@ -295,6 +300,58 @@ class TestMonteCarloEngine:
         np.testing.assert_array_almost_equal(result1.gdp, result2.gdp)
         np.testing.assert_array_almost_equal(result1.debt, result2.debt)
     
+    def test_uncertainty_spreads_paths(self, simple_scenario):
+        """Perturbed parameters are sampled independently per iteration."""
+        engine = MonteCarloEngine(seed=42)
+        result = engine.run_simulation(
+            simple_scenario,
+            iterations=500,
+            uncertainty_dict={"gdp_growth_rate": (0.025, 0.01)},
+        )
+
+        assert result.percentiles["10th"][-1] < result.percentiles["90th"][-1]
+        assert result.metadata["exploded_paths"] == 0
+
+    def test_debt_explosion_freezes_paths(self, simple_scenario):
+        """Exploding paths hold their debt and stop accumulating deficits."""
+        simple_scenario.economic_params.national_debt = 280.0
+        simple_scenario.spending[0].value = 60.0
+        engine = MonteCarloEngine(seed=42)
+        result = engine.run_simulation(simple_scenario, iterations=20)
+
+        assert result.metadata["exploded_paths"] == 20
+        assert result.deficit[-1] == 0
+        assert result.debt[-1] == result.debt[-2]
+
+    def test_chunked_simulation_matches_full_run(self, simple_scenario):
+        """Chunks draw the same parameter stream, so means and explosions match."""
+        uncertainty = {"gdp_growth_rate": (0.025, 0.01)}
+        full = MonteCarloEngine(seed=42).run_simulation(
+            simple_scenario, iterations=2000, uncertainty_dict=uncertainty
+        )
+        chunked = MonteCarloEngine(seed=42).run_simulation(
+            simple_scenario, iterations=2000, uncertainty_dict=uncertainty, chunk_size=300
+        )
+
+        np.testing.assert_allclose(chunked.debt, full.debt, rtol=1e-12)
+        np.testing.assert_allclose(chunked.gdp, full.gdp, rtol=1e-12)
+        assert chunked.metadata["exploded_paths"] == full.metadata["exploded_paths"]
+        np.testing.assert_allclose(chunked.percentiles["50th"], full.percentiles["50th"], rtol=1e-3)
+
+    def test_adaptive_simulation_reports_convergence(self, simple_scenario):
+        """Adaptive runs report achieved iterations and precision in metadata."""
+        result = MonteCarloEngine(seed=42).run_simulation(
+            simple_scenario,
+            iterations=20_000,
+            uncertainty_dict={"gdp_growth_rate": (0.025, 0.01)},
+            adaptive=AdaptiveSampling(tolerance=0.01, batch_size=250),
+        )
+
+        convergence = result.metadata["convergence"]
+        assert convergence["converged"]
+        assert result.metadata["iterations"] == convergence["iterations"] < 20_000
+        assert convergence["precision"]["final_mean_deficit"] <= 0.01
+
     def test_to_dataframe(self, simple_scenario):
         """Test conversion to pandas DataFrame."""
         engine = MonteCarloEngine(seed=42)
@@ -374,6 +431,79 @@ class TestEconomicModel:
         assert impact["Revenue_Difference"].iloc[-1] > 0
 
 
+class TestParameterSweep:
+    """Tests for batched parameter sweeps."""
+
+    @pytest.fixture
+    def scenario(self):
+        """Create a scenario with fixed and percent-of-GDP lines."""
+        params = EconomicParameters(
+            gdp=29.0, gdp_growth_rate=0.025, inflation_rate=0.03,
+            national_debt=35.0, interest_rate=0.04, simulation_years=8,
+        )
+        return PolicyScenario(
+            name="Sweep",
+            economic_params=params,
+            revenues=[
+                RevenueLine(name="Tax", is_percent=True, value=18.0),
+                RevenueLine(name="Fees", is_percent=False, value=0.4),
+            ],
+            spending=[SpendingCategory(name="Spending", is_percent=True, value=19.0)],
+        )
+
+    def test_sweep_matches_per_point_runs(self, scenario):
+        """Each grid point equals a separate run drawing the same stream."""
+        uncertainty = {"inflation_rate": (0.03, 0.01), "gdp_growth_rate": (0.02, 0.01)}
+        sweep = MonteCarloEngine(seed=3).run_sweep(
+            scenario,
+            {"debt_drag_factor": [0.0, 0.05], "national_debt": [30.0, 40.0]},
+            iterations=300,
+            uncertainty_dict=uncertainty,
+            max_batch_values=300 * 9 * 3,  # Forces two blocks of points
+        )
+
+        assert sweep.values["debt"].shape == (4, 9)
+        for point, row in sweep.points.iterrows():
+            variant = PolicyScenario(
+                name="Variant",
+                economic_params=EconomicParameters(**{**vars(scenario.economic_params), **row}),
+                revenues=scenario.revenues,
+                spending=scenario.spending,
+            )
+            single = MonteCarloEngine(seed=3).run_simulation(variant, 300, uncertainty_dict=uncertainty)
+            np.testing.assert_allclose(sweep.values["debt"][point], single.debt)
+            np.testing.assert_allclose(sweep.values["debt_90th"][point], single.percentiles["90th"])
+
+    def test_labelled_views(self, scenario):
+        """Results are indexed by the grid coordinates."""
+        grid = parameter_grid(gdp_growth_rate=[0.01, 0.03], inflation_rate=[0.02, 0.04, 0.06])
+        sweep = MonteCarloEngine(seed=1).run_sweep(scenario, grid, iterations=50)
+
+        assert len(grid) == 6
+        assert sweep.sel("gdp").loc[(0.03, 0.02)].iloc[-1] > sweep.sel("gdp").loc[(0.01, 0.02)].iloc[-1]
+        assert sweep.to_frame().index.names == ["gdp_growth_rate", "inflation_rate", "year"]
+        assert len(sweep.final("debt")) == 6
+
+    def test_unknown_parameter_rejected(self, scenario):
+        """Only parameters read by the projection can be swept."""
+        with pytest.raises(ValueError):
+            MonteCarloEngine().run_sweep(scenario, {"simulation_years": [5, 10]})
+
+    def test_tornado_and_comparison_use_batches(self, scenario):
+        """Tornado impacts and scenario comparisons agree with one-at-a-time runs."""
+        tornado = SensitivityAnalyzer(MonteCarloEngine(seed=2)).tornado_analysis(
+            scenario, {"national_debt": (30.0, 40.0), "simulation_years": (5, 10), "interest_rate": (0.02, 0.06)}
+        )
+        impacts = dict(zip(tornado["Parameter"], tornado["Impact"]))
+        assert impacts["national_debt"] == pytest.approx(10.0, rel=0.05)
+        assert impacts["interest_rate"] == 0  # Not read by the projection
+
+        comparator = ScenarioComparator({"base": scenario})
+        comparator.run_all(iterations=100)
+        single = MonteCarloEngine().run_simulation(scenario, 100)
+        np.testing.assert_allclose(comparator.results["base"].debt, single.debt)
+
+
 class TestSimulationResult:
     """Tests for SimulationResult handling."""
     
@@ -17,7 +17,8 @@ from core.interest_spending import (
     InterestOnDebtModel,
     DebtAssumptions,
 )
-from core.combined_outlook import CombinedFiscalOutlookModel
+from core.combined_outlook import CombinedFiscalOutlookModel, fiscal_gap
+from core.result_cache import ResultCache
 
 
 class TestDiscretionarySpending:
@@ -95,6 +96,27 @@ class TestDiscretionarySpending:
             totals["defense_10year_billions"] + totals["nondefense_10year_billions"]
         )
     
+    def test_paths_compound_at_constant_rate(self):
+        """Each stochastic path grows at a single drawn rate."""
+        model = DiscretionarySpendingModel(seed=7)
+        paths = model.project_defense(years=8, iterations=200)["defense_billions"]
+        
+        ratios = paths[:, 1:] / paths[:, :-1]
+        assert np.allclose(ratios, ratios[:, :1])
+        assert np.allclose(paths[:, 0], model.assumptions.defense_2025_billions * ratios[:, 0])
+    
+    def test_chunked_defense_matches_full(self):
+        """Streaming blocks give nearly the same statistics without the path arrays."""
+        full = DiscretionarySpendingModel(seed=7).project_defense(years=10, iterations=4000)
+        chunked = DiscretionarySpendingModel(seed=7).project_defense(years=10, iterations=4000, chunk_size=1000)
+        nondefense = DiscretionarySpendingModel(seed=7).project_nondefense_discretionary(
+            years=10, iterations=4000, chunk_size=1000
+        )
+        
+        assert "defense_billions" not in chunked and "nondefense_billions" not in nondefense
+        for key in ("mean", "median", "p10", "p90"):
+            np.testing.assert_allclose(chunked[key], full[key], rtol=0.01)
+    
     def test_category_breakdown(self):
         """Test non-defense breakdown by category."""
         model = DiscretionarySpendingModel()
@@ -141,6 +163,39 @@ class TestInterestOnDebt:
         # Rising rates should have higher interest by end
         assert rising["mean"][-1] > baseline["mean"][-1]
     
+    def test_interest_spike_scenario(self):
+        """Spike scenario jumps rates in year 1 and holds them with no noise."""
+        model = InterestOnDebtModel()
+        result = model.project_interest_expense(years=5, iterations=100, interest_rate_scenario="spike")
+        
+        rates = result["interest_rate"]
+        base_rate = model.calculate_current_interest_rate()
+        assert np.allclose(rates[:, 0], base_rate)
+        assert np.allclose(rates[:, 1:], min(0.05, base_rate + 0.01))
+        
+        # Debt recursion: next debt = debt + interest + primary deficit
+        debt = result["debt_billions"]
+        interest = result["interest_billions"]
+        primary = model.assumptions.primary_deficit_annual_billions
+        assert np.allclose(debt[:, 1:], debt[:, :-1] + interest[:, 1:] + primary)
+    
+    def test_coupled_debt_recursion(self):
+        """Coupled debt accrues interest on last year's debt plus the budget's own primary deficit."""
+        model = InterestOnDebtModel(seed=3)
+        revenue = np.full((12, 50), 5000.0)
+        gdp = 28000.0 * 1.025 ** np.arange(12)
+        result = model.project_coupled_debt(revenue, np.full((12, 1), 5600.0), gdp)
+
+        debt = result["debt_billions"]
+        previous = np.vstack([np.full((1, 50), model.assumptions.public_debt_2025_billions), debt[:-1]])
+        assert np.allclose(result["interest_billions"], previous * result["interest_rate"])
+        assert np.allclose(debt, previous + 600.0 + result["interest_billions"])
+        assert np.allclose(result["gdp"], gdp[:, np.newaxis])  # No drag by default
+
+        dragged = model.project_coupled_debt(revenue, np.full((12, 1), 5600.0), gdp, debt_drag_factor=0.05)
+        assert np.all(dragged["gdp"][-1] < gdp[-1])
+        assert np.all(dragged["revenue"][-1] < revenue[-1])
+    
     def test_interest_and_debt_dataframe(self):
         """Test interest and debt projection returns DataFrame."""
         model = InterestOnDebtModel()
@@ -218,6 +273,84 @@ class TestCombinedFiscalOutlook:
         except Exception as e:
             pytest.skip(f"Combined model requires full integration: {str(e)}")
     
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    def test_parallel_execution_matches_serial(self, executor):
+        """Components run on a pool give the same budget as serial execution."""
+        serial = CombinedFiscalOutlookModel(seed=21, enable_cache=False)
+        parallel = CombinedFiscalOutlookModel(seed=21, enable_cache=False)
+        
+        for _ in range(2):  # Second run checks RNG streams resume identically
+            expected = serial.project_unified_budget(years=8, iterations=200)
+            actual = parallel.project_unified_budget(years=8, iterations=200, executor=executor)
+            pd.testing.assert_frame_equal(actual, expected)
+    
+    def test_parallel_execution_with_shared_executor(self):
+        """An existing executor can be reused across calls."""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        model = CombinedFiscalOutlookModel(seed=3)
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            df = model.project_unified_budget(years=5, iterations=100, executor=pool)
+        assert len(df) == 5
+        assert np.all(df["total_spending"] > 0)
+    
+    def test_invalid_executor_rejected(self):
+        """Unknown execution modes raise a validation error."""
+        from core.validation import ValidationError
+        
+        model = CombinedFiscalOutlookModel()
+        with pytest.raises(ValidationError):
+            model.project_unified_budget(years=5, iterations=100, executor="gpu")
+    
+    def test_only_dirty_components_recompute(self):
+        """Changing one scenario or sub-model recomputes only the nodes that read it."""
+        model = CombinedFiscalOutlookModel(seed=5)
+        baseline = model.project_unified_budget(years=6, iterations=100)
+        assert len(model.last_recomputed) == 6
+
+        spike = model.project_unified_budget(years=6, iterations=100, interest_scenario="spike")
+        assert model.last_recomputed == ("interest",)
+        pd.testing.assert_series_equal(spike["medicare_spending"], baseline["medicare_spending"])
+
+        model.discretionary_model.assumptions.defense_2025_billions *= 1.1
+        model.project_unified_budget(years=6, iterations=100, interest_scenario="spike")
+        assert model.last_recomputed == ("discretionary",)
+
+        model.project_unified_budget(years=6, iterations=100, interest_scenario="spike")
+        assert model.last_recomputed == ()
+    
+    def test_rebuilt_unseeded_models_recompute_only_dirty_components(self):
+        """A fresh unseeded model per run (the dashboard pattern) reuses clean nodes."""
+        cache = ResultCache()
+        baseline = CombinedFiscalOutlookModel(cache=cache).project_unified_budget(years=6, iterations=100)
+        
+        model = CombinedFiscalOutlookModel(cache=cache)
+        spike = model.project_unified_budget(years=6, iterations=100, interest_scenario="spike")
+        assert model.last_recomputed == ("interest",)
+        pd.testing.assert_series_equal(spike["medicare_spending"], baseline["medicare_spending"])
+        
+        model = CombinedFiscalOutlookModel(cache=cache)
+        model.project_unified_budget(
+            years=6, iterations=100, interest_scenario="spike", discretionary_scenario="growth"
+        )
+        assert model.last_recomputed == ("discretionary",)
+    
+    def test_revenue_cached_by_scenario(self):
+        """Revenue is a cached node keyed by (years, iterations, scenario)."""
+        model = CombinedFiscalOutlookModel(seed=5)
+        baseline = model.project_unified_budget(years=6, iterations=100)
+        
+        recession = model.project_unified_budget(years=6, iterations=100, revenue_scenario="recession")
+        assert model.last_recomputed == ("revenue",)
+        assert not recession["total_revenue"].equals(baseline["total_revenue"])
+        
+        again = model.project_unified_budget(years=6, iterations=100)
+        assert model.last_recomputed == ()
+        pd.testing.assert_series_equal(again["total_revenue"], baseline["total_revenue"])
+        
+        model.project_unified_budget(years=7, iterations=100)
+        assert "revenue" in model.last_recomputed
+
     def test_fiscal_summary(self):
         """Test fiscal summary metrics."""
         model = CombinedFiscalOutlookModel()
@@ -234,6 +367,75 @@ class TestCombinedFiscalOutlook:
         except Exception as e:
             pytest.skip(f"Combined model requires full integration: {str(e)}")
     
+    def test_fiscal_gap_closed_form_hits_target(self):
+        """Applying the solved adjustment through the debt recursion reaches the target."""
+        years = 40
+        primary_balance = np.linspace(-800.0, -2500.0, years)
+        gdp = 28000.0 * 1.04 ** np.arange(years)
+        rates = np.linspace(0.03, 0.045, years)
+
+        gap = fiscal_gap(primary_balance, gdp, rates, 28000.0, 0.60)
+        debt = 28000.0
+        for t in range(years):
+            debt = debt * (1 + rates[t]) - (primary_balance[t] + gap / 100 * gdp[t])
+        assert debt / gdp[-1] == pytest.approx(0.60)
+
+        # Stacked paths solve column by column
+        batch = fiscal_gap(np.column_stack([primary_balance, primary_balance + 500.0]), gdp, rates, 28000.0)
+        assert batch[0] == pytest.approx(gap) and batch[1] < gap
+
+    def test_fiscal_gap_distribution(self):
+        """The gap comes from the cached projection, with one value per iteration."""
+        model = CombinedFiscalOutlookModel(seed=8)
+        result = model.calculate_fiscal_gap(years=30, iterations=200, return_distribution=True)
+
+        assert result["distribution"].shape == (200,)
+        assert result["p10"] <= result["p50"] <= result["p90"]
+        assert result["fiscal_gap_pct_gdp"] == pytest.approx(result["mean"], abs=3 * result["std"])
+
+        # A looser target reuses the cached paths and needs less adjustment
+        model.revenue_model.rng = None  # Any re-simulation would fail
+        assert model.calculate_fiscal_gap(years=30, iterations=200, target_debt_to_gdp=1.0) < result["fiscal_gap_pct_gdp"]
+
+    def test_fiscal_gap_paths_follow_gdp_growth(self):
+        """GDP growth drives the budget paths too, and each rate is cached separately."""
+        model = CombinedFiscalOutlookModel(seed=8)
+        slow = model._fiscal_gap_paths(20, 200, 0.015)
+        fast = model._fiscal_gap_paths(20, 200, 0.04)
+
+        assert fast["primary_balance"][-1].mean() > slow["primary_balance"][-1].mean()
+
+        model.revenue_model.rng = None  # Any re-simulation would fail
+        cached = model._fiscal_gap_paths(20, 200, 0.015)
+        np.testing.assert_array_equal(cached["primary_balance"], slow["primary_balance"])
+
+    def test_coupled_budget_is_consistent(self):
+        """Coupled interest and debt follow from the budget's own deficits."""
+        model = CombinedFiscalOutlookModel(seed=9)
+        df = model.project_coupled_budget(years=15, iterations=200)
+
+        debt = df["debt_billions"].to_numpy()
+        previous = np.concatenate([[model.interest_model.assumptions.public_debt_2025_billions], debt[:-1]])
+        assert np.allclose(debt, previous - df["deficit_surplus"])
+        assert np.allclose(df["debt_to_gdp"], debt / df["gdp"], rtol=1e-9)
+        # Repeat calls are served from the cache rather than redrawn
+        pd.testing.assert_frame_equal(model.project_coupled_budget(years=15, iterations=200), df)
+
+        dragged = model.project_coupled_budget(years=15, iterations=200, debt_drag_factor=0.05)
+        assert dragged["gdp"].iloc[-1] < df["gdp"].iloc[-1]
+        assert dragged["debt_to_gdp"].iloc[-1] > df["debt_to_gdp"].iloc[-1]
+
+    def test_cached_coupled_budget_is_writable(self):
+        """A cache hit returns a writable frame that does not alias the cache."""
+        model = CombinedFiscalOutlookModel(seed=1)
+        first = model.project_coupled_budget(years=5, iterations=100)
+        second = model.project_coupled_budget(years=5, iterations=100)
+
+        second.loc[0, "gdp"] = 1.0
+        first.loc[0, "gdp"] = 1.0
+        third = model.project_coupled_budget(years=5, iterations=100)
+        assert third.loc[0, "gdp"] > 1.0
+
     def test_fiscal_scenarios(self):
         """Test different fiscal scenarios."""
         model = CombinedFiscalOutlookModel()
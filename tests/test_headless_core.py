@@ -0,0 +1,105 @@
+"""
+Tests for the headless simulation core and lazy package exports.
+Edge cases must come back as structured events, and importing core must
+not pull in Tk or other GUI/report dependencies.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import core
+from core.simulation import SimulationEvent, simulate_years_headless
+
+
+def _scenario(**overrides):
+    general = {
+        "gdp": 29.0,
+        "gdp_growth_rate": 2.0,
+        "inflation_rate": 2.5,
+        "national_debt": 35.0,
+        "interest_rate": 4.0,
+        "surplus_redirect_post_debt": 0.0,
+        "transition_fund": 0.0,
+        "simulation_years": 5,
+        **overrides,
+    }
+    revenues = [{"name": "income_tax", "is_percent": True, "value": 17.0, "alloc_health": 0.0,
+                 "alloc_states": 0.0, "alloc_federal": 100.0}]
+    outs = [{"name": "federal", "is_percent": True, "value": 18.0, "allocations": []}]
+    return general, revenues, outs
+
+
+class TestHeadlessSimulation:
+    """Test simulate_years_headless events."""
+
+    def test_plain_run_has_no_events(self):
+        """An ordinary scenario simulates every year without events."""
+        run = simulate_years_headless(*_scenario())
+
+        assert len(run.results) == 5
+        assert run.events == [] and not run.stopped
+
+    def test_edge_cases_become_confirm_event(self):
+        """Pre-run edge cases are one confirm event; runs proceed by default."""
+        run = simulate_years_headless(*_scenario(gdp_growth_rate=-1.0, inflation_rate=60.0))
+
+        assert [event.level for event in run.events][:1] == ["confirm"]
+        assert "Negative GDP growth" in run.events[0].message
+        assert "Hyperinflation" in run.events[0].message
+        assert run.results is not None
+
+    def test_declining_confirmation_cancels(self):
+        """An on_event callback returning False cancels the run."""
+        seen = []
+
+        def decline(event: SimulationEvent):
+            seen.append(event)
+            return False
+
+        run = simulate_years_headless(*_scenario(gdp_growth_rate=-1.0), on_event=decline)
+
+        assert run.results is None and run.stopped
+        assert seen == run.events
+
+    def test_invalid_years_is_error_event(self):
+        """Invalid inputs report an error event instead of a dialog."""
+        run = simulate_years_headless(*_scenario(simulation_years="abc"))
+
+        assert run.results is None and run.stopped
+        assert run.events[0].level == "error"
+
+    def test_debt_explosion_stops_with_year(self):
+        """stop_on_debt_explosion ends the run with a dated error event."""
+        run = simulate_years_headless(*_scenario(national_debt=400.0, stop_on_debt_explosion=1))
+
+        errors = [event for event in run.events if event.level == "error"]
+        assert run.stopped and errors[0].year == 1
+
+
+class TestLazyExports:
+    """Test PEP 562 exports from the core package."""
+
+    def test_exports_resolve(self):
+        """Every name in __all__ resolves from its submodule."""
+        from core.social_security import SocialSecurityModel
+
+        assert core.SocialSecurityModel is SocialSecurityModel
+        assert core.BuilderPolicyType.__module__ == "core.policy_builder"
+        with pytest.raises(AttributeError):
+            core.not_an_export
+
+    def test_import_is_headless(self):
+        """Importing core and a model loads no GUI, scipy or report backends."""
+        probe = (
+            "import sys, core; from core import SocialSecurityModel, simulate_years_headless; "
+            "print(','.join(m for m in ('tkinter', 'scipy', 'reportlab', 'openpyxl') if m in sys.modules))"
+        )
+        completed = subprocess.run(
+            [sys.executable, "-c", probe], capture_output=True, text=True,
+            cwd=Path(__file__).resolve().parent.parent, check=True,
+        )
+
+        assert completed.stdout.strip() == ""
@@ -0,0 +1,127 @@
+"""
+Unit tests for batched healthcare simulation.
+simulate_healthcare_batch() must reproduce the per-year mechanism
+calculators and simulate_healthcare_years() for every policy it stacks.
+"""
+
+import copy
+
+import pandas as pd
+import pytest
+
+from core import PolicyType, get_policy_by_type, simulate_healthcare_batch, simulate_healthcare_years
+from core.context_aware_healthcare import (
+    CircuitBreakerEnforcer,
+    MechanismBasedRevenueCalculator,
+    MechanismBasedSpendingCalculator,
+    calculate_mechanism_based_outcomes,
+    compile_mechanics,
+)
+from core.policy_mechanics_extractor import CircuitBreaker, FundingMechanism, SurplusAllocation
+from core.projection_context import ProjectionContext
+from core.simulation import BASELINE_HEALTH_PCT_GDP
+
+
+@pytest.fixture
+def variant():
+    """USGHA with duplicate, extra and target-less mechanics to cover compile edge cases."""
+    policy = copy.deepcopy(get_policy_by_type(PolicyType.USGHA))
+    policy.policy_name = "USGHA variant"
+    mechanics = policy.mechanics
+    mechanics.funding_mechanisms += [
+        FundingMechanism(source_type="payroll_tax", percentage_rate=2.0),
+        FundingMechanism(source_type="transaction_tax", percentage_gdp=0.4),
+        FundingMechanism(source_type="import_tariffs", percentage_gdp=0.3),
+    ]
+    mechanics.surplus_allocation = SurplusAllocation(contingency_reserve_pct=50.0, dividends_pct=50.0)
+    mechanics.circuit_breakers = [
+        CircuitBreaker("spending_cap", 30.0, "percent_gdp", "never"),
+        CircuitBreaker("spending_cap", 12.0, "percent_gdp", "freeze_taxes"),
+    ]
+    mechanics.target_spending_year = None
+    return policy
+
+
+class TestCompileMechanics:
+    """Test mechanics compilation."""
+
+    def test_later_mechanism_replaces_earlier(self, variant):
+        """A second payroll tax replaces the first; other sources accumulate."""
+        compiled = compile_mechanics(variant.mechanics)
+
+        assert compiled.payroll_rate == 0.02
+        assert compiled.other_pct_gdp[-2:] == (0.004, 0.003)
+        assert compiled.target_pct_gdp is None
+        assert [action for _, action in compiled.spending_caps] == ["never", "freeze_taxes"]
+
+    @pytest.mark.parametrize("name", ["usgha", "variant"])
+    def test_matches_per_year_calculators(self, name, variant):
+        """Batched columns equal the scalar mechanism calculators year by year."""
+        policy = variant if name == "variant" else get_policy_by_type(PolicyType.USGHA)
+        mechanics = policy.mechanics
+        df = simulate_healthcare_batch([policy], 29e12, 35e12, years=12, start_year=2027)
+        gdp_path = ProjectionContext(12, gdp_growth=0.025, base_gdp=29e12).gdp
+
+        for i, row in df.iterrows():
+            revenue = MechanismBasedRevenueCalculator.calculate_from_mechanics(mechanics, gdp_path[i], 2027 + i, 2027)
+            assert row["Total Revenue"] == revenue.total
+            assert row["Efficiency Gains Revenue"] == revenue.efficiency_gains
+            assert row["Other Revenue"] == revenue.other_sources
+
+            if mechanics.target_spending_year:
+                spending = MechanismBasedSpendingCalculator.calculate_from_target(
+                    mechanics.target_spending_pct_gdp / 100, mechanics.target_spending_year,
+                    BASELINE_HEALTH_PCT_GDP, gdp_path[i], 2027 + i, 2027,
+                )
+                assert row["Healthcare Spending"] == spending.net_spending
+                assert row["Administrative Savings"] == spending.administrative_savings
+            else:
+                assert row["Healthcare Spending"] == BASELINE_HEALTH_PCT_GDP * gdp_path[i]
+
+            _, cap_message = CircuitBreakerEnforcer.check_spending_cap(
+                row["Health % GDP"], mechanics.circuit_breakers, 2027 + i
+            )
+            assert row["Circuit Breaker Message"].split("; ")[0] == (cap_message or "")
+
+    def test_deprecated_per_year_outcomes(self):
+        """calculate_mechanism_based_outcomes() still works, warns, and agrees with the batch."""
+        policy = get_policy_by_type(PolicyType.USGHA)
+        df = simulate_healthcare_batch([policy], 29e12, 35e12, years=5, start_year=2027)
+        gdp_path = ProjectionContext(5, gdp_growth=0.025, base_gdp=29e12).gdp
+
+        for i, row in df.iterrows():
+            with pytest.deprecated_call():
+                outcomes = calculate_mechanism_based_outcomes(
+                    policy.mechanics, gdp_path[i], 2027 + i, 2027, BASELINE_HEALTH_PCT_GDP
+                )
+            assert outcomes["revenue"].total == row["Total Revenue"]
+            assert outcomes["spending"].net_spending == row["Healthcare Spending"]
+            assert outcomes["surplus"] == row["Surplus/Deficit"]
+
+
+class TestHealthcareBatch:
+    """Test stacking many policies into one pass."""
+
+    def test_batch_matches_single_policy_runs(self, variant):
+        """Each block of the stacked frame equals simulate_healthcare_years()."""
+        policies = [get_policy_by_type(PolicyType.USGHA), variant, get_policy_by_type(PolicyType.CURRENT_US)]
+        stacked = simulate_healthcare_batch(policies, 29e12, 35e12, years=15)
+
+        assert list(stacked["Policy"].unique()) == [p.policy_name for p in policies]
+        for policy in policies:
+            block = stacked[stacked["Policy"] == policy.policy_name].drop(columns="Policy").reset_index(drop=True)
+            pd.testing.assert_frame_equal(block, simulate_healthcare_years(policy, 29e12, 35e12, years=15))
+
+    def test_legacy_policies_fall_back(self):
+        """Policies without mechanics keep the legacy model and input order."""
+        policies = [get_policy_by_type(PolicyType.UK_NHS), get_policy_by_type(PolicyType.USGHA)]
+        frames = simulate_healthcare_batch(policies, 29e12, 35e12, years=6, start_year=2027, stacked=False)
+
+        for policy, df in zip(policies, frames):
+            pd.testing.assert_frame_equal(df, simulate_healthcare_years(policy, 29e12, 35e12, years=6, start_year=2027))
+        assert len(simulate_healthcare_batch(policies, 29e12, 35e12, years=6)) == 12
+
+    def test_validates_inputs(self):
+        """Invalid inputs raise like simulate_healthcare_years()."""
+        with pytest.raises(ValueError):
+            simulate_healthcare_batch([get_policy_by_type(PolicyType.USGHA)], 29e12, -1.0)
@@ -0,0 +1,73 @@
+"""
+Unit tests for the Monte Carlo healthcare simulation.
+Paths come from the same mechanics kernel as simulate_healthcare_years(),
+so zero uncertainty must reproduce the deterministic run.
+"""
+
+import numpy as np
+import pytest
+
+from core import (
+    HealthcareUncertainty,
+    PolicyType,
+    get_policy_by_type,
+    healthcare_percentile_bands,
+    simulate_healthcare_monte_carlo,
+    simulate_healthcare_years,
+)
+from core.path_results import ProjectionPaths
+from core.simulation import MONTE_CARLO_PATHS
+
+
+@pytest.fixture(scope="module")
+def usgha():
+    return get_policy_by_type(PolicyType.USGHA)
+
+
+class TestHealthcareMonteCarlo:
+    """Test stochastic mechanics-based simulation."""
+
+    def test_zero_uncertainty_matches_deterministic(self, usgha):
+        """Every path equals simulate_healthcare_years() when nothing is perturbed."""
+        paths = simulate_healthcare_monte_carlo(
+            usgha, 29e12, 35e12, years=15, iterations=4,
+            uncertainty=HealthcareUncertainty(0.0, 0.0, 0.0, 0.0), seed=0,
+        )
+        df = simulate_healthcare_years(usgha, 29e12, 35e12, years=15)
+
+        assert isinstance(paths, ProjectionPaths) and paths.iterations == 4
+        np.testing.assert_array_equal(paths.year, df["Year"])
+        for name, column in MONTE_CARLO_PATHS.items():
+            np.testing.assert_array_equal(paths[name], np.repeat(df[column].to_numpy()[:, None], 4, axis=1))
+
+    def test_seeded_runs_reproduce(self, usgha):
+        """The same seed gives the same paths; the paths actually vary."""
+        first = simulate_healthcare_monte_carlo(usgha, 29e12, 35e12, iterations=200, seed=7)
+        second = simulate_healthcare_monte_carlo(usgha, 29e12, 35e12, iterations=200, seed=7)
+
+        for name in first.variables:
+            np.testing.assert_array_equal(first[name], second[name])
+        assert first.std("health_pct_gdp")[-1] > 0
+
+    @pytest.mark.parametrize("sampler", ["antithetic", "lhs"])
+    def test_samplers(self, usgha, sampler):
+        """Variance-reduced samplers run through the same draws."""
+        paths = simulate_healthcare_monte_carlo(usgha, 29e12, 35e12, years=10, iterations=64, seed=1, sampler=sampler)
+
+        assert paths["national_debt"].shape == (10, 64)
+
+    def test_percentile_bands(self, usgha):
+        """Bands cover debt, surplus and health % of GDP and are ordered."""
+        bands = healthcare_percentile_bands(
+            simulate_healthcare_monte_carlo(usgha, 29e12, 35e12, years=10, iterations=500, seed=2)
+        )
+
+        assert len(bands) == 10
+        for name in ("national_debt", "surplus", "health_pct_gdp"):
+            assert (bands[f"{name}_p10"] <= bands[f"{name}_p50"]).all()
+            assert (bands[f"{name}_p50"] <= bands[f"{name}_p90"]).all()
+
+    def test_requires_mechanics(self):
+        """Legacy policies without mechanics are rejected."""
+        with pytest.raises(ValueError, match="mechanics"):
+            simulate_healthcare_monte_carlo(get_policy_by_type(PolicyType.UK_NHS), 29e12, 35e12)
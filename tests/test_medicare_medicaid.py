@@ -9,6 +9,8 @@ Tests cover:
 - CBO baseline validation
 """
 
+from unittest import mock
+
 import pytest
 import numpy as np
 import pandas as pd
@@ -134,6 +136,59 @@ class TestMedicareModel:
         
         logger.info(f"Medicare all parts: {len(df)} records generated")
 
+    def test_all_parts_share_enrollment_draw(self):
+        """Parts A and B are priced against one enrollment path built from one draw."""
+        model = MedicareModel(seed=42)
+        draw_block = model.draw_block
+        draws = []
+
+        def recording(*specs):
+            draws.append(draw_block(*specs))
+            return draws[-1]
+
+        with mock.patch.object(model, "draw_block", side_effect=recording):
+            paths = model._simulate_all_parts(years=8, iterations=40)
+        enrollment_noise, part_a_noise, part_b_noise, _ = draws[0]
+
+        # Seeded reference rebuilt from the captured draws
+        enrollment = model._enrollment_paths(enrollment_noise)
+        growth = model.assumptions.medical_cost_growth_annual
+        np.testing.assert_array_equal(paths["enrollment"], enrollment)
+        np.testing.assert_array_equal(
+            paths["part_a_spending"], model._part_a_per_capita(part_a_noise, growth) * enrollment
+        )
+        np.testing.assert_array_equal(
+            paths["part_b_spending"], model._part_b_per_capita(part_b_noise, growth) * enrollment
+        )
+
+        # Perturbing only the enrollment draw moves Parts A and B by the same factor
+        def perturbed(*specs):
+            enrollment_noise, *cost_noise = draw_block(*specs)
+            return [enrollment_noise * 1.01, *cost_noise]
+
+        model.reseed(42)
+        with mock.patch.object(model, "draw_block", side_effect=perturbed):
+            shifted = model._simulate_all_parts(years=8, iterations=40)
+        factor = shifted["enrollment"] / paths["enrollment"]
+
+        expected = np.broadcast_to(np.power(1.01, np.arange(1, 9))[:, np.newaxis], factor.shape)
+        np.testing.assert_allclose(factor, expected)
+        np.testing.assert_allclose(shifted["part_a_spending"] / paths["part_a_spending"], factor)
+        np.testing.assert_allclose(shifted["part_b_spending"] / paths["part_b_spending"], factor)
+        # Part D prices its own deterministic enrollee path
+        np.testing.assert_array_equal(shifted["part_d_spending"], paths["part_d_spending"])
+
+    def test_all_parts_summary_matches_detail(self):
+        """Summary mode reports the same per-year means as the detailed frame."""
+        detail = MedicareModel(seed=7).project_all_parts(years=6, iterations=200)
+        summary = MedicareModel(seed=7).project_all_parts(years=6, iterations=200, return_summary=True)
+
+        assert len(summary) == 6
+        yearly = detail.groupby("year")["total_spending"].mean().values
+        np.testing.assert_allclose(summary["total_mean"].values, yearly)
+        assert (summary["total_p10"] < summary["total_mean"]).all()
+        assert (summary["total_mean"] < summary["total_p90"]).all()
+
     def test_spending_growth_over_time(self):
         """Test that Medicare spending grows over time."""
         model = MedicareModel(seed=42)
@@ -165,6 +220,28 @@ class TestMedicareModel:
         
         logger.info(f"Medicare CBO validation: 2025=${year_2025:.1f}B, 2034=${year_2034:.1f}B")
 
+    def test_chunked_summary_matches_full_summary(self):
+        """Streaming blocks give the same columns and nearly the same statistics."""
+        full = MedicareModel(seed=4).project_all_parts(years=10, iterations=4000, return_summary=True)
+        chunked = MedicareModel(seed=4).project_all_parts(
+            years=10, iterations=4000, return_summary=True, chunk_size=1000
+        )
+
+        assert list(chunked.columns) == list(full.columns)
+        for column in ("total_mean", "total_p10", "total_p90", "enrollment_mean"):
+            np.testing.assert_allclose(chunked[column], full[column], rtol=0.01)
+
+    @pytest.mark.parametrize("part", ["project_part_a", "project_part_b", "project_part_d"])
+    def test_chunked_part_matches_full(self, part):
+        """A single Part streams in blocks to nearly the same per-year moments."""
+        full = getattr(MedicareModel(seed=4), part)(years=10, iterations=4000)
+        chunked = getattr(MedicareModel(seed=4), part)(years=10, iterations=4000, chunk_size=1000)
+
+        assert "spending" not in chunked
+        np.testing.assert_allclose(chunked["mean_annual"], full["mean_annual"], rtol=0.01)
+        np.testing.assert_allclose(chunked["std_annual"], full["std_annual"], rtol=0.1)
+        np.testing.assert_allclose(chunked["enrollment_mean"], full["enrollment"].mean(axis=1), rtol=0.01)
+
 
 class TestMedicaidModel:
     """Test Medicaid projection model."""
@@ -280,6 +357,30 @@ class TestMedicaidModel:
         
         logger.info(f"Medicaid CMS validation: 2025=${year_2025:.1f}B, 2034=${year_2034:.1f}B")
 
+    def test_spending_with_predrawn_noise_is_reproducible(self):
+        """Same noise matrices produce identical spending paths."""
+        model = MedicaidModel()
+        noise = model.draw_noise(years=6, iterations=30)
+        assert noise["spending"].shape == (6, 30)
+
+        first = model.project_spending(years=6, iterations=30, noise=noise)
+        second = model.project_spending(years=6, iterations=30, noise=noise)
+        pd.testing.assert_frame_equal(first, second)
+
+    def test_spending_summary_matches_detail(self):
+        """Summary mode reports the same per-year statistics as the detailed frame."""
+        model = MedicaidModel()
+        noise = model.draw_noise(years=6, iterations=200)
+
+        detail = model.project_spending(years=6, iterations=200, noise=noise)
+        summary = model.project_spending(years=6, iterations=200, noise=noise, return_summary=True)
+
+        assert list(summary["year"]) == list(range(2025, 2031))
+        yearly = detail.groupby("year")["total_spending"]
+        np.testing.assert_allclose(summary["total_mean"].values, yearly.mean().values)
+        np.testing.assert_allclose(summary["total_p90"].values, yearly.quantile(0.9).values)
+        np.testing.assert_allclose(summary["federal_mean"].values, summary["total_mean"].values * 0.60)
+
     def test_policy_reform_eligibility(self):
         """Test policy reform: eligibility expansion."""
         model = MedicaidModel(seed=42)
@@ -0,0 +1,80 @@
+"""
+Unit tests for Monte Carlo policy scenarios.
+Tests the vectorized policy simulator and its summary-only mode.
+"""
+
+import numpy as np
+import pytest
+
+from core.monte_carlo_scenarios import MonteCarloPolicySimulator
+from core.online_stats import AdaptiveSampling
+
+
+class TestMonteCarloPolicySimulator:
+    """Test MonteCarloPolicySimulator.simulate_policy."""
+
+    def test_deficit_paths_shape(self):
+        """Simulation returns one deficit path per iteration."""
+        simulator = MonteCarloPolicySimulator()
+        result = simulator.simulate_policy("Test", 5.0, -3.0, years=8, iterations=200, random_seed=1)
+
+        assert result.simulation_results.shape == (200, 8)
+        assert result.p10_deficit <= result.median_deficit <= result.p90_deficit
+
+    def test_paths_compound_at_path_growth_rate(self):
+        """Each path grows at a single constant rate."""
+        simulator = MonteCarloPolicySimulator()
+        result = simulator.simulate_policy("Test", 0.0, 0.0, years=5, iterations=50, random_seed=2)
+
+        paths = result.simulation_results
+        ratios = paths[:, 1:] / paths[:, :-1]
+        assert np.allclose(ratios, ratios[:, :1])
+
+    def test_summary_only_matches_full_run(self):
+        """Skipping the path matrix leaves summary statistics unchanged."""
+        simulator = MonteCarloPolicySimulator()
+        full = simulator.simulate_policy("Test", 5.0, -3.0, iterations=1000, random_seed=3)
+        summary = simulator.simulate_policy(
+            "Test", 5.0, -3.0, iterations=1000, random_seed=3, return_paths=False
+        )
+
+        assert summary.simulation_results is None
+        assert summary.mean_deficit == pytest.approx(full.mean_deficit)
+        assert summary.p90_deficit == pytest.approx(full.p90_deficit)
+        assert summary.probability_balanced == full.probability_balanced
+
+    def test_float32_paths(self):
+        """Reduced precision output keeps results close to float64."""
+        simulator = MonteCarloPolicySimulator()
+        full = simulator.simulate_policy("Test", 5.0, -3.0, iterations=1000, random_seed=4)
+        reduced = simulator.simulate_policy(
+            "Test", 5.0, -3.0, iterations=1000, random_seed=4, dtype=np.float32
+        )
+
+        assert reduced.simulation_results.dtype == np.float32
+        assert reduced.mean_deficit == pytest.approx(full.mean_deficit, rel=1e-4)
+
+    def test_growth_scenarios_sampled(self):
+        """Discrete growth scenarios are drawn per iteration."""
+        simulator = MonteCarloPolicySimulator()
+        result = simulator.simulate_policy(
+            "Test", 0.0, 0.0, growth_scenarios=[0.01, 0.03], iterations=500, random_seed=5
+        )
+
+        paths = result.simulation_results
+        growth = np.round(paths[:, 1] / paths[:, 0] - 1, 6)
+        assert set(growth) == {0.01, 0.03}
+
+    def test_adaptive_stops_at_tolerance(self):
+        """Adaptive runs stop early once the deficit statistics converge."""
+        simulator = MonteCarloPolicySimulator()
+        adaptive = AdaptiveSampling(tolerance=0.01, batch_size=500)
+        result = simulator.simulate_policy(
+            "Test", 5.0, -3.0, iterations=50_000, random_seed=6, adaptive=adaptive
+        )
+
+        assert result.convergence["converged"]
+        assert result.iterations == result.convergence["iterations"] < 50_000
+        assert result.iterations % 500 == 0
+        assert result.simulation_results.shape == (result.iterations, 10)
+        assert max(result.convergence["precision"].values()) <= 0.01
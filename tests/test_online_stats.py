@@ -0,0 +1,180 @@
+"""
+Unit tests for streaming Monte Carlo summary statistics.
+Running moments must match NumPy exactly; quantile sketches must stay close.
+"""
+
+import numpy as np
+import pytest
+
+from core.online_stats import (
+    AdaptiveSampling,
+    ConvergenceMonitor,
+    QuantileSketch,
+    RunningMoments,
+    StreamingSummary,
+    final_year_mean,
+    final_year_percentile,
+    iter_chunks,
+    summarize_paths,
+    summary_statistics,
+)
+
+
+@pytest.fixture
+def samples():
+    """Skewed (cells, n) samples with a different scale per cell."""
+    rng = np.random.default_rng(11)
+    return rng.lognormal(0.0, 0.5, size=(5, 60_000)) * np.arange(1, 6)[:, np.newaxis]
+
+
+class TestRunningMoments:
+    """Test Welford/Chan mean and variance."""
+
+    def test_blocks_match_numpy(self, samples):
+        """Uneven blocks give the same mean and std as one pass."""
+        moments = RunningMoments(5)
+        for block in np.array_split(samples, 7, axis=1):
+            moments.update(block)
+
+        assert moments.count == samples.shape[1]
+        np.testing.assert_allclose(moments.mean, samples.mean(axis=1), rtol=1e-12)
+        np.testing.assert_allclose(moments.std, samples.std(axis=1), rtol=1e-10)
+
+    def test_merge_matches_single_accumulator(self, samples):
+        """Merging partial accumulators equals accumulating everything."""
+        left, right = RunningMoments(5), RunningMoments(5)
+        left.update(samples[:, :1_000])
+        right.update(samples[:, 1_000:])
+        left.merge(right)
+
+        np.testing.assert_allclose(left.mean, samples.mean(axis=1), rtol=1e-12)
+        np.testing.assert_allclose(left.variance, samples.var(axis=1), rtol=1e-10)
+
+
+class TestQuantileSketch:
+    """Test the merging t-digest."""
+
+    def test_quantiles_close_to_exact(self, samples):
+        """Sketch percentiles are within a small fraction of a standard deviation."""
+        sketch = QuantileSketch(5)
+        for block in np.array_split(samples, 12, axis=1):
+            sketch.update(block)
+
+        q = [0.01, 0.1, 0.5, 0.9, 0.99]
+        error = np.abs(sketch.quantile(q) - np.quantile(samples, q, axis=1))
+        assert np.all(error < 0.02 * samples.std(axis=1))
+        np.testing.assert_array_equal(sketch.quantile([0.0, 1.0]), [samples.min(axis=1), samples.max(axis=1)])
+
+    def test_merge_and_bounded_size(self, samples):
+        """Merged sketches stay within the compression limit and stay accurate."""
+        parts = []
+        for block in np.array_split(samples, 4, axis=1):
+            part = QuantileSketch(5, compression=100)
+            part.update(block)
+            parts.append(part)
+        merged = parts[0]
+        for part in parts[1:]:
+            merged.merge(part)
+
+        assert merged.count == samples.shape[1]
+        assert merged._means.shape[1] <= 100
+        error = np.abs(merged.quantile([0.5])[0] - np.median(samples, axis=1))
+        assert np.all(error < 0.02 * samples.std(axis=1))
+
+
+class TestStreamingSummary:
+    """Test the combined summary and the chunk driver."""
+
+    def test_keys_match_exact_summary(self, samples):
+        """Streaming and exact summaries share keys and agree closely."""
+        summary = StreamingSummary(5)
+        summary.update(samples)
+        streaming = summary.to_dict("total")
+        exact = summary_statistics(samples, "total")
+
+        assert list(streaming) == list(exact)
+        for key in exact:
+            np.testing.assert_allclose(streaming[key], exact[key], rtol=5e-3)
+
+    def test_summarize_paths_folds_every_block(self):
+        """Blocks are sized by chunk_size and every iteration is counted once."""
+        sizes = []
+
+        def simulate(n):
+            sizes.append(n)
+            return {"x": np.ones((3, n)), "y": np.full((3, n), 2.0)}
+
+        summaries = summarize_paths(simulate, iterations=25, chunk_size=10, moments_only=("y",))
+
+        assert sizes == [10, 10, 5]
+        assert summaries["x"].count == 25
+        np.testing.assert_array_equal(summaries["y"].mean, 2.0)
+        with pytest.raises(ValueError):
+            summaries["y"].percentile([50])
+
+    def test_iter_chunks_validates_size(self):
+        """Chunk sizes must be positive."""
+        assert list(iter_chunks(5, 2)) == [2, 2, 1]
+        with pytest.raises(ValueError):
+            list(iter_chunks(5, 0))
+
+
+class TestConvergenceMonitor:
+    """Test adaptive stopping on batch-means standard errors."""
+
+    def test_stops_when_tolerance_met(self):
+        """A noisy block stream stops once the final-year mean is precise enough."""
+        rng = np.random.default_rng(3)
+
+        def simulate(n):
+            return {"x": rng.normal(100.0, 10.0, size=(2, n))}
+
+        monitor = ConvergenceMonitor(
+            AdaptiveSampling(tolerance=0.002, batch_size=200),
+            {"mean": final_year_mean("x"), "p90": final_year_percentile("x", 90)},
+        )
+        summaries = summarize_paths(simulate, iterations=100_000, monitor=monitor)
+        report = monitor.report()
+
+        assert report["converged"]
+        assert summaries["x"].count == report["iterations"] < 100_000
+        assert all(value <= 0.002 for value in report["precision"].values())
+        assert report["estimates"]["mean"] == pytest.approx(100.0, rel=0.01)
+
+    def test_cap_and_minimum_batches(self):
+        """Unreachable tolerances run to the cap; easy ones still run min_batches."""
+        strict = ConvergenceMonitor(
+            AdaptiveSampling(tolerance=1e-9, batch_size=10), {"mean": final_year_mean("x")}
+        )
+        rng = np.random.default_rng(4)
+        summarize_paths(lambda n: {"x": rng.normal(size=(1, n))}, 45, monitor=strict)
+        assert strict.iterations == 45
+        assert not strict.converged
+
+        easy = ConvergenceMonitor(
+            AdaptiveSampling(tolerance=1.0, relative=False, batch_size=10, min_batches=3),
+            {"mean": final_year_mean("x")},
+        )
+        summarize_paths(lambda n: {"x": np.ones((1, n))}, 1_000, monitor=easy)
+        assert easy.iterations == 30
+
+        with pytest.raises(ValueError):
+            AdaptiveSampling(tolerance=0)
+
+    def test_short_final_batch_is_weighted(self):
+        """The mean estimate equals the pooled mean when the capped last batch is short."""
+        rng = np.random.default_rng(5)
+        blocks = []
+
+        def simulate(n):
+            blocks.append(rng.exponential(size=(1, n)))
+            return {"x": blocks[-1]}
+
+        monitor = ConvergenceMonitor(
+            AdaptiveSampling(tolerance=1e-9, batch_size=100), {"mean": final_year_mean("x")}
+        )
+        summarize_paths(simulate, 250, monitor=monitor)
+        pooled = np.concatenate(blocks, axis=1)
+
+        assert [block.shape[1] for block in blocks] == [100, 100, 50]
+        assert monitor.estimates()["mean"] == pytest.approx(pooled.mean(), rel=1e-12)
@@ -0,0 +1,93 @@
+"""
+Unit tests for columnar projection results.
+Reductions on ProjectionPaths must match the long-format DataFrame grouped
+by year, without the frame ever being built.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.medicare_medicaid import MedicaidModel, MedicareModel
+from core.path_results import ProjectionPaths
+from core.social_security import SocialSecurityModel
+
+
+@pytest.fixture
+def paths():
+    rng = np.random.default_rng(0)
+    return ProjectionPaths(np.arange(2026, 2031), {
+        "balance": rng.normal(100.0, 10.0, size=(5, 40)),
+        "solvent": rng.random((5, 40)) > 0.2,
+    })
+
+
+class TestProjectionPaths:
+    """Test the columnar container."""
+
+    def test_mapping_shares_arrays(self, paths):
+        """The mapping exposes year and the stored arrays without copying."""
+        balance = paths["balance"]
+
+        assert list(paths) == ["year", "balance", "solvent"]
+        assert paths.select(["balance"])["balance"] is balance
+        assert paths.with_paths(doubled=balance * 2)["balance"] is balance
+        assert (paths.years, paths.iterations) == (5, 40)
+
+    def test_shape_validation(self):
+        """Paths must match the year axis and each other's iteration count."""
+        with pytest.raises(ValueError):
+            ProjectionPaths(np.arange(3), {"a": np.zeros((4, 2))})
+        with pytest.raises(ValueError):
+            ProjectionPaths(np.arange(3), {"a": np.zeros((3, 2)), "b": np.zeros((3, 5))})
+
+    def test_agg_matches_groupby(self, paths):
+        """agg() lays out and computes what groupby("year").agg() would."""
+        spec = {"balance": ["mean", "std", "min", "max"], "solvent": ["mean"]}
+        expected = paths.to_frame().groupby("year").agg(spec).reset_index()
+
+        pd.testing.assert_frame_equal(paths.agg(spec), expected)
+
+    @pytest.mark.parametrize("order", ["iteration", "year"])
+    def test_to_frame_row_order(self, paths, order):
+        """Long format rows follow the requested order."""
+        df = paths.to_frame(["balance"], order=order, scenario="baseline")
+        path_3 = df[df["iteration"] == 3]
+
+        assert len(df) == 200 and (df["scenario"] == "baseline").all()
+        np.testing.assert_array_equal(path_3["balance"].to_numpy(), paths["balance"][:, 3])
+        assert df["year"].iloc[1] == (2027 if order == "iteration" else 2026)
+
+    def test_first_year(self):
+        """First year meeting a condition per iteration, NaN when never met."""
+        result = ProjectionPaths([2030, 2031, 2032], {"x": np.array([[5, 1, 5], [0, 1, 5], [0, 0, 5]])})
+
+        np.testing.assert_array_equal(result.first_year("x", lambda x: x <= 0), [2031, 2032, np.nan])
+
+
+class TestModelPaths:
+    """Test models returning columnar results."""
+
+    def test_medicare_long_frame_from_paths(self):
+        """The long frame is the year-major flattening of the returned paths."""
+        paths = MedicareModel(seed=4).project_all_parts(years=6, iterations=30, return_arrays=True)
+        df = MedicareModel(seed=4).project_all_parts(years=6, iterations=30)
+
+        assert isinstance(paths, ProjectionPaths)
+        pd.testing.assert_frame_equal(df, paths.to_frame(order="year"))
+
+    def test_medicaid_paths_by_category(self):
+        """Medicaid paths carry enrollment by category alongside the total."""
+        paths = MedicaidModel(seed=5).project_spending(years=4, iterations=20, return_arrays=True)
+
+        np.testing.assert_allclose(
+            paths["traditional_enrollment"] + paths["expansion_enrollment"] + paths["chip_enrollment"],
+            paths["enrollment"],
+        )
+
+    def test_solvency_from_paths_matches_long_frame(self):
+        """Depletion statistics agree for columnar paths and the long frame."""
+        model = SocialSecurityModel(seed=8)
+        paths = model.project_trust_funds(years=30, iterations=100, return_arrays=True)
+
+        assert model.estimate_solvency_dates(paths) == model.estimate_solvency_dates(paths.to_frame())
@@ -164,7 +164,7 @@ def run_combined_model_caching():
     print("  - Medicare projections cached by (years, iterations)")
     print("  - Social Security projections cached by (years, iterations, scenario)")
     print("  - Medicaid projections cached by (years, iterations)")
-    print("  - Revenue projections recomputed (vary by scenario)")
+    print("  - Revenue projections cached by (years, iterations, scenario)")
     print()
 
     return cache_hits, speedup
@@ -0,0 +1,77 @@
+"""
+Unit tests for compiled policy plans.
+A PolicyStepper must reproduce calculate_revenues_and_outs() year by year
+without modifying the caller's revenue and expenditure dicts.
+"""
+
+import copy
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from core.economics import calculate_revenues_and_outs, compile_policy
+from core.simulation import simulate_years_headless
+from defaults import initial_general, initial_outs, initial_revenues
+
+
+REVENUES = [
+    {"name": "income", "is_percent": True, "value": 10.0},
+    {"name": "tariffs", "is_percent": False, "value": 0.5},
+]
+OUTS = [
+    {"name": "health", "is_percent": True, "value": 6.0,
+     "allocations": [{"source": "income", "percent": 60.0}, {"source": "missing", "percent": 10.0}]},
+    {"name": "federal", "is_percent": False, "value": 1.0,
+     "allocations": [{"source": "income", "percent": 40.0}, {"source": "tariffs", "percent": 100.0}]},
+]
+
+
+class TestPolicyPlan:
+    """Test plan compilation and stepping."""
+
+    def test_compile_builds_allocation_matrix(self):
+        """Allocations become an (outs, revenues) matrix; unknown sources drop out."""
+        plan = compile_policy(REVENUES, OUTS)
+
+        np.testing.assert_array_equal(plan.allocation, [[0.6, 0.0], [0.4, 1.0]])
+        np.testing.assert_array_equal(plan.revenue_is_percent, [True, False])
+        with pytest.raises(ValueError):
+            plan.revenue_values[0] = 0.0
+
+    def test_stepper_matches_legacy_calculation(self):
+        """Each year matches calculate_revenues_and_outs() on mutable copies."""
+        stepper = compile_policy(REVENUES, OUTS).stepper()
+        revenues, outs = copy.deepcopy(REVENUES), copy.deepcopy(OUTS)
+
+        for gdp, scale in [(30.0, 1.04), (31.2, 1.05), (32.8, 0.98)]:
+            expected_surplus, expected_revenue = calculate_revenues_and_outs(revenues, outs, gdp, scale, 1.02)
+            surplus, revenue = stepper.step_dicts(gdp, scale)
+            assert surplus == pytest.approx(expected_surplus, rel=1e-12)
+            assert revenue == pytest.approx(expected_revenue, rel=1e-12)
+
+        assert REVENUES[1]["value"] == 0.5 and OUTS[1]["value"] == 1.0
+
+
+class TestReentrantSimulation:
+    """Test that simulate_years_headless leaves its inputs reusable."""
+
+    def test_repeated_runs_are_identical(self):
+        """The same policy dicts give the same results run after run."""
+        general, revenues, outs = (copy.deepcopy(x) for x in (initial_general, initial_revenues, initial_outs))
+        snapshot = copy.deepcopy((general, revenues, outs))
+
+        first = simulate_years_headless(general, revenues, outs).results
+        second = simulate_years_headless(general, revenues, outs).results
+
+        assert first.equals(second)
+        assert (general, revenues, outs) == snapshot
+
+    def test_shared_policy_across_threads(self):
+        """Concurrent runs over one policy definition agree."""
+        general, revenues, outs = (copy.deepcopy(x) for x in (initial_general, initial_revenues, initial_outs))
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda _: simulate_years_headless(general, revenues, outs).results, range(4)))
+
+        assert all(result.equals(results[0]) for result in results)
@@ -0,0 +1,130 @@
+"""
+Unit tests for the content-addressed policy registry.
+Repeat loads must return one shared frozen object whose compiled mechanics
+are reused by the simulator, while deep copies stay freely editable.
+"""
+
+import copy
+import dataclasses
+import pickle
+
+import pytest
+
+from core.context_aware_healthcare import compile_mechanics
+from core.healthcare import HealthcarePolicyModel, PolicyType, get_policy_by_type
+from core.policy_mechanics_extractor import PolicyMechanicsExtractor, mechanics_to_dict
+from core.policy_registry import PolicyRegistry, freeze, get_registry, is_frozen, precompiled_mechanics
+from core.simulation import simulate_healthcare_years
+
+
+@pytest.fixture
+def mechanics_data():
+    """Serialized USGHA mechanics, as stored by the policy library."""
+    return mechanics_to_dict(copy.deepcopy(get_policy_by_type(PolicyType.USGHA).mechanics))
+
+
+class TestRegisteredPolicies:
+    """Test get_policy_by_type and mechanics_from_dict registration."""
+
+    def test_repeat_load_is_shared(self):
+        """The same policy type returns the same frozen object."""
+        first = get_policy_by_type(PolicyType.USGHA)
+
+        assert get_policy_by_type(PolicyType.USGHA) is first
+        assert isinstance(first, HealthcarePolicyModel) and is_frozen(first)
+        assert get_policy_by_type(PolicyType.CURRENT_US) is not first
+
+    def test_assignment_is_rejected(self):
+        """Fields, nested lists and dicts of a registered policy are read-only."""
+        policy = get_policy_by_type(PolicyType.USGHA)
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            policy.policy_name = "Edited"
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            policy.mechanics.funding_mechanisms[0].percentage_gdp = 0.0
+        with pytest.raises(AttributeError):
+            policy.mechanics.funding_mechanisms.append(None)
+
+    def test_deepcopy_is_mutable(self):
+        """copy.deepcopy gives an ordinary, editable policy."""
+        policy = copy.deepcopy(get_policy_by_type(PolicyType.USGHA))
+
+        policy.policy_name = "Edited"
+        policy.mechanics.funding_mechanisms.append(policy.mechanics.funding_mechanisms[0])
+
+        assert type(policy) is HealthcarePolicyModel and not is_frozen(policy)
+        assert type(policy.mechanics.funding_mechanisms) is list
+        assert get_policy_by_type(PolicyType.USGHA).policy_name != "Edited"
+
+    def test_mechanics_memoized_by_content(self, mechanics_data):
+        """Equal dictionaries share one object; changed content builds another."""
+        first = PolicyMechanicsExtractor.mechanics_from_dict(mechanics_data)
+        again = PolicyMechanicsExtractor.mechanics_from_dict(copy.deepcopy(mechanics_data))
+
+        mechanics_data["policy_name"] = "Amended USGHA"
+        changed = PolicyMechanicsExtractor.mechanics_from_dict(mechanics_data)
+
+        assert again is first
+        assert changed is not first and changed.policy_name == "Amended USGHA"
+
+    def test_simulation_matches_mutable_copy(self):
+        """A registered policy simulates exactly like an editable copy of it."""
+        policy = get_policy_by_type(PolicyType.USGHA)
+
+        shared = simulate_healthcare_years(policy, base_gdp=29e12, initial_debt=35e12, years=10)
+        copied = simulate_healthcare_years(copy.deepcopy(policy), base_gdp=29e12, initial_debt=35e12, years=10)
+
+        assert shared.equals(copied)
+
+
+class TestPolicyRegistry:
+    """Test PolicyRegistry behavior."""
+
+    def test_compiled_mechanics_are_precompiled(self):
+        """Registered mechanics reuse the coefficients compiled at registration."""
+        mechanics = get_policy_by_type(PolicyType.USGHA).mechanics
+        unregistered = copy.deepcopy(mechanics)
+
+        assert precompiled_mechanics(mechanics) is precompiled_mechanics(mechanics)
+        assert precompiled_mechanics(unregistered) is not precompiled_mechanics(mechanics)
+        assert precompiled_mechanics(unregistered) == compile_mechanics(mechanics)
+
+    def test_lru_eviction(self):
+        """The least recently used entry is dropped past max_entries."""
+        registry = PolicyRegistry(max_entries=2)
+        built = []
+
+        def build(name):
+            built.append(name)
+            return {"name": name}
+
+        for name in ("a", "b", "a", "c", "a", "b"):
+            registry.register(name, lambda name=name: build(name))
+
+        assert built == ["a", "b", "c", "b"]
+        assert len(registry) == 2 and "b" in registry and "c" not in registry
+        assert registry.hits == 2 and registry.misses == 4
+
+    def test_pickle_round_trip(self):
+        """Frozen policies pickle and come back frozen and equal."""
+        policy = get_policy_by_type(PolicyType.USGHA)
+
+        restored = pickle.loads(pickle.dumps(policy))
+
+        assert restored == policy and is_frozen(restored)
+
+    def test_replace_returns_frozen(self):
+        """dataclasses.replace on a frozen policy gives a frozen policy."""
+        policy = dataclasses.replace(get_policy_by_type(PolicyType.USGHA), policy_name="Variant")
+
+        assert policy.policy_name == "Variant" and is_frozen(policy)
+
+    def test_invalid_size(self):
+        """max_entries must be positive."""
+        with pytest.raises(ValueError):
+            PolicyRegistry(max_entries=0)
+
+    def test_shared_instance(self):
+        """get_registry returns the process-wide registry."""
+        assert get_registry() is get_registry()
+        assert freeze([1, 2]) == (1, 2)
@@ -0,0 +1,228 @@
+"""
+Unit tests for shared projection contexts and growth index tables.
+Index tables must match direct compounding and be shared read-only
+across components that project on the same horizon.
+"""
+
+import dataclasses
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.combined_outlook import BUDGET_GRAPH, CombinedFiscalOutlookModel
+from core.discretionary_spending import DiscretionarySpendingModel
+from core.interest_spending import InterestOnDebtModel
+from core.medicare_medicaid import MedicaidModel, MedicareModel
+from core.projection_context import BASELINE_MEDICAL_INFLATION, ProjectionContext, growth_index
+from core.revenue_modeling import FederalRevenueModel
+from core.social_security import SocialSecurityModel
+
+
+class TestGrowthIndex:
+    """Test compound growth index tables."""
+
+    def test_constant_rate_matches_compounding(self):
+        """A constant-rate table equals (1 + r) ** t and starts at 1."""
+        index = growth_index(0.04, 30)
+
+        np.testing.assert_array_equal(index, np.power(1.04, np.arange(30)))
+        assert index[0] == 1.0
+
+    def test_constant_tables_are_shared_and_read_only(self):
+        """Repeated requests return the same table, which cannot be mutated."""
+        index = growth_index(0.055, 40)
+
+        assert growth_index(0.055, 40) is index
+        with pytest.raises(ValueError):
+            index[1] = 0.0
+
+    def test_per_path_rates(self):
+        """Per-iteration rates give a (years, iterations) table."""
+        rates = np.array([0.01, 0.02, 0.03])
+        index = growth_index(rates, 10)
+
+        assert index.shape == (10, 3)
+        np.testing.assert_allclose(index[:, 1], np.power(1.02, np.arange(10)))
+
+
+class TestProjectionContext:
+    """Test context index paths and their use by the models."""
+
+    def test_index_paths(self):
+        """GDP, wage, CPI and medical paths follow their own rates."""
+        context = ProjectionContext(20, gdp_growth=0.03, wage_growth=0.035, inflation=0.02, base_gdp=100.0)
+
+        np.testing.assert_allclose(context.gdp, 100.0 * 1.03 ** np.arange(20))
+        np.testing.assert_allclose(context.wage_index[-1], 1.035 ** 19)
+        np.testing.assert_allclose(context.cpi_index[-1], 1.02 ** 19)
+        np.testing.assert_array_equal(context.year_array, np.arange(2026, 2046))
+
+    def test_index_tables_built_once_and_read_only(self):
+        """Index tables are computed on first access and cannot be mutated."""
+        context = ProjectionContext(10, inflation=np.full(50, 0.03))
+
+        assert context.cpi_index is context.cpi_index
+        assert context.cpi_index.shape == (10, 50)
+        for table in (context.gdp, context.gdp_index, context.cpi_index, context.inflation):
+            with pytest.raises(ValueError, match="read-only"):
+                table[0] = 0.0
+
+    def test_per_path_contexts_compare_by_identity(self):
+        """Contexts with array rates support == and hash without ambiguity errors."""
+        context = ProjectionContext(10, medical_inflation=np.full(20, 0.04))
+
+        assert context == context
+        assert context != ProjectionContext(10, medical_inflation=np.full(20, 0.04))
+        assert {context: 1}[context] == 1
+
+    @pytest.mark.parametrize("model_class, project", [
+        (MedicareModel, lambda model, context: model.project_all_parts(
+            10, 400, return_arrays=True, context=context).mean("total_spending")),
+        (MedicaidModel, lambda model, context: model.project_spending(
+            10, 400, return_arrays=True, context=context).mean("total_spending")),
+    ], ids=["medicare", "medicaid"])
+    def test_per_path_medical_inflation(self, model_class, project):
+        """Per-path medical inflation matches the same constant rate on every path."""
+        constant = project(model_class(seed=1), ProjectionContext(10, medical_inflation=0.04))
+        per_path = project(model_class(seed=1), ProjectionContext(10, medical_inflation=np.full(400, 0.04)))
+
+        np.testing.assert_allclose(per_path, constant)
+
+    @pytest.mark.parametrize("project", [
+        lambda context, **kwargs: MedicareModel(seed=1).project_all_parts(
+            10, 400, return_summary=True, context=context, **kwargs),
+        lambda context, **kwargs: MedicaidModel(seed=1).project_spending(
+            10, 400, return_summary=True, context=context, **kwargs),
+        lambda context, **kwargs: SocialSecurityModel(seed=1).project_trust_funds(
+            10, 400, return_summary=True, context=context, **kwargs),
+    ], ids=["medicare", "medicaid", "social_security"])
+    def test_per_path_context_rejected_when_chunked(self, project):
+        """Chunked projections reject per-path rates sized to the full iteration count."""
+        context = ProjectionContext(10, inflation=np.full(400, 0.03), medical_inflation=np.full(400, 0.04))
+
+        with pytest.raises(ValueError, match="scalar rates"):
+            project(context, chunk_size=100)
+        assert len(project(context)) == 10
+
+    def test_per_path_count_must_match_iterations(self):
+        """Per-path rates sized for another iteration count raise a clear ValueError."""
+        context = ProjectionContext(10, inflation=np.full(400, 0.03))
+
+        with pytest.raises(ValueError, match="400 per-path rates"):
+            SocialSecurityModel(seed=1).project_trust_funds(10, 100, return_arrays=True, context=context)
+
+    def test_defaults_use_shared_baselines(self):
+        """Default rates are the shared baselines, so a default context is a zero deviation."""
+        context = ProjectionContext(10)
+
+        assert context.medical_inflation == BASELINE_MEDICAL_INFLATION
+        for rate in ("gdp_growth", "wage_growth", "inflation", "medical_inflation"):
+            assert context.shifted(rate, 0.07) == 0.07
+
+    def test_social_security_follows_context(self):
+        """A faster CPI path raises projected benefit payments."""
+        model = SocialSecurityModel(seed=7)
+        baseline = model.project_trust_funds(10, 100, return_arrays=True)
+        model.reseed(7)
+        inflated = model.project_trust_funds(
+            10, 100, return_arrays=True,
+            context=ProjectionContext(10, wage_growth=0.03, inflation=0.06),
+        )
+
+        assert np.all(inflated["benefit_payments_billions"][-1] > baseline["benefit_payments_billions"][-1])
+        np.testing.assert_array_equal(inflated["benefit_payments_billions"][0], baseline["benefit_payments_billions"][0])
+
+    def test_short_context_rejected(self):
+        """A context shorter than the projection raises ValueError, not IndexError."""
+        short = ProjectionContext(5)
+
+        with pytest.raises(ValueError, match="covers 5 years"):
+            SocialSecurityModel(seed=7).project_trust_funds(10, 50, return_arrays=True, context=short)
+        with pytest.raises(ValueError, match="covers 5 years"):
+            MedicareModel(seed=7).project_all_parts(10, 50, return_arrays=True, context=short)
+        with pytest.raises(ValueError, match="covers 5 years"):
+            CombinedFiscalOutlookModel(seed=7).project_unified_budget(years=10, iterations=100, context=short)
+
+    @pytest.mark.parametrize("model_class, project", [
+        (FederalRevenueModel, lambda model, context: model.project_all_revenues(
+            10, iterations=100, return_arrays=True, context=context).mean("total_revenues")),
+        (MedicareModel, lambda model, context: model.project_all_parts(
+            10, 100, return_arrays=True, context=context).mean("total_spending")),
+        (MedicaidModel, lambda model, context: model.project_spending(
+            10, 100, return_arrays=True, context=context).mean("total_spending")),
+        (DiscretionarySpendingModel, lambda model, context: model.project_all_discretionary(
+            10, 100, context=context)["total_mean"].to_numpy()),
+        (InterestOnDebtModel, lambda model, context: model.project_interest_and_debt(
+            10, 100, context=context)["interest_billions"].to_numpy()),
+    ], ids=["revenue", "medicare", "medicaid", "discretionary", "interest"])
+    def test_components_follow_context(self, model_class, project):
+        """Faster growth and inflation in the context raise every component's final year."""
+        baseline = project(model_class(seed=7), ProjectionContext(10))
+        faster = project(
+            model_class(seed=7),
+            ProjectionContext(10, gdp_growth=0.05, wage_growth=0.06, inflation=0.05, medical_inflation=0.08),
+        )
+
+        assert faster[-1] > baseline[-1]
+
+    def test_combined_passes_one_context(self):
+        """Every component of the unified budget projects against the same context."""
+        model = CombinedFiscalOutlookModel(seed=7)
+        context = model.projection_context(10, inflation=0.03)
+        calls = {}
+
+        def recording(node):
+            def kernel(sub_model, **kwargs):
+                calls[node.name] = kwargs["context"]
+                return node.kernel(sub_model, **kwargs)
+            return kernel
+
+        graph = tuple(dataclasses.replace(node, kernel=recording(node)) for node in BUDGET_GRAPH)
+        with mock.patch("core.combined_outlook.BUDGET_GRAPH", graph):
+            model.project_unified_budget(years=10, iterations=100, context=context)
+
+        assert set(calls) == {node.name for node in BUDGET_GRAPH}
+        assert all(passed is context for passed in calls.values())
+
+    def test_combined_medical_inflation(self):
+        """Higher medical inflation raises every health spending line together."""
+        baseline = CombinedFiscalOutlookModel(seed=7).project_unified_budget(years=10, iterations=200)
+        model = CombinedFiscalOutlookModel(seed=7)
+        inflated = model.project_unified_budget(
+            years=10, iterations=200, context=model.projection_context(10, medical_inflation=0.06)
+        )
+
+        for column in ("medicare_spending", "medicaid_spending", "healthcare_spending"):
+            assert inflated[column].iloc[-1] > baseline[column].iloc[-1]
+        np.testing.assert_array_equal(inflated["total_revenue"], baseline["total_revenue"])
+
+    def test_default_context_keeps_component_baselines(self):
+        """The shared default context reproduces every component's own calibration."""
+        shared = CombinedFiscalOutlookModel(seed=7, enable_cache=False)
+        standalone = CombinedFiscalOutlookModel(seed=7, enable_cache=False)
+
+        def without_context(node):
+            return lambda sub_model, **kwargs: node.kernel(sub_model, **{**kwargs, "context": None})
+
+        graph = tuple(dataclasses.replace(node, kernel=without_context(node)) for node in BUDGET_GRAPH)
+        with mock.patch("core.combined_outlook.BUDGET_GRAPH", graph):
+            expected = standalone.project_unified_budget(years=30, iterations=200)
+
+        pd.testing.assert_frame_equal(shared.project_unified_budget(years=30, iterations=200), expected)
+        assert dataclasses.astuple(shared.projection_context(30)) == dataclasses.astuple(ProjectionContext(30))
+
+    def test_context_keeps_cola_override(self):
+        """A lower annual_cola (e.g. chained CPI) still lowers benefits under a shared context."""
+        context = ProjectionContext(10)
+        baseline = SocialSecurityModel(seed=7)
+        chained = SocialSecurityModel(seed=7)
+        chained.benefit_formula.annual_cola = 0.026
+
+        base_paths = baseline.project_trust_funds(10, 100, return_arrays=True, context=context)
+        chained_paths = chained.project_trust_funds(10, 100, return_arrays=True, context=context)
+
+        assert np.all(
+            chained_paths["benefit_payments_billions"][-1] < base_paths["benefit_payments_billions"][-1]
+        )
@@ -0,0 +1,87 @@
+"""
+Unit tests for per-instance random streams.
+Models own SeedSequence-derived Generators instead of the global np.random state.
+"""
+
+import numpy as np
+
+from core.random_streams import make_generator, seed_sequence, spawn_seeds
+from core.medicare_medicaid import MedicareModel
+from core.revenue_modeling import FederalRevenueModel
+from core.combined_outlook import CombinedFiscalOutlookModel
+
+
+class TestRandomStreams:
+    """Test seed normalization and spawning helpers."""
+
+    def test_seed_sequence_normalization(self):
+        """Integers, SeedSequences and Generators all map to a SeedSequence."""
+        ss = np.random.SeedSequence(42)
+        assert seed_sequence(ss) is ss
+        assert seed_sequence(42).entropy == 42
+        assert seed_sequence(np.random.default_rng(ss)) is ss
+
+    def test_make_generator_is_deterministic(self):
+        """Same seed produces the same stream."""
+        assert make_generator(5).random() == make_generator(5).random()
+        rng = np.random.default_rng(1)
+        assert make_generator(rng) is rng
+
+    def test_spawned_children_are_independent(self):
+        """Children are reproducible and differ from each other."""
+        first = [make_generator(s).random() for s in spawn_seeds(9, 3)]
+        second = [make_generator(s).random() for s in spawn_seeds(9, 3)]
+        assert first == second
+        assert len(set(first)) == 3
+
+
+class TestModelStreams:
+    """Test that models do not share or touch global random state."""
+
+    def test_global_seed_does_not_affect_models(self):
+        """Reseeding the global RNG between runs leaves seeded models unchanged."""
+        np.random.seed(0)
+        first = FederalRevenueModel(seed=3).project_all_revenues(years=5, iterations=20, return_arrays=True)
+        np.random.seed(99)
+        second = FederalRevenueModel(seed=3).project_all_revenues(years=5, iterations=20, return_arrays=True)
+        np.testing.assert_array_equal(first["total_revenues"], second["total_revenues"])
+
+    def test_interleaved_models_are_isolated(self):
+        """Draws from one model do not shift another model's stream."""
+        alone = MedicareModel(seed=4).project_all_parts(years=5, iterations=10, return_summary=True)
+
+        model = MedicareModel(seed=4)
+        other = MedicareModel(seed=5)
+        other.project_all_parts(years=5, iterations=10, return_summary=True)
+        interleaved = model.project_all_parts(years=5, iterations=10, return_summary=True)
+
+        assert alone.equals(interleaved)
+
+    def test_reseed_restarts_stream(self):
+        """reseed() restarts the instance stream."""
+        model = MedicareModel(seed=8)
+        first = model.project_all_parts(years=4, iterations=5, return_summary=True)
+        model.reseed(8)
+        assert first.equals(model.project_all_parts(years=4, iterations=5, return_summary=True))
+
+    def test_combined_outlook_components_get_child_streams(self):
+        """Seeded combined outlook is reproducible with distinct component streams."""
+        first = CombinedFiscalOutlookModel(seed=11).project_unified_budget(years=5, iterations=100)
+        second = CombinedFiscalOutlookModel(seed=11).project_unified_budget(years=5, iterations=100)
+        assert first.equals(second)
+
+        model = CombinedFiscalOutlookModel(seed=11)
+        entropy = {
+            component.seed_sequence.spawn_key
+            for component in (model.revenue_model, model.ss_model, model.medicare_model,
+                              model.medicaid_model, model.discretionary_model, model.interest_model)
+        }
+        assert len(entropy) == 6
+
+    def test_unseeded_stream_uses_seed_sequence(self):
+        """An unseeded model's Generator derives from the sequence spawn() uses."""
+        model = MedicareModel()
+
+        assert model.rng.bit_generator.seed_seq is model.seed_sequence
+        reference = np.random.default_rng(model.seed_sequence)
+        np.testing.assert_array_equal(model.rng.random(5), reference.random(5))
@@ -0,0 +1,160 @@
+"""
+Unit tests for the content-addressed result cache.
+Tests LRU eviction, read-only sharing, the disk tier and model fingerprints.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.result_cache import ResultCache, fingerprint
+from core.revenue_modeling import FederalRevenueModel
+from core.combined_outlook import CombinedFiscalOutlookModel
+from core.social_security import SocialSecurityModel
+
+
+def _frame(value: float, rows: int = 5) -> pd.DataFrame:
+    return pd.DataFrame({"year": np.arange(2026, 2026 + rows), "spending": np.full(rows, value)})
+
+
+class TestResultCache:
+    """Test ResultCache memory and disk tiers."""
+
+    def test_lru_eviction_by_entries(self):
+        """Least recently used entries are evicted first."""
+        cache = ResultCache(max_entries=2)
+        cache.put("a", _frame(1.0))
+        cache.put("b", _frame(2.0))
+        cache.get("a")  # a becomes most recently used
+        cache.put("c", _frame(3.0))
+
+        assert "a" in cache and "c" in cache
+        assert "b" not in cache
+        assert cache.evictions == 1
+
+    def test_eviction_by_bytes(self):
+        """Byte limit bounds memory use."""
+        entry_bytes = _frame(1.0, rows=100).memory_usage(index=False).sum()
+        cache = ResultCache(max_bytes=int(entry_bytes * 2.5))
+        for key in "abcd":
+            cache.put(key, _frame(1.0, rows=100))
+
+        assert len(cache) == 2
+        assert cache.nbytes <= entry_bytes * 2.5
+
+    def test_hits_are_read_only_and_not_copied(self):
+        """Cached results are shared without copying and cannot be mutated."""
+        cache = ResultCache()
+        cache.put("a", _frame(1.0))
+        first, second = cache.get("a"), cache.get("a")
+
+        assert np.shares_memory(first["spending"].to_numpy(), second["spending"].to_numpy())
+        with pytest.raises(ValueError):
+            first.loc[0, "spending"] = 5.0
+        assert cache.hits == 2 and cache.get("missing") is None and cache.misses == 1
+
+    def test_disk_tier_shared_across_instances(self, tmp_path):
+        """Results written by one cache are read by another on the same directory."""
+        ResultCache(disk_dir=tmp_path).put("a", _frame(4.0))
+
+        reader = ResultCache(disk_dir=tmp_path)
+        result = reader.get("a")
+        pd.testing.assert_frame_equal(result, _frame(4.0))
+        assert len(reader) == 1  # Promoted into memory
+
+    def test_disk_tier_pruned_to_size(self, tmp_path):
+        """Oldest disk entries are removed above max_disk_bytes."""
+        cache = ResultCache(disk_dir=tmp_path, max_disk_bytes=1)
+        cache.put("a", _frame(1.0))
+        cache.put("b", _frame(2.0))
+        assert len(list(tmp_path.glob("*.npz"))) <= 1
+
+
+class TestFingerprint:
+    """Test content hashing of model state."""
+
+    def test_fingerprint_tracks_assumptions(self):
+        """Changing an assumption dataclass changes the fingerprint."""
+        model = FederalRevenueModel(seed=1)
+        before = fingerprint(model)
+        assert fingerprint(FederalRevenueModel(seed=1)) == before
+
+        model.corporate.marginal_tax_rate = 0.28
+        assert fingerprint(model) != before
+
+    def test_fingerprint_tracks_seed_not_stream_position(self):
+        """Seeds change the fingerprint; drawing from the generator does not."""
+        model = FederalRevenueModel(seed=1)
+        before = fingerprint(model)
+        model.rng.random(10)
+        assert fingerprint(model) == before
+
+        assert fingerprint(FederalRevenueModel(seed=2)) != before
+        assert fingerprint(FederalRevenueModel(seed=np.random.SeedSequence(1).spawn(1)[0])) != before
+
+    def test_unseeded_models_share_fingerprint(self):
+        """Unseeded models hash alike despite fresh SeedSequence entropy."""
+        assert fingerprint(FederalRevenueModel()) == fingerprint(FederalRevenueModel())
+        assert fingerprint(FederalRevenueModel()) != fingerprint(FederalRevenueModel(seed=1))
+
+
+class TestCombinedOutlookCache:
+    """Test CombinedFiscalOutlookModel cache integration."""
+
+    def test_modified_component_is_recomputed(self):
+        """Mutating a sub-model misses only that component's cache entry."""
+        model = CombinedFiscalOutlookModel(seed=1)
+        baseline = model.project_unified_budget(years=5, iterations=200)
+        assert model._cache.misses == 6
+
+        model.revenue_model.baseline_revenues["individual_income_tax"] *= 1.1
+        reform = model.project_unified_budget(years=5, iterations=200)
+
+        assert model._cache.misses == 7
+        assert (reform["total_revenue"] > baseline["total_revenue"]).all()
+        pd.testing.assert_series_equal(reform["medicare_spending"], baseline["medicare_spending"])
+
+    def test_policy_mechanics_change_cache_key(self):
+        """Applied mechanics are part of every cache key."""
+        model = CombinedFiscalOutlookModel()
+        before = model._get_cache_key("medicare_spending", model.medicare_model, years=5, iterations=100)
+        model._policy_mechanics = {"funding_mechanisms": ["payroll"]}
+        after = model._get_cache_key("medicare_spending", model.medicare_model, years=5, iterations=100)
+        assert before != after
+
+    def test_reseeded_component_is_recomputed(self):
+        """Reseeding or replacing a sub-model misses its cache entry."""
+        model = CombinedFiscalOutlookModel(seed=1)
+        model.project_unified_budget(years=5, iterations=200)
+
+        model.revenue_model.reseed(99)
+        model.project_unified_budget(years=5, iterations=200)
+        assert model._cache.misses == 7
+
+        model.ss_model = SocialSecurityModel(seed=99)
+        model.project_unified_budget(years=5, iterations=200)
+        assert model._cache.misses == 8
+
+    def test_shared_cache_across_models(self):
+        """Identically seeded models sharing a cache reuse each other's results."""
+        cache = ResultCache()
+        first = CombinedFiscalOutlookModel(seed=5, cache=cache).project_unified_budget(years=5, iterations=100)
+        second = CombinedFiscalOutlookModel(seed=5, cache=cache).project_unified_budget(years=5, iterations=100)
+
+        pd.testing.assert_frame_equal(first, second)
+        assert cache.hits == 6
+
+    def test_shared_cache_across_unseeded_models(self, tmp_path):
+        """Unseeded models reuse each other's results in memory and on disk."""
+        cache = ResultCache(disk_dir=tmp_path)
+        CombinedFiscalOutlookModel(cache=cache).project_unified_budget(years=10, iterations=200)
+
+        second = CombinedFiscalOutlookModel(cache=cache)
+        second.project_unified_budget(years=10, iterations=200)
+        assert second.last_recomputed == ()
+        assert cache.hits == 6
+
+        restarted = CombinedFiscalOutlookModel(cache=ResultCache(disk_dir=tmp_path))
+        restarted.project_unified_budget(years=10, iterations=200)
+        assert restarted.last_recomputed == ()
+        assert restarted._cache.hits == 6
@@ -190,6 +190,24 @@ class TestCorporateIncomeTaxProjection:
         # CIT should have reasonable volatility (not negative)
         assert cit_volatility > 0
 
+    def test_cit_recession_impact_applies_to_all_paths(self):
+        """Recession years cut revenue on every path; the mild shock stays a per-path mask."""
+        model = FederalRevenueModel()
+        gdp_growth = np.array([0.02, -0.03, 0.02, 0.02, 0.02])
+        noise = model.draw_noise(years=5, iterations=50)
+        noise["corporate_profit_shock"][:] = 1.0  # no mild profit declines
+        noise["corporate_avoidance"][:] = 1.0
+        noise["corporate"][:] = 1.0
+
+        result = model.project_corporate_income_tax(
+            years=5, gdp_growth=gdp_growth, iterations=50, noise=noise
+        )
+
+        revenues = result["revenues"]
+        assert np.allclose(revenues, revenues[:, :1])
+        growth = revenues[1:, 0] / revenues[:-1, 0]
+        assert growth[0] == pytest.approx((1 - 0.03 * 2.0) * 0.75)
+
     def test_cit_gdp_sensitivity(self):
         """CIT grows faster with higher GDP growth."""
         model = FederalRevenueModel()
@@ -254,6 +272,21 @@ class TestAllRevenuesProjection:
 
             assert np.isclose(total, row["total_revenues"], rtol=0.01)
 
+    def test_all_revenues_return_arrays_matches_dataframe(self):
+        """Array output matches the long-format DataFrame for the same seed."""
+        df = FederalRevenueModel(seed=7).project_all_revenues(years=5, iterations=20)
+        arrays = FederalRevenueModel(seed=7).project_all_revenues(
+            years=5, iterations=20, return_arrays=True
+        )
+
+        assert arrays["total_revenues"].shape == (5, 20)
+        first_path = df[df["iteration"] == 0]
+        assert np.allclose(first_path["total_revenues"].values, arrays["total_revenues"][:, 0])
+        assert np.allclose(
+            df.groupby("year")["total_revenues"].mean().values,
+            arrays["total_revenues"].mean(axis=1),
+        )
+
     def test_all_revenues_within_baseline_range(self):
         """Projected revenues are within reasonable range of baseline."""
         model = FederalRevenueModel()
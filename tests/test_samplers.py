@@ -0,0 +1,103 @@
+"""
+Unit tests for pluggable Monte Carlo samplers.
+The default sampler must match direct Generator calls; the others must
+preserve the requested distribution while reducing estimator variance.
+"""
+
+import numpy as np
+import pytest
+
+from core.medicare_medicaid import MedicareModel
+from core.monte_carlo_scenarios import MonteCarloPolicySimulator
+from core.samplers import (
+    AntitheticSampler,
+    Draw,
+    LatinHypercubeSampler,
+    PseudoRandomSampler,
+    Sampler,
+    SobolSampler,
+    make_sampler,
+)
+
+
+class TestSamplers:
+    """Test block drawing for each sampler."""
+
+    def test_pseudo_matches_generator_calls(self):
+        """Pseudo-random draws consume the Generator exactly like direct calls."""
+        drawn = PseudoRandomSampler().draw(np.random.default_rng(1), [
+            Draw((3, 50), 1.0, 0.02),
+            Draw((3, 50), uniform=True),
+        ])
+        rng = np.random.default_rng(1)
+        np.testing.assert_array_equal(drawn[0], rng.normal(1.0, 0.02, size=(3, 50)))
+        np.testing.assert_array_equal(drawn[1], rng.random((3, 50)))
+
+    @pytest.mark.parametrize("name", ["antithetic", "lhs", "sobol"])
+    def test_shapes_and_moments(self, name):
+        """Every sampler returns the requested shapes, locations and scales."""
+        normal, uniform, by_row = make_sampler(name).draw(np.random.default_rng(2), [
+            Draw((4, 4096), 10.0, 2.0),
+            Draw((4, 4096), uniform=True),
+            Draw((4096, 3), iteration_axis=0),
+        ])
+
+        assert normal.shape == (4, 4096) and by_row.shape == (4096, 3)
+        np.testing.assert_allclose(normal.mean(axis=1), 10.0, atol=0.1)
+        np.testing.assert_allclose(normal.std(axis=1), 2.0, rtol=0.05)
+        assert uniform.min() > 0.0 and uniform.max() < 1.0
+        assert np.all(np.isfinite(by_row))
+
+    def test_antithetic_pairs_mirror(self):
+        """The second half of a block mirrors the first."""
+        (values,) = AntitheticSampler().draw(np.random.default_rng(3), [Draw((10,), iteration_axis=0)])
+        np.testing.assert_allclose(values[5:], -values[:5], atol=1e-9)
+
+    def test_latin_hypercube_stratifies(self):
+        """Each of n strata holds exactly one point per dimension."""
+        points = LatinHypercubeSampler().uniform(np.random.default_rng(4), 100, 6)
+        strata = np.sort(np.floor(points * 100).astype(int), axis=0)
+        np.testing.assert_array_equal(strata, np.tile(np.arange(100)[:, np.newaxis], (1, 6)))
+
+    def test_block_validation(self):
+        """Unknown names and mismatched iteration counts are rejected."""
+        with pytest.raises(ValueError):
+            make_sampler("halton")
+        with pytest.raises(ValueError):
+            SobolSampler().draw(np.random.default_rng(5), [Draw((3, 10)), Draw((3, 11))])
+        assert isinstance(make_sampler(None), PseudoRandomSampler)
+
+    def test_incomplete_sampler_rejected(self):
+        """A sampler without uniform() fails when it is created."""
+        class NoPoints(Sampler):
+            name = "none"
+
+        with pytest.raises(TypeError):
+            NoPoints()
+
+
+class TestModelSamplers:
+    """Test samplers threaded through the models."""
+
+    def test_sobol_reduces_policy_estimator_variance(self):
+        """Replicate means spread far less with Sobol than with pseudo-random draws."""
+        def spread(sampler):
+            means = [
+                MonteCarloPolicySimulator(seed=seed, sampler=sampler)
+                .simulate_policy("Test", 5.0, -3.0, iterations=1024, return_paths=False)
+                .mean_deficit
+                for seed in range(10)
+            ]
+            return np.std(means)
+
+        assert spread("sobol") < 0.2 * spread("pseudo")
+
+    def test_sampler_survives_reseed(self):
+        """Models keep their sampler and stay reproducible under it."""
+        model = MedicareModel(seed=6, sampler="lhs")
+        first = model.project_all_parts(years=5, iterations=200, return_summary=True)
+        model.reseed(6)
+        second = model.project_all_parts(years=5, iterations=200, return_summary=True)
+
+        assert isinstance(model.sampler, LatinHypercubeSampler)
+        np.testing.assert_array_equal(first["total_mean"], second["total_mean"])
@@ -77,6 +77,38 @@ class TestPopulationProjection:
         # Note: Not exactly same due to random seed, but similar magnitude
         assert np.allclose(result1["population"], result2["population"], rtol=0.5)
 
+    def test_population_summary_only(self):
+        """Summary mode returns age-band totals that match the full tensor."""
+        model = SocialSecurityModel()
+
+        model.reseed(11)
+        full = model.project_population(years=8, iterations=20)
+        model.reseed(11)
+        summary = model.project_population(years=8, iterations=20, summary_only=True)
+
+        assert "population" not in summary
+        assert summary["total_population"].shape == (8, 20)
+        np.testing.assert_allclose(summary["total_population"], full["population"].sum(axis=1))
+        np.testing.assert_allclose(
+            summary["population_under_20"]
+            + summary["population_20_64"]
+            + summary["population_65_plus"],
+            summary["total_population"],
+        )
+        np.testing.assert_allclose(summary["births"], full["births"])
+
+    def test_population_reduced_precision(self):
+        """float32 projection stays close to the float64 result."""
+        model = SocialSecurityModel()
+
+        model.reseed(5)
+        result64 = model.project_population(years=10, iterations=10)
+        model.reseed(5)
+        result32 = model.project_population(years=10, iterations=10, dtype=np.float32)
+
+        assert result32["population"].dtype == np.float32
+        np.testing.assert_allclose(result32["population"], result64["population"], rtol=1e-5)
+
 
 class TestTrustFundProjection:
     """Test trust fund projection logic."""
@@ -147,6 +179,37 @@ class TestTrustFundProjection:
         assert std > 0
         assert std < mean * 0.5  # Std shouldn't be more than 50% of mean
 
+    def test_return_arrays_matches_dataframe(self):
+        """Raw array output matches the long-format DataFrame for a fixed seed."""
+        model = SocialSecurityModel()
+
+        model.reseed(123)
+        projections = model.project_trust_funds(years=15, iterations=50)
+        model.reseed(123)
+        paths = model.project_trust_funds(years=15, iterations=50, return_arrays=True)
+
+        assert paths["oasi_balance_billions"].shape == (15, 50)
+        np.testing.assert_array_equal(paths["year"], np.arange(2025, 2040))
+
+        # Long format is ordered by iteration, then year
+        iter_3 = projections[projections["iteration"] == 3]
+        np.testing.assert_array_equal(
+            iter_3["oasi_balance_billions"].values, paths["oasi_balance_billions"][:, 3]
+        )
+        np.testing.assert_array_equal(
+            iter_3["benefit_payments_billions"].values, paths["benefit_payments_billions"][:, 3]
+        )
+
+    def test_depletion_clamps_balances_at_zero(self):
+        """Depleted funds stay at zero and are flagged insolvent."""
+        model = SocialSecurityModel()
+        paths = model.project_trust_funds(years=40, iterations=200, return_arrays=True)
+
+        assert np.all(paths["oasi_balance_billions"] >= 0)
+        assert np.all(paths["di_balance_billions"] >= 0)
+        depleted = paths["oasi_balance_billions"] == 0
+        assert np.array_equal(~depleted, paths["oasi_solvent"])
+
 
 class TestSolvencyAnalysis:
     """Test solvency date estimation."""
@@ -185,6 +248,32 @@ class TestSolvencyAnalysis:
 
         assert p10 < mean < p90
 
+    def test_summary_mode_matches_raw_solvency(self):
+        """Per-year depletion shares reproduce the raw solvency statistics."""
+        raw = SocialSecurityModel(seed=8).project_trust_funds(years=30, iterations=500)
+        summary = SocialSecurityModel(seed=8).project_trust_funds(
+            years=30, iterations=500, return_summary=True
+        )
+        assert len(summary) == 30
+
+        model = SocialSecurityModel()
+        expected = model.estimate_solvency_dates(raw)["OASI"]
+        actual = model.estimate_solvency_dates(summary)["OASI"]
+        assert actual["probability_depleted"] == pytest.approx(expected["probability_depleted"])
+        assert actual["depletion_year_mean"] == pytest.approx(expected["depletion_year_mean"])
+        assert actual["depletion_year_std"] == pytest.approx(expected["depletion_year_std"])
+
+    def test_chunked_summary_counts_every_iteration(self):
+        """Streaming blocks keep depletion shares summing to the depleted fraction."""
+        summary = SocialSecurityModel(seed=8).project_trust_funds(
+            years=30, iterations=3000, return_summary=True, chunk_size=700
+        )
+        assert 0.0 <= summary["oasi_first_depletion_share"].sum() <= 1.0 + 1e-12
+        assert (summary["oasi_balance_p10"] <= summary["oasi_balance_p90"]).all()
+
+        with pytest.raises(ValueError):
+            SocialSecurityModel().project_trust_funds(years=5, iterations=100, chunk_size=10)
+
 
 class TestPolicyReforms:
     """Test policy reform scenarios."""
@@ -34,6 +34,7 @@ try:
     from core.discretionary_spending import DiscretionarySpendingModel
     from core.interest_spending import InterestOnDebtModel
     from core.combined_outlook import CombinedFiscalOutlookModel
+    from core.result_cache import ResultCache
     from core.healthcare import get_policy_by_type, PolicyType
     from core.economic_engine import MonteCarloEngine, PolicyScenario, EconomicParameters
     from core.data_loader import load_real_data
@@ -501,6 +502,26 @@ def load_revenue_scenarios():
         return json.load(f)
 
 
+def get_outlook_cache() -> "ResultCache":
+    """Process-wide component cache, so reruns only recompute changed components."""
+    return ResultCache()
+
+
+if HAS_STREAMLIT:
+    get_outlook_cache = st.cache_resource(get_outlook_cache)
+
+
+def new_outlook_model() -> "CombinedFiscalOutlookModel":
+    """
+    Fresh combined outlook model on the shared component cache.
+
+    Each run rebuilds the model because policy mechanics are applied to it
+    in place. The model is unseeded, so its cache keys do not depend on the
+    instance and a rerun with one changed scenario recomputes only that node.
+    """
+    return CombinedFiscalOutlookModel(cache=get_outlook_cache())
+
+
 def get_policy_library_policies(policy_type=None):
     """Load policies from library (NOT cached - always fresh)."""
     from core.policy_builder import PolicyLibrary, PolicyType
@@ -2431,7 +2452,7 @@ def page_discretionary_spending():
             if discretionary_mechanics.get("nondefense_discretionary_change") is not None:
                 assumptions.nondefense_discretionary_2025_billions *= (1 + discretionary_mechanics.get("nondefense_discretionary_change"))
             if discretionary_mechanics.get("budget_caps_enabled"):
-                assumptions.inflation_annual = min(assumptions.inflation_annual, 0.02)
+                assumptions.growth_cap_annual = 0.02
         model = DiscretionarySpendingModel(assumptions=assumptions)
         
         with st.spinner("Projecting discretionary spending..."):
@@ -2714,7 +2735,7 @@ def page_combined_outlook():
     )
     
     if st.button("Calculate Combined Fiscal Outlook"):
-        model = CombinedFiscalOutlookModel()
+        model = new_outlook_model()
 
         # Apply extracted mechanics using unified method
         if uploaded_policy and hasattr(uploaded_policy, "structured_mechanics") and uploaded_policy.structured_mechanics:
@@ -2748,7 +2769,7 @@ def page_combined_outlook():
                 if discretionary_mechanics.get("nondefense_discretionary_change") is not None:
                     model.discretionary_model.assumptions.nondefense_discretionary_2025_billions *= (1 + discretionary_mechanics.get("nondefense_discretionary_change"))
                 if discretionary_mechanics.get("budget_caps_enabled"):
-                    model.discretionary_model.assumptions.inflation_annual = min(model.discretionary_model.assumptions.inflation_annual, 0.02)
+                    model.discretionary_model.assumptions.growth_cap_annual = 0.02
             if medicaid_mechanics:
                 # Apply Medicaid-related signals to Medicaid model
                 if medicaid_mechanics.get("medicaid_expansion"):
@@ -2986,7 +3007,7 @@ def page_policy_comparison():
     )
     
     if st.button("Compare Policies"):
-        model = CombinedFiscalOutlookModel()
+        model = new_outlook_model()
         
         with st.spinner("Running policy comparison..."):
             comparison_data = {}